@@ -7,31 +7,36 @@ Standalone script for generating job descriptions based on sector, country, and
 import json
 import sys
 import logging
+from typing import Dict, Any, List
 from services.ai_suggestion_service import AISuggestionService
+from services.client_registry import get_service
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def run(args: List[str]) -> Dict[str, Any]:
+    """Generate a job description from a JSON argument (shared with worker.py)"""
+    if len(args) < 1:
+        raise ValueError("Parameters required: JSON string with sector, country, designation")
+    
+    input_data = json.loads(args[0])
+    sector = input_data.get('sector')
+    country = input_data.get('country')
+    designation = input_data.get('designation')
+    
+    if not all([sector, country, designation]):
+        raise ValueError("All parameters (sector, country, designation) are required")
+    
+    # Get shared AI service
+    ai_service = get_service(AISuggestionService)
+    
+    # Generate job description
+    return ai_service.generate_job_description(sector, country, designation)
+
 def main():
     try:
-        # Read input from command line argument
-        if len(sys.argv) < 2:
-            raise ValueError("Parameters required: JSON string with sector, country, designation")
-        
-        input_data = json.loads(sys.argv[1])
-        sector = input_data.get('sector')
-        country = input_data.get('country')
-        designation = input_data.get('designation')
-        
-        if not all([sector, country, designation]):
-            raise ValueError("All parameters (sector, country, designation) are required")
-        
-        # Initialize AI service
-        ai_service = AISuggestionService()
-        
-        # Generate job description
-        job_description = ai_service.generate_job_description(sector, country, designation)
+        job_description = run(sys.argv[1:])
         
         # Output result as JSON
         print(json.dumps(job_description, ensure_ascii=False))
@@ -7,30 +7,35 @@ Standalone script for comparing resume with job description and generating sugge
 import json
 import sys
 import logging
+from typing import Dict, Any, List
 from services.ai_suggestion_service import AISuggestionService
+from services.client_registry import get_service
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def run(args: List[str]) -> Dict[str, Any]:
+    """Compare resume with job description from a JSON argument (shared with worker.py)"""
+    if len(args) < 1:
+        raise ValueError("Parameters required: JSON string with resumeData and jobDescription")
+    
+    input_data = json.loads(args[0])
+    resume_data = input_data.get('resumeData')
+    job_description = input_data.get('jobDescription')
+    
+    if not resume_data or not job_description:
+        raise ValueError("Both resumeData and jobDescription are required")
+    
+    # Get shared AI service
+    ai_service = get_service(AISuggestionService)
+    
+    # Compare resume with job description and get suggestions
+    return ai_service.compare_resume_with_jd(resume_data, job_description)
+
 def main():
     try:
-        # Read input from command line argument
-        if len(sys.argv) < 2:
-            raise ValueError("Parameters required: JSON string with resumeData and jobDescription")
-        
-        input_data = json.loads(sys.argv[1])
-        resume_data = input_data.get('resumeData')
-        job_description = input_data.get('jobDescription')
-        
-        if not resume_data or not job_description:
-            raise ValueError("Both resumeData and jobDescription are required")
-        
-        # Initialize AI service
-        ai_service = AISuggestionService()
-        
-        # Compare resume with job description and get suggestions
-        suggestions = ai_service.compare_resume_with_jd(resume_data, job_description)
+        suggestions = run(sys.argv[1:])
         
         # Output result as JSON
         print(json.dumps(suggestions, ensure_ascii=False))
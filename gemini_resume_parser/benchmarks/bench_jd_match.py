@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark local JD match scoring on synthetic resumes and job descriptions
+
+Reports three numbers:
+
+    single   JobDescriptionProfile.prescore for one 1-5 page resume (p50 / p95; the budget is 10 ms)
+    1 x N    one JD against N resumes: prescore_many in one call vs a prescore loop
+    N x 1    one resume against N JDs via score_resumes_against_jds
+
+Usage:
+    python benchmarks/bench_jd_match.py
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.jd_match import KEYWORD_TERMS, SKILL_TERMS, JobDescriptionProfile, score_resumes_against_jds
+
+WORDS_PER_PAGE = 450
+FILLER = ["built", "service", "data", "platform", "users", "latency", "pipeline", "customers", "reports", "billing",
+          "search", "terraform", "kafka", "spark", "golang", "graphql", "redis", "postgres", "airflow", "grafana"]
+VOCABULARY = list(SKILL_TERMS) + list(KEYWORD_TERMS) + FILLER * 4
+
+
+def synthetic_text(words: int, rnd: random.Random) -> str:
+    lines = []
+    for start in range(0, words, 12):
+        lines.append(" ".join(rnd.choice(VOCABULARY) for _ in range(min(12, words - start))) + ".")
+    return "\n".join(lines)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f} ms"
+
+
+def bench_single(rnd: random.Random, jd: str):
+    profile = JobDescriptionProfile(jd)
+    print("single resume prescore")
+    for pages in (1, 2, 5):
+        resume = synthetic_text(pages * WORDS_PER_PAGE, rnd)
+        timings: List[float] = []
+        for _ in range(200):
+            started = time.perf_counter()
+            profile.prescore(resume)
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        print(f"  {pages} page(s): p50 {_ms(statistics.median(timings))}, p95 {_ms(timings[int(len(timings) * 0.95)])}")
+
+
+def bench_one_jd(rnd: random.Random, jd: str):
+    profile = JobDescriptionProfile(jd)
+    print("one JD against N two-page resumes")
+    for count in (100, 1000, 5000):
+        resumes = [synthetic_text(2 * WORDS_PER_PAGE, rnd) for _ in range(count)]
+        started = time.perf_counter()
+        profile.prescore_many(resumes)
+        batched = time.perf_counter() - started
+        started = time.perf_counter()
+        for resume in resumes:
+            profile.prescore(resume)
+        looped = time.perf_counter() - started
+        print(f"  N={count:>5}: batched {_ms(batched)} ({_ms(batched / count)}/resume), loop {_ms(looped)}")
+
+
+def bench_one_resume(rnd: random.Random):
+    resume = synthetic_text(2 * WORDS_PER_PAGE, rnd)
+    print("one two-page resume against N JDs")
+    for count in (100, 1000):
+        jds = [synthetic_text(250, rnd) for _ in range(count)]
+        started = time.perf_counter()
+        score_resumes_against_jds([resume], jds)
+        elapsed = time.perf_counter() - started
+        print(f"  N={count:>5}: {_ms(elapsed)} ({_ms(elapsed / count)}/JD)")
+
+
+def main():
+    rnd = random.Random(11)
+    jd = synthetic_text(250, rnd)
+    bench_single(rnd, jd)
+    bench_one_jd(rnd, jd)
+    bench_one_resume(rnd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark the tolerant JSON parser on adversarial inputs (64 KB to 1 MB)
+
+Reports one-shot repair_json time and chunked TolerantJsonParser time (64-character chunks,
+as from a streaming completion) for each input family at each size. Time per MB stays flat
+as the input grows when parsing is linear.
+
+Usage:
+    python benchmarks/bench_json_stream.py
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.test_json_stream import ADVERSARIAL, MB
+from utils.json_stream import TolerantJsonParser, repair_json
+
+SIZES = (MB // 16, MB // 4, MB)
+CHUNK = 64
+
+
+def _timed(func) -> float:
+    started = time.perf_counter()
+    try:
+        func()
+    except json.JSONDecodeError:
+        pass
+    return time.perf_counter() - started
+
+
+def _chunked(text: str):
+    parser = TolerantJsonParser(allow_array_root=True)
+    for index in range(0, len(text), CHUNK):
+        parser.feed(text[index:index + CHUNK])
+    parser.finish()
+
+
+def main():
+    print(f"{'input':<16}{'size':>8}{'one-shot':>12}{'chunked':>12}{'one-shot/MB':>14}")
+    for name, build in sorted(ADVERSARIAL.items()):
+        for size in SIZES:
+            text = build(size)
+            one_shot = _timed(lambda: repair_json(text, allow_array_root=True))
+            chunked = _timed(lambda: _chunked(text))
+            print(f"{name:<16}{size // 1024:>6}KB{one_shot:>11.3f}s{chunked:>11.3f}s{one_shot / (len(text) / MB):>13.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark repetition removal before and after the local synonym rewriter
+
+Runs a corpus of synthetic repetitive resumes through both flows of
+ResumeImprovementService with a fake model that answers instantly:
+
+    before  detect -> LLM rephrase, repeated up to 5 times until nothing is flagged
+    after   detect -> local rewrite -> one LLM rephrase for leftovers only -> local pass
+
+and reports local CPU time per resume, LLM calls, and the wall time those calls would add at
+an assumed rephrase latency. Two corpora are used: verbs and adjectives only (the graph can fix
+everything), and one that also repeats "microservices" (no synonyms, so the LLM is needed).
+
+Usage:
+    python benchmarks/bench_repetition_rewriter.py
+"""
+
+import copy
+import json
+import logging
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.resume_improvement_service import ResumeImprovementService
+from utils.repetition_rewriter import rewrite_repetitions
+
+RESUMES = 200
+REPHRASE_LATENCY = 2.5  # Assumed seconds for one ~1200-token rephrase; not slept
+VERBS = ["developed", "managed", "implemented", "built", "led", "optimized", "designed", "improved", "deployed", "created"]
+TERMS = ["scalable", "robust", "efficient", "secure", "reliable", "real-time"]
+NOUNS = ["service", "pipeline", "platform", "dashboard"]
+
+
+class FakeCompletions:
+    """Rephrase oracle: rewrites the flagged items and replaces repeated "microservices" """
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        payload = json.loads(kwargs["messages"][-1]["content"].split("INPUT:", 1)[1])
+        output: Dict[str, Any] = {"experience": [], "projects": [], "summary": None, "objective": None}
+        for section in ("experience", "projects"):
+            for entry in payload[section]:
+                text = entry["text"]
+                first = text.find("microservices") + 1
+                if first:
+                    text = text[:first] + text[first:].replace("microservices", "services")
+                output[section].append({"index": entry["index"], "description": rewrite_repetitions(text)[0]})
+        for field in ("summary", "objective"):
+            if payload.get(field):
+                output[field] = rewrite_repetitions(payload[field])[0]
+        message = SimpleNamespace(content=json.dumps(output))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+def make_corpus(terms: List[str], rnd: random.Random) -> List[Dict[str, Any]]:
+    def description() -> str:
+        return "\n".join(
+            f"{rnd.choice(VERBS).capitalize()} {rnd.choice(['a', 'an'])} {rnd.choice(terms)} {rnd.choice(NOUNS)} "
+            f"using {rnd.choice(terms)} patterns."
+            for _ in range(rnd.randint(4, 8))
+        )
+    return [
+        {
+            "summary": "Engineer who developed scalable systems and developed robust, scalable tools.",
+            "experience": [{"description": description()} for _ in range(3)],
+            "projects": [{"description": description()} for _ in range(3)],
+        }
+        for _ in range(RESUMES)
+    ]
+
+
+def before(service: ResumeImprovementService, resume: Dict[str, Any]) -> Dict[str, Any]:
+    for _ in range(5):
+        report = service._detect_repetitions_in_resume(resume)
+        if not report["issues_by_item"]:
+            break
+        resume = service._rephrase_resume_to_remove_repetition(resume, report)
+    return resume
+
+
+def after(service: ResumeImprovementService, resume: Dict[str, Any]) -> Dict[str, Any]:
+    report = service._detect_repetitions_in_resume(resume)
+    if report["issues_by_item"]:
+        leftovers = service._rewrite_repetitions_locally(resume, report)
+        if leftovers["issues_by_item"]:
+            resume = service._rephrase_resume_to_remove_repetition(resume, leftovers)
+            service._rewrite_repetitions_locally(resume, service._detect_repetitions_in_resume(resume))
+    return resume
+
+
+def _repeated_count(service: ResumeImprovementService, resume: Dict[str, Any]) -> int:
+    issues = service._detect_repetitions_in_resume(resume)["issues_by_item"]
+    return sum(sum(words.values()) for words in issues.values())
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    completions = FakeCompletions()
+    service = object.__new__(ResumeImprovementService)
+    service.model = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    service.model_name = "fake"
+
+    rnd = random.Random(7)
+    corpora = {
+        "verbs/adjectives": make_corpus(TERMS, rnd),
+        "with microservices": make_corpus(TERMS + ["microservices"], rnd),
+    }
+    print(f"{'corpus':<20}{'flow':<8}{'local ms/resume':>17}{'LLM calls':>11}{'LLM s/resume':>14}{'repeats left':>14}")
+    for name, corpus in corpora.items():
+        flagged = sum(_repeated_count(service, resume) for resume in corpus)
+        for label, flow in (("before", before), ("after", after)):
+            completions.calls = 0
+            resumes = copy.deepcopy(corpus)
+            started = time.perf_counter()
+            outputs = [flow(service, resume) for resume in resumes]
+            local_ms = (time.perf_counter() - started) * 1000 / len(corpus)
+            remaining = sum(_repeated_count(service, resume) for resume in outputs)
+            llm_seconds = completions.calls * REPHRASE_LATENCY / len(corpus)
+            print(f"{name:<20}{label:<8}{local_ms:>17.2f}{completions.calls:>11}{llm_seconds:>14.2f}{f'{flagged}->{remaining}':>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,88 @@ class OpenAIConfig:
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
     OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
     
+    # HTTP Connection Pool Configuration (shared client registry)
+    OPENAI_POOL_MAX_CONNECTIONS = int(os.getenv('OPENAI_POOL_MAX_CONNECTIONS', '20'))
+    OPENAI_POOL_MAX_KEEPALIVE = int(os.getenv('OPENAI_POOL_MAX_KEEPALIVE', '10'))
+    OPENAI_POOL_KEEPALIVE_EXPIRY = float(os.getenv('OPENAI_POOL_KEEPALIVE_EXPIRY', '60'))
+    OPENAI_TIMEOUT_SECONDS = float(os.getenv('OPENAI_TIMEOUT_SECONDS', '120'))
+    OPENAI_CONNECT_TIMEOUT_SECONDS = float(os.getenv('OPENAI_CONNECT_TIMEOUT_SECONDS', '10'))
+    OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', '2'))
+    
     # PDF Processing Configuration
     MAX_PDF_SIZE_MB = int(os.getenv('MAX_PDF_SIZE_MB', '10'))
     SUPPORTED_FORMATS = ['.pdf', '.docx', '.txt']
     
+    # Extraction Cache Configuration (content-addressed by SHA-256 of file bytes)
+    EXTRACTION_CACHE_ENABLED = os.getenv('EXTRACTION_CACHE_ENABLED', 'true').lower() == 'true'
+    EXTRACTION_CACHE_MAX_ENTRIES = int(os.getenv('EXTRACTION_CACHE_MAX_ENTRIES', '256'))
+    EXTRACTION_CACHE_DIR = os.getenv('EXTRACTION_CACHE_DIR', '')  # Empty disables the on-disk tier
+    EXTRACTION_CACHE_MAX_DISK_MB = int(os.getenv('EXTRACTION_CACHE_MAX_DISK_MB', '100'))
+    
+    # LLM Response Cache Configuration (low-temperature calls only)
+    LLM_CACHE_BACKEND = os.getenv('LLM_CACHE_BACKEND', 'memory').lower()  # memory, sqlite or none
+    LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', 'llm_cache.sqlite3')
+    LLM_CACHE_TTL_SECONDS = float(os.getenv('LLM_CACHE_TTL_SECONDS', '86400'))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '512'))
+    LLM_CACHE_MAX_TEMPERATURE = float(os.getenv('LLM_CACHE_MAX_TEMPERATURE', '0.2'))
+    
+    # Structured Outputs Configuration
+    # Request JSON-schema (strict) or JSON-mode responses built from the Pydantic response models
+    STRUCTURED_OUTPUTS_ENABLED = os.getenv('STRUCTURED_OUTPUTS_ENABLED', 'true').lower() == 'true'
+    
+    # Completion Budget Configuration (adaptive max_tokens, continuation of truncated completions)
+    COMPLETION_CONTINUATION_ROUNDS = int(os.getenv('COMPLETION_CONTINUATION_ROUNDS', '2'))  # 0 disables continuation
+    COMPLETION_MAX_TOKENS_CEILING = int(os.getenv('COMPLETION_MAX_TOKENS_CEILING', '8192'))
+    COMPLETION_TOKEN_HEADROOM = float(os.getenv('COMPLETION_TOKEN_HEADROOM', '1.25'))  # Multiplier on the estimated output size
+    
+    # Resume Session Store Configuration (upload once, reference by resume_id)
+    RESUME_STORE_BACKEND = os.getenv('RESUME_STORE_BACKEND', 'memory').lower()  # memory or sqlite
+    RESUME_STORE_PATH = os.getenv('RESUME_STORE_PATH', 'resume_sessions.sqlite3')
+    RESUME_STORE_TTL_SECONDS = float(os.getenv('RESUME_STORE_TTL_SECONDS', '3600'))  # Idle time before a session is dropped
+    RESUME_STORE_MAX_ENTRIES = int(os.getenv('RESUME_STORE_MAX_ENTRIES', '256'))
+
+    # Augmentation Configuration
+    # Max parallel FIX_* suggestion calls per request (1 = sequential)
+    AUGMENT_MAX_CONCURRENCY = int(os.getenv('AUGMENT_MAX_CONCURRENCY', '4'))
+    # Send all FIX_ACHIEVEMENT items in one request, retrying only malformed ones
+    AUGMENT_BATCH_ACHIEVEMENTS = os.getenv('AUGMENT_BATCH_ACHIEVEMENTS', 'true').lower() == 'true'
+
+    # AI Suggestions Configuration
+    # Generate the job description while the resume is being parsed (experience level estimated from raw text)
+    AI_SUGGESTIONS_PIPELINED = os.getenv('AI_SUGGESTIONS_PIPELINED', 'true').lower() == 'true'
+
+    # Resume Improvement Configuration
+    # patch: the model returns targeted edits applied locally; full: the model rewrites the whole resume
+    RESUME_IMPROVEMENT_MODE = os.getenv('RESUME_IMPROVEMENT_MODE', 'patch').lower()
+
+    # Persistent Worker Configuration (python worker.py)
+    # Requests one worker process handles at the same time
+    WORKER_MAX_CONCURRENCY = int(os.getenv('WORKER_MAX_CONCURRENCY', '8'))
+
+    # Skill Taxonomy Configuration
+    # Optional .tsv or .json file of extra skills and aliases merged into the built-in taxonomy
+    SKILL_TAXONOMY_PATH = os.getenv('SKILL_TAXONOMY_PATH', '')
+
+    # Bulk JD Screening Configuration (one job description vs many resumes)
+    BULK_MAX_RESUMES = int(os.getenv('BULK_MAX_RESUMES', '200'))
+    # Resumes analyzed by the LLM at the same time
+    BULK_MAX_CONCURRENCY = int(os.getenv('BULK_MAX_CONCURRENCY', '4'))
+    BULK_EXTRACTION_WORKERS = int(os.getenv('BULK_EXTRACTION_WORKERS', '4'))
+
+    # Batch Processing Configuration (python main.py batch)
+    # Resumes in the LLM stages (parse, ATS) at the same time
+    BATCH_CONCURRENCY = int(os.getenv('BATCH_CONCURRENCY', '8'))
+    # Processes for PDF/DOCX text extraction
+    BATCH_EXTRACTION_WORKERS = int(os.getenv('BATCH_EXTRACTION_WORKERS', '4'))
+
+    # Async Server Configuration (web_ui_async.py)
+    # Threads for PDF/DOCX text extraction
+    ASYNC_EXTRACTION_WORKERS = int(os.getenv('ASYNC_EXTRACTION_WORKERS', '4'))
+    # Threads for multi-call pipelines that still run on the sync client (suggestions, improvement, augmentation)
+    ASYNC_SERVICE_WORKERS = int(os.getenv('ASYNC_SERVICE_WORKERS', '64'))
+
     # Parsing Configuration
+    # Static instructions sent as the system prefix; the resume text follows in the user message
     DEFAULT_PROMPT_TEMPLATE = """
     You are an advanced resume parsing system that handles ALL types of resumes including academic, professional, student, and non-standard formats.
     Extract all possible information from the given resume text, even if the section headings differ or are non-standard.
@@ -101,8 +178,6 @@ class OpenAIConfig:
     References: Name, Title, Company, Phone, email, relationship
     Activities: Hobbies, interests, volunteer work, achievements, awards
     
-    Resume text: {resume_text}
-    
     **IMPORTANT**: 
     1. Ensure the name field contains the complete name (first + last) as it appears on the resume
     2. Distinguish between academic projects (COURSE:) and professional experience
@@ -118,6 +193,7 @@ class OpenAIConfig:
     - Activity descriptions: Each detail should be a separate sentence ending with \n
     - Example: "Developed web applications using React and Node.js.\nImplemented responsive design for mobile devices.\nCollaborated with team of 5 developers.\n"
     
+    The resume text to parse is provided in the user message.
     Output in pure JSON format only. Return ONLY the JSON output — no explanations.
     """
     
@@ -7,12 +7,14 @@ Enhances experience or project descriptions based on user prompts
 import sys
 import json
 import logging
+from typing import Dict, Any, List
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 from services.content_enhancement_service import ContentEnhancementService
+from services.client_registry import get_service
 
 # Configure logging to show all service logs and output to stderr for Node.js to see
 logging.basicConfig(
@@ -26,68 +28,56 @@ logger = logging.getLogger(__name__)
 services_logger = logging.getLogger('services.content_enhancement_service')
 services_logger.setLevel(logging.INFO)
 
+def run(args: List[str]) -> Dict[str, Any]:
+    """Enhance content described by a JSON argument (shared with worker.py)"""
+    # Get the JSON data from command line arguments
+    if len(args) < 1:
+        raise ValueError("No data provided")
+    
+    # Parse the input data
+    input_data = json.loads(args[0])
+    
+    # Validate required fields
+    required_fields = ['content_type', 'content_data', 'enhancement_prompt']
+    for field in required_fields:
+        if field not in input_data:
+            raise ValueError(f"Missing required field: {field}")
+    
+    content_type = input_data['content_type']
+    content_data = input_data['content_data']
+    enhancement_prompt = input_data['enhancement_prompt']
+    
+    # Validate content type
+    if content_type not in ['experience', 'project']:
+        raise ValueError("content_type must be 'experience' or 'project'")
+    
+    # Extract description from content_data
+    description = content_data.get('description', '')
+    if not description.strip():
+        logger.error("Description is required in content_data")
+        raise ValueError("Description is required in content_data")
+    
+    logger.info(f"Enhancing {content_type} description")
+    
+    # Get shared enhancement service
+    enhancement_service = get_service(ContentEnhancementService)
+    
+    # Use the simplified enhance_description method
+    enhanced_result = enhancement_service.enhance_description(description, enhancement_prompt, content_type)
+    
+    logger.info("Successfully enhanced content")
+    
+    return {
+        "success": True,
+        "data": enhanced_result,
+        "content_type": content_type
+    }
+
 def main():
     """Main function to enhance content based on command line arguments"""
     try:
-        # Get the JSON data from command line arguments
-        if len(sys.argv) < 2:
-            print(json.dumps({
-                "success": False,
-                "error": "No data provided"
-            }))
-            sys.exit(1)
-        
-        # Parse the input data
-        input_data = json.loads(sys.argv[1])
-        
-        # Validate required fields
-        required_fields = ['content_type', 'content_data', 'enhancement_prompt']
-        for field in required_fields:
-            if field not in input_data:
-                print(json.dumps({
-                    "success": False,
-                    "error": f"Missing required field: {field}"
-                }))
-                sys.exit(1)
-        
-        content_type = input_data['content_type']
-        content_data = input_data['content_data']
-        enhancement_prompt = input_data['enhancement_prompt']
-        
-        # Validate content type
-        if content_type not in ['experience', 'project']:
-            print(json.dumps({
-                "success": False,
-                "error": "content_type must be 'experience' or 'project'"
-            }))
-            sys.exit(1)
-        
-        # Extract description from content_data
-        description = content_data.get('description', '')
-        if not description.strip():
-            logger.error("Description is required in content_data")
-            print(json.dumps({
-                "success": False,
-                "error": "Description is required in content_data"
-            }))
-            sys.exit(1)
-        
-        logger.info(f"Enhancing {content_type} description")
-        
-        # Initialize enhancement service
-        enhancement_service = ContentEnhancementService()
-        
-        # Use the simplified enhance_description method
-        enhanced_result = enhancement_service.enhance_description(description, enhancement_prompt, content_type)
-        
-        logger.info("Successfully enhanced content")
-        
         # Return the enhanced content
-        print(json.dumps({
-            "success": True,
-            "data": enhanced_result,
-            "content_type": content_type
-        }))
+        print(json.dumps(run(sys.argv[1:])))
         
     except Exception as e:
         logger.error(f"Content enhancement failed: {str(e)}")
@@ -13,6 +13,7 @@ from typing import Dict, Any
 
 from services.openai_parser_service import OpenAIResumeParser
 from services.resume_improvement_service import ResumeImprovementService
+from services.batch_service import ResumeBatchProcessor
 from config.config import OpenAIConfig
 
 # Configure logging
@@ -87,8 +88,99 @@ def apply_ats_suggestions(parsed_resume_data: Dict[str, Any], ats_analysis: Dict
         logger.error(f"Failed to apply ATS suggestions: {str(e)}")
         raise
 
+def batch_main(argv):
+    """Command-line interface for the batch subcommand"""
+    parser = argparse.ArgumentParser(
+        prog="main.py batch",
+        description="Parse every resume of a directory or manifest into a JSONL file",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python main.py batch resumes/ -o results.jsonl
+  python main.py batch manifest.lst -o results.jsonl --ats --concurrency 16
+  python main.py batch resumes/ -o results.jsonl --no-resume
+
+Re-running the same command after an interruption skips resumes already in the output file.
+        """
+    )
+    
+    parser.add_argument(
+        'source',
+        help='Directory of resumes (searched recursively) or manifest file with one path per line'
+    )
+    
+    parser.add_argument(
+        '-o', '--output',
+        dest='output_file',
+        required=True,
+        help='JSONL output file (one record per resume, also used as the checkpoint)'
+    )
+    
+    parser.add_argument(
+        '--ats',
+        action='store_true',
+        help='Also run the standard ATS analysis for every resume'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        help=f'Resumes in the LLM stages at the same time (default: {OpenAIConfig.BATCH_CONCURRENCY})'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help=f'Processes for text extraction (default: {OpenAIConfig.BATCH_EXTRACTION_WORKERS})'
+    )
+    
+    parser.add_argument(
+        '--no-resume',
+        action='store_true',
+        help='Start over instead of skipping resumes already in the output file'
+    )
+    
+    parser.add_argument(
+        '--api-key',
+        help='OpenAI API key (if not set in environment)'
+    )
+    
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Enable verbose logging'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    try:
+        processor = ResumeBatchProcessor(
+            api_key=args.api_key,
+            with_ats=args.ats,
+            concurrency=args.concurrency,
+            extraction_workers=args.workers
+        )
+        report = processor.run(args.source, args.output_file, resume=not args.no_resume)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        
+        if report["failed"]:
+            sys.exit(2)
+        
+    except KeyboardInterrupt:
+        logger.info("Batch interrupted - run the same command again to continue")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Fatal error: {str(e)}")
+        sys.exit(1)
+
 def main():
     """Main function for command-line interface"""
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        return batch_main(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(
         description="Parse resumes using Google Gemini API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -97,6 +189,7 @@ Examples:
   python main.py resume.pdf
   python main.py resume.pdf -o results.json
   python main.py resume.pdf --api-key YOUR_API_KEY
+  python main.py batch resumes/ -o results.jsonl
         """
     )
     
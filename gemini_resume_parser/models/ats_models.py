@@ -0,0 +1,109 @@
+"""
+Pydantic models for ATS analysis responses (standard and JD-specific)
+
+These describe what the model returns; analysis_timestamp and extracted_text are set
+server-side after the call.
+"""
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class ATSFeedbackSection(BaseModel):
+    """Model for one detailed feedback category"""
+    score: int = Field(default=0, description="Category score between 0-100")
+    title: str = Field(default="", description="Category title")
+    description: str = Field(default="", description="What this category evaluates")
+    positives: List[str] = Field(default_factory=list, description="What the resume does well")
+    negatives: List[str] = Field(default_factory=list, description="What the resume lacks")
+    suggestions: List[str] = Field(default_factory=list, description="Actionable suggestions (ADD_SKILLS, FIX_REPETITION, ...)")
+    specific_issues: List[str] = Field(default_factory=list, description="Exact problems found")
+    improvement_examples: List[str] = Field(default_factory=list, description="Before/after examples")
+
+
+class ATSCategoryScores(BaseModel):
+    """Model for standard ATS category scores"""
+    keyword_usage_placement: int = 0
+    skills_match_alignment: int = 0
+    formatting_layout_ats: int = 0
+    section_organization: int = 0
+    achievements_impact_metrics: int = 0
+    grammar_spelling_quality: int = 0
+    header_consistency: int = 0
+    clarity_brevity: int = 0
+    repetition_avoidance: int = 0
+    contact_information_completeness: int = 0
+    resume_length_optimization: int = 0
+
+
+class ATSDetailedFeedback(BaseModel):
+    """Model for standard ATS detailed feedback"""
+    keyword_usage_placement: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    skills_match_alignment: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    formatting_layout_ats: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    section_organization: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    achievements_impact_metrics: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    grammar_spelling_quality: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    header_consistency: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    clarity_brevity: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    repetition_avoidance: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    contact_information_completeness: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    resume_length_optimization: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+
+
+class ATSAnalysisResponse(BaseModel):
+    """Main model for standard ATS analysis response"""
+    overall_score: int = Field(default=0, description="Weighted average of all category scores (0-100)")
+    category_scores: ATSCategoryScores = Field(default_factory=ATSCategoryScores)
+    detailed_feedback: ATSDetailedFeedback = Field(default_factory=ATSDetailedFeedback)
+    strengths: List[str] = Field(default_factory=list, description="Specific strengths")
+    weaknesses: List[str] = Field(default_factory=list, description="Specific weaknesses")
+    recommendations: List[str] = Field(default_factory=list, description="One recommendation per issue found")
+
+
+class JDCategoryScores(BaseModel):
+    """Model for JD-specific ATS category scores"""
+    keyword_match_skills: int = 0
+    experience_relevance: int = 0
+    education_certifications: int = 0
+    achievements_impact: int = 0
+    formatting_structure: int = 0
+    soft_skills_match: int = 0
+    repetition_avoidance: int = 0
+    contact_information_completeness: int = 0
+    resume_length_optimization: int = 0
+
+
+class JDDetailedFeedback(BaseModel):
+    """Model for JD-specific ATS detailed feedback"""
+    keyword_match_skills: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    experience_relevance: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    education_certifications: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    achievements_impact: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    formatting_structure: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    soft_skills_match: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    repetition_avoidance: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    contact_information_completeness: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+    resume_length_optimization: ATSFeedbackSection = Field(default_factory=ATSFeedbackSection)
+
+
+class JDSpecificATSResponse(BaseModel):
+    """Main model for JD-specific ATS analysis response"""
+    overall_score: int = Field(default=0, description="Weighted average of all category scores (0-100)")
+    match_percentage: int = Field(default=0, description="Percentage of job requirements met (0-100)")
+    missing_keywords: List[str] = Field(default_factory=list, description="Job keywords missing from the resume")
+    category_scores: JDCategoryScores = Field(default_factory=JDCategoryScores)
+    detailed_feedback: JDDetailedFeedback = Field(default_factory=JDDetailedFeedback)
+    strengths: List[str] = Field(default_factory=list, description="Strengths relevant to the job")
+    weaknesses: List[str] = Field(default_factory=list, description="Weaknesses relevant to the job")
+    recommendations: List[str] = Field(default_factory=list, description="Job-focused recommendations")
+
+
+class FixAchievementLine(BaseModel):
+    """Model for one batched FIX_ACHIEVEMENT line"""
+    id: str = Field(default="", description="Id of the input item")
+    line: str = Field(default="", description="Single FIX_ACHIEVEMENT line")
+
+
+class FixAchievementBatchResponse(BaseModel):
+    """Model for the batched FIX_ACHIEVEMENT response"""
+    lines: List[FixAchievementLine] = Field(default_factory=list, description="One entry per input item")
@@ -0,0 +1,139 @@
+"""
+Pydantic models for resume parsing and improvement responses
+
+Field names follow the frontend conventions produced by the parser's frontend mapping.
+Skills are returned as a list of categories so the schema has no free-form keys; the
+parser folds them back into the {category: [skills]} object.
+"""
+from typing import Any, List, Optional
+from pydantic import BaseModel, Field
+
+
+class BasicDetails(BaseModel):
+    """Model for contact and header details"""
+    fullName: str = Field(default="", description="Full name (first and last)")
+    professionalTitle: str = ""
+    phone: str = ""
+    email: str = ""
+    location: str = ""
+    website: str = ""
+    github: str = ""
+    linkedin: str = ""
+
+
+class SkillCategory(BaseModel):
+    """Model for one skill category as it appears in the resume"""
+    category: str = Field(default="", description="Original category name, e.g. 'Languages' or 'Frameworks'")
+    skills: List[str] = Field(default_factory=list, description="Skills listed under the category")
+
+
+class EducationEntry(BaseModel):
+    """Model for an education entry"""
+    institution: str = ""
+    degree: str = ""
+    year: str = Field(default="", description="End or graduation date")
+    grade: str = ""
+    description: str = ""
+    location: str = ""
+
+
+class ExperienceEntry(BaseModel):
+    """Model for an employment entry"""
+    company: str = ""
+    position: str = ""
+    startDate: str = ""
+    endDate: str = ""
+    description: str = ""
+    location: str = ""
+
+
+class ProjectEntry(BaseModel):
+    """Model for a project entry"""
+    name: str = ""
+    techStack: str = Field(default="", description="Comma-separated technologies")
+    startDate: str = ""
+    endDate: str = ""
+    description: str = ""
+    link: str = ""
+
+
+class CertificationEntry(BaseModel):
+    """Model for a certification entry"""
+    certificateName: str = ""
+    link: str = ""
+    issueDate: str = ""
+    instituteName: str = ""
+
+
+class LanguageEntry(BaseModel):
+    """Model for a spoken language"""
+    name: str = ""
+    proficiency: str = ""
+
+
+class ActivityEntry(BaseModel):
+    """Model for an activity, award or interest"""
+    title: str = ""
+    description: str = ""
+
+
+class ReferenceEntry(BaseModel):
+    """Model for a reference contact"""
+    name: str = ""
+    title: str = ""
+    company: str = ""
+    phone: str = ""
+    email: str = ""
+    relationship: str = ""
+
+
+class ParsedResumeResponse(BaseModel):
+    """Main model for resume parsing response"""
+    basicDetails: BasicDetails = Field(default_factory=BasicDetails)
+    summary: str = ""
+    objective: str = ""
+    skills: List[SkillCategory] = Field(default_factory=list)
+    education: List[EducationEntry] = Field(default_factory=list)
+    experience: List[ExperienceEntry] = Field(default_factory=list)
+    projects: List[ProjectEntry] = Field(default_factory=list)
+    certifications: List[CertificationEntry] = Field(default_factory=list)
+    languages: List[LanguageEntry] = Field(default_factory=list)
+    activities: List[ActivityEntry] = Field(default_factory=list)
+    references: List[ReferenceEntry] = Field(default_factory=list)
+
+
+class RephrasedDescription(BaseModel):
+    """Model for one rewritten description addressed by its list index"""
+    index: int = 0
+    description: str = ""
+
+
+class RepetitionRephraseResponse(BaseModel):
+    """Model for the repetition-removal rephrase response"""
+    experience: List[RephrasedDescription] = Field(default_factory=list)
+    projects: List[RephrasedDescription] = Field(default_factory=list)
+    summary: Optional[str] = Field(default=None, description="Rewritten summary, or null if it was not part of the input")
+    objective: Optional[str] = Field(default=None, description="Rewritten objective, or null if it was not part of the input")
+
+
+class ProjectTechStack(BaseModel):
+    """Model for the technologies of one project addressed by its list index"""
+    index: int = 0
+    tech_stack: List[str] = Field(default_factory=list)
+
+
+class TechStackBatchResponse(BaseModel):
+    """Model for the batched project tech-stack response"""
+    projects: List[ProjectTechStack] = Field(default_factory=list)
+
+
+class ResumePatchOperation(BaseModel):
+    """Model for one JSON-Patch-style edit of the parsed resume"""
+    op: str = Field(default="replace", description="add, replace or remove")
+    path: str = Field(default="", description="JSON Pointer, list items addressed by id, e.g. /experience/exp-0/description")
+    value: Any = Field(default=None, description="New field value or item (omitted for remove)")
+
+
+class ResumePatchResponse(BaseModel):
+    """Model for the patch-mode resume improvement response"""
+    operations: List[ResumePatchOperation] = Field(default_factory=list)
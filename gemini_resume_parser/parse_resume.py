@@ -7,25 +7,30 @@ Standalone script for parsing resume files
 import json
 import sys
 import logging
+from typing import Dict, Any, List
 from services.openai_parser_service import OpenAIResumeParser
+from services.client_registry import get_service
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def run(args: List[str]) -> Dict[str, Any]:
+    """Parse the resume file given as the first argument (shared with worker.py)"""
+    if len(args) < 1:
+        raise ValueError("File path required")
+    
+    file_path = args[0]
+    
+    # Get shared parser
+    parser = get_service(OpenAIResumeParser)
+    
+    # Parse resume
+    return parser.parse_resume_from_file(file_path)
+
 def main():
     try:
-        # Read file path from command line argument
-        if len(sys.argv) < 2:
-            raise ValueError("File path required")
-        
-        file_path = sys.argv[1]
-        
-        # Initialize parser
-        parser = OpenAIResumeParser()
-        
-        # Parse resume
-        parsed_data = parser.parse_resume_from_file(file_path)
+        parsed_data = run(sys.argv[1:])
         
         # Output result as JSON
         print(json.dumps(parsed_data, ensure_ascii=False))
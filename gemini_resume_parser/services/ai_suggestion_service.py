@@ -5,9 +5,33 @@ import re
 from typing import Dict, Any, Optional
 from openai import OpenAI
 from .openai_parser_service import OpenAIResumeParser
+from utils.jd_match import jd_match_components
+from utils.structured_output import with_response_format, parse_structured
+from utils.json_stream import repair_json
+from utils.keyword_matcher import KeywordMatcher
+from utils.skill_taxonomy import skill_key
+from models.ai_suggestion_models import AIComparisonResponse, JobDescriptionResponse
 
 logger = logging.getLogger(__name__)
 
+# Level and sector indicators (whole words; "it" must not match inside "digital")
+_ENTRY_LEVEL_INDICATORS = KeywordMatcher([
+    'junior', 'jr', 'entry', 'associate', 'assistant', 'trainee', 'intern',
+    'graduate', 'fresher', 'new grad', 'recent graduate', 'student'
+])
+_SENIOR_LEVEL_INDICATORS = KeywordMatcher([
+    'senior', 'sr', 'lead', 'principal', 'architect', 'manager', 'director',
+    'head', 'chief', 'vp', 'vice president', 'executive', 'expert', 'specialist'
+])
+_TECH_SECTORS = KeywordMatcher(['technology', 'tech', 'software', 'it', 'information'])
+_CREATIVE_SECTORS = KeywordMatcher(['design', 'creative', 'art', 'media', 'marketing'])
+_MANAGEMENT_SECTORS = KeywordMatcher(['management', 'consulting', 'strategy', 'business'])
+_JD_LEVEL_TERMS = KeywordMatcher({
+    **dict.fromkeys(['senior', 'lead', 'principal', 'architect', 'manager'], 'senior'),
+    **dict.fromkeys(['mid', 'intermediate', '3+ years', '5+ years'], 'mid'),
+    **dict.fromkeys(['junior', 'entry', '0-2 years', '1-3 years'], 'entry')
+})
+
 class AISuggestionService:
     """
     AI service for generating job descriptions and resume suggestions
@@ -144,21 +168,21 @@ class AISuggestionService:
 
         try:
             logger.info(f"Generating job description with temperature={self.temperature}, top_p={self.top_p}")
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
+            response = self.client.chat.completions.create(**with_response_format({
+                "model": self.model_name,
+                "messages": [
                     {"role": "system", "content": "You are an expert global job market analyst and HR recruiter. Generate realistic, ATS-friendly job descriptions."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                max_tokens=4000
-            )
-            cleaned_response = self._clean_openai_response(response.choices[0].message.content)
-            return json.loads(cleaned_response)
+                "temperature": self.temperature,
+                "top_p": self.top_p,
+                "max_tokens": 4000
+            }, JobDescriptionResponse, "job_description"))
+            response_text = response.choices[0].message.content
+            return parse_structured(response_text, "legacy.job_description", repair_json)
         except json.JSONDecodeError as json_error:
             logger.error(f"Failed to parse OpenAI JSON response for job description: {str(json_error)}")
-            logger.error(f"Raw response: {cleaned_response}")
+            logger.error(f"Raw response: {response_text}")
             raise Exception(f"Invalid JSON response from AI: {str(json_error)}")
         except Exception as e:
             logger.error(f"Failed to generate job description: {str(e)}")
@@ -324,16 +348,16 @@ class AISuggestionService:
         try:
             logger.info(f"Comparing resume with JD using temperature={self.temperature}, top_p={self.top_p}")
             logger.info(f"🔍 Starting AI response generation...")
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
+            response = self.client.chat.completions.create(**with_response_format({
+                "model": self.model_name,
+                "messages": [
                     {"role": "system", "content": "You are an expert resume optimization specialist and career coach. Provide detailed, actionable suggestions for resume improvement."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                max_tokens=4000
-            )
+                "temperature": self.temperature,
+                "top_p": self.top_p,
+                "max_tokens": 4000
+            }, AIComparisonResponse, "resume_comparison"))
             
             # Check if the response was blocked or filtered
             if hasattr(response, 'choices') and response.choices:
@@ -365,144 +389,8 @@ class AISuggestionService:
                 logger.warning("⚠️ Using comprehensive fallback response due to response access error")
                 return ai_response
             
-            # Log raw response for debugging
-            logger.info(f"🔍 Raw Gemini response length: {len(response_text)} characters")
-            logger.debug(f"🔍 Raw Gemini response: {response_text}")
-            
-            # Check if score exists in raw response
-            if 'overallScore' in response_text:
-                logger.info("✅ 'overallScore' found in raw response")
-            else:
-                logger.warning("⚠️ 'overallScore' NOT found in raw response")
-            
-            # Check for key sections in raw response
-            key_sections = ['sectionSuggestions', 'workExperience', 'skills', 'projects', 'education', 'certifications']
-            for section in key_sections:
-                if section in response_text:
-                    logger.info(f"✅ '{section}' found in raw response")
-                    # Show context around the section
-                    section_pos = response_text.find(section)
-                    if section_pos > 0:
-                        context_start = max(0, section_pos - 50)
-                        context_end = min(len(response_text), section_pos + 100)
-                        context = response_text[context_start:context_end]
-                        logger.info(f"   Context around '{section}': {context}")
-                else:
-                    logger.warning(f"⚠️ '{section}' NOT found in raw response")
-            
-            # Check for overallScore in raw response
-            if 'overallScore' in response_text:
-                score_pos = response_text.find('overallScore')
-                if score_pos > 0:
-                    context_start = max(0, score_pos - 30)
-                    context_end = min(len(response_text), score_pos + 50)
-                    score_context = response_text[context_start:context_end]
-                    logger.info(f"   Context around 'overallScore': {score_context}")
-            
-            cleaned_response = self._clean_openai_response(response_text)
-            logger.info(f"🔍 Cleaned response length: {len(cleaned_response)} characters")
-            logger.debug(f"🔍 Cleaned response: {cleaned_response}")
-            
-            # Check if score exists in cleaned response
-            if 'overallScore' in cleaned_response:
-                logger.info("✅ 'overallScore' found in cleaned response")
-            else:
-                logger.warning("⚠️ 'overallScore' NOT found in cleaned response")
-            
-            # Check if cleaning removed important sections
-            if "workExperience" in response_text and "workExperience" not in cleaned_response:
-                logger.warning("⚠️ WARNING: workExperience section was removed during cleaning!")
-            if "sectionSuggestions" in response_text and "sectionSuggestions" not in cleaned_response:
-                logger.warning("⚠️ WARNING: sectionSuggestions was removed during cleaning!")
-            if "overallScore" in response_text and "overallScore" not in cleaned_response:
-                logger.error("🚨 CRITICAL: overallScore was removed during cleaning!")
-            
-            # Log the first 200 characters of cleaned response for debugging
-            logger.info(f"🔍 First 200 chars of cleaned response: {cleaned_response[:200]}")
-            logger.info(f"🔍 Last 200 chars of cleaned response: {cleaned_response[-200:]}")
-            
-            # Check if the response contains the expected structure
-            expected_keys = ['overallScore', 'sectionSuggestions', 'workExperience', 'skills']
-            missing_keys = [key for key in expected_keys if key not in cleaned_response]
-            
-            # Initialize present_keys to avoid reference error
-            present_keys = []
-            for key in ['existing', 'rewrite', 'recommendations', 'overallScore', 'sectionSuggestions', 'workExperience', 'skills', 'projects', 'education', 'certifications']:
-                if key in cleaned_response:
-                    present_keys.append(key)
-            
-            if missing_keys:
-                logger.warning(f"⚠️ Missing expected keys in cleaned response: {missing_keys}")
-                logger.warning(f"⚠️ This suggests the JSON extraction is incomplete")
-                
-                logger.info(f"🔍 Keys actually present in cleaned response: {present_keys}")
-                
-                # If we only have fragment keys, this is a problem
-                if set(present_keys).issubset({'existing', 'rewrite', 'recommendations'}):
-                    logger.error("🚨 CRITICAL: Only fragment keys found - JSON extraction is incomplete!")
-                    logger.error("🚨 The system extracted only a portion of the response instead of the complete structure")
-            else:
-                logger.info(f"✅ All expected keys found in cleaned response")
-            
-            # Check if the response is incomplete (only fragment keys)
-            if set(present_keys).issubset({'existing', 'rewrite', 'recommendations'}):
-                logger.error("🚨 Detected incomplete JSON response - attempting recovery...")
-                
-                # Try to extract the complete response again with more aggressive methods
-                logger.info("🔄 Attempting aggressive JSON recovery...")
-                recovered_response = self._aggressive_json_recovery(response_text)
-                
-                if recovered_response and recovered_response != cleaned_response:
-                    logger.info(f"🔄 Recovered response length: {len(recovered_response)} characters")
-                    cleaned_response = recovered_response
-                    
-                    # Re-check the keys
-                    present_keys = []
-                    for key in ['existing', 'rewrite', 'recommendations', 'overallScore', 'sectionSuggestions', 'workExperience', 'skills', 'projects', 'education', 'certifications']:
-                        if key in cleaned_response:
-                            present_keys.append(key)
-                    
-                    logger.info(f"🔍 Keys after recovery: {present_keys}")
-            
-            # Additional check for incomplete JSON structure
-            if 'sectionSuggestions' in cleaned_response and not cleaned_response.strip().startswith('{"overallScore"'):
-                logger.info("🔍 Detected potentially incomplete JSON structure, attempting to fix...")
-                fixed_response = self._detect_and_fix_incomplete_json(cleaned_response)
-                if fixed_response != cleaned_response:
-                    logger.info(f"🔄 Fixed incomplete JSON structure: {len(fixed_response)} characters")
-                    cleaned_response = fixed_response
-            
-            try:
-                ai_response = json.loads(cleaned_response)
-                logger.info(f"✅ Successfully parsed JSON response with {len(cleaned_response)} characters")
-            except json.JSONDecodeError as json_error:
-                logger.error(f"🚨 Failed to parse cleaned JSON response: {str(json_error)}")
-                logger.error(f"🚨 Cleaned response that failed: {cleaned_response}")
-                
-                # Try to extract a valid JSON portion
-                logger.info("🔄 Attempting to extract valid JSON portion...")
-                valid_json = self._extract_and_fix_json(cleaned_response)
-                
-                try:
-                    ai_response = json.loads(valid_json)
-                    logger.info(f"✅ Successfully parsed extracted JSON: {len(valid_json)} characters")
-                except json.JSONDecodeError as second_error:
-                    logger.error(f"🚨 Even extracted JSON failed: {str(second_error)}")
-                    # Create a minimal fallback response
-                    ai_response = {
-                        "overallScore": 0,  # Will be calculated dynamically
-                        "analysisTimestamp": datetime.datetime.utcnow().isoformat() + "Z",
-                        "sectionSuggestions": {
-                            "professionalSummary": {"existing": "", "rewrite": "", "recommendations": [""]},
-                            "skills": {"existing": [], "rewrite": [], "recommendations": [""]},
-                            "workExperience": [],
-                            "projects": [],
-                            "education": {"existing": [], "rewrite": "", "recommendations": [""]},
-                            "certifications": {"existing": [], "rewrite": "", "recommendations": [""]}
-                        },
-                        "topRecommendations": [""]
-                    }
-                    logger.warning("⚠️ Using fallback response structure")
+            # Structured outputs parse directly; the tolerant parser only runs if that fails
+            ai_response = parse_structured(response_text, "legacy.compare_resume", self._recover_comparison_response)
             
             # Enforce schema compliance - ensure all required sections are present
             logger.info(f"🔍 Starting schema compliance enforcement...")
@@ -541,6 +429,7 @@ class AISuggestionService:
                 logger.warning("⚠️ No sectionSuggestions in AI response")
             
             # Validate that skills suggestions only reference existing categories and remove duplicate skills
+            # (skills compare by canonical taxonomy key, so "JS" is a duplicate of "JavaScript")
             if 'sectionSuggestions' in ai_response and 'skills' in ai_response['sectionSuggestions']:
                 skills_suggestions = ai_response['sectionSuggestions']['skills']
                 if 'rewrite' in skills_suggestions and isinstance(skills_suggestions['rewrite'], list):
@@ -557,22 +446,22 @@ class AISuggestionService:
                             if isinstance(skill_list, list):
                                 for skill in skill_list:
                                     if skill and str(skill).strip():
-                                        existing_skills.add(str(skill).strip().lower())
+                                        existing_skills.add(skill_key(skill))
                             elif isinstance(skill_list, str) and skill_list.strip():
-                                existing_skills.add(skill_list.strip().lower())
+                                existing_skills.add(skill_key(skill_list))
                     elif isinstance(skills_data, list):
                         # If skills is a flat list, treat all skills as uncategorized
                         existing_skills = set()
                         for skill in skills_data:
                             if skill and str(skill).strip():
-                                existing_skills.add(str(skill).strip().lower())
+                                existing_skills.add(skill_key(skill))
                         logger.info(f"Skills data is a list with {len(existing_skills)} unique skills")
                     elif isinstance(skills_data, str):
                         # If skills is a string, split and add to existing skills
                         existing_skills = set()
                         if skills_data.strip():
                             skills_list = [skill.strip() for skill in skills_data.split(',') if skill.strip()]
-                            existing_skills.update([skill.lower() for skill in skills_list])
+                            existing_skills.update(skill_key(skill) for skill in skills_list)
                         logger.info(f"Skills data is a string with {len(existing_skills)} unique skills")
                     else:
                         logger.warning(f"Unexpected skills data type: {type(skills_data)}")
@@ -589,9 +478,9 @@ class AISuggestionService:
                                 if isinstance(skill_list, list):
                                     for skill in skill_list:
                                         if skill and str(skill).strip():
-                                            category_skills.add(str(skill).strip().lower())
+                                            category_skills.add(skill_key(skill))
                                 elif isinstance(skill_list, str) and skill_list.strip():
-                                    category_skills.add(skill_list.strip().lower())
+                                    category_skills.add(skill_key(skill_list))
                                 existing_skills_per_category[category] = category_skills
                         
                         for skill_line in skills_suggestions['rewrite']:
@@ -611,7 +500,7 @@ class AISuggestionService:
                                         
                                         for skill in individual_skills:
                                             # Check if skill exists in this specific category
-                                            if skill.lower() not in category_existing_skills:
+                                            if skill_key(skill) not in category_existing_skills:
                                                 new_skills.append(skill)
                                                 logger.info(f"Adding new skill to {category}: {skill}")
                                             else:
@@ -634,7 +523,7 @@ class AISuggestionService:
                                         individual_skills = [skill.strip() for skill in skills_part.split(',') if skill.strip()]
                                         new_skills = []
                                         for skill in individual_skills:
-                                            if skill.lower() not in existing_skills:
+                                            if skill_key(skill) not in existing_skills:
                                                 new_skills.append(skill)
                                             else:
                                                 logger.info(f"Filtering out duplicate skill: {skill} (already exists)")
@@ -651,7 +540,7 @@ class AISuggestionService:
                                 # Single skill without category, check if it already exists
                                 if isinstance(skill_line, str) and skill_line.strip():
                                     skill_name = skill_line.strip()
-                                    if skill_name.lower() not in existing_skills:
+                                    if skill_key(skill_name) not in existing_skills:
                                         filtered_rewrite.append(skill_line)
                                         logger.info(f"Keeping single skill suggestion: {skill_name}")
                                     else:
@@ -668,7 +557,7 @@ class AISuggestionService:
             return ai_response
         except json.JSONDecodeError as json_error:
             logger.error(f"🚨 Failed to parse Gemini JSON response: {str(json_error)}")
-            logger.error(f"🚨 Raw response: {cleaned_response}")
+            logger.error(f"🚨 Raw response: {response_text}")
             
             # Try to create a fallback response instead of raising an error
             logger.info("🔄 JSON parsing failed, creating fallback response...")
@@ -758,10 +647,10 @@ class AISuggestionService:
         skills_data = None
         
         # Try different possible keys for skills
-        for skill_key in ['skills', 'technical_skills', 'technicalSkills', 'expertise', 'competencies']:
-            if skill_key in resume_data:
-                skills_data = resume_data[skill_key]
-                logger.info(f"Found skills under key '{skill_key}': {type(skills_data)} - {skills_data}")
+        for field_name in ['skills', 'technical_skills', 'technicalSkills', 'expertise', 'competencies']:
+            if field_name in resume_data:
+                skills_data = resume_data[field_name]
+                logger.info(f"Found skills under key '{field_name}': {type(skills_data)} - {skills_data}")
                 skills_found = True
                 break
         
@@ -1298,28 +1187,16 @@ class AISuggestionService:
             sector_lower = sector.lower()
             designation_lower = designation.lower()
             
-            # Entry level indicators (typically junior positions)
-            entry_level_indicators = [
-                'junior', 'jr', 'entry', 'associate', 'assistant', 'trainee', 'intern',
-                'graduate', 'fresher', 'new grad', 'recent graduate', 'student'
-            ]
-            
-            # Senior level indicators (typically leadership/experienced positions)
-            senior_level_indicators = [
-                'senior', 'sr', 'lead', 'principal', 'architect', 'manager', 'director',
-                'head', 'chief', 'vp', 'vice president', 'executive', 'expert', 'specialist'
-            ]
-            
             # Check designation for level indicators
-            if any(indicator in designation_lower for indicator in entry_level_indicators):
+            if _ENTRY_LEVEL_INDICATORS.contains_any(designation_lower):
                 logger.info(f"🎯 Designation suggests Entry level: {designation}")
                 return "Entry level"
-            elif any(indicator in designation_lower for indicator in senior_level_indicators):
+            elif _SENIOR_LEVEL_INDICATORS.contains_any(designation_lower):
                 logger.info(f"🎯 Designation suggests Senior level: {designation}")
                 return "Senior level"
             
             # Check sector-specific patterns
-            if any(tech_sector in sector_lower for tech_sector in ['technology', 'tech', 'software', 'it', 'information']):
+            if _TECH_SECTORS.contains_any(sector_lower):
                 # Tech sector often requires more experience
                 if 'junior' in designation_lower or 'entry' in designation_lower:
                     return "Entry level"
@@ -1329,14 +1206,14 @@ class AISuggestionService:
                     # Default to Mid level for tech sector
                     return "Mid level"
             
-            elif any(creative_sector in sector_lower for creative_sector in ['design', 'creative', 'art', 'media', 'marketing']):
+            elif _CREATIVE_SECTORS.contains_any(sector_lower):
                 # Creative sectors often have entry-level opportunities
                 if 'senior' in designation_lower or 'lead' in designation_lower:
                     return "Senior level"
                 else:
                     return "Mid level"
             
-            elif any(management_sector in sector_lower for management_sector in ['management', 'consulting', 'strategy', 'business']):
+            elif _MANAGEMENT_SECTORS.contains_any(sector_lower):
                 # Management/consulting often requires experience
                 if 'junior' in designation_lower or 'associate' in designation_lower:
                     return "Mid level"
@@ -1351,373 +1228,39 @@ class AISuggestionService:
             logger.warning(f"❌ Error determining intelligent default experience: {str(e)}")
             return "Mid level"
 
-    def _clean_openai_response(self, response_text: str) -> str:
-        """Clean OpenAI API response to extract valid JSON"""
-        import re
-        import json
-        
-        logger.info(f"🧹 Cleaning OpenAI response of {len(response_text)} characters")
-        
-        # Remove markdown code blocks
-        if response_text.startswith("```json"):
-            response_text = response_text.replace("```json", "").replace("```", "")
-        elif response_text.startswith("```"):
-            response_text = response_text.replace("```", "")
+    def _recover_comparison_response(self, response_text: str) -> Dict[str, Any]:
+        """
+        Repair path for comparison responses that are not plain JSON
 
-        response_text = response_text.strip()
-        
-        # Try to find JSON content within markdown blocks first
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            # Validate the extracted JSON
-            try:
-                parsed = json.loads(json_content)
-                logger.info(f"✅ Successfully extracted JSON from markdown block: {len(json_content)} characters")
-                return json_content
-            except json.JSONDecodeError:
-                logger.warning("❌ Extracted JSON from markdown block is invalid")
-        
-        # Try to find the complete JSON response by looking for the root structure
-        # Look for responses that start with { and contain sectionSuggestions
-        if 'sectionSuggestions' in response_text:
-            logger.info("🔍 Found 'sectionSuggestions' in response, looking for complete JSON structure")
-            
-            # Find the opening brace before sectionSuggestions
-            section_start = response_text.find('sectionSuggestions')
-            if section_start > 0:
-                # Look backwards for the opening brace
-                brace_start = response_text.rfind('{', 0, section_start)
-                if brace_start > 0:
-                    # Extract from opening brace to the end
-                    potential_complete = response_text[brace_start:]
-                    logger.info(f"🔍 Found potential complete JSON starting at brace {brace_start}: {len(potential_complete)} characters")
-                    
-                    # Try to find the matching closing brace
-                    brace_count = 0
-                    end_pos = -1
-                    for i, char in enumerate(potential_complete):
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                end_pos = i + 1
-                                break
-                    
-                    if end_pos > 0:
-                        complete_json = potential_complete[:end_pos]
-                        logger.info(f"🔍 Extracted complete JSON with balanced braces: {len(complete_json)} characters")
-                        
-                        # Validate the extracted JSON
-                        try:
-                            parsed = json.loads(complete_json)
-                            logger.info(f"✅ Successfully extracted complete JSON: {len(complete_json)} characters")
-                            
-                            # Validate the structure
-                            if self._validate_json_structure(complete_json):
-                                logger.info("✅ JSON structure validation passed")
-                                return complete_json
-                            else:
-                                logger.warning("⚠️ JSON structure validation failed, trying to fix...")
-                                try:
-                                    fixed_json = self._fix_common_json_issues(complete_json)
-                                    if self._validate_json_structure(fixed_json):
-                                        logger.info("✅ Fixed JSON structure validation passed")
-                                        return fixed_json
-                                    else:
-                                        logger.warning("⚠️ Fixed JSON still fails structure validation")
-                                except Exception as fix_error:
-                                    logger.warning(f"⚠️ Error fixing JSON: {str(fix_error)}")
-                        except json.JSONDecodeError:
-                            logger.warning("❌ Complete JSON extraction failed, trying to fix...")
-                            try:
-                                fixed_json = self._fix_common_json_issues(complete_json)
-                                parsed = json.loads(fixed_json)
-                                if self._validate_json_structure(fixed_json):
-                                    logger.info("✅ Successfully fixed complete JSON with valid structure: {len(fixed_json)} characters")
-                                    return fixed_json
-                                else:
-                                    logger.warning("⚠️ Fixed JSON has invalid structure")
-                            except json.JSONDecodeError:
-                                logger.warning("❌ Fixed complete JSON still invalid")
-            
-            # Method 2: Look for the overallScore and extract from there
-            if 'overallScore' in response_text:
-                logger.info("🔍 Found 'overallScore', looking for complete JSON structure from there")
-                
-                score_start = response_text.find('overallScore')
-                if score_start > 0:
-                    # Look backwards for the opening brace
-                    brace_start = response_text.rfind('{', 0, score_start)
-                    if brace_start > 0:
-                        # Extract from opening brace to end
-                        potential_from_score = response_text[brace_start:]
-                        logger.info(f"🔍 Found potential JSON starting from overallScore: {len(potential_from_score)} characters")
-                        
-                        # Try to find the matching closing brace
-                        brace_count = 0
-                        end_pos = -1
-                        for i, char in enumerate(potential_from_score):
-                            if char == '{':
-                                brace_count += 1
-                            elif char == '}':
-                                brace_count -= 1
-                                if brace_count == 0:
-                                    end_pos = i + 1
-                                    break
-                        
-                        if end_pos > 0:
-                            complete_from_score = potential_from_score[:end_pos]
-                            logger.info(f"🔍 Extracted complete JSON from overallScore: {len(complete_from_score)} characters")
-                            
-                            # Validate the extracted JSON
-                            try:
-                                parsed = json.loads(complete_from_score)
-                                logger.info(f"✅ Successfully extracted complete JSON from overallScore: {len(complete_from_score)} characters")
-                                
-                                # Validate the structure
-                                if self._validate_json_structure(complete_from_score):
-                                    logger.info("✅ JSON structure validation passed for overallScore extraction")
-                                    return complete_from_score
-                                else:
-                                    logger.warning("⚠️ JSON structure validation failed for overallScore extraction")
-                            except json.JSONDecodeError:
-                                logger.warning("❌ overallScore JSON extraction failed")
-            
-            # Method 3: Try to reconstruct the complete structure from fragments
-            logger.info("🔍 Attempting to reconstruct complete JSON structure from fragments")
-            
-            # Look for the main sections and try to reconstruct
-            main_sections = ['professionalSummary', 'skills', 'workExperience', 'projects', 'education', 'certifications']
-            found_sections = {}
-            
-            for section in main_sections:
-                if section in response_text:
-                    # Find the section content
-                    section_start = response_text.find(section)
-                    if section_start > 0:
-                        # Look for the content after the section name
-                        content_start = response_text.find('{', section_start)
-                        if content_start > 0:
-                            # Try to extract the section content
-                            brace_count = 0
-                            end_pos = -1
-                            for i, char in enumerate(response_text[content_start:], content_start):
-                                if char == '{':
-                                    brace_count += 1
-                                elif char == '}':
-                                    brace_count -= 1
-                                    if brace_count == 0:
-                                        end_pos = i + 1
-                                        break
-                            
-                            if end_pos > 0:
-                                section_content = response_text[content_start:end_pos]
-                                found_sections[section] = section_content
-                                logger.info(f"🔍 Extracted {section} section: {len(section_content)} characters")
-            
-            if found_sections:
-                # Try to reconstruct a complete response
-                reconstructed = {
-                    "overallScore": 0,  # Will be calculated dynamically
-                    "analysisTimestamp": datetime.datetime.utcnow().isoformat() + "Z",
-                    "sectionSuggestions": {},
-                    "topRecommendations": ["Resume analysis completed with reconstructed data"]
-                }
-                
-                # Add extracted sections
-                for section_name, section_content in found_sections.items():
-                    try:
-                        # Try to parse the section content
-                        section_data = json.loads(section_content)
-                        reconstructed["sectionSuggestions"][section_name] = section_data
-                    except:
-                        # If parsing fails, create a basic structure
-                        reconstructed["sectionSuggestions"][section_name] = {
-                            "existing": "",
-                            "rewrite": "",
-                            "recommendations": [""]
-                        }
-                
-                # Add missing sections with defaults
-                for section in main_sections:
-                    if section not in reconstructed["sectionSuggestions"]:
-                        reconstructed["sectionSuggestions"][section] = {
-                            "existing": "",
-                            "rewrite": "",
-                            "recommendations": [""]
-                        }
-                
-                logger.info("✅ Fragment reconstruction completed")
-                return json.dumps(reconstructed)
-        
-        # Try to find any JSON object in the text - use more specific pattern
-        json_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            # Validate the extracted JSON
-            try:
-                parsed = json.loads(json_content)
-                logger.info(f"✅ Successfully extracted JSON object: {len(json_content)} characters")
-                return json_content
-            except json.JSONDecodeError:
-                logger.warning("❌ Extracted JSON object is invalid")
-                # Try to fix common issues
-                try:
-                    fixed_json = self._fix_common_json_issues(json_content)
-                    parsed = json.loads(fixed_json)
-                    logger.info(f"✅ Successfully fixed and parsed JSON: {len(fixed_json)} characters")
-                    return fixed_json
-                except json.JSONDecodeError:
-                    logger.warning("❌ Fixed JSON is still invalid")
-        
-        # Try to find JSON with more flexible pattern
-        json_pattern = r'(\{.*\})'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            # Validate the extracted JSON
-            try:
-                parsed = json.loads(json_content)
-                logger.info(f"✅ Successfully extracted JSON with flexible pattern: {len(json_content)} characters")
-                return json_content
-            except json.JSONDecodeError:
-                logger.warning("❌ Flexible JSON extraction failed")
-        
-        # If the entire response looks like JSON, try to clean it
-        if response_text.startswith('{') and response_text.endswith('}'):
-            # Try to fix common JSON issues
-            cleaned = self._fix_common_json_issues(response_text)
-            try:
-                parsed = json.loads(cleaned)
-                logger.info(f"✅ Successfully cleaned and parsed JSON: {len(cleaned)} characters")
-                return cleaned
-            except json.JSONDecodeError:
-                logger.warning("❌ Cleaned JSON is still invalid")
-        
-        # If all else fails, try to extract and fix the JSON
-        logger.warning("⚠️ All JSON extraction methods failed, attempting recovery")
-        return self._extract_and_fix_json(response_text)
-    
-    def _fix_common_json_issues(self, json_text: str) -> str:
-        """Fix common JSON formatting issues"""
-        # Remove any trailing commas before closing brackets/braces
-        json_text = re.sub(r',(\s*[}\]])', r'\1', json_text)
-        
-        # Fix missing quotes around property names
-        json_text = re.sub(r'([{,])\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:', r'\1"\2":', json_text)
-        
-        # Fix single quotes to double quotes
-        json_text = json_text.replace("'", '"')
-        
-        # Remove any control characters
-        json_text = ''.join(char for char in json_text if ord(char) >= 32 or char in '\n\r\t')
-        
-        # Fix common Gemini response issues
-        # Remove any text before the first {
-        first_brace = json_text.find('{')
-        if first_brace > 0:
-            json_text = json_text[first_brace:]
-            logger.info(f"🧹 Removed {first_brace} characters before first brace")
-        
-        # Remove any text after the last }
-        last_brace = json_text.rfind('}')
-        if last_brace > 0 and last_brace < len(json_text) - 1:
-            json_text = json_text[:last_brace + 1]
-            logger.info(f"🧹 Removed {len(json_text) - last_brace - 1} characters after last brace")
-        
-        # Fix common Gemini formatting issues
-        json_text = re.sub(r'```json\s*', '', json_text)
-        json_text = re.sub(r'```\s*', '', json_text)
-        
-        # Fix any remaining markdown artifacts
-        json_text = re.sub(r'^[^{]*', '', json_text)
-        json_text = re.sub(r'[^}]*$', '', json_text)
-        
-        # Ensure the structure is preserved - look for missing wrapper
-        if 'sectionSuggestions' in json_text and not json_text.strip().startswith('{"overallScore"'):
-            logger.info("🧹 Detected missing overallScore wrapper, attempting to preserve structure")
-            
-            # Check if we need to add the wrapper
-            if not json_text.strip().startswith('{'):
-                logger.warning("🧹 JSON doesn't start with {, this might cause issues")
-        
-        return json_text
-    
-    def _extract_and_fix_json(self, text: str) -> str:
-        """Extract JSON from text and attempt to fix it"""
-        import re
-        
-        logger.info(f"🔍 Attempting to extract and fix JSON from text of length {len(text)}")
-        
-        # Find the largest potential JSON object
-        json_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-        matches = re.findall(json_pattern, text, re.DOTALL)
-        
-        if matches:
-            # Sort by length to get the largest match
-            largest_match = max(matches, key=len)
-            logger.info(f"🔍 Found potential JSON object of length {len(largest_match)}")
-            
-            # Try to fix common issues
-            fixed = self._fix_common_json_issues(largest_match)
-            
-            # Validate
-            try:
-                json.loads(fixed)
-                logger.info(f"✅ Successfully extracted and fixed JSON: {len(fixed)} characters")
-                return fixed
-            except json.JSONDecodeError as e:
-                logger.warning(f"❌ Fixed JSON still invalid: {str(e)}")
-        
-        # Try alternative extraction methods
-        logger.info("🔍 Trying alternative JSON extraction methods")
-        
-        # Method 1: Find anything between { and }
-        simple_pattern = r'(\{.*\})'
-        simple_matches = re.findall(simple_pattern, text, re.DOTALL)
-        if simple_matches:
-            largest_simple = max(simple_matches, key=len)
-            logger.info(f"🔍 Found simple JSON pattern of length {len(largest_simple)}")
-            
-            # Try to fix it
-            fixed_simple = self._fix_common_json_issues(largest_simple)
-            try:
-                json.loads(fixed_simple)
-                logger.info(f"✅ Successfully extracted and fixed simple JSON: {len(fixed_simple)} characters")
-                return fixed_simple
-            except json.JSONDecodeError:
-                logger.warning("❌ Simple JSON extraction also failed")
-        
-        # Method 2: Look for specific sections that might be valid
-        logger.info("🔍 Looking for specific valid JSON sections")
-        
-        # Try to find sectionSuggestions
-        if 'sectionSuggestions' in text:
-            start_idx = text.find('sectionSuggestions')
-            if start_idx > 0:
-                # Find the opening brace before sectionSuggestions
-                brace_idx = text.rfind('{', 0, start_idx)
-                if brace_idx > 0:
-                    # Extract from opening brace to end
-                    potential_json = text[brace_idx:]
-                    logger.info(f"🔍 Found potential JSON starting with sectionSuggestions: {len(potential_json)} characters")
-                    
-                    # Try to fix and validate
-                    fixed_section = self._fix_common_json_issues(potential_json)
-                    try:
-                        json.loads(fixed_section)
-                        logger.info(f"✅ Successfully extracted sectionSuggestions JSON: {len(fixed_section)} characters")
-                        return fixed_section
-                    except json.JSONDecodeError:
-                        logger.warning("❌ sectionSuggestions JSON extraction failed")
-        
-        # If we can't extract valid JSON, return a minimal valid structure
-        logger.warning("Could not extract valid JSON from AI response, returning fallback structure")
-        return '{"error": "Invalid JSON response", "message": "Could not parse AI response"}'
+        Runs the tolerant parser (prose, fences, truncation) and, if the text holds no JSON
+        object at all, returns a minimal response structure for schema enforcement to fill.
+        """
+        logger.info(f"🔍 Raw comparison response length: {len(response_text)} characters")
+        try:
+            ai_response = repair_json(response_text)
+        except json.JSONDecodeError as json_error:
+            logger.error(f"🚨 Could not recover JSON from comparison response: {str(json_error)}")
+            logger.debug(f"🔍 Raw comparison response: {response_text}")
+            ai_response = {
+                "overallScore": 0,  # Will be calculated dynamically
+                "analysisTimestamp": datetime.datetime.utcnow().isoformat() + "Z",
+                "sectionSuggestions": {
+                    "professionalSummary": {"existing": "", "rewrite": "", "recommendations": [""]},
+                    "skills": {"existing": [], "rewrite": [], "recommendations": [""]},
+                    "workExperience": [],
+                    "projects": [],
+                    "education": {"existing": [], "rewrite": "", "recommendations": [""]},
+                    "certifications": {"existing": [], "rewrite": "", "recommendations": [""]}
+                },
+                "topRecommendations": [""]
+            }
+            logger.warning("⚠️ Using fallback response structure")
+            return ai_response
+
+        missing_keys = [key for key in ('overallScore', 'sectionSuggestions') if key not in ai_response]
+        if missing_keys:
+            logger.warning(f"⚠️ Recovered comparison response is missing {missing_keys}; schema enforcement will fill them")
+        return ai_response
 
     def _enforce_schema_compliance(self, ai_response: Dict[str, Any], resume_data: Dict[str, Any], job_description: str, target_experience: str = "Mid level") -> Dict[str, Any]:
         """
@@ -2501,10 +2044,10 @@ class AISuggestionService:
         # Check for job description keyword matches (60 points max)
         if job_description:
             job_keywords = job_description.lower().split()
-            resume_text = str(resume_data).lower()
             
-            # Count keyword matches
-            matches = sum(1 for keyword in job_keywords if keyword in resume_text)
+            # Count keyword matches: compile the JD's distinct words once, scan the resume once
+            found = KeywordMatcher(set(job_keywords)).find_keywords(str(resume_data))
+            matches = sum(1 for keyword in job_keywords if keyword in found)
             keyword_score = min(60, matches * 2)  # Max 60 points for keyword matches
             score += keyword_score
         
@@ -2723,229 +2266,6 @@ class AISuggestionService:
         logger.info("🔒 Completed final NA validation - response is guaranteed to be NA-free")
         return validated_response
 
-    def _aggressive_json_recovery(self, response_text: str) -> str:
-        """
-        Aggressively try to recover the complete JSON response when normal extraction fails.
-        """
-        logger.info("🚨 Starting aggressive JSON recovery...")
-        
-        # Method 1: Look for the largest JSON object that contains sectionSuggestions
-        if 'sectionSuggestions' in response_text:
-            logger.info("🔍 Found sectionSuggestions, looking for complete structure...")
-            
-            # Find all potential JSON objects
-            json_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-            matches = re.findall(json_pattern, response_text, re.DOTALL)
-            
-            # Filter for objects that contain sectionSuggestions
-            valid_matches = [match for match in matches if 'sectionSuggestions' in match]
-            
-            if valid_matches:
-                # Get the largest valid match
-                largest_valid = max(valid_matches, key=len)
-                logger.info(f"🔍 Found valid JSON with sectionSuggestions: {len(largest_valid)} characters")
-                
-                # Try to fix and validate
-                try:
-                    fixed = self._fix_common_json_issues(largest_valid)
-                    if self._validate_json_structure(fixed):
-                        logger.info("✅ Aggressive recovery successful!")
-                        return fixed
-                except Exception as e:
-                    logger.warning(f"⚠️ Aggressive recovery failed: {str(e)}")
-        
-        # Method 2: Look for JSON that starts with overallScore
-        if 'overallScore' in response_text:
-            logger.info("🔍 Found overallScore, looking for complete structure...")
-            
-            score_pos = response_text.find('overallScore')
-            if score_pos > 0:
-                # Look backwards for opening brace
-                brace_start = response_text.rfind('{', 0, score_pos)
-                if brace_start > 0:
-                    # Extract from opening brace to end
-                    potential = response_text[brace_start:]
-                    
-                    # Try to find balanced braces
-                    brace_count = 0
-                    end_pos = -1
-                    for i, char in enumerate(potential):
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                end_pos = i + 1
-                                break
-                    
-                    if end_pos > 0:
-                        complete = potential[:end_pos]
-                        logger.info(f"🔍 Extracted complete JSON from overallScore: {len(complete)} characters")
-                        
-                        try:
-                            fixed = self._fix_common_json_issues(complete)
-                            if self._validate_json_structure(fixed):
-                                logger.info("✅ Aggressive recovery from overallScore successful!")
-                                return fixed
-                        except Exception as e:
-                            logger.warning(f"⚠️ Aggressive recovery from overallScore failed: {str(e)}")
-        
-        # Method 3: Try to reconstruct from fragments
-        logger.info("🔍 Attempting fragment reconstruction...")
-        
-        # Look for individual sections and try to reconstruct
-        sections = {}
-        for section in ['professionalSummary', 'skills', 'workExperience', 'projects', 'education', 'certifications']:
-            if section in response_text:
-                # Find the section content
-                section_start = response_text.find(section)
-                if section_start > 0:
-                    # Look for the content after the section name
-                    content_start = response_text.find('{', section_start)
-                    if content_start > 0:
-                        # Try to extract the section content
-                        brace_count = 0
-                        end_pos = -1
-                        for i, char in enumerate(response_text[content_start:], content_start):
-                            if char == '{':
-                                brace_count += 1
-                            elif char == '}':
-                                brace_count -= 1
-                                if brace_count == 0:
-                                    end_pos = i + 1
-                                    break
-                        
-                        if end_pos > 0:
-                            section_content = response_text[content_start:end_pos]
-                            sections[section] = section_content
-                            logger.info(f"🔍 Extracted {section} section: {len(section_content)} characters")
-        
-        if sections:
-            # Try to reconstruct a complete response
-            reconstructed = {
-                "overallScore": 0,  # Will be calculated dynamically
-                "analysisTimestamp": datetime.datetime.utcnow().isoformat() + "Z",
-                "sectionSuggestions": {},
-                "topRecommendations": ["Resume analysis completed with partial data"]
-            }
-            
-            # Add extracted sections
-            for section_name, section_content in sections.items():
-                try:
-                    # Try to parse the section content
-                    section_data = json.loads(section_content)
-                    reconstructed["sectionSuggestions"][section_name] = section_data
-                except:
-                    # If parsing fails, create a basic structure
-                    reconstructed["sectionSuggestions"][section_name] = {
-                        "existing": "",
-                        "rewrite": "",
-                        "recommendations": [""]
-                    }
-            
-            # Add missing sections with defaults
-            for section in ['professionalSummary', 'skills', 'workExperience', 'projects', 'education', 'certifications']:
-                if section not in reconstructed["sectionSuggestions"]:
-                    reconstructed["sectionSuggestions"][section] = {
-                        "existing": "",
-                        "rewrite": "",
-                        "recommendations": [""]
-                    }
-            
-            logger.info("✅ Fragment reconstruction completed")
-            return json.dumps(reconstructed)
-        
-        logger.warning("⚠️ All aggressive recovery methods failed")
-        return ""
-    
-    def _detect_and_fix_incomplete_json(self, json_text: str) -> str:
-        """
-        Detect and fix incomplete JSON structures that are missing the root wrapper.
-        """
-        try:
-            # Check if the JSON is missing the root wrapper
-            if 'sectionSuggestions' in json_text and not json_text.strip().startswith('{"overallScore"'):
-                logger.info("🔍 Detected incomplete JSON structure, attempting to fix...")
-                
-                # Try to parse what we have
-                try:
-                    parsed = json.loads(json_text)
-                    logger.info("✅ Incomplete JSON is still valid, no fixing needed")
-                    return json_text
-                except json.JSONDecodeError:
-                    logger.info("🔍 Incomplete JSON is invalid, attempting to wrap...")
-                    
-                    # Look for the first valid JSON object
-                    first_brace = json_text.find('{')
-                    if first_brace >= 0:
-                        # Try to find the matching closing brace
-                        brace_count = 0
-                        end_pos = -1
-                        for i, char in enumerate(json_text[first_brace:], first_brace):
-                            if char == '{':
-                                brace_count += 1
-                            elif char == '}':
-                                brace_count -= 1
-                                if brace_count == 0:
-                                    end_pos = i + 1
-                                    break
-                        
-                        if end_pos > 0:
-                            # Extract the valid JSON portion
-                            valid_portion = json_text[first_brace:end_pos]
-                            logger.info(f"🔍 Extracted valid JSON portion: {len(valid_portion)} characters")
-                            
-                            # Try to parse it
-                            try:
-                                parsed = json.loads(valid_portion)
-                                logger.info("✅ Valid JSON portion extracted and parsed")
-                                
-                                # Now wrap it in the complete structure
-                                wrapped_json = {
-                                    "overallScore": 0,  # Will be calculated dynamically
-                                    "analysisTimestamp": datetime.datetime.utcnow().isoformat() + "Z",
-                                    "sectionSuggestions": parsed,
-                                    "topRecommendations": ["Resume analysis completed with wrapped data"]
-                                }
-                                
-                                logger.info("✅ Successfully wrapped incomplete JSON")
-                                return json.dumps(wrapped_json)
-                                
-                            except json.JSONDecodeError:
-                                logger.warning("⚠️ Even the extracted portion is invalid")
-            
-            return json_text
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Error detecting/fixing incomplete JSON: {str(e)}")
-            return json_text
-    
-    def _validate_json_structure(self, json_text: str) -> bool:
-        """
-        Validate that the extracted JSON has the complete structure we need.
-        """
-        try:
-            # Check if it contains the essential keys
-            essential_keys = ['overallScore', 'sectionSuggestions']
-            if not all(key in json_text for key in essential_keys):
-                logger.warning(f"⚠️ JSON missing essential keys: {[key for key in essential_keys if key not in json_text]}")
-                return False
-            
-            # Check if sectionSuggestions has the required structure
-            if 'sectionSuggestions' in json_text:
-                section_keys = ['professionalSummary', 'skills', 'workExperience', 'projects', 'education', 'certifications']
-                missing_sections = [key for key in section_keys if key not in json_text]
-                if missing_sections:
-                    logger.warning(f"⚠️ sectionSuggestions missing sections: {missing_sections}")
-                    return False
-            
-            logger.info("✅ JSON structure validation passed")
-            return True
-            
-        except Exception as e:
-            logger.warning(f"⚠️ JSON structure validation failed: {str(e)}")
-            return False
-
     def _extract_experience_from_summary(self, resume_data: Dict[str, Any]) -> Optional[int]:
         """
         Extract experience years from summary text using intelligent pattern matching.
@@ -3251,8 +2571,13 @@ class AISuggestionService:
             # Convert job description to lowercase for easier matching
             jd_lower = job_description.lower()
             
-            # Extract key requirements from job description
-            required_skills = self._extract_required_skills_from_jd(jd_lower)
+            # Skills and keyword overlap come from the local term-vector matcher
+            matches = jd_match_components(
+                self._collect_resume_text(resume_data),
+                self._collect_resume_text(resume_data.get('skills', {})),
+                job_description
+            )
+            required_skills = matches["required_skills"]
             required_experience = self._extract_required_experience_from_jd(jd_lower)
             required_education = self._extract_required_education_from_jd(jd_lower)
             
@@ -3262,7 +2587,7 @@ class AISuggestionService:
             logger.info(f"   - Required education: {required_education}")
             
             # Skills match (20 points)
-            skills_match = self._calculate_skills_match(resume_data, required_skills)
+            skills_match = self._calculate_skills_match(resume_data, required_skills, matches["matched_skills"])
             score += min(skills_match, 20)
             
             # Experience match (15 points)
@@ -3274,15 +2599,15 @@ class AISuggestionService:
             score += min(education_match, 10)
             
             # Keyword match (5 points)
-            keyword_match = self._calculate_keyword_match(resume_data, jd_lower)
-            score += min(keyword_match, 5)
+            keyword_match = min(len(matches["matched_keywords"]), 5)
+            score += keyword_match
             
             final_score = max(0, min(max_score, score))
             logger.info(f"📊 JD Match Score Breakdown:")
             logger.info(f"   - Skills match: {min(skills_match, 20)}/20")
             logger.info(f"   - Experience match: {min(experience_match, 15)}/15")
             logger.info(f"   - Education match: {min(education_match, 10)}/10")
-            logger.info(f"   - Keyword match: {min(keyword_match, 5)}/5")
+            logger.info(f"   - Keyword match: {keyword_match}/5")
             logger.info(f"   - Total JD match: {final_score}/50")
             
             return final_score
@@ -3291,33 +2616,23 @@ class AISuggestionService:
             logger.warning(f"❌ Error calculating JD match score: {str(e)}")
             return 25  # Return middle score if analysis fails
     
-    def _extract_required_skills_from_jd(self, jd_lower: str) -> list:
-        """Extract required skills from job description"""
-        skills = []
-        
-        # Common technical skills to look for
-        technical_skills = [
-            'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'aws', 'docker',
-            'kubernetes', 'machine learning', 'ai', 'data analysis', 'excel', 'tableau',
-            'power bi', 'salesforce', 'marketing', 'seo', 'content creation', 'project management'
-        ]
-        
-        for skill in technical_skills:
-            if skill in jd_lower:
-                skills.append(skill)
-        
-        return skills
+    def _collect_resume_text(self, value: Any) -> str:
+        """Join every string value of a resume section into plain text for local matching"""
+        if isinstance(value, dict):
+            return "\n".join(self._collect_resume_text(v) for v in value.values())
+        if isinstance(value, list):
+            return "\n".join(self._collect_resume_text(v) for v in value)
+        if value is None:
+            return ""
+        return str(value)
     
     def _extract_required_experience_from_jd(self, jd_lower: str) -> str:
         """Extract required experience level from job description"""
-        if any(term in jd_lower for term in ['senior', 'lead', 'principal', 'architect', 'manager']):
-            return 'senior'
-        elif any(term in jd_lower for term in ['mid', 'intermediate', '3+ years', '5+ years']):
-            return 'mid'
-        elif any(term in jd_lower for term in ['junior', 'entry', '0-2 years', '1-3 years']):
-            return 'entry'
-        else:
-            return 'mid'  # Default to mid level
+        levels = {hit.value for hit in _JD_LEVEL_TERMS.find_all(jd_lower)}
+        for level in ('senior', 'mid', 'entry'):
+            if level in levels:
+                return level
+        return 'mid'  # Default to mid level
     
     def _extract_required_education_from_jd(self, jd_lower: str) -> list:
         """Extract required education from job description"""
@@ -3332,29 +2647,15 @@ class AISuggestionService:
         
         return education
     
-    def _calculate_skills_match(self, resume_data: Dict[str, Any], required_skills: list) -> int:
+    def _calculate_skills_match(self, resume_data: Dict[str, Any], required_skills: list, matched_skills: list) -> int:
         """Calculate skills match score (0-20 points)"""
         if not required_skills:
             return 10  # Neutral score if no skills specified
         
-        resume_skills = set()
-        skills_data = resume_data.get('skills', {})
-        
-        if isinstance(skills_data, dict):
-            for category, skill_list in skills_data.items():
-                if isinstance(skill_list, list):
-                    resume_skills.update([str(s).lower().strip() for s in skill_list if s])
-                elif isinstance(skill_list, str):
-                    resume_skills.add(skill_list.lower().strip())
-        elif isinstance(skills_data, list):
-            resume_skills.update([str(s).lower().strip() for s in skills_data if s])
-        
-        # Calculate match percentage
-        if not resume_skills:
+        if not self._collect_resume_text(resume_data.get('skills', {})).strip():
             return 0
         
-        matched_skills = sum(1 for skill in required_skills if any(skill in resume_skill for resume_skill in resume_skills))
-        match_percentage = matched_skills / len(required_skills)
+        match_percentage = len(matched_skills) / len(required_skills)
         
         return int(match_percentage * 20)
     
@@ -3399,20 +2700,3 @@ class AISuggestionService:
         match_percentage = matched_education / len(required_education)
         
         return int(match_percentage * 10)
-    
-    def _calculate_keyword_match(self, resume_data: Dict[str, Any], jd_lower: str) -> int:
-
-        """Calculate keyword match score (0-5 points)"""
-        # Extract key terms from resume
-        resume_text = self._format_resume_for_comparison(resume_data).lower()
-        
-        # Look for important keywords in both resume and JD
-        important_keywords = [
-            'leadership', 'management', 'strategy', 'innovation', 'collaboration',
-            'communication', 'problem solving', 'analytical', 'creative', 'detail-oriented',
-            'results-driven', 'customer-focused', 'team player', 'self-motivated'
-        ]
-        
-        matched_keywords = sum(1 for keyword in important_keywords if keyword in resume_text and keyword in jd_lower)
-        
-        return min(matched_keywords, 5)
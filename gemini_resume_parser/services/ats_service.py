@@ -1,9 +1,19 @@
+import asyncio
 import json
 import logging
 import datetime
 import re
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Iterator, Optional, List, Tuple
 from openai import OpenAI
+from config.config import OpenAIConfig
+from utils.response_cache import cached_chat_completion
+from utils.power_words import collect_used_power_words, find_repetitions, power_word_type, tokenize_sections
+from utils.tech_stack import extract_tech_stack, format_tech_stack
+from utils.prompt_registry import register_prompt
+from utils.structured_output import with_response_format, parse_structured
+from utils.json_stream import repair_json
+from utils.continuation import adaptive_max_tokens, continued_chat_completion, acontinued_chat_completion
+from models.ats_models import ATSAnalysisResponse, JDSpecificATSResponse, FixAchievementBatchResponse
 from .openai_parser_service import OpenAIResumeParser
 
 logger = logging.getLogger(__name__)
@@ -13,99 +23,101 @@ def _collect_used_power_words_from_text(text: str) -> List[str]:
     Collect action verbs and professional terms already present in the resume text.
     Used to avoid suggesting synonyms that are already present in the resume.
     """
-    import re as _re
-    action_verbs = {
-        'implemented', 'managed', 'developed', 'created', 'built', 'designed', 'led', 'executed', 'delivered',
-        'optimized', 'improved', 'enhanced', 'streamlined', 'automated', 'deployed', 'integrated', 'configured',
-        'maintained', 'monitored', 'analyzed', 'resolved', 'coordinated', 'collaborated', 'mentored', 'trained',
-        'established', 'initiated', 'launched', 'completed', 'achieved', 'increased', 'reduced', 'saved',
-        'transformed', 'migrated', 'upgraded', 'refactored', 'debugged', 'tested', 'validated', 'verified',
-        'documented', 'presented', 'communicated', 'facilitated', 'supervised', 'directed', 'guided', 'influenced',
-        'negotiated', 'planned', 'organized', 'scheduled', 'prioritized', 'evaluated', 'assessed', 'reviewed',
-        'recommended', 'proposed', 'suggested', 'identified', 'discovered', 'investigated', 'researched',
-        'studied', 'learned', 'acquired', 'gained', 'obtained', 'secured', 'earned', 'won', 'received',
-        'engineered', 'constructed', 'architected', 'fabricated', 'assembled', 'crafted', 'forged', 'molded',
-        'shaped', 'formed', 'generated', 'produced', 'manufactured', 'fashioned', 'devised', 'conceived',
-        'invented', 'innovated', 'pioneered', 'spearheaded', 'championed', 'advocated', 'promoted', 'endorsed',
-        'supported', 'backed', 'sponsored', 'funded', 'financed', 'invested', 'contributed', 'donated',
-        'provided', 'supplied', 'delivered', 'distributed', 'allocated', 'assigned', 'designated', 'appointed',
-        'selected', 'chosen', 'picked', 'elected', 'voted', 'decided', 'determined', 'resolved', 'settled',
-        'concluded', 'finalized', 'completed', 'finished', 'accomplished', 'achieved', 'attained', 'reached',
-        'obtained', 'acquired', 'gained', 'earned', 'won', 'secured', 'captured', 'seized', 'grasped',
-        'gripped', 'held', 'maintained', 'retained', 'preserved', 'conserved', 'protected', 'safeguarded',
-        'defended', 'shielded', 'guarded', 'watched', 'monitored', 'observed', 'tracked', 'followed',
-        'pursued', 'chased', 'hunted', 'searched', 'explored', 'investigated', 'examined', 'studied',
-        'analyzed', 'evaluated', 'assessed', 'reviewed', 'inspected', 'checked', 'verified', 'confirmed',
-        'validated', 'authenticated', 'certified', 'approved', 'endorsed', 'sanctioned', 'authorized',
-        'permitted', 'allowed', 'enabled', 'facilitated', 'assisted', 'helped', 'aided', 'supported',
-        'backed', 'sponsored', 'promoted', 'advanced', 'progressed', 'moved', 'shifted', 'transferred',
-        'relocated', 'migrated', 'transported', 'conveyed', 'carried', 'delivered', 'distributed', 'spread',
-        'extended', 'expanded', 'enlarged', 'increased', 'boosted', 'enhanced', 'improved', 'upgraded',
-        'refined', 'polished', 'perfected', 'optimized', 'maximized', 'minimized', 'reduced', 'decreased',
-        'lowered', 'diminished', 'lessened', 'cut', 'trimmed', 'slashed', 'eliminated', 'removed',
-        'deleted', 'erased', 'wiped', 'cleared', 'cleaned', 'purified', 'sanitized', 'sterilized',
-        'disinfected', 'decontaminated', 'neutralized', 'balanced', 'stabilized', 'secured', 'fixed',
-        'repaired', 'restored', 'renewed', 'refreshed', 'revitalized', 'rejuvenated', 'regenerated',
-        'rebuilt', 'reconstructed', 'reassembled', 'repaired', 'mended', 'patched', 'fixed', 'corrected',
-        'adjusted', 'modified', 'altered', 'changed', 'transformed', 'converted', 'adapted', 'customized',
-        'personalized', 'tailored', 'fitted', 'sized', 'scaled', 'proportioned', 'balanced', 'harmonized',
-        'synchronized', 'coordinated', 'orchestrated', 'conducted', 'directed', 'managed', 'administered',
-        'supervised', 'oversaw', 'controlled', 'governed', 'regulated', 'monitored', 'tracked', 'followed',
-        'pursued', 'chased', 'hunted', 'searched', 'explored', 'investigated', 'examined', 'studied',
-        'analyzed', 'evaluated', 'assessed', 'reviewed', 'inspected', 'checked', 'verified', 'confirmed',
-        'validated', 'authenticated', 'certified', 'approved', 'endorsed', 'sanctioned', 'authorized',
-        'permitted', 'allowed', 'enabled', 'facilitated', 'assisted', 'helped', 'aided', 'supported','utilized'
-    }
-    professional_terms = {
-        'scalable', 'secure', 'efficient', 'robust', 'reliable', 'flexible', 'comprehensive', 'advanced',
-        'innovative', 'cutting-edge', 'state-of-the-art', 'high-performance', 'enterprise-grade', 'mission-critical',
-        'cost-effective', 'user-friendly', 'intuitive', 'seamless', 'integrated', 'automated', 'streamlined',
-        'optimized', 'enhanced', 'improved', 'upgraded', 'modernized', 'standardized', 'centralized',
-        'distributed', 'cloud-based', 'web-based', 'mobile-first', 'responsive', 'cross-platform',
-        'real-time', 'high-availability', 'fault-tolerant', 'load-balanced', 'microservices', 'api-driven',
-        'protected', 'safe', 'guarded', 'shielded', 'defended', 'secured', 'fortified', 'reinforced',
-        'strengthened', 'hardened', 'toughened', 'solidified', 'stabilized', 'balanced', 'harmonized',
-        'synchronized', 'coordinated', 'orchestrated', 'conducted', 'directed', 'managed', 'administered',
-        'supervised', 'oversaw', 'controlled', 'governed', 'regulated', 'monitored', 'tracked', 'followed',
-        'modular', 'service-oriented', 'component-based', 'object-oriented', 'functional', 'procedural',
-        'declarative', 'imperative', 'reactive', 'event-driven', 'message-driven', 'data-driven', 'test-driven',
-        'behavior-driven', 'domain-driven', 'model-driven', 'architecture-driven', 'design-driven', 'user-driven',
-        'customer-driven', 'business-driven', 'market-driven', 'performance-driven', 'quality-driven',
-        'security-driven', 'compliance-driven', 'agile-driven', 'lean-driven', 'devops-driven', 'cloud-driven'
-    }
-    
-    # Use more comprehensive regex to capture all forms including past tense and participles
-    tokens = _re.findall(r'\b[a-zA-Z]+(?:ed|ing|s)?\b', (text or '').lower())
-    
-    # Also check for base forms - strip common endings
-    all_words = set()
-    for token in tokens:
-        all_words.add(token)
-        # Strip common verb endings to get base form
-        base = token
-        if token.endswith('ed'):
-            base = token[:-2]
-            if len(base) > 2:
-                all_words.add(base)
-        elif token.endswith('ing'):
-            base = token[:-3]
-            if len(base) > 2:
-                all_words.add(base)
-        elif token.endswith('s') and len(token) > 3:
-            base = token[:-1]
-            all_words.add(base)
-    
-    used = {t for t in all_words if t in action_verbs or t in professional_terms}
+    used = collect_used_power_words(text)
     
     # Log for debugging
-    logger.info(f"🔍 DEBUG: Found {len(used)} power words already used in resume: {sorted(used)}")
+    logger.info(f"🔍 DEBUG: Found {len(used)} power words already used in resume: {used}")
+    
+    return used
+
+def _analyze_power_word_repetitions(sections: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Repetition analysis shared by the Standard and JD-specific ATS services.
+    Tokenizes each section once and reports repeated action verbs and professional terms
+    per section, with context snippets for FIX_REPETITION suggestions.
+    """
+    repetition_analysis = {
+        "total_words_analyzed": 0,
+        "sections_analyzed": len(sections),
+        "repetitions_found": {},
+        "debug_info": {},
+        "action_verbs_found": {},
+        "professional_terms_found": {},
+        "section_analysis": {}
+    }
     
-    return sorted(used)
+    for section_name, tokenized in tokenize_sections(sections).items():
+        repetition_analysis["total_words_analyzed"] += len(tokenized.tokens)
+        if not tokenized.tokens:
+            continue
+        
+        action_verb_reps, professional_term_reps = find_repetitions(tokenized)
+        repetition_analysis["section_analysis"][section_name] = {
+            "action_verb_repetitions": action_verb_reps,
+            "professional_term_repetitions": professional_term_reps,
+            "total_words": len(tokenized.tokens)
+        }
+        
+        # Keep first-occurrence order across both word types
+        relevant_repetitions = {
+            word: tokenized.counts[word] for word in tokenized.counts
+            if word in action_verb_reps or word in professional_term_reps
+        }
+        if not relevant_repetitions:
+            continue
+        
+        repetition_analysis["repetitions_found"][section_name] = relevant_repetitions
+        repetition_analysis["action_verbs_found"][section_name] = action_verb_reps
+        repetition_analysis["professional_terms_found"][section_name] = professional_term_reps
+        
+        # Store context for each repetition (sentences containing the word as a whole token)
+        for word, count in relevant_repetitions.items():
+            repetition_analysis["debug_info"][f"{section_name}_{word}"] = {
+                "word": word,
+                "count": count,
+                "contexts": tokenized.contexts(word, limit=3),
+                "section": section_name,
+                "type": power_word_type(word)
+            }
+    
+    return repetition_analysis
+
+FIX_REPETITION_PROMPT = register_prompt(
+    "ats.fix_repetition",
+    system="""
+    You generate precise, single-line replacement instructions in the required format.
+
+    You are improving resume language variety. Produce EXACTLY ONE line in this format and nothing else:
+    FIX_REPETITION: [Section] - [Word Type] '[word]' used [X] times - Replace instances: [Instance 1: '[exact context]' → '[alternative1]'], [Instance 2: '[exact context]' → '[alternative2]'], [Instance 3: '[exact context]' → '[alternative3]']
+
+    Requirements:
+    - Use the section, word type, word and count given in the user message exactly
+    - Use 2-3 short, professional alternatives suitable for resumes
+    - CRITICAL: Each alternative MUST be different (no duplicates) and MUST NOT be any of the banned words listed in the user message (words already present elsewhere in the resume or already suggested)
+    - CRITICAL: Do NOT suggest 'engineered', 'created', 'developed', 'designed', 'enhanced', 'improved', 'collaborated', 'secure', 'microservices' if they appear in the banned list
+    - Avoid proposing any alternative that already appears in the provided contexts or elsewhere in the resume
+    - If no suitable single-word verb remains, REFRAME the phrase (still keeping meaning) to remove the repetition without using any banned words
+    - Distribute different alternatives across instances to avoid introducing new repetition within the same section
+    - If fewer than 3 contexts provided, still output 2-3 replacements using the available contexts
+    - Do NOT include any preface or follow-up text, no code fences, only the single line
+    """,
+    user_template="""
+    Section: {section}
+    Word Type: {word_type}
+    word: {word}
+    X: {count}
+    Banned words: {banned_list}
+
+    Context sentences where the word appears (may be trimmed):
+    {context_text}
+    """
+)
 
-def _generate_fix_repetition_line(section: str, word_type: str, word: str, count: int, contexts: List[str], client: Any, model_name: str, temperature: float, top_p: float, forbidden_words: List[str], already_suggested: List[str]) -> str:
+def _generate_fix_repetition_line(section: str, word_type: str, word: str, count: int, contexts: List[str], client: Any, model_name: str, temperature: float, top_p: float, forbidden_words: List[str], already_suggested: List[str], use_cache: bool = True) -> str:
     """
     Use the model to generate one FIX_REPETITION suggestion line for a repeated word,
     following the mandatory format. Returns a single-line string, or empty string on failure.
+    Repairs pass use_cache=False: a cached answer would just repeat the line being repaired.
     """
     try:
         # Limit to first 3 context snippets to keep prompt compact
@@ -114,34 +126,18 @@ def _generate_fix_repetition_line(section: str, word_type: str, word: str, count
 
         banned_list = ", ".join(sorted(set((forbidden_words or []) + (already_suggested or [])))) or "(none)"
 
-        prompt = f"""
-        You are improving resume language variety. Produce EXACTLY ONE line in this format and nothing else:
-        FIX_REPETITION: [Section] - [Word Type] '[word]' used [X] times - Replace instances: [Instance 1: '[exact context]' → '[alternative1]'], [Instance 2: '[exact context]' → '[alternative2]'], [Instance 3: '[exact context]' → '[alternative3]']
-
-        Requirements:
-        - Use section: {section}
-        - Word Type is exactly: {word_type}
-        - word is exactly: {word}
-        - X is exactly: {count}
-        - Use 2-3 short, professional alternatives suitable for resumes
-        - CRITICAL: Each alternative MUST be different (no duplicates) and MUST NOT be any of these words already present elsewhere in the resume or already suggested: {banned_list}
-        - CRITICAL: Do NOT suggest 'engineered', 'created', 'developed', 'designed', 'enhanced', 'improved', 'collaborated', 'secure', 'microservices' if they appear in the banned list
-        - Avoid proposing any alternative that already appears in the provided contexts or elsewhere in the resume
-        - If no suitable single-word verb remains, REFRAME the phrase (still keeping meaning) to remove the repetition without using any banned words
-        - Distribute different alternatives across instances to avoid introducing new repetition within the same section
-        - If fewer than 3 contexts provided, still output 2-3 replacements using the available contexts
-        - Do NOT include any preface or follow-up text, no code fences, only the single line
-
-        Context sentences where the word appears (may be trimmed):
-        {context_text}
-        """
-
-        response = client.chat.completions.create(
+        response = cached_chat_completion(
+            client,
+            use_cache=use_cache,
             model=model_name,
-            messages=[
-                {"role": "system", "content": "You generate precise, single-line replacement instructions in the required format."},
-                {"role": "user", "content": prompt.strip()}
-            ],
+            messages=FIX_REPETITION_PROMPT.messages(
+                section=section,
+                word_type=word_type,
+                word=word,
+                count=count,
+                banned_list=banned_list,
+                context_text=context_text
+            ),
             temperature=0.1,
             top_p=0.8,
             max_tokens=200
@@ -160,14 +156,56 @@ def _generate_fix_repetition_line(section: str, word_type: str, word: str, count
         logger.warning(f"Failed to generate FIX_REPETITION line for '{word}' in section '{section}': {e}")
         return ""
 
-def _augment_repetition_suggestions_with_debug(ats_response: Dict[str, Any], repetition_debug: Dict[str, Any], resume_text: str, client: Any, model_name: str, temperature: float, top_p: float) -> Dict[str, Any]:
+# Regenerations of a FIX_REPETITION line whose alternatives collide with an earlier word's
+FIX_REPETITION_REPAIR_ATTEMPTS = 2
+
+def _extract_fix_repetition_alternatives(line: str) -> List[str]:
+    """Return the lowercased replacement words proposed by a FIX_REPETITION line."""
+    return [alt.strip().lower() for alt in re.findall(r"→\s*'([^']+)'", line or "") if alt.strip()]
+
+def _generate_fix_repetition_lines_concurrently(jobs: List[Dict[str, Any]], client: Any, model_name: str, temperature: float, top_p: float, forbidden_words: List[str], max_concurrency: int) -> Iterator[str]:
+    """
+    Fan out FIX_REPETITION generation over a bounded thread pool.
+    Every job is sent the same reserved banned list; results are yielded in job order
+    as soon as each one (and every job before it) has finished, so the caller can
+    deduplicate alternatives across words while later calls are still in flight.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max(1, min(max_concurrency, len(jobs)))
+    logger.info(f"🔍 DEBUG: Generating {len(jobs)} FIX_REPETITION lines with {workers} concurrent workers")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _generate_fix_repetition_line,
+                job["section"], job["word_type"], job["word"], job["count"], job["contexts"],
+                client, model_name, temperature, top_p, forbidden_words, []
+            )
+            for job in jobs
+        ]
+        # _generate_fix_repetition_line never raises; failures come back as ""
+        for future in futures:
+            yield future.result()
+
+def _augment_repetition_suggestions_with_debug(ats_response: Dict[str, Any], repetition_debug: Dict[str, Any], resume_text: str, client: Any, model_name: str, temperature: float, top_p: float, max_concurrency: Optional[int] = None, on_line: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
     """
     Augment repetition_avoidance suggestions to include a FIX_REPETITION line for
     every repeated word detected in the debug analysis. Avoid duplicates if the AI
     already provided a FIX_REPETITION for a given word.
+
+    With max_concurrency > 1 the per-word calls run in parallel against a banned list
+    reserved up front; alternatives that collide with an earlier word's are repaired
+    afterwards by sequential regeneration. Every line is checked against the alternatives
+    already suggested before it is added, and a line that still collides after
+    FIX_REPETITION_REPAIR_ATTEMPTS regenerations is dropped, so alternatives stay globally unique.
+
+    on_line, if given, is called with each FIX_REPETITION line as soon as it is added.
     """
     try:
         import re as _re
+        if max_concurrency is None:
+            max_concurrency = OpenAIConfig.AUGMENT_MAX_CONCURRENCY
+
         detailed = ats_response.setdefault("detailed_feedback", {})
         rep = detailed.setdefault("repetition_avoidance", {})
         suggestions: List[str] = rep.setdefault("suggestions", [])
@@ -180,9 +218,7 @@ def _augment_repetition_suggestions_with_debug(ats_response: Dict[str, Any], rep
             m = _re.search(r"FIX_REPETITION:\s*[^']*'([^']+)'", s)
             if m:
                 covered_words.add(m.group(1).strip().lower())
-            for alt in _re.findall(r"→\s*'([^']+)'", s):
-                if alt:
-                    suggested_alternatives.add(alt.strip().lower())
+            suggested_alternatives.update(_extract_fix_repetition_alternatives(s))
 
         repetitions_found = repetition_debug.get("repetitions_found", {})
         debug_info = repetition_debug.get("debug_info", {})
@@ -207,27 +243,66 @@ def _augment_repetition_suggestions_with_debug(ats_response: Dict[str, Any], rep
             suggestions[:] = [s for s in suggestions if not s.startswith("FIX_REPETITION:")]
             return ats_response
 
+        jobs: List[Dict[str, Any]] = []
         for section, words in repetitions_found.items():
             for word, count in words.items():
                 if word.lower() in covered_words:
                     continue
+                jobs.append({
+                    "section": section,
+                    "word": word,
+                    "count": count,
+                    "word_type": "Action Verb" if word in action_verbs_found.get(section, {}) else "Professional Term",
+                    "contexts": debug_info.get(f"{section}_{word}", {}).get("contexts", []),
+                })
 
-                word_type = "Action Verb" if word in action_verbs_found.get(section, {}) else "Professional Term"
-                contexts = debug_info.get(f"{section}_{word}", {}).get("contexts", [])
-                
-                # Current forbidden list for this word includes all forbidden words + already suggested
-                current_forbidden = list(forbidden_words) + list(suggested_alternatives)
-                logger.info(f"🔍 DEBUG: Generating suggestions for '{word}' avoiding these words: {sorted(current_forbidden)}")
-                
+        def _record(line: str) -> None:
+            suggestions.append(line)
+            if on_line:
+                on_line(line)
+            # Update global suggested_alternatives with any new alts from this line
+            for alt in _extract_fix_repetition_alternatives(line):
+                suggested_alternatives.add(alt)
+                logger.info(f"🔍 DEBUG: Added '{alt}' to suggested alternatives list")
+
+        def _generate(job: Dict[str, Any], use_cache: bool = True) -> str:
+            # Current forbidden list for this word includes all forbidden words + already suggested
+            current_forbidden = list(forbidden_words) + list(suggested_alternatives)
+            logger.info(f"🔍 DEBUG: Generating suggestions for '{job['word']}' avoiding these words: {sorted(current_forbidden)}")
+            return _generate_fix_repetition_line(job["section"], job["word_type"], job["word"], job["count"], job["contexts"], client, model_name, temperature, top_p, current_forbidden, [], use_cache=use_cache)
+
+        def _collides(line: str) -> bool:
+            return bool(set(_extract_fix_repetition_alternatives(line)) & suggested_alternatives)
+
+        def _claim(job: Dict[str, Any], line: str) -> str:
+            # Another word may already have claimed one of these alternatives - regenerate with the full banned list
+            attempts = 0
+            while line and _collides(line) and attempts < FIX_REPETITION_REPAIR_ATTEMPTS:
+                attempts += 1
+                logger.info(f"🔍 DEBUG: Alternatives for '{job['word']}' collide with earlier suggestions - repairing (attempt {attempts})")
+                line = _generate(job, use_cache=False)
+            if line and _collides(line):
+                logger.warning(f"⚠️ Dropping FIX_REPETITION for '{job['word']}': alternatives still collide after {attempts} repair(s)")
+                return ""
+            return line
+
+        if max_concurrency > 1 and len(jobs) > 1:
+            reserved = list(forbidden_words) + list(suggested_alternatives)
+            lines = _generate_fix_repetition_lines_concurrently(jobs, client, model_name, temperature, top_p, reserved, max_concurrency)
+            repaired = 0
+            for job, line in zip(jobs, lines):
+                if line and _collides(line):
+                    repaired += 1
+                line = _claim(job, line)
+                if line and isinstance(line, str):
+                    _record(line)
+            logger.info(f"🔍 DEBUG: Concurrent FIX_REPETITION generation finished ({len(jobs)} words, {repaired} repaired)")
+        else:
+            for job in jobs:
                 # Generate a single FIX_REPETITION line using the model, leveraging contexts
-                line = _generate_fix_repetition_line(section, word_type, word, count, contexts, client, model_name, temperature, top_p, current_forbidden, [])
+                line = _claim(job, _generate(job))
                 if line and isinstance(line, str):
-                    suggestions.append(line)
-                    # Update global suggested_alternatives with any new alts from this line
-                    for alt in _re.findall(r"→\s*'([^']+)'", line):
-                        if alt:
-                            suggested_alternatives.add(alt.strip().lower())
-                            logger.info(f"🔍 DEBUG: Added '{alt}' to suggested alternatives list")
+                    _record(line)
 
         # Ensure negatives/specific_issues enumerate all repeated words as issues
         rep.setdefault("negatives", [])
@@ -245,35 +320,64 @@ def _augment_repetition_suggestions_with_debug(ats_response: Dict[str, Any], rep
         logger.warning(f"Failed to augment repetition suggestions: {e}")
         return ats_response
 
+FIX_ACHIEVEMENT_PROMPT = register_prompt(
+    "ats.fix_achievement",
+    system="""
+    You generate precise, single-line achievement enhancement instructions with quantified metrics.
+
+    You are improving resume achievements with quantified metrics. Produce EXACTLY ONE line in this format and nothing else:
+    FIX_ACHIEVEMENT: [Section] - Achievement '[achievement excerpt]' lacks metrics - Add quantified impact: '[enhanced achievement with specific numbers, percentages, timeframes, and measurable results]'
+
+    Requirements:
+    - Use the section and achievement excerpt given in the user message
+    - Add 2-3 specific metrics: numbers, percentages, timeframes, team sizes, cost savings, efficiency improvements
+    - Make metrics realistic and relevant to the achievement type
+    - Use professional language with strong action verbs
+    - Include measurable business impact
+    - Do NOT include any preface or follow-up text, no code fences, only the single line
+    """,
+    user_template="""
+    Section: {section}
+    Achievement excerpt: {excerpt}...
+
+    Context of the achievement:
+    {context}
+    """
+)
+
+FIX_ACHIEVEMENT_BATCH_PROMPT = register_prompt(
+    "ats.fix_achievement_batch",
+    system="""
+    You generate precise, single-line achievement enhancement instructions with quantified metrics, returned as JSON.
+
+    You are improving resume achievements with quantified metrics. For EVERY achievement in the input array produce one line in this format:
+    FIX_ACHIEVEMENT: [Section] - Achievement '[achievement excerpt]' lacks metrics - Add quantified impact: '[enhanced achievement with specific numbers, percentages, timeframes, and measurable results]'
+
+    Requirements:
+    - Use each item's own section and the first 50 characters of its achievement as the excerpt
+    - Add 2-3 specific metrics: numbers, percentages, timeframes, team sizes, cost savings, efficiency improvements
+    - Make metrics realistic and relevant to the achievement type
+    - Use professional language with strong action verbs
+    - Include measurable business impact
+    - Return ONLY a JSON object with one entry per input item, in the form: {"lines": [{"id": "<item id>", "line": "FIX_ACHIEVEMENT: ..."}]}
+    - Do NOT include any preface or follow-up text and no code fences
+    """,
+    user_template="""
+    Achievements:
+    {achievements}
+    """
+)
+
 def _generate_fix_achievement_line(section: str, achievement: str, context: str, client: Any, model_name: str, temperature: float, top_p: float) -> str:
     """
     Use the model to generate one FIX_ACHIEVEMENT suggestion line for an unquantified achievement,
     following the mandatory format. Returns a single-line string, or empty string on failure.
     """
     try:
-        prompt = f"""
-        You are improving resume achievements with quantified metrics. Produce EXACTLY ONE line in this format and nothing else:
-        FIX_ACHIEVEMENT: [Section] - Achievement '[achievement excerpt]' lacks metrics - Add quantified impact: '[enhanced achievement with specific numbers, percentages, timeframes, and measurable results]'
-
-        Requirements:
-        - Use section: {section}
-        - Achievement excerpt: {achievement[:50]}...
-        - Add 2-3 specific metrics: numbers, percentages, timeframes, team sizes, cost savings, efficiency improvements
-        - Make metrics realistic and relevant to the achievement type
-        - Use professional language with strong action verbs
-        - Include measurable business impact
-        - Do NOT include any preface or follow-up text, no code fences, only the single line
-
-        Context of the achievement:
-        {context}
-        """
-
-        response = client.chat.completions.create(
+        response = cached_chat_completion(
+            client,
             model=model_name,
-            messages=[
-                {"role": "system", "content": "You generate precise, single-line achievement enhancement instructions with quantified metrics."},
-                {"role": "user", "content": prompt.strip()}
-            ],
+            messages=FIX_ACHIEVEMENT_PROMPT.messages(section=section, excerpt=achievement[:50], context=context),
             temperature=0.1,
             top_p=0.8,
             max_tokens=200
@@ -292,13 +396,64 @@ def _generate_fix_achievement_line(section: str, achievement: str, context: str,
         logger.warning(f"Failed to generate FIX_ACHIEVEMENT line for achievement in section '{section}': {e}")
         return ""
 
-def _augment_achievement_suggestions_with_debug(ats_response: Dict[str, Any], achievement_debug: Dict[str, Any], resume_text: str, client: Any, model_name: str, temperature: float, top_p: float) -> Dict[str, Any]:
+def _generate_fix_achievement_lines_batched(items: List[Dict[str, str]], client: Any, model_name: str, temperature: float, top_p: float) -> Dict[str, str]:
+    """
+    Use the model to generate FIX_ACHIEVEMENT lines for several achievements in one request.
+    Each item carries an "id", "section", "achievement" and "context"; the model returns a JSON
+    array of {"id", "line"} objects. Returns a mapping of id -> line for well-formed entries only,
+    so callers can retry whatever is missing individually.
+    """
+    if not items:
+        return {}
+    try:
+        payload = [
+            {"id": item["id"], "section": item["section"], "achievement": item["achievement"], "context": item["context"]}
+            for item in items
+        ]
+        response = client.chat.completions.create(**with_response_format({
+            "model": model_name,
+            "messages": FIX_ACHIEVEMENT_BATCH_PROMPT.messages(achievements=json.dumps(payload, ensure_ascii=False, indent=2)),
+            "temperature": 0.1,
+            "top_p": 0.8,
+            "max_tokens": min(4000, 200 * len(items) + 100)
+        }, FixAchievementBatchResponse, "fix_achievement_batch"))
+
+        parsed = parse_structured(response.choices[0].message.content, "ats.fix_achievement_batch", lambda text: repair_json(text, allow_array_root=True))
+        entries = parsed.get("lines") if isinstance(parsed, dict) else parsed
+
+        expected_ids = {item["id"] for item in items}
+        lines: Dict[str, str] = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            item_id = str(entry.get("id", ""))
+            line = entry.get("line")
+            if item_id not in expected_ids or not isinstance(line, str):
+                continue
+            line = line.strip()
+            if not line.startswith("FIX_ACHIEVEMENT:") or "\n" in line:
+                continue
+            lines[item_id] = line
+        return lines
+    except Exception as e:
+        logger.warning(f"Failed to generate batched FIX_ACHIEVEMENT lines for {len(items)} achievements: {e}")
+        return {}
+
+def _augment_achievement_suggestions_with_debug(ats_response: Dict[str, Any], achievement_debug: Dict[str, Any], resume_text: str, client: Any, model_name: str, temperature: float, top_p: float, batched: Optional[bool] = None, on_line: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
     """
     Augment achievements_impact_metrics suggestions to include a FIX_ACHIEVEMENT line for
     every unquantified achievement detected in the debug analysis.
+
+    In batched mode all achievements are sent in a single request; only items that come
+    back missing or malformed are retried one by one.
+
+    on_line, if given, is called with each FIX_ACHIEVEMENT line as soon as it is added.
     """
     try:
         import re as _re
+        if batched is None:
+            batched = OpenAIConfig.AUGMENT_BATCH_ACHIEVEMENTS
+
         detailed = ats_response.setdefault("detailed_feedback", {})
         achievements = detailed.setdefault("achievements_impact_metrics", {})
         suggestions: List[str] = achievements.setdefault("suggestions", [])
@@ -335,22 +490,41 @@ def _augment_achievement_suggestions_with_debug(ats_response: Dict[str, Any], ac
             
             return ats_response
 
+        pending: List[Dict[str, str]] = []
         for section, achievements_list in unquantified_achievements.items():
             for achievement in achievements_list:
                 achievement_id = achievement[:30].lower()
-                if achievement_id in covered_achievements:
+                if achievement_id in covered_achievements or any(p["achievement_id"] == achievement_id for p in pending):
                     continue
 
                 # Get context for this achievement
                 context = debug_info.get(f"{section}_{achievement_id}", {}).get("context", achievement)
-                
-                logger.info(f"🎯 DEBUG ACHIEVEMENTS: Generating suggestion for unquantified achievement in {section}: {achievement[:50]}...")
+                pending.append({
+                    "id": f"a{len(pending) + 1}",
+                    "achievement_id": achievement_id,
+                    "section": section,
+                    "achievement": achievement,
+                    "context": context,
+                })
+
+        batched_lines: Dict[str, str] = {}
+        if batched and len(pending) > 1:
+            logger.info(f"🎯 DEBUG ACHIEVEMENTS: Generating {len(pending)} suggestions in a single batched request")
+            batched_lines = _generate_fix_achievement_lines_batched(pending, client, model_name, temperature, top_p)
+            logger.info(f"🎯 DEBUG ACHIEVEMENTS: Batched request returned {len(batched_lines)}/{len(pending)} valid lines")
+
+        for item in pending:
+            line = batched_lines.get(item["id"])
+            if not line:
+                logger.info(f"🎯 DEBUG ACHIEVEMENTS: Generating suggestion for unquantified achievement in {item['section']}: {item['achievement'][:50]}...")
                 
                 # Generate a single FIX_ACHIEVEMENT line using the model
-                line = _generate_fix_achievement_line(section, achievement, context, client, model_name, temperature, top_p)
-                if line and isinstance(line, str):
-                    suggestions.append(line)
-                    covered_achievements.add(achievement_id)
+                line = _generate_fix_achievement_line(item["section"], item["achievement"], item["context"], client, model_name, temperature, top_p)
+            if line and isinstance(line, str):
+                suggestions.append(line)
+                covered_achievements.add(item["achievement_id"])
+                if on_line:
+                    on_line(line)
 
         # Ensure negatives/specific_issues enumerate all unquantified achievements as issues
         achievements.setdefault("negatives", [])
@@ -399,6 +573,607 @@ def _mirror_skill_suggestions_into_recommendations(ats_response: Dict[str, Any])
         logger.warning(f"Failed to mirror skills suggestions into recommendations: {e}")
         return ats_response
 
+def _suggestion_callback(on_suggestion: Optional[Callable[[str, str], None]], category: str) -> Optional[Callable[[str], None]]:
+    """Bind a (category, line) suggestion callback to one feedback category"""
+    if on_suggestion is None:
+        return None
+    return lambda line: on_suggestion(category, line)
+
+def _stream_analysis_events(client: Any, request: Dict[str, Any], finalize: Callable[..., Dict[str, Any]], use_cache: bool = True) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Drive one ATS analysis as a sequence of (event, data) pairs for incremental delivery.
+
+    Events, in order:
+    - "local": repetition and achievement findings from the local analyzers (no LLM)
+    - "field" / "category": top-level members and detailed_feedback blocks of the main
+      analysis as soon as the model has finished writing each one (raw, before scoring)
+    - "suggestion": each FIX_REPETITION / FIX_ACHIEVEMENT line as augmentation produces it
+    - "result": the merged document, identical to what the non-streaming call returns
+
+    Args:
+        client: OpenAI client for the main analysis call
+        request: Output of the service's _build_*_request method
+        finalize: Called as finalize(response_text, on_suggestion) to post-process the analysis
+        use_cache: Serve identical requests from the LLM response cache
+    """
+    import queue
+    import threading
+    from utils.json_stream import JsonMemberStream
+    from utils.response_cache import stream_chat_completion
+
+    repetition_debug = request["repetition_debug"]
+    achievement_debug = request["achievement_debug"]
+    yield "local", {
+        "repetitions_found": repetition_debug.get("repetitions_found", {}),
+        "unquantified_achievements": achievement_debug.get("unquantified_achievements", {}),
+        "achievement_summary": achievement_debug.get("summary", {})
+    }
+
+    members = JsonMemberStream(max_depth=2)
+    for delta in stream_chat_completion(client, use_cache=use_cache, **request["completion_kwargs"]):
+        for path, value in members.feed(delta):
+            if len(path) == 2 and path[0] == "detailed_feedback":
+                yield "category", {"name": path[1], "feedback": value}
+            elif len(path) == 1 and path[0] not in ("detailed_feedback", "extracted_text"):
+                yield "field", {"name": path[0], "value": value}
+
+    # Post-processing runs in a worker so suggestion lines can be yielded while it is still going
+    events = queue.Queue()
+    outcome: Dict[str, Any] = {}
+
+    def _run_finalize():
+        try:
+            outcome["result"] = finalize(
+                members.text,
+                lambda category, line: events.put(("suggestion", {"category": category, "line": line}))
+            )
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            events.put(None)
+
+    threading.Thread(target=_run_finalize, name="ats-stream-finalize", daemon=True).start()
+    while True:
+        event = events.get()
+        if event is None:
+            break
+        yield event
+
+    if "error" in outcome:
+        raise outcome["error"]
+    yield "result", outcome["result"]
+
+STANDARD_ATS_PROMPT = register_prompt(
+    "ats.standard",
+    system="""
+    You are an expert ATS (Applicant Tracking System) analyst with 10+ years of experience in resume optimization and HR technology.
+    
+    TASK: Perform a comprehensive ATS analysis of the provided resume with precise, consistent scoring and HIGHLY SPECIFIC, ACTIONABLE feedback that will increase the resume score by 10-15 points when applied.
+    
+    CRITICAL REQUIREMENTS - MANDATORY COMPLIANCE:
+    - Return ONLY valid JSON (no markdown, no code fences, no explanations, no additional text)
+    - NEVER omit any section - if no issues exist, return empty arrays/strings but keep the section structure
+    - ALWAYS include ALL required sections: overall_score, category_scores, detailed_feedback, strengths, weaknesses, recommendations
+    - NEVER copy the resume text into your response - the original text is attached to the result after analysis
+    - Ensure all scores are integers between 0-100 (never "NA", "N/A", "None", "Null", "Unknown", or text)
+    - NEVER use placeholder values - provide HIGHLY SPECIFIC, ACTIONABLE content with EXACT text examples
+    - LANGUAGE VARIETY: Use varied language within same sections, allow appropriate repetition across different sections
+    - PERFECT GRAMMAR: All content must have flawless spelling, grammar, and professional language
+    - CONSISTENT SCORING: Apply the same rigorous standards across all categories
+    - COMPREHENSIVE REPETITION ANALYSIS: For repetition_avoidance section, analyze ALL repeated words and provide individual FIX_REPETITION suggestions for EACH repeated word - if 15 words are repeated, provide 15 specific FIX_REPETITION suggestions
+    - SPECIFIC FEEDBACK: Every suggestion must include EXACT text examples, specific section locations, and precise improvement instructions
+    
+    PRECISE SCORING CRITERIA - APPLY CONSISTENTLY:
+    
+    DYNAMIC SCORING RULES:
+    - Use precise scores (not just multiples of 5) - e.g., 87, 93, 76, 84
+    - Count total issues/problems found across all categories
+    - If total issues = 0: Apply 1.15x bonus multiplier to all category scores
+    - If total issues = 1-2: Apply 1.10x bonus multiplier to all category scores  
+    - If total issues = 3-4: Apply 1.05x bonus multiplier to all category scores
+    - If total issues = 5+: No bonus multiplier (use base scores)
+    - Final scores must be integers between 0-100 (cap at 100 if bonus exceeds)
+    
+    KEYWORD_USAGE_PLACEMENT (0-100):
+    - 90-100: Perfect keyword presence and natural placement throughout resume, critical ATS ranking terms included, excellent industry-specific terminology
+    - 80-89: Excellent keyword usage with minor gaps in placement or density, good industry keyword coverage
+    - 70-79: Good keyword coverage but some important terms missing or poorly placed, fair industry-specific language
+    - 60-69: Fair keyword usage, missing critical ATS ranking terms, limited industry-specific terminology
+    - 50-59: Poor keyword placement, limited ATS optimization, poor industry keyword coverage
+    - 0-49: Very poor keyword usage, minimal ATS ranking potential, minimal industry-relevant terminology
+    
+    SKILLS_MATCH_ALIGNMENT (0-100):
+    - 90-100: Perfect alignment of technical and soft skills with industry requirements
+    - 80-89: Excellent skills match with minor gaps in required competencies
+    - 70-79: Good skills alignment but missing some important technical/soft skills
+    - 60-69: Fair skills match, significant gaps in required competencies
+    - 50-59: Poor skills alignment, limited relevant competencies
+    - 0-49: Very poor skills match, minimal relevant skills
+    
+    FORMATTING_LAYOUT_ATS (0-100):
+    - 90-100: Perfect clean, simple, standardized formatting, fully ATS-compatible
+    - 80-89: Excellent formatting with minor ATS compatibility issues
+    - 70-79: Good formatting but some ATS parsing concerns (tables, graphics, complex layouts)
+    - 60-69: Fair formatting with significant ATS problems
+    - 50-59: Poor formatting, major ATS parsing issues
+    - 0-49: Critical formatting problems, completely ATS-incompatible
+    
+    SECTION_ORGANIZATION (0-100):
+    - 90-100: All essential sections present with proper labeling (contact, summary, experience, skills, education, projects, certificates)
+    - 80-89: Most sections complete with minor organizational issues, may be missing projects or certificates
+    - 70-79: Basic sections present but some incomplete or poorly organized, missing important sections like projects
+    - 60-69: Missing important sections (projects, certificates) or significant organizational gaps
+    - 50-59: Major sections missing (projects, certificates) or severely disorganized
+    - 0-49: Critical sections missing, resume structure incomplete, no projects or certificates
+    
+    ACHIEVEMENTS_IMPACT_METRICS (0-100):
+    - 90-100: Quantified achievements throughout with specific metrics and measurable impact
+    - 80-89: Good use of metrics with some quantified results and clear impact
+    - 70-79: Some achievements quantified but inconsistent impact measurement
+    - 60-69: Limited quantified achievements, mostly descriptive without metrics
+    - 50-59: Very few quantified results, mostly vague descriptions
+    - 0-49: No quantified achievements, all descriptions lack measurable impact
+    
+    GRAMMAR_SPELLING_QUALITY (0-100):
+    - 90-100: Perfect spelling and grammar, professional language throughout
+    - 80-89: Minor spelling/grammar issues, mostly professional quality
+    - 70-79: Some spelling/grammar errors but generally acceptable quality
+    - 60-69: Multiple spelling/grammar issues affecting professional quality
+    - 50-59: Significant spelling/grammar problems
+    - 0-49: Critical spelling/grammar errors throughout
+    
+    HEADER_CONSISTENCY (0-100):
+    - 90-100: Perfect use of standard section labels, consistent header formatting
+    - 80-89: Excellent header consistency with minor variations
+    - 70-79: Good header usage but some non-standard labels
+    - 60-69: Fair header consistency, some ATS import issues
+    - 50-59: Poor header usage, significant ATS parsing problems
+    - 0-49: Very poor header consistency, major ATS import failures
+    
+    CLARITY_BREVITY (0-100):
+    - 90-100: Perfect clarity and brevity, concise professional language
+    - 80-89: Excellent clarity with minor verbosity issues
+    - 70-79: Good clarity but some run-on sentences or unclear points
+    - 60-69: Fair clarity, some confusing or overly complex language
+    - 50-59: Poor clarity, significant readability issues
+    - 0-49: Very poor clarity, major communication problems
+    
+    REPETITION_AVOIDANCE (0-100):
+    - 90-100: Perfect varied language, no unnecessary repetitions within same section, professional diversity across all sections
+    - 80-89: Excellent language variety with minor repetitive elements within sections, good cross-section diversity
+    - 70-79: Good variety but some repetitive action verbs or phrases within same section, acceptable cross-section repetition
+    - 60-69: Fair variety, noticeable repetition within same section affecting quality, some cross-section repetition acceptable
+    - 50-59: Poor variety, significant repetitive language within same section, limited cross-section diversity
+    - 0-49: Very poor variety, excessive repetition within same section, minimal cross-section language diversity
+    
+    COMPREHENSIVE REPETITION DETECTION REQUIREMENTS - MANDATORY:
+    - FOCUS ON ACTION VERBS AND PROFESSIONAL LANGUAGE: Only detect repeated action verbs, professional terms, and descriptive words that affect resume quality
+    - IGNORE COMMON WORDS: Do not flag repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
+    - IGNORE PROPER NOUNS: Do not flag repetitions of names, locations, company names, technologies, skills, universities, dates
+    - DETECT ACTION VERB REPETITIONS: Find action verbs that appear 2+ times within the same section (implemented, managed, developed, created, built, designed, etc.)
+    - DETECT PROFESSIONAL TERM REPETITIONS: Find professional descriptive words that appear 2+ times (scalable, secure, efficient, optimized, etc.)
+    - COUNT EXACT OCCURRENCES: For each relevant repeated word, count exactly how many times it appears in each section
+    - IDENTIFY WORD LOCATIONS: Note the exact context and position of each repeated word instance
+    - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternative words/phrases
+    - DEBUG OUTPUT: Log only relevant repetitions (action verbs and professional terms) with counts and locations
+    
+    CONTACT_INFORMATION_COMPLETENESS (0-100):
+    - 90-100: Complete contact info (name, phone, email, LinkedIn, location) with proper formatting
+    - 80-89: Missing 1-2 non-critical contact elements, good overall contact presentation
+    - 70-79: Missing important contact details (email/phone), some formatting issues
+    - 60-69: Multiple missing contact elements, poor contact information organization
+    - 50-59: Major contact information gaps, significant formatting problems
+    - 0-49: Critical contact information missing, completely inadequate contact section
+    
+    RESUME_LENGTH_OPTIMIZATION (0-100):
+    - 90-100: Perfect length for experience level, optimal content density
+    - 80-89: Appropriate length with minor adjustments needed, good content balance
+    - 70-79: Fair length optimization, some content could be condensed or expanded
+    - 60-69: Length issues (too short/long), content density problems
+    - 50-59: Poor length optimization, significant content balance issues
+    - 0-49: Inappropriate resume length, major content organization problems
+    
+    The user message contains the RESUME TEXT TO ANALYZE, the REPETITION DEBUG ANALYSIS RESULTS and the PARSED RESUME DATA (for accurate analysis).
+    
+    IMPORTANT: Use the repetition debug analysis results in the user message to determine if repetitions exist. 
+    - If repetitions_found is empty or shows 0 repeated words, DO NOT generate any FIX_REPETITION suggestions
+    - Only generate FIX_REPETITION suggestions for words that are actually listed in the repetitions_found section
+    - If no repetitions are detected, focus on other aspects of language variety and professional presentation
+    
+    CRITICAL ANALYSIS REQUIREMENTS:
+    - FIRST analyze the PARSED DATA to understand what information is actually present
+    - THEN analyze the raw text for formatting, grammar, and presentation issues
+    - ONLY suggest missing elements that are genuinely absent from the parsed data
+    - PROJECT DESCRIPTION LENGTH ENFORCEMENT: For ALL projects, count the number of statements (sentences ending with period, exclamation, or question mark) - if less than 6 statements, you MUST suggest expansion to exactly 6-7 statements - if more than 7 statements, you MUST suggest reduction to exactly 6-7 statements - this is MANDATORY and CRITICAL
+    - DO NOT suggest missing elements that already exist in the parsed data
+    - Cross-reference parsed data with raw text to identify discrepancies
+    - SECTION-SPECIFIC ANALYSIS: Each section should ONLY contain suggestions relevant to that specific section
+    - NO CROSS-SECTION SUGGESTIONS: Do not include suggestions from other sections in any section's feedback
+    - IF SECTION IS COMPLETE: If a section has all required elements and is well-formatted, return empty arrays for negatives, suggestions, and specific_issues
+    - SECTION ISOLATION: Each detailed_feedback section must be completely independent and self-contained
+    - MANDATORY PROJECT DESCRIPTION LENGTH: ALL project descriptions MUST be exactly 6-7 statements - NO EXCEPTIONS - if less than 6 statements, MUST expand to 6-7 statements - if more than 7 statements, MUST condense to 6-7 statements - this is a CRITICAL REQUIREMENT
+    - PROJECT DESCRIPTION ENFORCEMENT: For EVERY project with less than 6 statements, you MUST generate exactly 6-7 statements in your suggestions - COUNT the statements and ensure they are exactly 6-7 - this is MANDATORY
+    - PROJECT DESCRIPTION COUNTING: When analyzing projects, count each statement (each sentence ending with period, exclamation, or question mark) - if count is less than 6, you MUST suggest expansion to exactly 6-7 statements - if count is more than 7, you MUST suggest reduction to exactly 6-7 statements
+    
+    COMPREHENSIVE REPETITION ANALYSIS REQUIREMENTS - MANDATORY:
+    - FOCUS ON ACTION VERBS AND PROFESSIONAL TERMS: Only analyze repeated action verbs and professional descriptive words that impact resume quality
+    - IGNORE COMMON WORDS: Do not analyze repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
+    - IGNORE PROPER NOUNS: Do not analyze repetitions of names, locations, company names, technologies, skills, universities, dates
+    - DETECT ACTION VERB REPETITIONS: Find action verbs that appear 2+ times within the same section (implemented, managed, developed, created, built, designed, etc.)
+    - DETECT PROFESSIONAL TERM REPETITIONS: Find professional descriptive words that appear 2+ times (scalable, secure, efficient, optimized, etc.)
+    - COUNT EXACT FREQUENCY: For each relevant repeated word, count exactly how many times it appears in each section
+    - IDENTIFY CONTEXT: Note the exact context and sentence where each repeated word appears
+    - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternative words/phrases
+    - DEBUG LOGGING: Include detailed debug information showing only relevant repetitions with counts and locations
+    - ENHANCEMENT EXAMPLES: Show before/after examples for every repeated action verb/professional term with specific replacements
+    - COMPREHENSIVE COVERAGE: Find ALL repeated action verbs and professional terms in the resume
+    - MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, you MUST provide a specific recommendation in the suggestions section
+    - NO PARTIAL ANALYSIS: If 12 repeated words are detected, you MUST provide 12 specific recommendations - NO EXCEPTIONS
+    - COMPLETE ISSUE COUNTING: Count ALL repeated words as issues - if 12 words are repeated, show 12 issues to fix
+    
+    SECTION DETECTION REQUIREMENTS:
+    - Check PARSED DATA for projects: Look for "projects", "project", "portfolio" keys with actual content
+    - Check PARSED DATA for certificates: Look for "certificates", "certifications", "certificate" keys with actual content
+    - Check PARSED DATA for experience: Look for "experience", "work_experience" with company, position, dates
+    - Check PARSED DATA for education: Look for "education", "academic" with institution, degree, year
+    - Check PARSED DATA for contact: Look for "contact", "basic_details" with phone, email, location
+    - Check PARSED DATA for skills: Look for "skills", "competencies" with actual skill lists
+    - Check PARSED DATA for summary: Look for "summary", "objective", "profile" with actual content
+    - If sections exist in parsed data but are empty/incomplete, suggest improvements rather than additions
+    - If sections are completely missing from parsed data, then suggest additions
+    - Include specific feedback about missing sections in weaknesses and recommendations
+    - DATE FORMAT VALIDATION: Check ALL date fields (startDate, endDate, year, issueDate) across ALL sections for proper "MMM YYYY" format (e.g., "Jan 2025", "Dec 2024", "Mar 2023")
+    - If dates are in wrong format (e.g., "2025-01", "01/2025", "January 2025", "2025", "01-2025"), flag as date format issues in SECTION_ORGANIZATION
+    
+    SECTION-SPECIFIC FEEDBACK RULES:
+    - CONTACT SECTION: Only suggest contact-related improvements (phone, email, LinkedIn, location, formatting)
+    - SKILLS SECTION: Only suggest skills-related improvements (missing skills, categorization, formatting)
+    - EXPERIENCE SECTION: Only suggest experience-related improvements (job descriptions, achievements, formatting)
+    - EDUCATION SECTION: Only suggest education-related improvements (degrees, institutions, dates, formatting)
+    - PROJECTS SECTION: Only suggest project-related improvements (descriptions, tech stacks, outcomes, formatting) - MANDATORY: ensure all project descriptions are exactly 6-7 statements
+    - CERTIFICATIONS SECTION: Only suggest certification-related improvements (missing certs, organizations, dates)
+    - SUMMARY SECTION: Only suggest summary-related improvements (content, length, keywords, formatting)
+    - FORMATTING SECTION: Only suggest formatting-related improvements (layout, ATS compatibility, structure)
+    - GRAMMAR SECTION: Only suggest grammar and spelling improvements
+    - REPETITION SECTION: Only suggest repetition-related improvements within the same section
+    - If a section is complete and well-formatted, return empty arrays for that section's feedback
+    
+    REQUIRED OUTPUT SCHEMA (MUST INCLUDE ALL SECTIONS):
+    {
+        "overall_score": <calculate_weighted_average_of_all_category_scores>,
+        "analysis_timestamp": "<set_by_server>",
+        "category_scores": {
+            "keyword_usage_placement": <exact_score_based_on_criteria_above>,
+            "skills_match_alignment": <exact_score_based_on_criteria_above>,
+            "formatting_layout_ats": <exact_score_based_on_criteria_above>,
+            "section_organization": <exact_score_based_on_criteria_above>,
+            "achievements_impact_metrics": <exact_score_based_on_criteria_above>,
+            "grammar_spelling_quality": <exact_score_based_on_criteria_above>,
+            "header_consistency": <exact_score_based_on_criteria_above>,
+            "clarity_brevity": <exact_score_based_on_criteria_above>,
+            "repetition_avoidance": <exact_score_based_on_criteria_above>,
+            "contact_information_completeness": <exact_score_based_on_criteria_above>,
+            "resume_length_optimization": <exact_score_based_on_criteria_above>
+        },
+        "detailed_feedback": {
+            "keyword_usage_placement": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Keyword Usage & Placement",
+                "description": "Comprehensive analysis of keyword presence, placement, and ATS ranking optimization",
+                "positives": ["Quote EXACT phrases from resume that demonstrate good keyword usage with line numbers", "Reference SPECIFIC sections with strong industry terminology and exact locations", "Identify ALL instances of effective keyword integration"],
+                "negatives": ["Quote EXACT text that lacks important keywords with specific line/section references", "Identify SPECIFIC sections missing critical ATS terms with exact locations and missing keyword lists", "List ALL missing industry keywords, technical terms, soft skills, action verbs", "Identify ALL sections with insufficient keyword density"],
+                "suggestions": ["Provide EXACT text replacement for specific phrases with before/after examples", "Specify EXACT sections that need keyword additions with specific keyword lists and placement instructions", "Add missing technical keywords: [list 15-20 specific technical terms]", "Add missing soft skills: [list 8-10 specific soft skills]", "Add missing action verbs: [list 10-15 power action verbs]", "Add missing industry terms: [list 12-15 industry-specific keywords]"],
+                "specific_issues": ["List EXACT problematic text found in resume with line numbers and section names", "Identify SPECIFIC missing keywords with exact locations and industry relevance", "Document ALL instances of weak language that needs keyword enhancement", "Identify ALL sections with poor keyword optimization"],
+                "improvement_examples": ["Show DETAILED before/after text examples with exact replacements", "Provide SPECIFIC additions needed in each section with exact positioning", "Demonstrate keyword integration in summary, experience, skills, and projects sections"]
+            },
+            "skills_match_alignment": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Skills Match & Alignment",
+                "description": "Comprehensive analysis of technical and soft skills alignment with industry requirements - ONLY skills-related feedback. Do NOT include proficiency-level qualifiers (Advanced/Intermediate/Beginner/Expert). Prioritize core skills aligned with the person's designation/title.",
+                "positives": ["Quote specific skills listed in resume that align well", "Reference specific sections with strong skill presentation", "Identify ALL well-presented technical and soft skills"],
+                "negatives": ["Quote specific skills that are poorly presented", "Identify specific missing skills with exact locations", "List ALL missing technical skills, programming languages, frameworks, tools (bare names only, no proficiency levels)", "Identify ALL missing soft skills, leadership qualities, communication abilities", "Document ALL skills that need better categorization or presentation"],
+                "suggestions": ["Provide exact skill additions needed (bare skill names only, no proficiency levels)", "Specify which sections need skill reorganization", "ADD_SKILLS: Technical Skills - Add: [list 12-15 core technical skills (bare names only)]", "ADD_SKILLS: Soft Skills - Add: [list 8-10 specific soft skills]", "ADD_SKILLS: Tools & Technologies - Add: [list 10-12 specific tools and technologies]", "ADD_SKILLS: Certifications - Add: [list 5-8 relevant certifications]", "ADD_SKILLS_CATEGORY: [Category Name] - Add: [comma-separated bare skill names]"],
+                "specific_issues": ["List exact skill formatting problems found", "Identify specific missing competencies with locations", "Document ALL instances of incomplete skill presentation", "Identify ALL sections with insufficient skill coverage"],
+                "improvement_examples": ["Show before/after skill presentation examples", "Provide specific skill additions needed in each section", "Demonstrate proper skill categorization and proficiency levels"],
+                "section_isolation_note": "ONLY include skills-related suggestions. Do not suggest contact, experience, education, or other section improvements in this skills section feedback."
+            },
+            "formatting_layout_ats": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Formatting & Layout ATS",
+                "description": "Analysis of clean, simple formatting and ATS compatibility - ONLY formatting-related feedback",
+                "positives": ["Quote specific formatting elements that work well", "Reference specific sections with good ATS compatibility"],
+                "negatives": ["Quote specific formatting problems found", "Identify specific sections with ATS parsing issues"],
+                "suggestions": ["Provide exact formatting fixes needed", "Specify which sections need layout improvements"],
+                "specific_issues": ["List exact formatting problems found in resume", "Identify specific ATS compatibility issues with locations"],
+                "improvement_examples": ["Show before/after formatting examples", "Provide specific layout changes needed in each section"],
+                "section_isolation_note": "ONLY include formatting-related suggestions. Do not suggest content, skills, experience, or other section improvements in this formatting section feedback."
+            },
+            "section_organization": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Section Organization",
+                "description": "Comprehensive analysis of essential resume sections and proper organization",
+                "positives": ["Quote specific well-organized sections", "Reference specific section headers that work well", "Identify ALL properly structured sections"],
+                "negatives": ["Quote specific section organization problems", "Identify specific missing or poorly labeled sections", "List ALL missing essential sections: Projects, Certifications, Languages, References", "Document ALL incomplete sections with missing information", "Identify ALL sections with poor organization or labeling", "List ALL certifications missing issuing organizations", "Document ALL certifications without proper organizational attribution", "List ALL project descriptions that are too short (less than 6 statements) or too long (more than 7 statements)", "Document ALL project descriptions that need length optimization for professional presentation", "List ALL dates in wrong format - must be 'MMM YYYY' format (e.g., 'Jan 2025', 'Dec 2024') - flag dates like '2025-01', '01/2025', 'January 2025', '2025', '01-2025'"],
+                "suggestions": ["Provide exact section reorganization needed", "Specify which sections need better labeling", "ADD: Projects Section - Create comprehensive projects section with tech stacks, challenges, outcomes", "ADD: Certifications Section - Add relevant certifications with issuing organizations and dates", "ADD: Languages Section - Include language proficiencies if applicable", "IMPROVE: Section Headers - Standardize all section headers for ATS compatibility", "ADD_ORGANIZATION: Certifications Section - For EVERY certificate missing organization, infer and add appropriate issuing organization", "OPTIMIZE_PROJECT_DESCRIPTION: For project descriptions with less than 6 statements - MANDATORY: Expand to EXACTLY 6-7 statements with detailed tech stack, challenges, solutions, outcomes, and impact metrics - COUNT statements and ensure exactly 6-7", "OPTIMIZE_PROJECT_DESCRIPTION: For project descriptions with more than 7 statements - MANDATORY: Condense to EXACTLY 6-7 statements with precise, professional language focusing on key achievements and technical details - COUNT statements and ensure exactly 6-7", "FIX_DATE_FORMAT: Convert ALL dates to 'MMM YYYY' format - Change '2025-01' to 'Jan 2025', '01/2025' to 'Jan 2025', 'January 2025' to 'Jan 2025', '2025' to 'Jan 2025', '01-2025' to 'Jan 2025'"],
+                "specific_issues": ["List exact section organization problems found", "Identify specific missing sections with exact locations", "Document ALL instances of poor section structure", "Identify ALL sections with insufficient content", "List ALL certifications that need issuing organizations added", "List ALL project descriptions with incorrect length (too short: less than 6 statements, too long: more than 7 statements) with exact project names and current statement counts", "List ALL dates in incorrect format with exact field names and current values - must be 'MMM YYYY' format"],
+                "improvement_examples": ["Show before/after section organization examples", "Provide specific section additions needed", "Demonstrate proper section structure and content organization", "Show examples of certificates with proper organizational attribution", "Show before/after project description length examples: 'Current: [2 statements] → Optimized: [6-7 statements with tech stack, challenges, solutions, outcomes]'", "Show before/after project description length examples: 'Current: [10 statements] → Optimized: [6-7 concise, professional statements focusing on key achievements]'", "Show before/after date format examples: 'Current: 2025-01 → Fixed: Jan 2025', 'Current: 01/2025 → Fixed: Jan 2025', 'Current: January 2025 → Fixed: Jan 2025'"]
+            },
+            "achievements_impact_metrics": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Achievements & Impact Metrics",
+                "description": "Comprehensive analysis of quantified achievements and measurable results",
+                "positives": ["Quote specific quantified achievements from resume", "Reference specific sections with strong metrics", "Identify ALL instances of effective quantification"],
+                "negatives": ["Quote specific achievements that lack metrics", "Identify specific sections missing quantified results", "List ALL achievements without numbers, percentages, dollar amounts, timeframes", "Document ALL instances of vague descriptions that need quantification", "Identify ALL sections with insufficient measurable impact"],
+                "suggestions": ["Provide exact metric additions needed", "Specify which achievements need quantification", "ENHANCE_ACHIEVEMENT: Experience Section - Add quantified metrics: team sizes, project scopes, efficiency improvements, cost savings, timeframes", "ENHANCE_ACHIEVEMENT: Projects Section - Add specific outcomes: user impact, performance gains, technical achievements", "ENHANCE_ACHIEVEMENT: Summary Section - Add quantified experience: years of experience, team leadership, project delivery"],
+                "specific_issues": ["List exact achievements lacking metrics found", "Identify specific sections needing quantification with locations", "Document ALL instances of weak achievement descriptions", "Identify ALL sections with poor impact measurement"],
+                "improvement_examples": ["Show before/after achievement examples with metrics", "Provide specific quantified improvements needed", "Demonstrate proper quantification in experience, projects, and summary sections"]
+            },
+            "grammar_spelling_quality": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Grammar & Spelling Quality",
+                "description": "Analysis of error-free professional language and quality - ONLY grammar and spelling feedback",
+                "positives": ["Quote specific well-written sentences from resume", "Reference specific sections with excellent grammar"],
+                "negatives": ["Quote specific grammatical errors found", "Identify specific spelling mistakes with exact locations"],
+                "suggestions": ["Provide exact corrections for specific errors", "Specify which sentences need rewriting"],
+                "specific_issues": ["List exact grammatical errors found in resume", "Identify specific spelling mistakes with locations"],
+                "improvement_examples": ["Show before/after grammar correction examples", "Provide specific sentence improvements needed"],
+                "section_isolation_note": "ONLY include grammar and spelling suggestions. Do not suggest content, formatting, skills, or other section improvements in this grammar section feedback."
+            },
+            "header_consistency": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Header Consistency",
+                "description": "Analysis of standard section labels and header formatting",
+                "positives": ["Quote specific well-formatted headers from resume", "Reference specific sections with consistent labeling"],
+                "negatives": ["Quote specific inconsistent headers found", "Identify specific non-standard section labels"],
+                "suggestions": ["Provide exact header corrections needed", "Specify which headers need standardization"],
+                "specific_issues": ["List exact header inconsistencies found", "Identify specific non-standard labels with locations"],
+                "improvement_examples": ["Show before/after header examples", "Provide specific header standardization needed"]
+            },
+            "clarity_brevity": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Clarity & Brevity",
+                "description": "Analysis of clear, concise sentences and professional brevity",
+                "positives": ["Quote specific clear, concise sentences from resume", "Reference specific sections with excellent brevity"],
+                "negatives": ["Quote specific unclear or verbose sentences found", "Identify specific sections that are too wordy"],
+                "suggestions": ["Provide exact sentence simplifications needed", "Specify which sections need condensing"],
+                "specific_issues": ["List exact unclear sentences found in resume", "Identify specific verbose sections with locations"],
+                "improvement_examples": ["Show before/after clarity examples", "Provide specific sentence improvements needed"]
+            },
+            "repetition_avoidance": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Repetition Avoidance",
+                "description": "Comprehensive analysis of ALL repeated language and unnecessary repetitions within same section, allowing legitimate repetition across different sections - ONLY repetition-related feedback",
+                "positives": ["Quote specific varied language examples from resume", "Reference specific sections with good word variety", "Note acceptable cross-section repetition where appropriate"],
+                "negatives": ["Quote EVERY specific repetitive action verb found within same section", "Identify ALL sections with excessive action verb repetition", "List ALL overused action verbs with exact counts", "Document ALL redundant professional terms with specific locations", "Count EVERY instance of repeated action verbs within same section", "DEBUG: List ALL detected repeated action verbs with exact counts: Action Verb '[word]' appears [X] times in [Section]: [Context1], [Context2], [Context3]", "DEBUG: Categorize repetitions by type: Action Verbs: [list], Professional Terms: [list]", "MANDATORY: List EVERY repeated word as a separate issue - if 12 words are repeated, list ALL 12 as separate issues"],
+                "suggestions": ["Provide exact action verb replacements needed for EVERY repeated action verb within same section", "Specify ALL sections that need internal action verb variety", "FIX_REPETITION: [Section] - Action Verb '[repeated action verb]' used [X] times - Replace instances: [Instance 1: '[exact context]' → '[alternative1]'], [Instance 2: '[exact context]' → '[alternative2]'], [Instance 3: '[exact context]' → '[alternative3]']", "ENHANCE_VARIETY: For each repeated action verb, provide 3-5 specific professional alternatives with context", "DEBUG: Show complete action verb frequency analysis for each section", "MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, provide a specific FIX_REPETITION recommendation", "NO PARTIAL ANALYSIS: If 12 repeated words are detected, provide 12 specific FIX_REPETITION recommendations", "COMPREHENSIVE RECOMMENDATIONS: Include recommendations for ALL action verbs AND professional terms", "CRITICAL: Generate ONE FIX_REPETITION suggestion for EACH repeated word - if 'created' appears 3 times, generate 1 FIX_REPETITION suggestion for 'created' with 3 specific replacements", "CRITICAL: Generate ONE FIX_REPETITION suggestion for EACH professional term - if 'scalable' appears 3 times, generate 1 FIX_REPETITION suggestion for 'scalable' with 3 specific replacements", "MANDATORY: Based on the repetition debug analysis, generate FIX_REPETITION suggestions for ALL detected repeated words", "CRITICAL: If repetition_debug_analysis shows 17 repeated words, generate 17 FIX_REPETITION suggestions", "REQUIRED: For each word in the repetition analysis, create: FIX_REPETITION: [Section] - [Word Type] '[word]' used [X] times - Replace instances: [specific replacements]", "Note that cross-section repetition is acceptable when contextually appropriate"],
+                "specific_issues": ["List EVERY exact repetitive action verb found within same section in resume with counts", "Identify ALL specific sections needing internal action verb variety with exact locations", "Document ALL instances of overused action verbs", "Count ALL repeated action verbs within each section", "DEBUG: Complete action verb inventory: [Section1]: [action_verb1: X times], [action_verb2: Y times], [Section2]: [action_verb3: Z times]", "DEBUG: Highlight problematic repetitions: Action verbs appearing 3+ times in same section"],
+                "improvement_examples": ["Show before/after repetition examples for EVERY repeated action verb within same section", "Provide specific action verb variety improvements needed for ALL repetitions within sections", "Demonstrate alternative action verb choices for EVERY overused term", "DEBUG: Before/After examples: 'Current: [exact repeated action verb]' → 'Improved: [varied action verb alternatives]'", "DEBUG: Show action verb replacement mapping: [Original Action Verb] → [Alternative 1, Alternative 2, Alternative 3]"],
+                "section_isolation_note": "ONLY include repetition-related suggestions. Do not suggest content, formatting, skills, or other section improvements in this repetition section feedback."
+            },
+            "contact_information_completeness": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Contact Information Completeness",
+                "description": "Comprehensive analysis of contact details presence, formatting, and professional presentation - ONLY contact-related feedback",
+                "positives": ["Quote specific well-formatted contact information from resume", "Reference specific contact elements that are complete", "Identify ALL properly formatted contact details"],
+                "negatives": ["Quote specific missing contact information", "Identify specific contact formatting problems", "List ALL missing contact elements: phone number, email address, LinkedIn profile, location, professional title", "Document ALL contact formatting issues: inconsistent formatting, missing elements, poor presentation"],
+                "suggestions": ["Provide exact contact additions needed", "Specify which contact elements need formatting fixes", "FIX_CONTACT: Add missing phone number with proper formatting", "FIX_CONTACT: Add professional email address", "FIX_CONTACT: Add LinkedIn profile URL", "FIX_CONTACT: Add current location", "FIX_CONTACT: Add professional title"],
+                "specific_issues": ["List exact missing contact information found", "Identify specific contact formatting problems with locations", "Document ALL instances of incomplete contact information", "Identify ALL contact formatting inconsistencies"],
+                "improvement_examples": ["Show before/after contact information examples", "Provide specific contact improvements needed", "Demonstrate proper contact formatting and completeness"],
+                "section_isolation_note": "ONLY include contact-related suggestions. Do not suggest skills, experience, education, or other section improvements in this contact section feedback."
+            },
+            "resume_length_optimization": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Resume Length Optimization",
+                "description": "Comprehensive analysis of resume length appropriateness and section-specific description optimization",
+                "positives": ["Quote specific sections with appropriate length", "Reference specific content that is well-balanced", "Identify ALL well-sized descriptions"],
+                "negatives": ["Quote specific sections that are too long/short", "Identify specific content that needs length adjustment", "List ALL project descriptions that are too short (less than 2 sentences)", "List ALL experience descriptions that are too short (less than 2 sentences)", "List ALL summary descriptions that are too short (less than 50 words)", "List ALL project descriptions that are too long (more than 5 sentences)", "List ALL experience descriptions that are too long (more than 5 sentences)", "List ALL summary descriptions that are too long (more than 150 words)"],
+                "suggestions": ["Provide exact content additions/removals needed", "Specify which sections need length optimization", "OPTIMIZE_DESCRIPTION: Project Section - Current: '[exact short description]' - Expand to: '[detailed 3-4 sentence description with tech stack, challenges, outcomes, and metrics]'", "OPTIMIZE_DESCRIPTION: Experience Section - Current: '[exact short description]' - Expand to: '[detailed 3-4 sentence description with responsibilities, achievements, and quantified results]'", "OPTIMIZE_DESCRIPTION: Summary Section - Current: '[exact short summary]' - Expand to: '[comprehensive 3-4 line summary with experience, skills, achievements, and career objectives]'", "OPTIMIZE_DESCRIPTION: Project Section - Current: '[exact long description]' - Compress to: '[concise 2-3 sentence description focusing on key outcomes and tech stack]'", "OPTIMIZE_DESCRIPTION: Experience Section - Current: '[exact long description]' - Compress to: '[focused 2-3 sentence description highlighting main achievements and responsibilities]'", "OPTIMIZE_DESCRIPTION: Summary Section - Current: '[exact long summary]' - Compress to: '[concise 2-3 line summary with core competencies and value proposition]'"],
+                "specific_issues": ["List exact length problems found in resume", "Identify specific sections needing length adjustment with locations", "Document ALL descriptions that need expansion with exact content", "Document ALL descriptions that need compression with exact content"],
+                "improvement_examples": ["Show before/after length optimization examples", "Provide specific content density improvements needed", "Demonstrate optimal description lengths for projects, experience, and summary sections"]
+            }
+        },
+        "strengths": [
+            "Specific strength 1 with details",
+            "Specific strength 2 with details",
+            "Specific strength 3 with details"
+        ],
+        "weaknesses": [
+            "Specific weakness 1 with details",
+            "Specific weakness 2 with details",
+            "Specific weakness 3 with details"
+        ],
+        "recommendations": [
+            "MANDATORY: Include ALL identified issues from EVERY section in recommendations",
+            "If 5 repetition issues found, list ALL 5 repetition fixes in recommendations",
+            "If 3 sections missing dates, list ALL 3 sections with missing dates in recommendations", 
+            "If multiple description length issues, list ALL description optimization needs in recommendations",
+            "If project descriptions are too short (less than 6 statements), include 'OPTIMIZE_PROJECT_LENGTH: Expand project descriptions to 6-7 professional statements with tech stack, challenges, solutions, outcomes, and impact metrics' in recommendations",
+            "If project descriptions are too long (more than 7 statements), include 'OPTIMIZE_PROJECT_LENGTH: Condense project descriptions to 6-7 concise, professional statements focusing on key achievements and technical details' in recommendations",
+            "If experience descriptions are too short, include 'OPTIMIZE_DESCRIPTION: Expand experience descriptions' in recommendations", 
+            "If summary description is too short, include 'OPTIMIZE_DESCRIPTION: Expand summary description' in recommendations",
+            "If experience descriptions are too long, include 'OPTIMIZE_DESCRIPTION: Compress experience descriptions' in recommendations",
+            "If summary description is too long, include 'OPTIMIZE_DESCRIPTION: Compress summary description' in recommendations",
+            "If skills are unstructured, include skills restructuring in recommendations",
+            "If certificates missing organizations, include ALL organization inferences in recommendations",
+            "For EVERY certificate without issuing organization, include 'ADD_ORGANIZATION: [Certificate Name] - Add issuing organization' in recommendations",
+            "If dates are in wrong format, include 'FIX_DATE_FORMAT: Convert ALL dates to MMM YYYY format (e.g., Jan 2025, Dec 2024)' in recommendations",
+            "EVERY single issue must appear in recommendations - DO NOT limit to 5 items",
+            "Priority recommendation 1: [Most critical issue with specific action]",
+            "Priority recommendation 2: [Second critical issue with specific action]",
+            "Continue listing ALL remaining issues until EVERY problem is addressed",
+            "Include ALL missing dates from ALL sections as separate recommendation items",
+            "Include ALL repetition issues as separate recommendation items",
+            "Include ALL description length issues as separate recommendation items",
+            "Include ALL formatting issues as separate recommendation items",
+            "Include ALL grammar issues as separate recommendation items",
+            "Include ALL missing certificate organizations as separate recommendation items",
+            "TOTAL RECOMMENDATIONS SHOULD EQUAL TOTAL ISSUES FOUND"
+        ]
+    }
+    
+    FINAL INSTRUCTIONS - CRITICAL FOR CONSISTENCY:
+    - NEVER omit sections - return empty values instead of missing sections!
+    - overall_score MUST be a weighted average of all category scores (integer 0-100)
+    - All category scores MUST be integers between 0-100 based on precise criteria above!
+    - Provide specific, actionable recommendations with clear next steps!
+    - Focus on ATS compatibility, professional presentation, and measurable improvements!
+    - Use varied, professional language - avoid repetition across sections!
+    - Ensure all feedback is specific to the actual resume content analyzed!
+    - Calculate scores based on objective criteria, not subjective opinions!
+    - Maintain consistency in scoring methodology across all categories!
+    - Apply the same rigorous standards for each parameter from the CSV criteria!
+    - Ensure consistent evaluation of keyword usage, skills match, formatting, and all other parameters!
+    - Use the exact scoring ranges provided for each category - no deviations!
+    - Provide consistent, professional feedback that matches the scoring criteria exactly!
+    
+    ULTRA-COMPREHENSIVE FEEDBACK REQUIREMENTS - MANDATORY FOR 90+ SCORE IMPROVEMENT:
+    - For POSITIVES: Quote EXACT phrases with precise locations from the actual resume that demonstrate strengths
+    - For NEGATIVES: Quote EXACT problematic text with specific replacements, missing elements with precise additions, formatting issues with exact fixes
+    - For SUGGESTIONS: Provide COMPLETE before/after text replacements that will boost scores by 5-10 points each
+    - Always reference EXACT content with QUANTIFIED improvements and INDUSTRY KEYWORDS
+    - Provide SPECIFIC text replacements: "Replace '[exact current text]' with '[complete improved text with metrics and keywords]'"
+    - Add SPECIFIC skills: "Add these exact skills to Skills section: [list 8-10 specific technical skills]"
+    - Enhance SPECIFIC achievements: "Replace '[current achievement]' with '[quantified achievement with numbers, percentages, and impact metrics]'"
+    - Fix SPECIFIC formatting: "Change '[exact formatting issue]' to '[exact formatting solution]'"
+    - Add SPECIFIC keywords: "Integrate these exact industry terms: [list 10-15 specific keywords with placement instructions]"
+    - Enhance SPECIFIC sections: "In [exact section], add '[complete content with quantified metrics]'"
+    
+    COMPREHENSIVE REPETITION ANALYSIS - MANDATORY DEBUGGING:
+    - FOCUS ON ACTION VERBS AND PROFESSIONAL TERMS: Only analyze repeated action verbs and professional descriptive words
+    - IGNORE COMMON WORDS: Do not analyze repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
+    - IGNORE PROPER NOUNS: Do not analyze repetitions of names, locations, company names, technologies, skills, universities, dates
+    - COUNT RELEVANT REPETITIONS: Find action verbs and professional terms that appear 2+ times within the same section
+    - DEBUG OUTPUT FORMAT: "DEBUG: Action Verb '[word]' appears [X] times in [Section]: [Context1], [Context2], [Context3]"
+    - CATEGORIZE REPETITIONS: "DEBUG: Action Verbs: [list], Professional Terms: [list]"
+    - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternatives
+    - ENHANCEMENT EXAMPLES: Show before/after for every repeated action verb/professional term with specific replacements
+    - COMPREHENSIVE COVERAGE: Find ALL repeated action verbs and professional terms
+    - DEBUG INVENTORY: "DEBUG: Action Verb inventory: [Section1]: [word1: X times], [word2: Y times]"
+    - REPLACEMENT MAPPING: "DEBUG: [Original Action Verb] → [Alternative 1, Alternative 2, Alternative 3]"
+    - MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, you MUST provide a specific recommendation
+    - NO PARTIAL ANALYSIS: If 12 repeated words are detected, you MUST provide 12 specific recommendations - NO EXCEPTIONS
+    - COMPLETE ISSUE COUNTING: Count ALL repeated words as issues - if 12 words are repeated, show 12 issues to fix
+    - COMPREHENSIVE RECOMMENDATIONS: Include recommendations for ALL action verbs AND professional terms detected
+    
+    MANDATORY REPETITION RECOMMENDATION FORMAT - COMPLETE COVERAGE REQUIRED:
+    For EVERY repeated word detected, you MUST provide a recommendation in this exact format:
+    "FIX_REPETITION: [Section] - [Word Type] '[repeated word]' used [X] times - Replace instances: [Instance 1: '[exact context]' → '[alternative1]'], [Instance 2: '[exact context]' → '[alternative2]'], [Instance 3: '[exact context]' → '[alternative3]']"
+    STRICT UNIQUENESS RULES FOR ALTERNATIVES:
+    - Do NOT suggest any alternative that already appears anywhere in the resume text.
+    - Do NOT reuse the same alternative across different FIX_REPETITION lines.
+    - If all obvious alternatives are already present, REFRAME the sentence fragment to eliminate repetition while preserving meaning (e.g., "built microservices" → "architected a microservice-based platform").
+    - Prefer concise, professional verbs; vary verbs across instances.
+    
+    EXAMPLE FOR COMPLETE COVERAGE:
+    If these words are detected as repeated:
+    - Action Verb 'built' (4 times)
+    - Action Verb 'implemented' (3 times)  
+    - Action Verb 'designed' (2 times)
+    - Professional Term 'scalable' (2 times)
+    - Professional Term 'secure' (2 times)
+    
+    You MUST provide 5 separate recommendations:
+    1. "FIX_REPETITION: General - Action Verb 'built' used 4 times - Replace instances: [Instance 1: 'built microservices' → 'created microservices'], [Instance 2: 'built and deployed' → 'developed and deployed'], [Instance 3: 'built monitoring' → 'established monitoring'], [Instance 4: 'built CI/CD' → 'implemented CI/CD']"
+    2. "FIX_REPETITION: General - Action Verb 'implemented' used 3 times - Replace instances: [Instance 1: 'implemented fraud detection' → 'developed fraud detection'], [Instance 2: 'implemented CI/CD' → 'established CI/CD'], [Instance 3: 'implemented monitoring' → 'configured monitoring']"
+    3. "FIX_REPETITION: General - Action Verb 'designed' used 2 times - Replace instances: [Instance 1: 'designed architecture' → 'architected solution'], [Instance 2: 'designed UI' → 'created UI']"
+    4. "FIX_REPETITION: General - Professional Term 'scalable' used 2 times - Replace instances: [Instance 1: 'scalable architecture' → 'robust architecture'], [Instance 2: 'scalable solution' → 'flexible solution']"
+    5. "FIX_REPETITION: General - Professional Term 'secure' used 2 times - Replace instances: [Instance 1: 'secure authentication' → 'robust authentication'], [Instance 2: 'secure system' → 'protected system']"
+    
+    COMPREHENSIVE PROBLEM DETECTION REQUIREMENTS - IDENTIFY EVERY POSSIBLE ISSUE:
+    - CONTACT SECTION: Check for missing name, phone, email, LinkedIn, location, professional title, website, GitHub
+    - SUMMARY SECTION: Check for missing professional summary, quantified experience, industry keywords, achievement highlights, skills mention, description length (too short/long)
+    - EXPERIENCE SECTION: Check for missing company names, job titles, dates, locations, quantified achievements, action verbs, industry keywords, technical details, team sizes, project scopes, business impact, description length (too short/long)
+    - EDUCATION SECTION: Check for missing institution names, degrees, graduation years, GPAs, locations, relevant coursework, academic achievements, honors
+    - SKILLS SECTION: Check for missing technical skills, soft skills, tools, frameworks, programming languages, certifications, proficiency levels, industry-specific competencies, unstructured skills text that needs proper formatting
+    - PROJECTS SECTION: Check for missing project names, descriptions, tech stacks, dates, links, challenges solved, outcomes achieved, team collaboration details, description length (too short/long), project description length validation (MANDATORY: exactly 6-7 statements required - count each statement and ensure exactly 6-7)
+    - CERTIFICATIONS SECTION: Check for missing certificate names, issuing organizations, dates, expiration dates, credential IDs, skill validation, infer organizations from certificate names
+    - LANGUAGES SECTION: Check for missing language proficiency levels, certifications, relevant language skills for the role
+    - REFERENCES SECTION: Check for missing reference contact information, professional relationships, permission to contact
+    - FORMATTING ISSUES: Check for inconsistent fonts, spacing, bullet points, section headers, date formats, contact formatting, ATS compatibility
+    - KEYWORD OPTIMIZATION: Check for missing industry keywords, technical terms, soft skills, action verbs, quantified metrics, location keywords
+    - ACHIEVEMENT QUANTIFICATION: Check for missing numbers, percentages, dollar amounts, timeframes, team sizes, project scopes, efficiency improvements, cost savings
+    - GRAMMAR & SPELLING: Check for typos, grammatical errors, inconsistent tense, punctuation issues, professional language quality
+    - REPETITION ISSUES: Check for ALL repeated words within same section, ALL overused action verbs, ALL redundant phrases, lack of variety - LIST EVERY SINGLE REPETITION ISSUE
+    - SECTION COMPLETENESS: Check for missing essential sections, incomplete information, empty fields, placeholder text
+    - ATS COMPATIBILITY: Check for tables, graphics, complex formatting, non-standard fonts, header issues, parsing problems
+    - MISSING DATES ANALYSIS: Check for missing dates in ALL sections (experience, education, projects, certifications, languages, references) and list EVERY section with missing dates
+    - DESCRIPTION OPTIMIZATION: Check for descriptions that are too short (less than 2 sentences) or too long (more than 5 sentences) in ALL sections
+    
+    SPECIFIC SECTION ANALYSIS REQUIREMENTS:
+    - EXPERIENCE SECTION: Check for missing company names, job titles, dates, descriptions, locations
+    - EDUCATION SECTION: Check for missing institution names, degrees, graduation years, GPAs, locations
+    - CONTACT SECTION: Check for missing phone, email, LinkedIn, location, professional title
+    - SKILLS SECTION: Check for missing technical skills, soft skills, skill categorization
+    - PROJECTS SECTION: Check for missing project names, descriptions, tech stacks, dates, links, project description length validation (MANDATORY: exactly 6-7 statements required - count each statement and ensure exactly 6-7)
+    - CERTIFICATIONS SECTION: Check for missing certificate names, issuing organizations, dates
+    - SUMMARY SECTION: Check for missing professional summary or objective
+    - LANGUAGES SECTION: Check for missing language proficiency levels
+    - REFERENCES SECTION: Check for missing reference contact information
+    
+    ULTRA-COMPREHENSIVE SUGGESTION FORMAT FOR 90+ SCORES:
+    - SKILLS FORMAT: "ADD_SKILLS: [Section] - Missing: [exact skill list] - Add: 'Technical Skills: Python (Advanced), React.js (Expert), AWS (Intermediate), Machine Learning (Advanced), SQL (Expert), Docker (Intermediate), Git (Advanced), Agile/Scrum (Expert), Kubernetes (Intermediate), Microservices (Advanced)'"
+    - SKILLS STRUCTURE FORMAT: "STRUCTURE_SKILLS: [Section] - Current: '[unstructured skills text]' - Restructure to: 'Technical: [Java, Python, JavaScript], Soft Skills: [Communication, Leadership, Problem Solving], Tools: [Git, Docker, Jenkins], Frameworks: [React, Angular, Spring]'"
+    - ACHIEVEMENT FORMAT: "ENHANCE_ACHIEVEMENT: [Section] - Current: '[exact current text]' - Replace with: '[quantified achievement with 2-3 specific metrics, percentages, and business impact]'"
+    - KEYWORD FORMAT: "ADD_KEYWORDS: [Section] - Missing terms: [exact keyword list] - Integration: 'Naturally integrate these terms: [specific placement instructions for each keyword]'"
+    - EXPERIENCE FORMAT: "IMPROVE_EXPERIENCE: [Section] - Current: '[exact bullet point]' - Replace with: '[power verb] + [specific action] + [quantified result] + [business impact] + [relevant keywords]'"
+    - PROJECT FORMAT: "ENHANCE_PROJECT: [Section] - Current: '[exact description]' - Replace with: '[detailed project with tech stack, challenges solved, quantified outcomes, and industry keywords]'"
+    - PROJECT LENGTH FORMAT: "OPTIMIZE_PROJECT_LENGTH: [Project Name] - Current: '[X statements]' - Issue: '[too short: less than 6 statements / too long: more than 7 statements]' - Replace with: '[6-7 professional statements with tech stack, challenges, solutions, outcomes, and impact metrics]'"
+    - CONTACT FORMAT: "FIX_CONTACT: [Section] - Issue: '[exact issue]' - Solution: '[complete contact format with all required elements]'"
+    - SUMMARY FORMAT: "REWRITE_SUMMARY: [Section] - Current: '[exact text]' - Replace with: '[3-4 line professional summary with years of experience, key skills, achievements, and industry keywords]'"
+    - MISSING SECTION FORMAT: "ADD_SECTION: [Section Name] - Missing: [section description] - Add: '[complete section content with all required elements]'"
+    - FORMATTING FORMAT: "FIX_FORMATTING: [Section] - Issue: '[exact formatting problem]' - Solution: '[exact formatting fix]'"
+    - GRAMMAR FORMAT: "FIX_GRAMMAR: [Section] - Current: '[exact text with error]' - Replace with: '[corrected text]'"
+    - MISSING DATES FORMAT: "ADD_DATES: [All Sections with Missing Dates] - Missing dates in: [Experience Section: Company A, Company B], [Projects Section: Project X, Project Y], [Certifications Section: Cert A, Cert B] - Add: '[Experience: Jan 2020 - Dec 2022], [Projects: Mar 2021 - May 2021, Jun 2022 - Aug 2022], [Certifications: Issued: Jan 2023, Valid until: Jan 2026]'"
+    - PROJECT DATES FORMAT: "ADD_PROJECT_DATES: Projects Section - Missing start/end dates for: [Project Name 1, Project Name 2] - Add dummy dates: '[Project 1: Jan 2023 - Mar 2023], [Project 2: Apr 2023 - Jun 2023]' with realistic 2-4 month durations"
+    - ORGANIZATION INFERENCE FORMAT: "ADD_ORGANIZATION: [Section] - Certificate: '[certificate name]' - Inferred organization: '[Google for Google Cloud Certification, Microsoft for Azure Certification, Oracle for Oracle Database Certification, etc.]'"
+    - DESCRIPTION LENGTH FORMAT: "OPTIMIZE_DESCRIPTION: [Section] - Current: '[exact description]' - Issue: '[too short: less than 2 sentences / too long: more than 5 sentences]' - Replace with: '[optimized 2-4 sentence description with keywords and metrics]'"
+    - REPETITION FORMAT: "FIX_REPETITION: [Section] - Repeated words: '[managed, developed, implemented, created]' - Replace instances: '[First: managed → led], [Second: developed → engineered], [Third: implemented → executed], [Fourth: created → designed]'"
+    
+    PARSED DATA ANALYSIS RULES:
+    - If parsed data shows projects with dates, DO NOT suggest missing project dates
+    - If parsed data shows experience with company names, DO NOT suggest missing company names
+    - If parsed data shows education with degrees, DO NOT suggest missing degrees
+    - If parsed data shows contact info, DO NOT suggest missing contact information
+    - If parsed data shows skills, DO NOT suggest missing skills section
+    - Only suggest missing elements if they are genuinely absent from the parsed data
+    - Focus on quality improvements for existing elements rather than suggesting missing elements
+    - Check for completeness: if a field exists but is empty or incomplete, suggest improvements
+    - Check for accuracy: if a field exists but has poor content, suggest better content
+    """,
+    user_template="""
+    RESUME TEXT TO ANALYZE:
+    {resume_text}
+
+    REPETITION DEBUG ANALYSIS RESULTS:
+    {repetition_debug}
+
+    PARSED RESUME DATA (for accurate analysis):
+    {parsed_data}
+    """
+)
+
+TECH_STACK_PROMPT = register_prompt(
+    "tech_stack.extract",
+    system="""
+    Analyze the project description in the user message and extract all technologies, frameworks, programming languages, tools, and platforms mentioned.
+    
+    Return ONLY a comma-separated list of technologies found. Do not include explanations or additional text.
+    Examples of what to extract:
+    - Programming languages: Python, JavaScript, Java, C++, etc.
+    - Frameworks: React, Angular, Django, Spring, etc.
+    - Databases: MySQL, MongoDB, PostgreSQL, etc.
+    - Cloud platforms: AWS, Azure, GCP, etc.
+    - Tools: Docker, Kubernetes, Git, Jenkins, etc.
+    - Libraries: NumPy, Pandas, Express.js, etc.
+    
+    If no technologies are found, return an empty string.
+    """,
+    user_template="""
+    PROJECT DESCRIPTION:
+    {description}
+    """
+)
+
 class StandardATSService:
     """
     Standard ATS (Applicant Tracking System) analysis service
@@ -459,19 +1234,91 @@ class StandardATSService:
         self.update_generation_parameters(temperature=0.1, top_p=0.8)
         logger.info("🎯 Set consistent parameters for deterministic ATS analysis")
 
-    def analyze_resume(self, resume_text: str, parsed_data: Dict[str, Any] = None) -> Dict[str, Any]:
+    def analyze_resume(self, resume_text: str, parsed_data: Dict[str, Any] = None, use_cache: bool = True) -> Dict[str, Any]:
         """
         Analyze resume for ATS optimization and provide comprehensive feedback
         
         Args:
             resume_text: Raw resume text to analyze
             parsed_data: Optional parsed resume data for more accurate analysis
+            use_cache: Serve identical requests from the LLM response cache (set False to force a fresh call)
             
         Returns:
             Dictionary containing ATS analysis results with scores and recommendations
         """
         logger.info(f"Starting Standard ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
         
+        request = self._build_analysis_request(resume_text, parsed_data)
+
+        try:
+            logger.info(f"Generating ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
+            response = continued_chat_completion(self.client, use_cache=use_cache, **request["completion_kwargs"])
+            return self._finalize_analysis(response.choices[0].message.content, resume_text, request)
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze resume for ATS: {str(e)}")
+            raise
+
+    async def aanalyze_resume(self, resume_text: str, parsed_data: Dict[str, Any] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Async version of analyze_resume
+        
+        The main analysis call goes through the shared AsyncOpenAI client; local pre-analysis
+        and post-processing (including FIX_* augmentation calls) run in a worker thread.
+        
+        Args:
+            resume_text: Raw resume text to analyze
+            parsed_data: Optional parsed resume data for more accurate analysis
+            use_cache: Serve identical requests from the LLM response cache (set False to force a fresh call)
+            
+        Returns:
+            Dictionary containing ATS analysis results with scores and recommendations
+        """
+        logger.info(f"Starting Standard ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
+        
+        request = await asyncio.to_thread(self._build_analysis_request, resume_text, parsed_data)
+
+        try:
+            response = await acontinued_chat_completion(self.parser.async_client, use_cache=use_cache, **request["completion_kwargs"])
+            return await asyncio.to_thread(self._finalize_analysis, response.choices[0].message.content, resume_text, request)
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze resume for ATS: {str(e)}")
+            raise
+
+    def analyze_resume_stream(self, resume_text: str, parsed_data: Dict[str, Any] = None, use_cache: bool = True) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streaming version of analyze_resume
+        
+        Yields local analyzer findings immediately, category blocks as the model writes them,
+        FIX_* suggestion lines as augmentation completes them, and finally the merged result.
+        
+        Args:
+            resume_text: Raw resume text to analyze
+            parsed_data: Optional parsed resume data for more accurate analysis
+            use_cache: Serve identical requests from the LLM response cache (set False to force a fresh call)
+            
+        Yields:
+            (event, data) tuples; the last one is ("result", <same document analyze_resume returns>)
+        """
+        logger.info(f"Starting streamed Standard ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
+        
+        request = self._build_analysis_request(resume_text, parsed_data)
+
+        try:
+            yield from _stream_analysis_events(
+                self.client,
+                request,
+                lambda response_text, on_suggestion: self._finalize_analysis(response_text, resume_text, request, on_suggestion),
+                use_cache=use_cache
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze resume for ATS: {str(e)}")
+            raise
+
+    def _build_analysis_request(self, resume_text: str, parsed_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run the local pre-analysis and build the chat completion arguments for the analysis request"""
         # Validate parsed data if provided
         if parsed_data:
             parsed_data = self._validate_parsed_data(parsed_data)
@@ -483,630 +1330,93 @@ class StandardATSService:
         # Still need repetition analysis for the suggestions (but without debug logging)
         repetition_debug = self._analyze_repetitions_debug(resume_text)
         
-        prompt = f"""
-        You are an expert ATS (Applicant Tracking System) analyst with 10+ years of experience in resume optimization and HR technology.
-        
-        TASK: Perform a comprehensive ATS analysis of the provided resume with precise, consistent scoring and HIGHLY SPECIFIC, ACTIONABLE feedback that will increase the resume score by 10-15 points when applied.
-        
-        CRITICAL REQUIREMENTS - MANDATORY COMPLIANCE:
-        - Return ONLY valid JSON (no markdown, no code fences, no explanations, no additional text)
-        - NEVER omit any section - if no issues exist, return empty arrays/strings but keep the section structure
-        - ALWAYS include ALL required sections: overall_score, category_scores, detailed_feedback, extracted_text, strengths, weaknesses, recommendations
-        - Ensure all scores are integers between 0-100 (never "NA", "N/A", "None", "Null", "Unknown", or text)
-        - NEVER use placeholder values - provide HIGHLY SPECIFIC, ACTIONABLE content with EXACT text examples
-        - LANGUAGE VARIETY: Use varied language within same sections, allow appropriate repetition across different sections
-        - PERFECT GRAMMAR: All content must have flawless spelling, grammar, and professional language
-        - CONSISTENT SCORING: Apply the same rigorous standards across all categories
-        - COMPREHENSIVE REPETITION ANALYSIS: For repetition_avoidance section, analyze ALL repeated words and provide individual FIX_REPETITION suggestions for EACH repeated word - if 15 words are repeated, provide 15 specific FIX_REPETITION suggestions
-        - SPECIFIC FEEDBACK: Every suggestion must include EXACT text examples, specific section locations, and precise improvement instructions
-        
-        PRECISE SCORING CRITERIA - APPLY CONSISTENTLY:
-        
-        DYNAMIC SCORING RULES:
-        - Use precise scores (not just multiples of 5) - e.g., 87, 93, 76, 84
-        - Count total issues/problems found across all categories
-        - If total issues = 0: Apply 1.15x bonus multiplier to all category scores
-        - If total issues = 1-2: Apply 1.10x bonus multiplier to all category scores  
-        - If total issues = 3-4: Apply 1.05x bonus multiplier to all category scores
-        - If total issues = 5+: No bonus multiplier (use base scores)
-        - Final scores must be integers between 0-100 (cap at 100 if bonus exceeds)
-        
-        KEYWORD_USAGE_PLACEMENT (0-100):
-        - 90-100: Perfect keyword presence and natural placement throughout resume, critical ATS ranking terms included, excellent industry-specific terminology
-        - 80-89: Excellent keyword usage with minor gaps in placement or density, good industry keyword coverage
-        - 70-79: Good keyword coverage but some important terms missing or poorly placed, fair industry-specific language
-        - 60-69: Fair keyword usage, missing critical ATS ranking terms, limited industry-specific terminology
-        - 50-59: Poor keyword placement, limited ATS optimization, poor industry keyword coverage
-        - 0-49: Very poor keyword usage, minimal ATS ranking potential, minimal industry-relevant terminology
-        
-        SKILLS_MATCH_ALIGNMENT (0-100):
-        - 90-100: Perfect alignment of technical and soft skills with industry requirements
-        - 80-89: Excellent skills match with minor gaps in required competencies
-        - 70-79: Good skills alignment but missing some important technical/soft skills
-        - 60-69: Fair skills match, significant gaps in required competencies
-        - 50-59: Poor skills alignment, limited relevant competencies
-        - 0-49: Very poor skills match, minimal relevant skills
-        
-        FORMATTING_LAYOUT_ATS (0-100):
-        - 90-100: Perfect clean, simple, standardized formatting, fully ATS-compatible
-        - 80-89: Excellent formatting with minor ATS compatibility issues
-        - 70-79: Good formatting but some ATS parsing concerns (tables, graphics, complex layouts)
-        - 60-69: Fair formatting with significant ATS problems
-        - 50-59: Poor formatting, major ATS parsing issues
-        - 0-49: Critical formatting problems, completely ATS-incompatible
-        
-        SECTION_ORGANIZATION (0-100):
-        - 90-100: All essential sections present with proper labeling (contact, summary, experience, skills, education, projects, certificates)
-        - 80-89: Most sections complete with minor organizational issues, may be missing projects or certificates
-        - 70-79: Basic sections present but some incomplete or poorly organized, missing important sections like projects
-        - 60-69: Missing important sections (projects, certificates) or significant organizational gaps
-        - 50-59: Major sections missing (projects, certificates) or severely disorganized
-        - 0-49: Critical sections missing, resume structure incomplete, no projects or certificates
-        
-        ACHIEVEMENTS_IMPACT_METRICS (0-100):
-        - 90-100: Quantified achievements throughout with specific metrics and measurable impact
-        - 80-89: Good use of metrics with some quantified results and clear impact
-        - 70-79: Some achievements quantified but inconsistent impact measurement
-        - 60-69: Limited quantified achievements, mostly descriptive without metrics
-        - 50-59: Very few quantified results, mostly vague descriptions
-        - 0-49: No quantified achievements, all descriptions lack measurable impact
-        
-        GRAMMAR_SPELLING_QUALITY (0-100):
-        - 90-100: Perfect spelling and grammar, professional language throughout
-        - 80-89: Minor spelling/grammar issues, mostly professional quality
-        - 70-79: Some spelling/grammar errors but generally acceptable quality
-        - 60-69: Multiple spelling/grammar issues affecting professional quality
-        - 50-59: Significant spelling/grammar problems
-        - 0-49: Critical spelling/grammar errors throughout
-        
-        HEADER_CONSISTENCY (0-100):
-        - 90-100: Perfect use of standard section labels, consistent header formatting
-        - 80-89: Excellent header consistency with minor variations
-        - 70-79: Good header usage but some non-standard labels
-        - 60-69: Fair header consistency, some ATS import issues
-        - 50-59: Poor header usage, significant ATS parsing problems
-        - 0-49: Very poor header consistency, major ATS import failures
-        
-        CLARITY_BREVITY (0-100):
-        - 90-100: Perfect clarity and brevity, concise professional language
-        - 80-89: Excellent clarity with minor verbosity issues
-        - 70-79: Good clarity but some run-on sentences or unclear points
-        - 60-69: Fair clarity, some confusing or overly complex language
-        - 50-59: Poor clarity, significant readability issues
-        - 0-49: Very poor clarity, major communication problems
-        
-        REPETITION_AVOIDANCE (0-100):
-        - 90-100: Perfect varied language, no unnecessary repetitions within same section, professional diversity across all sections
-        - 80-89: Excellent language variety with minor repetitive elements within sections, good cross-section diversity
-        - 70-79: Good variety but some repetitive action verbs or phrases within same section, acceptable cross-section repetition
-        - 60-69: Fair variety, noticeable repetition within same section affecting quality, some cross-section repetition acceptable
-        - 50-59: Poor variety, significant repetitive language within same section, limited cross-section diversity
-        - 0-49: Very poor variety, excessive repetition within same section, minimal cross-section language diversity
-        
-        COMPREHENSIVE REPETITION DETECTION REQUIREMENTS - MANDATORY:
-        - FOCUS ON ACTION VERBS AND PROFESSIONAL LANGUAGE: Only detect repeated action verbs, professional terms, and descriptive words that affect resume quality
-        - IGNORE COMMON WORDS: Do not flag repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
-        - IGNORE PROPER NOUNS: Do not flag repetitions of names, locations, company names, technologies, skills, universities, dates
-        - DETECT ACTION VERB REPETITIONS: Find action verbs that appear 2+ times within the same section (implemented, managed, developed, created, built, designed, etc.)
-        - DETECT PROFESSIONAL TERM REPETITIONS: Find professional descriptive words that appear 2+ times (scalable, secure, efficient, optimized, etc.)
-        - COUNT EXACT OCCURRENCES: For each relevant repeated word, count exactly how many times it appears in each section
-        - IDENTIFY WORD LOCATIONS: Note the exact context and position of each repeated word instance
-        - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternative words/phrases
-        - DEBUG OUTPUT: Log only relevant repetitions (action verbs and professional terms) with counts and locations
-        
-        CONTACT_INFORMATION_COMPLETENESS (0-100):
-        - 90-100: Complete contact info (name, phone, email, LinkedIn, location) with proper formatting
-        - 80-89: Missing 1-2 non-critical contact elements, good overall contact presentation
-        - 70-79: Missing important contact details (email/phone), some formatting issues
-        - 60-69: Multiple missing contact elements, poor contact information organization
-        - 50-59: Major contact information gaps, significant formatting problems
-        - 0-49: Critical contact information missing, completely inadequate contact section
-        
-        RESUME_LENGTH_OPTIMIZATION (0-100):
-        - 90-100: Perfect length for experience level, optimal content density
-        - 80-89: Appropriate length with minor adjustments needed, good content balance
-        - 70-79: Fair length optimization, some content could be condensed or expanded
-        - 60-69: Length issues (too short/long), content density problems
-        - 50-59: Poor length optimization, significant content balance issues
-        - 0-49: Inappropriate resume length, major content organization problems
-        
-        RESUME TEXT TO ANALYZE:
-        {resume_text}
-        
-        REPETITION DEBUG ANALYSIS RESULTS:
-        {repetition_debug}
-        
-        IMPORTANT: Use the repetition debug analysis results above to determine if repetitions exist. 
-        - If repetitions_found is empty or shows 0 repeated words, DO NOT generate any FIX_REPETITION suggestions
-        - Only generate FIX_REPETITION suggestions for words that are actually listed in the repetitions_found section
-        - If no repetitions are detected, focus on other aspects of language variety and professional presentation
-        
-        PARSED RESUME DATA (for accurate analysis):
-        {json.dumps(parsed_data, indent=2) if parsed_data else "No parsed data provided"}
-        
-        CRITICAL ANALYSIS REQUIREMENTS:
-        - FIRST analyze the PARSED DATA to understand what information is actually present
-        - THEN analyze the raw text for formatting, grammar, and presentation issues
-        - ONLY suggest missing elements that are genuinely absent from the parsed data
-        - PROJECT DESCRIPTION LENGTH ENFORCEMENT: For ALL projects, count the number of statements (sentences ending with period, exclamation, or question mark) - if less than 6 statements, you MUST suggest expansion to exactly 6-7 statements - if more than 7 statements, you MUST suggest reduction to exactly 6-7 statements - this is MANDATORY and CRITICAL
-        - DO NOT suggest missing elements that already exist in the parsed data
-        - Cross-reference parsed data with raw text to identify discrepancies
-        - SECTION-SPECIFIC ANALYSIS: Each section should ONLY contain suggestions relevant to that specific section
-        - NO CROSS-SECTION SUGGESTIONS: Do not include suggestions from other sections in any section's feedback
-        - IF SECTION IS COMPLETE: If a section has all required elements and is well-formatted, return empty arrays for negatives, suggestions, and specific_issues
-        - SECTION ISOLATION: Each detailed_feedback section must be completely independent and self-contained
-        - MANDATORY PROJECT DESCRIPTION LENGTH: ALL project descriptions MUST be exactly 6-7 statements - NO EXCEPTIONS - if less than 6 statements, MUST expand to 6-7 statements - if more than 7 statements, MUST condense to 6-7 statements - this is a CRITICAL REQUIREMENT
-        - PROJECT DESCRIPTION ENFORCEMENT: For EVERY project with less than 6 statements, you MUST generate exactly 6-7 statements in your suggestions - COUNT the statements and ensure they are exactly 6-7 - this is MANDATORY
-        - PROJECT DESCRIPTION COUNTING: When analyzing projects, count each statement (each sentence ending with period, exclamation, or question mark) - if count is less than 6, you MUST suggest expansion to exactly 6-7 statements - if count is more than 7, you MUST suggest reduction to exactly 6-7 statements
-        
-        COMPREHENSIVE REPETITION ANALYSIS REQUIREMENTS - MANDATORY:
-        - FOCUS ON ACTION VERBS AND PROFESSIONAL TERMS: Only analyze repeated action verbs and professional descriptive words that impact resume quality
-        - IGNORE COMMON WORDS: Do not analyze repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
-        - IGNORE PROPER NOUNS: Do not analyze repetitions of names, locations, company names, technologies, skills, universities, dates
-        - DETECT ACTION VERB REPETITIONS: Find action verbs that appear 2+ times within the same section (implemented, managed, developed, created, built, designed, etc.)
-        - DETECT PROFESSIONAL TERM REPETITIONS: Find professional descriptive words that appear 2+ times (scalable, secure, efficient, optimized, etc.)
-        - COUNT EXACT FREQUENCY: For each relevant repeated word, count exactly how many times it appears in each section
-        - IDENTIFY CONTEXT: Note the exact context and sentence where each repeated word appears
-        - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternative words/phrases
-        - DEBUG LOGGING: Include detailed debug information showing only relevant repetitions with counts and locations
-        - ENHANCEMENT EXAMPLES: Show before/after examples for every repeated action verb/professional term with specific replacements
-        - COMPREHENSIVE COVERAGE: Find ALL repeated action verbs and professional terms in the resume
-        - MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, you MUST provide a specific recommendation in the suggestions section
-        - NO PARTIAL ANALYSIS: If 12 repeated words are detected, you MUST provide 12 specific recommendations - NO EXCEPTIONS
-        - COMPLETE ISSUE COUNTING: Count ALL repeated words as issues - if 12 words are repeated, show 12 issues to fix
-        
-        SECTION DETECTION REQUIREMENTS:
-        - Check PARSED DATA for projects: Look for "projects", "project", "portfolio" keys with actual content
-        - Check PARSED DATA for certificates: Look for "certificates", "certifications", "certificate" keys with actual content
-        - Check PARSED DATA for experience: Look for "experience", "work_experience" with company, position, dates
-        - Check PARSED DATA for education: Look for "education", "academic" with institution, degree, year
-        - Check PARSED DATA for contact: Look for "contact", "basic_details" with phone, email, location
-        - Check PARSED DATA for skills: Look for "skills", "competencies" with actual skill lists
-        - Check PARSED DATA for summary: Look for "summary", "objective", "profile" with actual content
-        - If sections exist in parsed data but are empty/incomplete, suggest improvements rather than additions
-        - If sections are completely missing from parsed data, then suggest additions
-        - Include specific feedback about missing sections in weaknesses and recommendations
-        - DATE FORMAT VALIDATION: Check ALL date fields (startDate, endDate, year, issueDate) across ALL sections for proper "MMM YYYY" format (e.g., "Jan 2025", "Dec 2024", "Mar 2023")
-        - If dates are in wrong format (e.g., "2025-01", "01/2025", "January 2025", "2025", "01-2025"), flag as date format issues in SECTION_ORGANIZATION
-        
-        SECTION-SPECIFIC FEEDBACK RULES:
-        - CONTACT SECTION: Only suggest contact-related improvements (phone, email, LinkedIn, location, formatting)
-        - SKILLS SECTION: Only suggest skills-related improvements (missing skills, categorization, formatting)
-        - EXPERIENCE SECTION: Only suggest experience-related improvements (job descriptions, achievements, formatting)
-        - EDUCATION SECTION: Only suggest education-related improvements (degrees, institutions, dates, formatting)
-        - PROJECTS SECTION: Only suggest project-related improvements (descriptions, tech stacks, outcomes, formatting) - MANDATORY: ensure all project descriptions are exactly 6-7 statements
-        - CERTIFICATIONS SECTION: Only suggest certification-related improvements (missing certs, organizations, dates)
-        - SUMMARY SECTION: Only suggest summary-related improvements (content, length, keywords, formatting)
-        - FORMATTING SECTION: Only suggest formatting-related improvements (layout, ATS compatibility, structure)
-        - GRAMMAR SECTION: Only suggest grammar and spelling improvements
-        - REPETITION SECTION: Only suggest repetition-related improvements within the same section
-        - If a section is complete and well-formatted, return empty arrays for that section's feedback
-        
-        REQUIRED OUTPUT SCHEMA (MUST INCLUDE ALL SECTIONS):
-        {{
-            "overall_score": <calculate_weighted_average_of_all_category_scores>,
-            "analysis_timestamp": "{datetime.datetime.utcnow().isoformat()}Z",
-            "category_scores": {{
-                "keyword_usage_placement": <exact_score_based_on_criteria_above>,
-                "skills_match_alignment": <exact_score_based_on_criteria_above>,
-                "formatting_layout_ats": <exact_score_based_on_criteria_above>,
-                "section_organization": <exact_score_based_on_criteria_above>,
-                "achievements_impact_metrics": <exact_score_based_on_criteria_above>,
-                "grammar_spelling_quality": <exact_score_based_on_criteria_above>,
-                "header_consistency": <exact_score_based_on_criteria_above>,
-                "clarity_brevity": <exact_score_based_on_criteria_above>,
-                "repetition_avoidance": <exact_score_based_on_criteria_above>,
-                "contact_information_completeness": <exact_score_based_on_criteria_above>,
-                "resume_length_optimization": <exact_score_based_on_criteria_above>
-            }},
-            "detailed_feedback": {{
-                "keyword_usage_placement": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Keyword Usage & Placement",
-                    "description": "Comprehensive analysis of keyword presence, placement, and ATS ranking optimization",
-                    "positives": ["Quote EXACT phrases from resume that demonstrate good keyword usage with line numbers", "Reference SPECIFIC sections with strong industry terminology and exact locations", "Identify ALL instances of effective keyword integration"],
-                    "negatives": ["Quote EXACT text that lacks important keywords with specific line/section references", "Identify SPECIFIC sections missing critical ATS terms with exact locations and missing keyword lists", "List ALL missing industry keywords, technical terms, soft skills, action verbs", "Identify ALL sections with insufficient keyword density"],
-                    "suggestions": ["Provide EXACT text replacement for specific phrases with before/after examples", "Specify EXACT sections that need keyword additions with specific keyword lists and placement instructions", "Add missing technical keywords: [list 15-20 specific technical terms]", "Add missing soft skills: [list 8-10 specific soft skills]", "Add missing action verbs: [list 10-15 power action verbs]", "Add missing industry terms: [list 12-15 industry-specific keywords]"],
-                    "specific_issues": ["List EXACT problematic text found in resume with line numbers and section names", "Identify SPECIFIC missing keywords with exact locations and industry relevance", "Document ALL instances of weak language that needs keyword enhancement", "Identify ALL sections with poor keyword optimization"],
-                    "improvement_examples": ["Show DETAILED before/after text examples with exact replacements", "Provide SPECIFIC additions needed in each section with exact positioning", "Demonstrate keyword integration in summary, experience, skills, and projects sections"]
-                }},
-                "skills_match_alignment": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Skills Match & Alignment",
-                    "description": "Comprehensive analysis of technical and soft skills alignment with industry requirements - ONLY skills-related feedback. Do NOT include proficiency-level qualifiers (Advanced/Intermediate/Beginner/Expert). Prioritize core skills aligned with the person's designation/title.",
-                    "positives": ["Quote specific skills listed in resume that align well", "Reference specific sections with strong skill presentation", "Identify ALL well-presented technical and soft skills"],
-                    "negatives": ["Quote specific skills that are poorly presented", "Identify specific missing skills with exact locations", "List ALL missing technical skills, programming languages, frameworks, tools (bare names only, no proficiency levels)", "Identify ALL missing soft skills, leadership qualities, communication abilities", "Document ALL skills that need better categorization or presentation"],
-                    "suggestions": ["Provide exact skill additions needed (bare skill names only, no proficiency levels)", "Specify which sections need skill reorganization", "ADD_SKILLS: Technical Skills - Add: [list 12-15 core technical skills (bare names only)]", "ADD_SKILLS: Soft Skills - Add: [list 8-10 specific soft skills]", "ADD_SKILLS: Tools & Technologies - Add: [list 10-12 specific tools and technologies]", "ADD_SKILLS: Certifications - Add: [list 5-8 relevant certifications]", "ADD_SKILLS_CATEGORY: [Category Name] - Add: [comma-separated bare skill names]"],
-                    "specific_issues": ["List exact skill formatting problems found", "Identify specific missing competencies with locations", "Document ALL instances of incomplete skill presentation", "Identify ALL sections with insufficient skill coverage"],
-                    "improvement_examples": ["Show before/after skill presentation examples", "Provide specific skill additions needed in each section", "Demonstrate proper skill categorization and proficiency levels"],
-                    "section_isolation_note": "ONLY include skills-related suggestions. Do not suggest contact, experience, education, or other section improvements in this skills section feedback."
-                }},
-                "formatting_layout_ats": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Formatting & Layout ATS",
-                    "description": "Analysis of clean, simple formatting and ATS compatibility - ONLY formatting-related feedback",
-                    "positives": ["Quote specific formatting elements that work well", "Reference specific sections with good ATS compatibility"],
-                    "negatives": ["Quote specific formatting problems found", "Identify specific sections with ATS parsing issues"],
-                    "suggestions": ["Provide exact formatting fixes needed", "Specify which sections need layout improvements"],
-                    "specific_issues": ["List exact formatting problems found in resume", "Identify specific ATS compatibility issues with locations"],
-                    "improvement_examples": ["Show before/after formatting examples", "Provide specific layout changes needed in each section"],
-                    "section_isolation_note": "ONLY include formatting-related suggestions. Do not suggest content, skills, experience, or other section improvements in this formatting section feedback."
-                }},
-                "section_organization": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Section Organization",
-                    "description": "Comprehensive analysis of essential resume sections and proper organization",
-                    "positives": ["Quote specific well-organized sections", "Reference specific section headers that work well", "Identify ALL properly structured sections"],
-                    "negatives": ["Quote specific section organization problems", "Identify specific missing or poorly labeled sections", "List ALL missing essential sections: Projects, Certifications, Languages, References", "Document ALL incomplete sections with missing information", "Identify ALL sections with poor organization or labeling", "List ALL certifications missing issuing organizations", "Document ALL certifications without proper organizational attribution", "List ALL project descriptions that are too short (less than 6 statements) or too long (more than 7 statements)", "Document ALL project descriptions that need length optimization for professional presentation", "List ALL dates in wrong format - must be 'MMM YYYY' format (e.g., 'Jan 2025', 'Dec 2024') - flag dates like '2025-01', '01/2025', 'January 2025', '2025', '01-2025'"],
-                    "suggestions": ["Provide exact section reorganization needed", "Specify which sections need better labeling", "ADD: Projects Section - Create comprehensive projects section with tech stacks, challenges, outcomes", "ADD: Certifications Section - Add relevant certifications with issuing organizations and dates", "ADD: Languages Section - Include language proficiencies if applicable", "IMPROVE: Section Headers - Standardize all section headers for ATS compatibility", "ADD_ORGANIZATION: Certifications Section - For EVERY certificate missing organization, infer and add appropriate issuing organization", "OPTIMIZE_PROJECT_DESCRIPTION: For project descriptions with less than 6 statements - MANDATORY: Expand to EXACTLY 6-7 statements with detailed tech stack, challenges, solutions, outcomes, and impact metrics - COUNT statements and ensure exactly 6-7", "OPTIMIZE_PROJECT_DESCRIPTION: For project descriptions with more than 7 statements - MANDATORY: Condense to EXACTLY 6-7 statements with precise, professional language focusing on key achievements and technical details - COUNT statements and ensure exactly 6-7", "FIX_DATE_FORMAT: Convert ALL dates to 'MMM YYYY' format - Change '2025-01' to 'Jan 2025', '01/2025' to 'Jan 2025', 'January 2025' to 'Jan 2025', '2025' to 'Jan 2025', '01-2025' to 'Jan 2025'"],
-                    "specific_issues": ["List exact section organization problems found", "Identify specific missing sections with exact locations", "Document ALL instances of poor section structure", "Identify ALL sections with insufficient content", "List ALL certifications that need issuing organizations added", "List ALL project descriptions with incorrect length (too short: less than 6 statements, too long: more than 7 statements) with exact project names and current statement counts", "List ALL dates in incorrect format with exact field names and current values - must be 'MMM YYYY' format"],
-                    "improvement_examples": ["Show before/after section organization examples", "Provide specific section additions needed", "Demonstrate proper section structure and content organization", "Show examples of certificates with proper organizational attribution", "Show before/after project description length examples: 'Current: [2 statements] → Optimized: [6-7 statements with tech stack, challenges, solutions, outcomes]'", "Show before/after project description length examples: 'Current: [10 statements] → Optimized: [6-7 concise, professional statements focusing on key achievements]'", "Show before/after date format examples: 'Current: 2025-01 → Fixed: Jan 2025', 'Current: 01/2025 → Fixed: Jan 2025', 'Current: January 2025 → Fixed: Jan 2025'"]
-                }},
-                "achievements_impact_metrics": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Achievements & Impact Metrics",
-                    "description": "Comprehensive analysis of quantified achievements and measurable results",
-                    "positives": ["Quote specific quantified achievements from resume", "Reference specific sections with strong metrics", "Identify ALL instances of effective quantification"],
-                    "negatives": ["Quote specific achievements that lack metrics", "Identify specific sections missing quantified results", "List ALL achievements without numbers, percentages, dollar amounts, timeframes", "Document ALL instances of vague descriptions that need quantification", "Identify ALL sections with insufficient measurable impact"],
-                    "suggestions": ["Provide exact metric additions needed", "Specify which achievements need quantification", "ENHANCE_ACHIEVEMENT: Experience Section - Add quantified metrics: team sizes, project scopes, efficiency improvements, cost savings, timeframes", "ENHANCE_ACHIEVEMENT: Projects Section - Add specific outcomes: user impact, performance gains, technical achievements", "ENHANCE_ACHIEVEMENT: Summary Section - Add quantified experience: years of experience, team leadership, project delivery"],
-                    "specific_issues": ["List exact achievements lacking metrics found", "Identify specific sections needing quantification with locations", "Document ALL instances of weak achievement descriptions", "Identify ALL sections with poor impact measurement"],
-                    "improvement_examples": ["Show before/after achievement examples with metrics", "Provide specific quantified improvements needed", "Demonstrate proper quantification in experience, projects, and summary sections"]
-                }},
-                "grammar_spelling_quality": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Grammar & Spelling Quality",
-                    "description": "Analysis of error-free professional language and quality - ONLY grammar and spelling feedback",
-                    "positives": ["Quote specific well-written sentences from resume", "Reference specific sections with excellent grammar"],
-                    "negatives": ["Quote specific grammatical errors found", "Identify specific spelling mistakes with exact locations"],
-                    "suggestions": ["Provide exact corrections for specific errors", "Specify which sentences need rewriting"],
-                    "specific_issues": ["List exact grammatical errors found in resume", "Identify specific spelling mistakes with locations"],
-                    "improvement_examples": ["Show before/after grammar correction examples", "Provide specific sentence improvements needed"],
-                    "section_isolation_note": "ONLY include grammar and spelling suggestions. Do not suggest content, formatting, skills, or other section improvements in this grammar section feedback."
-                }},
-                "header_consistency": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Header Consistency",
-                    "description": "Analysis of standard section labels and header formatting",
-                    "positives": ["Quote specific well-formatted headers from resume", "Reference specific sections with consistent labeling"],
-                    "negatives": ["Quote specific inconsistent headers found", "Identify specific non-standard section labels"],
-                    "suggestions": ["Provide exact header corrections needed", "Specify which headers need standardization"],
-                    "specific_issues": ["List exact header inconsistencies found", "Identify specific non-standard labels with locations"],
-                    "improvement_examples": ["Show before/after header examples", "Provide specific header standardization needed"]
-                }},
-                "clarity_brevity": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Clarity & Brevity",
-                    "description": "Analysis of clear, concise sentences and professional brevity",
-                    "positives": ["Quote specific clear, concise sentences from resume", "Reference specific sections with excellent brevity"],
-                    "negatives": ["Quote specific unclear or verbose sentences found", "Identify specific sections that are too wordy"],
-                    "suggestions": ["Provide exact sentence simplifications needed", "Specify which sections need condensing"],
-                    "specific_issues": ["List exact unclear sentences found in resume", "Identify specific verbose sections with locations"],
-                    "improvement_examples": ["Show before/after clarity examples", "Provide specific sentence improvements needed"]
-                }},
-                "repetition_avoidance": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Repetition Avoidance",
-                    "description": "Comprehensive analysis of ALL repeated language and unnecessary repetitions within same section, allowing legitimate repetition across different sections - ONLY repetition-related feedback",
-                    "positives": ["Quote specific varied language examples from resume", "Reference specific sections with good word variety", "Note acceptable cross-section repetition where appropriate"],
-                    "negatives": ["Quote EVERY specific repetitive action verb found within same section", "Identify ALL sections with excessive action verb repetition", "List ALL overused action verbs with exact counts", "Document ALL redundant professional terms with specific locations", "Count EVERY instance of repeated action verbs within same section", "DEBUG: List ALL detected repeated action verbs with exact counts: Action Verb '[word]' appears [X] times in [Section]: [Context1], [Context2], [Context3]", "DEBUG: Categorize repetitions by type: Action Verbs: [list], Professional Terms: [list]", "MANDATORY: List EVERY repeated word as a separate issue - if 12 words are repeated, list ALL 12 as separate issues"],
-                    "suggestions": ["Provide exact action verb replacements needed for EVERY repeated action verb within same section", "Specify ALL sections that need internal action verb variety", "FIX_REPETITION: [Section] - Action Verb '[repeated action verb]' used [X] times - Replace instances: [Instance 1: '[exact context]' → '[alternative1]'], [Instance 2: '[exact context]' → '[alternative2]'], [Instance 3: '[exact context]' → '[alternative3]']", "ENHANCE_VARIETY: For each repeated action verb, provide 3-5 specific professional alternatives with context", "DEBUG: Show complete action verb frequency analysis for each section", "MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, provide a specific FIX_REPETITION recommendation", "NO PARTIAL ANALYSIS: If 12 repeated words are detected, provide 12 specific FIX_REPETITION recommendations", "COMPREHENSIVE RECOMMENDATIONS: Include recommendations for ALL action verbs AND professional terms", "CRITICAL: Generate ONE FIX_REPETITION suggestion for EACH repeated word - if 'created' appears 3 times, generate 1 FIX_REPETITION suggestion for 'created' with 3 specific replacements", "CRITICAL: Generate ONE FIX_REPETITION suggestion for EACH professional term - if 'scalable' appears 3 times, generate 1 FIX_REPETITION suggestion for 'scalable' with 3 specific replacements", "MANDATORY: Based on the repetition debug analysis, generate FIX_REPETITION suggestions for ALL detected repeated words", "CRITICAL: If repetition_debug_analysis shows 17 repeated words, generate 17 FIX_REPETITION suggestions", "REQUIRED: For each word in the repetition analysis, create: FIX_REPETITION: [Section] - [Word Type] '[word]' used [X] times - Replace instances: [specific replacements]", "Note that cross-section repetition is acceptable when contextually appropriate"],
-                    "specific_issues": ["List EVERY exact repetitive action verb found within same section in resume with counts", "Identify ALL specific sections needing internal action verb variety with exact locations", "Document ALL instances of overused action verbs", "Count ALL repeated action verbs within each section", "DEBUG: Complete action verb inventory: [Section1]: [action_verb1: X times], [action_verb2: Y times], [Section2]: [action_verb3: Z times]", "DEBUG: Highlight problematic repetitions: Action verbs appearing 3+ times in same section"],
-                    "improvement_examples": ["Show before/after repetition examples for EVERY repeated action verb within same section", "Provide specific action verb variety improvements needed for ALL repetitions within sections", "Demonstrate alternative action verb choices for EVERY overused term", "DEBUG: Before/After examples: 'Current: [exact repeated action verb]' → 'Improved: [varied action verb alternatives]'", "DEBUG: Show action verb replacement mapping: [Original Action Verb] → [Alternative 1, Alternative 2, Alternative 3]"],
-                    "section_isolation_note": "ONLY include repetition-related suggestions. Do not suggest content, formatting, skills, or other section improvements in this repetition section feedback."
-                }},
-                "contact_information_completeness": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Contact Information Completeness",
-                    "description": "Comprehensive analysis of contact details presence, formatting, and professional presentation - ONLY contact-related feedback",
-                    "positives": ["Quote specific well-formatted contact information from resume", "Reference specific contact elements that are complete", "Identify ALL properly formatted contact details"],
-                    "negatives": ["Quote specific missing contact information", "Identify specific contact formatting problems", "List ALL missing contact elements: phone number, email address, LinkedIn profile, location, professional title", "Document ALL contact formatting issues: inconsistent formatting, missing elements, poor presentation"],
-                    "suggestions": ["Provide exact contact additions needed", "Specify which contact elements need formatting fixes", "FIX_CONTACT: Add missing phone number with proper formatting", "FIX_CONTACT: Add professional email address", "FIX_CONTACT: Add LinkedIn profile URL", "FIX_CONTACT: Add current location", "FIX_CONTACT: Add professional title"],
-                    "specific_issues": ["List exact missing contact information found", "Identify specific contact formatting problems with locations", "Document ALL instances of incomplete contact information", "Identify ALL contact formatting inconsistencies"],
-                    "improvement_examples": ["Show before/after contact information examples", "Provide specific contact improvements needed", "Demonstrate proper contact formatting and completeness"],
-                    "section_isolation_note": "ONLY include contact-related suggestions. Do not suggest skills, experience, education, or other section improvements in this contact section feedback."
-                }},
-                "resume_length_optimization": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Resume Length Optimization",
-                    "description": "Comprehensive analysis of resume length appropriateness and section-specific description optimization",
-                    "positives": ["Quote specific sections with appropriate length", "Reference specific content that is well-balanced", "Identify ALL well-sized descriptions"],
-                    "negatives": ["Quote specific sections that are too long/short", "Identify specific content that needs length adjustment", "List ALL project descriptions that are too short (less than 2 sentences)", "List ALL experience descriptions that are too short (less than 2 sentences)", "List ALL summary descriptions that are too short (less than 50 words)", "List ALL project descriptions that are too long (more than 5 sentences)", "List ALL experience descriptions that are too long (more than 5 sentences)", "List ALL summary descriptions that are too long (more than 150 words)"],
-                    "suggestions": ["Provide exact content additions/removals needed", "Specify which sections need length optimization", "OPTIMIZE_DESCRIPTION: Project Section - Current: '[exact short description]' - Expand to: '[detailed 3-4 sentence description with tech stack, challenges, outcomes, and metrics]'", "OPTIMIZE_DESCRIPTION: Experience Section - Current: '[exact short description]' - Expand to: '[detailed 3-4 sentence description with responsibilities, achievements, and quantified results]'", "OPTIMIZE_DESCRIPTION: Summary Section - Current: '[exact short summary]' - Expand to: '[comprehensive 3-4 line summary with experience, skills, achievements, and career objectives]'", "OPTIMIZE_DESCRIPTION: Project Section - Current: '[exact long description]' - Compress to: '[concise 2-3 sentence description focusing on key outcomes and tech stack]'", "OPTIMIZE_DESCRIPTION: Experience Section - Current: '[exact long description]' - Compress to: '[focused 2-3 sentence description highlighting main achievements and responsibilities]'", "OPTIMIZE_DESCRIPTION: Summary Section - Current: '[exact long summary]' - Compress to: '[concise 2-3 line summary with core competencies and value proposition]'"],
-                    "specific_issues": ["List exact length problems found in resume", "Identify specific sections needing length adjustment with locations", "Document ALL descriptions that need expansion with exact content", "Document ALL descriptions that need compression with exact content"],
-                    "improvement_examples": ["Show before/after length optimization examples", "Provide specific content density improvements needed", "Demonstrate optimal description lengths for projects, experience, and summary sections"]
-                }}
-            }},
-            "extracted_text": "Complete text content extracted from the resume",
-            "strengths": [
-                "Specific strength 1 with details",
-                "Specific strength 2 with details",
-                "Specific strength 3 with details"
-            ],
-            "weaknesses": [
-                "Specific weakness 1 with details",
-                "Specific weakness 2 with details",
-                "Specific weakness 3 with details"
-            ],
-            "recommendations": [
-                "MANDATORY: Include ALL identified issues from EVERY section in recommendations",
-                "If 5 repetition issues found, list ALL 5 repetition fixes in recommendations",
-                "If 3 sections missing dates, list ALL 3 sections with missing dates in recommendations", 
-                "If multiple description length issues, list ALL description optimization needs in recommendations",
-                "If project descriptions are too short (less than 6 statements), include 'OPTIMIZE_PROJECT_LENGTH: Expand project descriptions to 6-7 professional statements with tech stack, challenges, solutions, outcomes, and impact metrics' in recommendations",
-                "If project descriptions are too long (more than 7 statements), include 'OPTIMIZE_PROJECT_LENGTH: Condense project descriptions to 6-7 concise, professional statements focusing on key achievements and technical details' in recommendations",
-                "If experience descriptions are too short, include 'OPTIMIZE_DESCRIPTION: Expand experience descriptions' in recommendations", 
-                "If summary description is too short, include 'OPTIMIZE_DESCRIPTION: Expand summary description' in recommendations",
-                "If experience descriptions are too long, include 'OPTIMIZE_DESCRIPTION: Compress experience descriptions' in recommendations",
-                "If summary description is too long, include 'OPTIMIZE_DESCRIPTION: Compress summary description' in recommendations",
-                "If skills are unstructured, include skills restructuring in recommendations",
-                "If certificates missing organizations, include ALL organization inferences in recommendations",
-                "For EVERY certificate without issuing organization, include 'ADD_ORGANIZATION: [Certificate Name] - Add issuing organization' in recommendations",
-                "If dates are in wrong format, include 'FIX_DATE_FORMAT: Convert ALL dates to MMM YYYY format (e.g., Jan 2025, Dec 2024)' in recommendations",
-                "EVERY single issue must appear in recommendations - DO NOT limit to 5 items",
-                "Priority recommendation 1: [Most critical issue with specific action]",
-                "Priority recommendation 2: [Second critical issue with specific action]",
-                "Continue listing ALL remaining issues until EVERY problem is addressed",
-                "Include ALL missing dates from ALL sections as separate recommendation items",
-                "Include ALL repetition issues as separate recommendation items",
-                "Include ALL description length issues as separate recommendation items",
-                "Include ALL formatting issues as separate recommendation items",
-                "Include ALL grammar issues as separate recommendation items",
-                "Include ALL missing certificate organizations as separate recommendation items",
-                "TOTAL RECOMMENDATIONS SHOULD EQUAL TOTAL ISSUES FOUND"
-            ]
-        }}
-        
-        FINAL INSTRUCTIONS - CRITICAL FOR CONSISTENCY:
-        - NEVER omit sections - return empty values instead of missing sections!
-        - overall_score MUST be a weighted average of all category scores (integer 0-100)
-        - All category scores MUST be integers between 0-100 based on precise criteria above!
-        - Provide specific, actionable recommendations with clear next steps!
-        - Focus on ATS compatibility, professional presentation, and measurable improvements!
-        - Use varied, professional language - avoid repetition across sections!
-        - Ensure all feedback is specific to the actual resume content analyzed!
-        - Calculate scores based on objective criteria, not subjective opinions!
-        - Maintain consistency in scoring methodology across all categories!
-        - Apply the same rigorous standards for each parameter from the CSV criteria!
-        - Ensure consistent evaluation of keyword usage, skills match, formatting, and all other parameters!
-        - Use the exact scoring ranges provided for each category - no deviations!
-        - Provide consistent, professional feedback that matches the scoring criteria exactly!
-        
-        ULTRA-COMPREHENSIVE FEEDBACK REQUIREMENTS - MANDATORY FOR 90+ SCORE IMPROVEMENT:
-        - For POSITIVES: Quote EXACT phrases with precise locations from the actual resume that demonstrate strengths
-        - For NEGATIVES: Quote EXACT problematic text with specific replacements, missing elements with precise additions, formatting issues with exact fixes
-        - For SUGGESTIONS: Provide COMPLETE before/after text replacements that will boost scores by 5-10 points each
-        - Always reference EXACT content with QUANTIFIED improvements and INDUSTRY KEYWORDS
-        - Provide SPECIFIC text replacements: "Replace '[exact current text]' with '[complete improved text with metrics and keywords]'"
-        - Add SPECIFIC skills: "Add these exact skills to Skills section: [list 8-10 specific technical skills]"
-        - Enhance SPECIFIC achievements: "Replace '[current achievement]' with '[quantified achievement with numbers, percentages, and impact metrics]'"
-        - Fix SPECIFIC formatting: "Change '[exact formatting issue]' to '[exact formatting solution]'"
-        - Add SPECIFIC keywords: "Integrate these exact industry terms: [list 10-15 specific keywords with placement instructions]"
-        - Enhance SPECIFIC sections: "In [exact section], add '[complete content with quantified metrics]'"
-        
-        COMPREHENSIVE REPETITION ANALYSIS - MANDATORY DEBUGGING:
-        - FOCUS ON ACTION VERBS AND PROFESSIONAL TERMS: Only analyze repeated action verbs and professional descriptive words
-        - IGNORE COMMON WORDS: Do not analyze repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
-        - IGNORE PROPER NOUNS: Do not analyze repetitions of names, locations, company names, technologies, skills, universities, dates
-        - COUNT RELEVANT REPETITIONS: Find action verbs and professional terms that appear 2+ times within the same section
-        - DEBUG OUTPUT FORMAT: "DEBUG: Action Verb '[word]' appears [X] times in [Section]: [Context1], [Context2], [Context3]"
-        - CATEGORIZE REPETITIONS: "DEBUG: Action Verbs: [list], Professional Terms: [list]"
-        - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternatives
-        - ENHANCEMENT EXAMPLES: Show before/after for every repeated action verb/professional term with specific replacements
-        - COMPREHENSIVE COVERAGE: Find ALL repeated action verbs and professional terms
-        - DEBUG INVENTORY: "DEBUG: Action Verb inventory: [Section1]: [word1: X times], [word2: Y times]"
-        - REPLACEMENT MAPPING: "DEBUG: [Original Action Verb] → [Alternative 1, Alternative 2, Alternative 3]"
-        - MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, you MUST provide a specific recommendation
-        - NO PARTIAL ANALYSIS: If 12 repeated words are detected, you MUST provide 12 specific recommendations - NO EXCEPTIONS
-        - COMPLETE ISSUE COUNTING: Count ALL repeated words as issues - if 12 words are repeated, show 12 issues to fix
-        - COMPREHENSIVE RECOMMENDATIONS: Include recommendations for ALL action verbs AND professional terms detected
-        
-        MANDATORY REPETITION RECOMMENDATION FORMAT - COMPLETE COVERAGE REQUIRED:
-        For EVERY repeated word detected, you MUST provide a recommendation in this exact format:
-        "FIX_REPETITION: [Section] - [Word Type] '[repeated word]' used [X] times - Replace instances: [Instance 1: '[exact context]' → '[alternative1]'], [Instance 2: '[exact context]' → '[alternative2]'], [Instance 3: '[exact context]' → '[alternative3]']"
-        STRICT UNIQUENESS RULES FOR ALTERNATIVES:
-        - Do NOT suggest any alternative that already appears anywhere in the resume text.
-        - Do NOT reuse the same alternative across different FIX_REPETITION lines.
-        - If all obvious alternatives are already present, REFRAME the sentence fragment to eliminate repetition while preserving meaning (e.g., "built microservices" → "architected a microservice-based platform").
-        - Prefer concise, professional verbs; vary verbs across instances.
-        
-        EXAMPLE FOR COMPLETE COVERAGE:
-        If these words are detected as repeated:
-        - Action Verb 'built' (4 times)
-        - Action Verb 'implemented' (3 times)  
-        - Action Verb 'designed' (2 times)
-        - Professional Term 'scalable' (2 times)
-        - Professional Term 'secure' (2 times)
-        
-        You MUST provide 5 separate recommendations:
-        1. "FIX_REPETITION: General - Action Verb 'built' used 4 times - Replace instances: [Instance 1: 'built microservices' → 'created microservices'], [Instance 2: 'built and deployed' → 'developed and deployed'], [Instance 3: 'built monitoring' → 'established monitoring'], [Instance 4: 'built CI/CD' → 'implemented CI/CD']"
-        2. "FIX_REPETITION: General - Action Verb 'implemented' used 3 times - Replace instances: [Instance 1: 'implemented fraud detection' → 'developed fraud detection'], [Instance 2: 'implemented CI/CD' → 'established CI/CD'], [Instance 3: 'implemented monitoring' → 'configured monitoring']"
-        3. "FIX_REPETITION: General - Action Verb 'designed' used 2 times - Replace instances: [Instance 1: 'designed architecture' → 'architected solution'], [Instance 2: 'designed UI' → 'created UI']"
-        4. "FIX_REPETITION: General - Professional Term 'scalable' used 2 times - Replace instances: [Instance 1: 'scalable architecture' → 'robust architecture'], [Instance 2: 'scalable solution' → 'flexible solution']"
-        5. "FIX_REPETITION: General - Professional Term 'secure' used 2 times - Replace instances: [Instance 1: 'secure authentication' → 'robust authentication'], [Instance 2: 'secure system' → 'protected system']"
-        
-        COMPREHENSIVE PROBLEM DETECTION REQUIREMENTS - IDENTIFY EVERY POSSIBLE ISSUE:
-        - CONTACT SECTION: Check for missing name, phone, email, LinkedIn, location, professional title, website, GitHub
-        - SUMMARY SECTION: Check for missing professional summary, quantified experience, industry keywords, achievement highlights, skills mention, description length (too short/long)
-        - EXPERIENCE SECTION: Check for missing company names, job titles, dates, locations, quantified achievements, action verbs, industry keywords, technical details, team sizes, project scopes, business impact, description length (too short/long)
-        - EDUCATION SECTION: Check for missing institution names, degrees, graduation years, GPAs, locations, relevant coursework, academic achievements, honors
-        - SKILLS SECTION: Check for missing technical skills, soft skills, tools, frameworks, programming languages, certifications, proficiency levels, industry-specific competencies, unstructured skills text that needs proper formatting
-        - PROJECTS SECTION: Check for missing project names, descriptions, tech stacks, dates, links, challenges solved, outcomes achieved, team collaboration details, description length (too short/long), project description length validation (MANDATORY: exactly 6-7 statements required - count each statement and ensure exactly 6-7)
-        - CERTIFICATIONS SECTION: Check for missing certificate names, issuing organizations, dates, expiration dates, credential IDs, skill validation, infer organizations from certificate names
-        - LANGUAGES SECTION: Check for missing language proficiency levels, certifications, relevant language skills for the role
-        - REFERENCES SECTION: Check for missing reference contact information, professional relationships, permission to contact
-        - FORMATTING ISSUES: Check for inconsistent fonts, spacing, bullet points, section headers, date formats, contact formatting, ATS compatibility
-        - KEYWORD OPTIMIZATION: Check for missing industry keywords, technical terms, soft skills, action verbs, quantified metrics, location keywords
-        - ACHIEVEMENT QUANTIFICATION: Check for missing numbers, percentages, dollar amounts, timeframes, team sizes, project scopes, efficiency improvements, cost savings
-        - GRAMMAR & SPELLING: Check for typos, grammatical errors, inconsistent tense, punctuation issues, professional language quality
-        - REPETITION ISSUES: Check for ALL repeated words within same section, ALL overused action verbs, ALL redundant phrases, lack of variety - LIST EVERY SINGLE REPETITION ISSUE
-        - SECTION COMPLETENESS: Check for missing essential sections, incomplete information, empty fields, placeholder text
-        - ATS COMPATIBILITY: Check for tables, graphics, complex formatting, non-standard fonts, header issues, parsing problems
-        - MISSING DATES ANALYSIS: Check for missing dates in ALL sections (experience, education, projects, certifications, languages, references) and list EVERY section with missing dates
-        - DESCRIPTION OPTIMIZATION: Check for descriptions that are too short (less than 2 sentences) or too long (more than 5 sentences) in ALL sections
-        
-        SPECIFIC SECTION ANALYSIS REQUIREMENTS:
-        - EXPERIENCE SECTION: Check for missing company names, job titles, dates, descriptions, locations
-        - EDUCATION SECTION: Check for missing institution names, degrees, graduation years, GPAs, locations
-        - CONTACT SECTION: Check for missing phone, email, LinkedIn, location, professional title
-        - SKILLS SECTION: Check for missing technical skills, soft skills, skill categorization
-        - PROJECTS SECTION: Check for missing project names, descriptions, tech stacks, dates, links, project description length validation (MANDATORY: exactly 6-7 statements required - count each statement and ensure exactly 6-7)
-        - CERTIFICATIONS SECTION: Check for missing certificate names, issuing organizations, dates
-        - SUMMARY SECTION: Check for missing professional summary or objective
-        - LANGUAGES SECTION: Check for missing language proficiency levels
-        - REFERENCES SECTION: Check for missing reference contact information
-        
-        ULTRA-COMPREHENSIVE SUGGESTION FORMAT FOR 90+ SCORES:
-        - SKILLS FORMAT: "ADD_SKILLS: [Section] - Missing: [exact skill list] - Add: 'Technical Skills: Python (Advanced), React.js (Expert), AWS (Intermediate), Machine Learning (Advanced), SQL (Expert), Docker (Intermediate), Git (Advanced), Agile/Scrum (Expert), Kubernetes (Intermediate), Microservices (Advanced)'"
-        - SKILLS STRUCTURE FORMAT: "STRUCTURE_SKILLS: [Section] - Current: '[unstructured skills text]' - Restructure to: 'Technical: [Java, Python, JavaScript], Soft Skills: [Communication, Leadership, Problem Solving], Tools: [Git, Docker, Jenkins], Frameworks: [React, Angular, Spring]'"
-        - ACHIEVEMENT FORMAT: "ENHANCE_ACHIEVEMENT: [Section] - Current: '[exact current text]' - Replace with: '[quantified achievement with 2-3 specific metrics, percentages, and business impact]'"
-        - KEYWORD FORMAT: "ADD_KEYWORDS: [Section] - Missing terms: [exact keyword list] - Integration: 'Naturally integrate these terms: [specific placement instructions for each keyword]'"
-        - EXPERIENCE FORMAT: "IMPROVE_EXPERIENCE: [Section] - Current: '[exact bullet point]' - Replace with: '[power verb] + [specific action] + [quantified result] + [business impact] + [relevant keywords]'"
-        - PROJECT FORMAT: "ENHANCE_PROJECT: [Section] - Current: '[exact description]' - Replace with: '[detailed project with tech stack, challenges solved, quantified outcomes, and industry keywords]'"
-        - PROJECT LENGTH FORMAT: "OPTIMIZE_PROJECT_LENGTH: [Project Name] - Current: '[X statements]' - Issue: '[too short: less than 6 statements / too long: more than 7 statements]' - Replace with: '[6-7 professional statements with tech stack, challenges, solutions, outcomes, and impact metrics]'"
-        - CONTACT FORMAT: "FIX_CONTACT: [Section] - Issue: '[exact issue]' - Solution: '[complete contact format with all required elements]'"
-        - SUMMARY FORMAT: "REWRITE_SUMMARY: [Section] - Current: '[exact text]' - Replace with: '[3-4 line professional summary with years of experience, key skills, achievements, and industry keywords]'"
-        - MISSING SECTION FORMAT: "ADD_SECTION: [Section Name] - Missing: [section description] - Add: '[complete section content with all required elements]'"
-        - FORMATTING FORMAT: "FIX_FORMATTING: [Section] - Issue: '[exact formatting problem]' - Solution: '[exact formatting fix]'"
-        - GRAMMAR FORMAT: "FIX_GRAMMAR: [Section] - Current: '[exact text with error]' - Replace with: '[corrected text]'"
-        - MISSING DATES FORMAT: "ADD_DATES: [All Sections with Missing Dates] - Missing dates in: [Experience Section: Company A, Company B], [Projects Section: Project X, Project Y], [Certifications Section: Cert A, Cert B] - Add: '[Experience: Jan 2020 - Dec 2022], [Projects: Mar 2021 - May 2021, Jun 2022 - Aug 2022], [Certifications: Issued: Jan 2023, Valid until: Jan 2026]'"
-        - PROJECT DATES FORMAT: "ADD_PROJECT_DATES: Projects Section - Missing start/end dates for: [Project Name 1, Project Name 2] - Add dummy dates: '[Project 1: Jan 2023 - Mar 2023], [Project 2: Apr 2023 - Jun 2023]' with realistic 2-4 month durations"
-        - ORGANIZATION INFERENCE FORMAT: "ADD_ORGANIZATION: [Section] - Certificate: '[certificate name]' - Inferred organization: '[Google for Google Cloud Certification, Microsoft for Azure Certification, Oracle for Oracle Database Certification, etc.]'"
-        - DESCRIPTION LENGTH FORMAT: "OPTIMIZE_DESCRIPTION: [Section] - Current: '[exact description]' - Issue: '[too short: less than 2 sentences / too long: more than 5 sentences]' - Replace with: '[optimized 2-4 sentence description with keywords and metrics]'"
-        - REPETITION FORMAT: "FIX_REPETITION: [Section] - Repeated words: '[managed, developed, implemented, created]' - Replace instances: '[First: managed → led], [Second: developed → engineered], [Third: implemented → executed], [Fourth: created → designed]'"
-        
-        PARSED DATA ANALYSIS RULES:
-        - If parsed data shows projects with dates, DO NOT suggest missing project dates
-        - If parsed data shows experience with company names, DO NOT suggest missing company names
-        - If parsed data shows education with degrees, DO NOT suggest missing degrees
-        - If parsed data shows contact info, DO NOT suggest missing contact information
-        - If parsed data shows skills, DO NOT suggest missing skills section
-        - Only suggest missing elements if they are genuinely absent from the parsed data
-        - Focus on quality improvements for existing elements rather than suggesting missing elements
-        - Check for completeness: if a field exists but is empty or incomplete, suggest improvements
-        - Check for accuracy: if a field exists but has poor content, suggest better content
+        return {
+            "achievement_debug": achievement_debug,
+            "repetition_debug": repetition_debug,
+            "completion_kwargs": with_response_format({
+                "model": self.model_name,
+                "messages": STANDARD_ATS_PROMPT.messages(
+                    resume_text=resume_text,
+                    repetition_debug=repetition_debug,
+                    parsed_data=json.dumps(parsed_data, indent=2) if parsed_data else "No parsed data provided"
+                ),
+                "temperature": self.temperature,
+                "top_p": self.top_p,
+                # Feedback for every category is fixed-size; quoted issues grow with the resume
+                "max_tokens": adaptive_max_tokens(resume_text, ATSAnalysisResponse, base_tokens=2600, output_ratio=0.25)
+            }, ATSAnalysisResponse, "ats_analysis")
+        }
+
+    def _finalize_analysis(self, response_text: str, resume_text: str, request: Dict[str, Any], on_suggestion: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
         """
+        Parse the analysis output and apply schema enforcement, suggestion augmentation and scoring
 
+        on_suggestion, if given, is called with (category, line) for every FIX_* line added by augmentation.
+        """
+        achievement_debug = request["achievement_debug"]
+        repetition_debug = request["repetition_debug"]
+        
         try:
-            logger.info(f"Generating ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "You are an expert ATS (Applicant Tracking System) analyst with 10+ years of experience in resume optimization and HR technology."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                max_tokens=4000
-            )
-            cleaned_response = self._clean_openai_response(response.choices[0].message.content)
-            
-            # Parse the JSON response
-            ats_response = json.loads(cleaned_response)
-            
-            # Enforce schema compliance
-            ats_response = self._enforce_ats_schema_compliance(ats_response)
-            
-            # Validate CSV parameters
-            ats_response = self._validate_csv_parameters(ats_response)
-            
-            # Augment repetition suggestions using internal debug analysis so ALL repeated words are covered
-            ats_response = _augment_repetition_suggestions_with_debug(
-                ats_response,
-                repetition_debug,
-                resume_text,
-                self.client,
-                self.model_name,
-                self.temperature,
-                self.top_p
-            )
-
-            # Augment achievement suggestions using internal debug analysis so ALL unquantified achievements are covered
-            ats_response = _augment_achievement_suggestions_with_debug(
-                ats_response,
-                achievement_debug,
-                resume_text,
-                self.client,
-                self.model_name,
-                self.temperature,
-                self.top_p
-            )
-
-            # Mirror skills-related suggestions into top-level recommendations for full coverage
-            ats_response = _mirror_skill_suggestions_into_recommendations(ats_response)
-            
-            # Apply dynamic scoring based on issues count
-            ats_response = self._apply_dynamic_scoring(ats_response)
-            
-            # Add improvement potential analysis
-            ats_response = self._add_improvement_potential(ats_response)
-            
-            # Add achievement debug information
-            ats_response["achievement_debug_analysis"] = achievement_debug
-            
-            # Final validation
-            ats_response = self._final_ats_validation(ats_response)
-            
-            logger.info(f"✅ Standard ATS analysis completed successfully with overall score: {ats_response.get('overall_score', 'N/A')}")
-            return ats_response
-            
+            # Structured outputs parse directly; the tolerant parser only runs if that fails
+            ats_response = parse_structured(response_text, "ats.standard", repair_json)
         except json.JSONDecodeError as json_error:
             logger.error(f"Failed to parse OpenAI JSON response for ATS analysis: {str(json_error)}")
-            logger.error(f"Raw response: {cleaned_response}")
+            logger.error(f"Raw response: {response_text}")
             raise Exception(f"Invalid JSON response from AI: {str(json_error)}")
-        except Exception as e:
-            logger.error(f"Failed to analyze resume for ATS: {str(e)}")
-            raise
+        
+        # Stamp server-side so the prompt stays byte-identical (and cacheable) across calls
+        ats_response["analysis_timestamp"] = datetime.datetime.utcnow().isoformat() + "Z"
+        
+        # The model is never asked to echo the resume; attach the input text instead
+        ats_response["extracted_text"] = resume_text
+        
+        # Enforce schema compliance
+        ats_response = self._enforce_ats_schema_compliance(ats_response)
+        
+        # Validate CSV parameters
+        ats_response = self._validate_csv_parameters(ats_response)
+        
+        # Augment repetition suggestions using internal debug analysis so ALL repeated words are covered
+        ats_response = _augment_repetition_suggestions_with_debug(
+            ats_response,
+            repetition_debug,
+            resume_text,
+            self.client,
+            self.model_name,
+            self.temperature,
+            self.top_p,
+            on_line=_suggestion_callback(on_suggestion, "repetition_avoidance")
+        )
 
-    def _clean_openai_response(self, response_text: str) -> str:
-        """Clean OpenAI API response to extract valid JSON"""
-        import re
-        import json
-        
-        logger.info(f"🧹 Cleaning OpenAI ATS response of {len(response_text)} characters")
-        
-        # Remove markdown code blocks
-        if response_text.startswith("```json"):
-            response_text = response_text.replace("```json", "").replace("```", "")
-        elif response_text.startswith("```"):
-            response_text = response_text.replace("```", "")
-
-        response_text = response_text.strip()
-        
-        # Try to find JSON content within markdown blocks first
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            try:
-                parsed = json.loads(json_content)
-                logger.info(f"✅ Successfully extracted JSON from markdown block: {len(json_content)} characters")
-                return json_content
-            except json.JSONDecodeError:
-                logger.warning("❌ Extracted JSON from markdown block is invalid")
-        
-        # Try to find the complete JSON response
-        if response_text.startswith('{') and response_text.endswith('}'):
-            try:
-                parsed = json.loads(response_text)
-                logger.info(f"✅ Successfully parsed complete JSON: {len(response_text)} characters")
-                return response_text
-            except json.JSONDecodeError:
-                logger.warning("❌ Complete JSON parsing failed")
-        
-        # Try to find JSON object in the text
-        json_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            try:
-                parsed = json.loads(json_content)
-                logger.info(f"✅ Successfully extracted JSON object: {len(json_content)} characters")
-                return json_content
-            except json.JSONDecodeError:
-                logger.warning("❌ Extracted JSON object is invalid")
-        
-        logger.warning("Could not extract valid JSON from AI response")
-        return '{"error": "Invalid JSON response", "message": "Could not parse AI response"}'
+        # Augment achievement suggestions using internal debug analysis so ALL unquantified achievements are covered
+        ats_response = _augment_achievement_suggestions_with_debug(
+            ats_response,
+            achievement_debug,
+            resume_text,
+            self.client,
+            self.model_name,
+            self.temperature,
+            self.top_p,
+            on_line=_suggestion_callback(on_suggestion, "achievements_impact_metrics")
+        )
+
+        # Mirror skills-related suggestions into top-level recommendations for full coverage
+        ats_response = _mirror_skill_suggestions_into_recommendations(ats_response)
+        
+        # Apply dynamic scoring based on issues count
+        ats_response = self._apply_dynamic_scoring(ats_response)
+        
+        # Add improvement potential analysis
+        ats_response = self._add_improvement_potential(ats_response)
+        
+        # Add achievement debug information
+        ats_response["achievement_debug_analysis"] = achievement_debug
+        
+        # Final validation
+        ats_response = self._final_ats_validation(ats_response)
+        
+        logger.info(f"✅ Standard ATS analysis completed successfully with overall score: {ats_response.get('overall_score', 'N/A')}")
+        return ats_response
 
     def _enforce_ats_schema_compliance(self, ats_response: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1466,7 +1776,10 @@ class StandardATSService:
 
     def _extract_tech_stack_from_description(self, description: str) -> str:
         """
-        Extract tech stack from project description using AI analysis
+        Extract tech stack from project description
+        
+        The local technology dictionary is tried first; the LLM is only asked when the
+        description names no known technology.
         
         Args:
             description: Project description text
@@ -1477,46 +1790,21 @@ class StandardATSService:
         if not description or not description.strip():
             return ""
         
+        tech_stack = format_tech_stack(extract_tech_stack(description))
+        if tech_stack:
+            return tech_stack
+        
         try:
-            prompt = f"""
-            Analyze the following project description and extract all technologies, frameworks, programming languages, tools, and platforms mentioned.
-            
-            PROJECT DESCRIPTION:
-            {description}
-            
-            Return ONLY a comma-separated list of technologies found. Do not include explanations or additional text.
-            Examples of what to extract:
-            - Programming languages: Python, JavaScript, Java, C++, etc.
-            - Frameworks: React, Angular, Django, Spring, etc.
-            - Databases: MySQL, MongoDB, PostgreSQL, etc.
-            - Cloud platforms: AWS, Azure, GCP, etc.
-            - Tools: Docker, Kubernetes, Git, Jenkins, etc.
-            - Libraries: NumPy, Pandas, Express.js, etc.
-            
-            If no technologies are found, return an empty string.
-            """
-            
             response = self.client.chat.completions.create(
                 model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
+                messages=TECH_STACK_PROMPT.messages(description=description),
                 temperature=0.1,
                 top_p=0.8,
                 max_tokens=200
             )
             
-            tech_stack = response.choices[0].message.content.strip()
-            
-            # Clean up the response
-            tech_stack = tech_stack.replace('"', '').replace("'", "").strip()
-            
-            # Remove any non-technology words and clean up
-            tech_terms = []
-            for term in tech_stack.split(','):
-                term = term.strip()
-                if term and len(term) > 1 and not term.lower() in ['and', 'or', 'with', 'using', 'built', 'developed', 'created']:
-                    tech_terms.append(term)
-            
-            return ', '.join(tech_terms) if tech_terms else ""
+            # Drop quotes, filler words and duplicate spellings
+            return format_tech_stack((response.choices[0].message.content or "").split(','))
             
         except Exception as e:
             logger.warning(f"Failed to extract tech stack from description: {e}")
@@ -1609,99 +1897,8 @@ class StandardATSService:
         Returns:
             Dictionary containing repetition analysis with debug information
         """
-        # Removed debug logging to reduce console output - analysis runs silently
-        
-        import re
-        from collections import defaultdict, Counter
-        
-        # Define action verbs and professional terms to focus on
-        action_verbs = {
-            'implemented', 'managed', 'developed', 'created', 'built', 'designed', 'led', 'executed', 'delivered',
-            'optimized', 'improved', 'enhanced', 'streamlined', 'automated', 'deployed', 'integrated', 'configured',
-            'maintained', 'monitored', 'analyzed', 'resolved', 'coordinated', 'collaborated', 'mentored', 'trained',
-            'established', 'initiated', 'launched', 'completed', 'achieved', 'increased', 'reduced', 'saved',
-            'transformed', 'migrated', 'upgraded', 'refactored', 'debugged', 'tested', 'validated', 'verified',
-            'documented', 'presented', 'communicated', 'facilitated', 'supervised', 'directed', 'guided', 'influenced',
-            'negotiated', 'planned', 'organized', 'scheduled', 'prioritized', 'evaluated', 'assessed', 'reviewed',
-            'recommended', 'proposed', 'suggested', 'identified', 'discovered', 'investigated', 'researched',
-            'studied', 'learned', 'acquired', 'gained', 'obtained', 'secured', 'earned', 'won', 'received', 'utilized'
-        }
-        
-        professional_terms = {
-            'scalable', 'secure', 'efficient', 'robust', 'reliable', 'flexible', 'comprehensive', 'advanced',
-            'innovative', 'cutting-edge', 'state-of-the-art', 'high-performance', 'enterprise-grade', 'mission-critical',
-            'cost-effective', 'user-friendly', 'intuitive', 'seamless', 'integrated', 'automated', 'streamlined',
-            'optimized', 'enhanced', 'improved', 'upgraded', 'modernized', 'standardized', 'centralized',
-            'distributed', 'cloud-based', 'web-based', 'mobile-first', 'responsive', 'cross-platform',
-            'real-time', 'high-availability', 'fault-tolerant', 'load-balanced', 'microservices', 'api-driven'
-        }
-        
-        # Common words to ignore
-        common_words = {
-            'and', 'in', 'with', 'of', 'to', 'for', 'on', 'by', 'the', 'a', 'an', 'is', 'are', 'was', 'were',
-            'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'may', 'might', 'can', 'must', 'shall', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she',
-            'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
-        }
-        
-        # Split resume into sections (basic section detection)
         sections = self._split_resume_into_sections(resume_text)
-        
-        repetition_analysis = {
-            "total_words_analyzed": 0,
-            "sections_analyzed": len(sections),
-            "repetitions_found": {},
-            "debug_info": {},
-            "action_verbs_found": {},
-            "professional_terms_found": {}
-        }
-        
-        for section_name, section_text in sections.items():
-            # Clean and tokenize text
-            words = re.findall(r'\b[a-zA-Z]+\b', section_text.lower())
-            word_count = Counter(words)
-            
-            # Filter for action verbs and professional terms only
-            relevant_repetitions = {}
-            action_verb_reps = {}
-            professional_term_reps = {}
-            
-            for word, count in word_count.items():
-                if count >= 2 and word not in common_words:
-                    if word in action_verbs:
-                        action_verb_reps[word] = count
-                        relevant_repetitions[word] = count
-                    elif word in professional_terms:
-                        professional_term_reps[word] = count
-                        relevant_repetitions[word] = count
-            
-            if relevant_repetitions:
-                repetition_analysis["repetitions_found"][section_name] = relevant_repetitions
-                repetition_analysis["action_verbs_found"][section_name] = action_verb_reps
-                repetition_analysis["professional_terms_found"][section_name] = professional_term_reps
-                
-                # Store context for each repetition (without debug logging)
-                for word, count in relevant_repetitions.items():
-                    word_type = "Action Verb" if word in action_verbs else "Professional Term"
-                    
-                    # Find contexts where the word appears
-                    contexts = []
-                    sentences = re.split(r'[.!?]+', section_text)
-                    for sentence in sentences:
-                        if word.lower() in sentence.lower():
-                            contexts.append(sentence.strip()[:100] + "..." if len(sentence.strip()) > 100 else sentence.strip())
-                    
-                    repetition_analysis["debug_info"][f"{section_name}_{word}"] = {
-                        "word": word,
-                        "count": count,
-                        "contexts": contexts[:3],  # Limit to first 3 contexts
-                        "section": section_name,
-                        "type": word_type
-                    }
-            
-            repetition_analysis["total_words_analyzed"] += len(words)
-        
-        return repetition_analysis
+        return _analyze_power_word_repetitions(sections)
 
     def _split_resume_into_sections(self, resume_text: str) -> Dict[str, str]:
         """
@@ -1898,6 +2095,386 @@ class StandardATSService:
         return achievement_analysis
 
 
+JD_SPECIFIC_ATS_PROMPT = register_prompt(
+    "ats.jd_specific",
+    system="""
+    You are an expert ATS (Applicant Tracking System) analyst and job matching specialist with 10+ years of experience in recruitment technology and resume optimization.
+    
+    TASK: Perform a comprehensive job-specific ATS analysis comparing the resume against the provided job description with precise, consistent scoring and HIGHLY SPECIFIC, ACTIONABLE feedback that will increase both the overall score and job match percentage by 10-15 points when applied.
+    
+    CRITICAL REQUIREMENTS - MANDATORY COMPLIANCE:
+    - Return ONLY valid JSON (no markdown, no code fences, no explanations, no additional text)
+    - NEVER omit any section - if no issues exist, return empty arrays/strings but keep the section structure
+    - ALWAYS include ALL required sections: overall_score, match_percentage, missing_keywords, category_scores, detailed_feedback, strengths, weaknesses, recommendations
+    - NEVER copy the resume text into your response - the original text is attached to the result after analysis
+    - Ensure all scores are integers between 0-100 (never "NA", "N/A", "None", "Null", "Unknown", or text)
+    - NEVER use placeholder values - provide specific, actionable content
+    - LANGUAGE VARIETY: Use varied language within same sections, allow appropriate repetition across different sections
+    - PERFECT GRAMMAR: All content must have flawless spelling, grammar, and professional language
+    - CONSISTENT SCORING: Apply the same rigorous standards across all categories
+    - COMPREHENSIVE REPETITION ANALYSIS: For repetition_avoidance section, analyze ALL repeated words and provide individual FIX_REPETITION suggestions for EACH repeated word - if 15 words are repeated, provide 15 specific FIX_REPETITION suggestions
+    
+    PRECISE SCORING CRITERIA - APPLY CONSISTENTLY:
+    
+    DYNAMIC SCORING RULES:
+    - Use precise scores (not just multiples of 5) - e.g., 87, 93, 76, 84
+    - Count total issues/problems found across all categories
+    - If total issues = 0: Apply 1.15x bonus multiplier to all category scores
+    - If total issues = 1-2: Apply 1.10x bonus multiplier to all category scores  
+    - If total issues = 3-4: Apply 1.05x bonus multiplier to all category scores
+    - If total issues = 5+: No bonus multiplier (use base scores)
+    - Final scores must be integers between 0-100 (cap at 100 if bonus exceeds)
+    
+    KEYWORD_MATCH_SKILLS (0-100):
+    - 90-100: Perfect keyword alignment, all required skills present, industry terms matched
+    - 80-89: Excellent keyword match with minor gaps in skill alignment
+    - 70-79: Good keyword coverage but missing some important job-specific terms
+    - 60-69: Fair keyword match, missing several critical skills/terms
+    - 50-59: Poor keyword alignment, significant gaps in required skills
+    - 0-49: Very poor keyword match, minimal alignment with job requirements
+    
+    EXPERIENCE_RELEVANCE (0-100):
+    - 90-100: Perfect experience alignment, exact role match, relevant industry background
+    - 80-89: Excellent experience match with minor gaps in role relevance
+    - 70-79: Good experience alignment but some gaps in role-specific experience
+    - 60-69: Fair experience match, missing some relevant experience areas
+    - 50-59: Poor experience alignment, significant gaps in relevant experience
+    - 0-49: Very poor experience match, minimal relevant experience
+    
+    EDUCATION_CERTIFICATIONS (0-100):
+    - 90-100: Perfect education match, all required qualifications present
+    - 80-89: Excellent education alignment with minor gaps
+    - 70-79: Good education match but missing some preferred qualifications
+    - 60-69: Fair education alignment, missing important qualifications
+    - 50-59: Poor education match, significant gaps in required qualifications
+    - 0-49: Very poor education alignment, minimal required qualifications
+    
+    ACHIEVEMENTS_IMPACT (0-100):
+    - 90-100: Quantified achievements directly relevant to job requirements
+    - 80-89: Good achievement alignment with some relevant metrics
+    - 70-79: Fair achievement relevance but missing some job-specific impact
+    - 60-69: Limited achievement alignment with job requirements
+    - 50-59: Poor achievement relevance, minimal job-specific impact
+    - 0-49: Very poor achievement alignment, no relevant impact shown
+    
+    FORMATTING_STRUCTURE (0-100):
+    - 90-100: Perfect ATS format, clear structure, job-relevant organization
+    - 80-89: Excellent formatting with minor ATS optimization issues
+    - 70-79: Good formatting but some ATS compatibility concerns
+    - 60-69: Fair formatting with significant ATS issues
+    - 50-59: Poor formatting, major ATS compatibility problems
+    - 0-49: Very poor formatting, completely ATS-incompatible
+    
+    SOFT_SKILLS_MATCH (0-100):
+    - 90-100: Perfect soft skills alignment with job requirements
+    - 80-89: Excellent soft skills match with minor gaps
+    - 70-79: Good soft skills alignment but missing some required traits
+    - 60-69: Fair soft skills match, missing important job-relevant skills
+    - 50-59: Poor soft skills alignment, significant gaps
+    - 0-49: Very poor soft skills match, minimal alignment
+    
+    REPETITION_AVOIDANCE (0-100):
+    - 90-100: Perfect varied language, no unnecessary repetitions within same section, professional diversity across all sections
+    - 80-89: Excellent language variety with minor repetitive elements within sections, good cross-section diversity
+    - 70-79: Good variety but some repetitive action verbs or phrases within same section, acceptable cross-section repetition
+    - 60-69: Fair variety, noticeable repetition within same section affecting quality, some cross-section repetition acceptable
+    - 50-59: Poor variety, significant repetitive language within same section, limited cross-section diversity
+    - 0-49: Very poor variety, excessive repetition within same section, minimal cross-section language diversity
+    
+    COMPREHENSIVE REPETITION DETECTION REQUIREMENTS - MANDATORY:
+    - FOCUS ON ACTION VERBS AND PROFESSIONAL LANGUAGE: Only detect repeated action verbs, professional terms, and descriptive words that affect resume quality
+    - IGNORE COMMON WORDS: Do not flag repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
+    - IGNORE PROPER NOUNS: Do not flag repetitions of names, locations, company names, technologies, skills, universities, dates
+    - DETECT ACTION VERB REPETITIONS: Find action verbs that appear 2+ times within the same section (implemented, managed, developed, created, built, designed, etc.)
+    - DETECT PROFESSIONAL TERM REPETITIONS: Find professional descriptive words that appear 2+ times (scalable, secure, efficient, optimized, etc.)
+    - COUNT EXACT OCCURRENCES: For each relevant repeated word, count exactly how many times it appears in each section
+    - IDENTIFY WORD LOCATIONS: Note the exact context and position of each repeated word instance
+    - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternative words/phrases
+    - DEBUG OUTPUT: Log only relevant repetitions (action verbs and professional terms) with counts and locations
+    
+    CONTACT_INFORMATION_COMPLETENESS (0-100):
+    - 90-100: Complete contact info (name, phone, email, LinkedIn, location) with proper formatting
+    - 80-89: Missing 1-2 non-critical contact elements, good overall contact presentation
+    - 70-79: Missing important contact details (email/phone), some formatting issues
+    - 60-69: Multiple missing contact elements, poor contact information organization
+    - 50-59: Major contact information gaps, significant formatting problems
+    - 0-49: Critical contact information missing, completely inadequate contact section
+    
+    RESUME_LENGTH_OPTIMIZATION (0-100):
+    - 90-100: Perfect length for experience level, optimal content density
+    - 80-89: Appropriate length with minor adjustments needed, good content balance
+    - 70-79: Fair length optimization, some content could be condensed or expanded
+    - 60-69: Length issues (too short/long), content density problems
+    - 50-59: Poor length optimization, significant content balance issues
+    - 0-49: Inappropriate resume length, major content organization problems
+    
+    The user message contains the RESUME TEXT TO ANALYZE, the REPETITION DEBUG ANALYSIS RESULTS, the PARSED RESUME DATA (for accurate analysis) and the JOB DESCRIPTION TO MATCH AGAINST.
+    
+    IMPORTANT: Use the repetition debug analysis results in the user message to determine if repetitions exist. 
+    - If repetitions_found is empty or shows 0 repeated words, DO NOT generate any FIX_REPETITION suggestions
+    - Only generate FIX_REPETITION suggestions for words that are actually listed in the repetitions_found section
+    - If no repetitions are detected, focus on other aspects of language variety and professional presentation
+    
+    CRITICAL ANALYSIS REQUIREMENTS:
+    - FIRST analyze the PARSED DATA to understand what information is actually present
+    - THEN analyze the raw text for formatting, grammar, and presentation issues
+    - ONLY suggest missing elements that are genuinely absent from the parsed data
+    - PROJECT DESCRIPTION LENGTH ENFORCEMENT: For ALL projects, count the number of statements (sentences ending with period, exclamation, or question mark) - if less than 6 statements, you MUST suggest expansion to exactly 6-7 statements - if more than 7 statements, you MUST suggest reduction to exactly 6-7 statements - this is MANDATORY and CRITICAL
+    - DO NOT suggest missing elements that already exist in the parsed data
+    - Cross-reference parsed data with job requirements to identify gaps
+    - Focus on job-relevant missing elements and improvements
+    - SECTION-SPECIFIC ANALYSIS: Each section should ONLY contain suggestions relevant to that specific section
+    - NO CROSS-SECTION SUGGESTIONS: Do not include suggestions from other sections in any section's feedback
+    - IF SECTION IS COMPLETE: If a section has all required elements and is well-formatted, return empty arrays for negatives, suggestions, and specific_issues
+    - SECTION ISOLATION: Each detailed_feedback section must be completely independent and self-contained
+    - MANDATORY PROJECT DESCRIPTION LENGTH: ALL project descriptions MUST be exactly 6-7 statements - NO EXCEPTIONS - if less than 6 statements, MUST expand to 6-7 statements - if more than 7 statements, MUST condense to 6-7 statements - this is a CRITICAL REQUIREMENT
+    - PROJECT DESCRIPTION ENFORCEMENT: For EVERY project with less than 6 statements, you MUST generate exactly 6-7 statements in your suggestions - COUNT the statements and ensure they are exactly 6-7 - this is MANDATORY
+    - PROJECT DESCRIPTION COUNTING: When analyzing projects, count each statement (each sentence ending with period, exclamation, or question mark) - if count is less than 6, you MUST suggest expansion to exactly 6-7 statements - if count is more than 7, you MUST suggest reduction to exactly 6-7 statements
+    
+    COMPREHENSIVE REPETITION ANALYSIS REQUIREMENTS - MANDATORY:
+    - FOCUS ON ACTION VERBS AND PROFESSIONAL TERMS: Only analyze repeated action verbs and professional descriptive words that impact resume quality
+    - IGNORE COMMON WORDS: Do not analyze repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
+    - IGNORE PROPER NOUNS: Do not analyze repetitions of names, locations, company names, technologies, skills, universities, dates
+    - DETECT ACTION VERB REPETITIONS: Find action verbs that appear 2+ times within the same section (implemented, managed, developed, created, built, designed, etc.)
+    - DETECT PROFESSIONAL TERM REPETITIONS: Find professional descriptive words that appear 2+ times (scalable, secure, efficient, optimized, etc.)
+    - COUNT EXACT FREQUENCY: For each relevant repeated word, count exactly how many times it appears in each section
+    - IDENTIFY CONTEXT: Note the exact context and sentence where each repeated word appears
+    - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternative words/phrases
+    - DEBUG LOGGING: Include detailed debug information showing only relevant repetitions with counts and locations
+    - ENHANCEMENT EXAMPLES: Show before/after examples for every repeated action verb/professional term with specific replacements
+    - COMPREHENSIVE COVERAGE: Find ALL repeated action verbs and professional terms in the resume
+    - MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, you MUST provide a specific recommendation in the suggestions section
+    - NO PARTIAL ANALYSIS: If 12 repeated words are detected, you MUST provide 12 specific recommendations - NO EXCEPTIONS
+    - COMPLETE ISSUE COUNTING: Count ALL repeated words as issues - if 12 words are repeated, show 12 issues to fix
+    
+    SECTION DETECTION REQUIREMENTS:
+    - Check PARSED DATA for projects: Look for "projects", "project", "portfolio" keys with actual content
+    - Check PARSED DATA for certificates: Look for "certificates", "certifications", "certificate" keys with actual content
+    - Check PARSED DATA for experience: Look for "experience", "work_experience" with company, position, dates
+    - Check PARSED DATA for education: Look for "education", "academic" with institution, degree, year
+    - Check PARSED DATA for contact: Look for "contact", "basic_details" with phone, email, location
+    - Check PARSED DATA for skills: Look for "skills", "competencies" with actual skill lists
+    - Check PARSED DATA for summary: Look for "summary", "objective", "profile" with actual content
+    - If sections exist in parsed data but are empty/incomplete, suggest job-relevant improvements rather than additions
+    - If sections are completely missing from parsed data, then suggest job-relevant additions
+    - Include specific feedback about missing sections in weaknesses and recommendations
+    
+    SECTION-SPECIFIC FEEDBACK RULES:
+    - KEYWORD MATCH SECTION: Only suggest keyword-related improvements (missing job keywords, skill terms, industry terminology)
+    - EXPERIENCE RELEVANCE SECTION: Only suggest experience-related improvements (job relevance, role alignment, industry experience)
+    - EDUCATION SECTION: Only suggest education-related improvements (degrees, certifications, qualifications for the role)
+    - ACHIEVEMENTS SECTION: Only suggest achievement-related improvements (quantified results, job-relevant impact metrics)
+    - FORMATTING SECTION: Only suggest formatting-related improvements (layout, ATS compatibility, structure)
+    - SOFT SKILLS SECTION: Only suggest soft skills-related improvements (leadership, communication, teamwork for the role)
+    - REPETITION SECTION: Only suggest repetition-related improvements within the same section
+    - CONTACT SECTION: Only suggest contact-related improvements (phone, email, LinkedIn, location, formatting)
+    - LENGTH SECTION: Only suggest length-related improvements (content density, section optimization)
+    - If a section is complete and well-formatted, return empty arrays for that section's feedback
+    
+    REQUIRED OUTPUT SCHEMA (MUST INCLUDE ALL SECTIONS):
+    {
+        "overall_score": <calculate_weighted_average_of_all_category_scores>,
+        "match_percentage": <percentage_of_job_requirements_met>,
+        "missing_keywords": ["Specific missing keyword 1", "Specific missing keyword 2"],
+        "analysis_timestamp": "<set_by_server>",
+        "category_scores": {
+            "keyword_match_skills": <exact_score_based_on_criteria_above>,
+            "experience_relevance": <exact_score_based_on_criteria_above>,
+            "education_certifications": <exact_score_based_on_criteria_above>,
+            "achievements_impact": <exact_score_based_on_criteria_above>,
+            "formatting_structure": <exact_score_based_on_criteria_above>,
+            "soft_skills_match": <exact_score_based_on_criteria_above>,
+            "repetition_avoidance": <exact_score_based_on_criteria_above>,
+            "contact_information_completeness": <exact_score_based_on_criteria_above>,
+            "resume_length_optimization": <exact_score_based_on_criteria_above>
+        },
+        "detailed_feedback": {
+            "keyword_match_skills": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Keyword Match & Skills",
+                "description": "Specific analysis of keyword alignment with job requirements - ONLY keyword and skills-related feedback. Do NOT include proficiency-level qualifiers (Advanced/Intermediate/Beginner/Expert) in skills. Emphasize core designation-aligned skills.",
+                "positives": ["Quote specific job-relevant keywords found in resume", "Reference specific sections with strong job keyword alignment"],
+                "negatives": ["Quote specific missing job keywords", "Identify specific sections lacking required job terms", "List missing core skills (bare names only) aligned with the job designation"],
+                "suggestions": ["Provide exact job keyword additions needed", "Specify which sections need job-specific terminology", "ADD_SKILLS: Core Skills - Add: [list 10-15 core skills (bare names only, no proficiency)"]],
+                "specific_issues": ["List exact missing job keywords found", "Identify specific sections needing job terms with locations"],
+                "improvement_examples": ["Show before/after job keyword examples", "Provide specific job-relevant additions needed"],
+                "section_isolation_note": "ONLY include keyword and skills-related suggestions. Do not suggest contact, formatting, experience, or other section improvements in this keyword section feedback."
+            },
+            "experience_relevance": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Experience Relevance",
+                "description": "Specific analysis of experience alignment with job requirements - ONLY experience-related feedback",
+                "positives": ["Quote specific job-relevant experience from resume", "Reference specific roles that align with job requirements"],
+                "negatives": ["Quote specific experience that lacks job relevance", "Identify specific roles missing job-required experience"],
+                "suggestions": ["Provide exact experience additions needed", "Specify which roles need job-relevant enhancements"],
+                "specific_issues": ["List exact experience gaps found", "Identify specific roles needing job alignment with locations"],
+                "improvement_examples": ["Show before/after experience examples", "Provide specific job-relevant experience improvements needed"],
+                "section_isolation_note": "ONLY include experience-related suggestions. Do not suggest contact, formatting, skills, or other section improvements in this experience section feedback."
+            },
+            "education_certifications": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Education & Certifications",
+                "description": "Specific analysis of educational background match with job requirements",
+                "positives": ["Quote specific job-relevant education from resume", "Reference specific certifications that match job requirements"],
+                "negatives": ["Quote specific missing job-required education", "Identify specific certifications needed for the role"],
+                "suggestions": ["Provide exact education additions needed", "Specify which certifications to pursue for this role"],
+                "specific_issues": ["List exact education gaps found", "Identify specific missing qualifications with locations"],
+                "improvement_examples": ["Show before/after education examples", "Provide specific job-relevant education improvements needed"]
+            },
+            "achievements_impact": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Achievements & Impact",
+                "description": "Specific analysis of quantified achievements and job-relevant impact",
+                "positives": ["Quote specific job-relevant achievements from resume", "Reference specific quantified results that align with job requirements"],
+                "negatives": ["Quote specific achievements lacking job relevance", "Identify specific results that need job-focused metrics"],
+                "suggestions": ["Provide exact job-relevant achievement additions needed", "Specify which achievements need job-focused quantification"],
+                "specific_issues": ["List exact achievement gaps found", "Identify specific results needing job relevance with locations"],
+                "improvement_examples": ["Show before/after achievement examples", "Provide specific job-relevant achievement improvements needed"]
+            },
+            "formatting_structure": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Formatting & Structure",
+                "description": "Specific analysis of resume format and ATS compatibility for job application",
+                "positives": ["Quote specific well-formatted sections from resume", "Reference specific formatting that enhances job application"],
+                "negatives": ["Quote specific formatting problems found", "Identify specific sections with ATS compatibility issues"],
+                "suggestions": ["Provide exact formatting fixes needed for job application", "Specify which sections need job-focused formatting"],
+                "specific_issues": ["List exact formatting problems found in resume", "Identify specific ATS issues with locations"],
+                "improvement_examples": ["Show before/after formatting examples", "Provide specific job application formatting improvements needed"]
+            },
+            "soft_skills_match": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Soft Skills Match",
+                "description": "Specific analysis of soft skills alignment with job requirements",
+                "positives": ["Quote specific job-relevant soft skills from resume", "Reference specific sections with strong soft skills presentation"],
+                "negatives": ["Quote specific missing job-required soft skills", "Identify specific sections lacking soft skills alignment"],
+                "suggestions": ["Provide exact soft skills additions needed for this role", "Specify which sections need job-relevant soft skills"],
+                "specific_issues": ["List exact soft skills gaps found", "Identify specific sections needing soft skills with locations"],
+                "improvement_examples": ["Show before/after soft skills examples", "Provide specific job-relevant soft skills improvements needed"]
+            },
+            "repetition_avoidance": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Repetition Avoidance",
+                "description": "Specific analysis of varied language and minimal unnecessary repetitions within same section, allowing legitimate repetition across different sections",
+                "positives": ["Quote specific varied language examples from resume", "Reference specific sections with good word variety", "Note acceptable cross-section repetition where appropriate"],
+                "negatives": ["Quote specific repetitive action verbs found within same section", "Identify specific sections with excessive action verb repetition", "DEBUG: List ALL detected repeated action verbs with exact counts: Action Verb '[word]' appears [X] times in [Section]: [Context1], [Context2], [Context3]", "DEBUG: Categorize repetitions by type: Action Verbs: [list], Professional Terms: [list]", "MANDATORY: List EVERY repeated word as a separate issue - if 12 words are repeated, list ALL 12 as separate issues"],
+                "suggestions": ["Provide exact action verb replacements needed within same section", "Specify which sections need internal action verb variety", "FIX_REPETITION: [Section] - Action Verb '[repeated action verb]' used [X] times - Replace instances: [Instance 1: '[exact context]' → '[alternative1]'], [Instance 2: '[exact context]' → '[alternative2]'], [Instance 3: '[exact context]' → '[alternative3]']", "ENHANCE_VARIETY: For each repeated action verb, provide 3-5 specific professional alternatives with context", "DEBUG: Show complete action verb frequency analysis for each section", "MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, provide a specific FIX_REPETITION recommendation", "NO PARTIAL ANALYSIS: If 12 repeated words are detected, provide 12 specific FIX_REPETITION recommendations", "COMPREHENSIVE RECOMMENDATIONS: Include recommendations for ALL action verbs AND professional terms", "CRITICAL: Generate ONE FIX_REPETITION suggestion for EACH repeated word - if 'created' appears 3 times, generate 1 FIX_REPETITION suggestion for 'created' with 3 specific replacements", "CRITICAL: Generate ONE FIX_REPETITION suggestion for EACH professional term - if 'scalable' appears 3 times, generate 1 FIX_REPETITION suggestion for 'scalable' with 3 specific replacements", "MANDATORY: Based on the repetition debug analysis, generate FIX_REPETITION suggestions for ALL detected repeated words", "CRITICAL: If repetition_debug_analysis shows 17 repeated words, generate 17 FIX_REPETITION suggestions", "REQUIRED: For each word in the repetition analysis, create: FIX_REPETITION: [Section] - [Word Type] '[word]' used [X] times - Replace instances: [specific replacements]", "Note that cross-section repetition is acceptable when contextually appropriate"],
+                "specific_issues": ["List exact repetitive action verbs found within same section in resume", "Identify specific sections needing internal action verb variety with locations", "DEBUG: Complete action verb inventory: [Section1]: [action_verb1: X times], [action_verb2: Y times], [Section2]: [action_verb3: Z times]", "DEBUG: Highlight problematic repetitions: Action verbs appearing 3+ times in same section"],
+                "improvement_examples": ["Show before/after repetition examples within same section", "Provide specific action verb variety improvements needed within sections", "DEBUG: Before/After examples: 'Current: [exact repeated action verb]' → 'Improved: [varied action verb alternatives]'", "DEBUG: Show action verb replacement mapping: [Original Action Verb] → [Alternative 1, Alternative 2, Alternative 3]"]
+            },
+            "contact_information_completeness": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Contact Information Completeness",
+                "description": "Specific analysis of contact details presence, formatting, and professional presentation - ONLY contact-related feedback",
+                "positives": ["Quote specific well-formatted contact information from resume", "Reference specific contact elements that are complete"],
+                "negatives": ["Quote specific missing contact information", "Identify specific contact formatting problems"],
+                "suggestions": ["Provide exact contact additions needed", "Specify which contact elements need formatting fixes"],
+                "specific_issues": ["List exact missing contact information found", "Identify specific contact formatting problems with locations"],
+                "improvement_examples": ["Show before/after contact information examples", "Provide specific contact improvements needed"],
+                "section_isolation_note": "ONLY include contact-related suggestions. Do not suggest skills, experience, education, or other section improvements in this contact section feedback."
+            },
+            "resume_length_optimization": {
+                "score": <exact_score_based_on_criteria_above>,
+                "title": "Resume Length Optimization",
+                "description": "Specific analysis of resume length appropriateness for experience level and content density",
+                "positives": ["Quote specific sections with appropriate length", "Reference specific content that is well-balanced"],
+                "negatives": ["Quote specific sections that are too long/short", "Identify specific content that needs length adjustment"],
+                "suggestions": ["Provide exact content additions/removals needed", "Specify which sections need length optimization"],
+                "specific_issues": ["List exact length problems found in resume", "Identify specific sections needing length adjustment with locations"],
+                "improvement_examples": ["Show before/after length optimization examples", "Provide specific content density improvements needed"]
+            }
+        },
+        "strengths": [
+            "Specific strength 1 with job relevance details",
+            "Specific strength 2 with job relevance details",
+            "Specific strength 3 with job relevance details"
+        ],
+        "weaknesses": [
+            "Specific weakness 1 with job impact details",
+            "Specific weakness 2 with job impact details",
+            "Specific weakness 3 with job impact details"
+        ],
+        "recommendations": [
+            "Priority recommendation 1 with specific job-focused action",
+            "Priority recommendation 2 with specific job-focused action", 
+            "Priority recommendation 3 with specific job-focused action",
+            "Priority recommendation 4 with specific job-focused action",
+            "Priority recommendation 5 with specific job-focused action"
+        ]
+    }
+    
+    FINAL INSTRUCTIONS - CRITICAL FOR CONSISTENCY:
+    - NEVER omit sections - return empty values instead of missing sections!
+    - overall_score MUST be a weighted average of all category scores (integer 0-100)
+    - match_percentage MUST be calculated based on job requirements met (integer 0-100)
+    - All category scores MUST be integers between 0-100 based on precise criteria above!
+    - Provide specific, actionable recommendations with clear job-focused next steps!
+    - Focus on job-specific optimization, ATS compatibility, and measurable improvements!
+    - Use varied, professional language - avoid repetition across sections!
+    - Ensure all feedback is specific to the actual resume and job description analyzed!
+    - Calculate scores based on objective job matching criteria, not subjective opinions!
+    - Maintain consistency in scoring methodology across all categories!
+    - Analyze how well the resume matches the specific job requirements with precision!
+    
+    DETAILED FEEDBACK REQUIREMENTS - MANDATORY:
+    - For POSITIVES: Quote specific phrases, sentences, or sections from the actual resume that demonstrate job-relevant strengths
+    - For NEGATIVES: Quote specific problematic text, missing elements, or job-matching issues found in the resume
+    - For SUGGESTIONS: Provide exact text replacements, specific additions, or precise modifications needed for job alignment
+    - Always reference actual content from the resume being analyzed, not generic advice
+    - Point to specific sections (e.g., "In your Experience section under 'Software Engineer'...")
+    - Quote exact text that needs improvement (e.g., "The phrase 'did stuff' should be replaced with...")
+    - Identify specific missing job-relevant elements (e.g., "Your skills section is missing 'Python' which is required for this role")
+    - Reference specific job-matching issues (e.g., "Your experience description lacks the 'team leadership' mentioned in the job requirements")
+    - Provide concrete examples of what to add, remove, or modify in the actual resume content to better match the job
+    - For REPETITION ANALYSIS: Focus on repetition within the same section, not across different sections (e.g., using "implemented" in two different projects is acceptable)
+    
+    SPECIFIC SECTION ANALYSIS REQUIREMENTS:
+    - EXPERIENCE SECTION: Check for missing company names, job titles, dates, descriptions, locations, job-relevant keywords
+    - EDUCATION SECTION: Check for missing institution names, degrees, graduation years, GPAs, locations, job-relevant qualifications
+    - CONTACT SECTION: Check for missing phone, email, LinkedIn, location, professional title
+    - SKILLS SECTION: Check for missing technical skills, soft skills, job-required competencies, skill categorization
+    - PROJECTS SECTION: Check for missing project names, descriptions, tech stacks, dates, links, job-relevant technologies, project description length validation (MANDATORY: exactly 6-7 statements required - count each statement and ensure exactly 6-7)
+    - TECH STACK EXTRACTION: For projects with missing or empty tech stacks, analyze the project description to extract relevant technologies, frameworks, programming languages, and tools mentioned
+    - CERTIFICATIONS SECTION: Check for missing certificate names, issuing organizations, dates, job-relevant certifications
+    - SUMMARY SECTION: Check for missing professional summary or objective that aligns with job requirements
+    - LANGUAGES SECTION: Check for missing language proficiency levels, job-relevant languages
+    - REFERENCES SECTION: Check for missing reference contact information
+    
+    SUGGESTION FORMAT REQUIREMENTS:
+    - Use specific format: "MISSING: [Section] - [Specific Element] - [Job-Relevant Action Required]"
+    - Use specific format: "IMPROVE: [Section] - [Current Text] - [Job-Aligned Improvement]"
+    - Use specific format: "ADD: [Section] - [Missing Element] - [Job-Specific Addition Needed]"
+    - Use specific format: "FIX: [Section] - [Issue Description] - [Job-Matching Fix Required]"
+    - Always specify the exact section and field that needs attention
+    - Always provide the exact text or element that needs to be added/changed for job alignment
+    - Always explain what specific action is required to better match the job requirements
+    
+    PARSED DATA ANALYSIS RULES:
+    - If parsed data shows projects with dates, DO NOT suggest missing project dates
+    - If parsed data shows experience with company names, DO NOT suggest missing company names
+    - If parsed data shows education with degrees, DO NOT suggest missing degrees
+    - If parsed data shows contact info, DO NOT suggest missing contact information
+    - If parsed data shows skills, DO NOT suggest missing skills section
+    - Only suggest missing elements if they are genuinely absent from the parsed data
+    - Focus on job-relevant quality improvements for existing elements rather than suggesting missing elements
+    - Check for job relevance: if a field exists but lacks job-relevant content, suggest job-aligned improvements
+    - Check for completeness: if a field exists but is empty or incomplete, suggest job-relevant improvements
+    - Check for accuracy: if a field exists but has poor content, suggest better job-matching content
+    """,
+    user_template="""
+    RESUME TEXT TO ANALYZE:
+    {resume_text}
+
+    REPETITION DEBUG ANALYSIS RESULTS:
+    {repetition_debug}
+
+    PARSED RESUME DATA (for accurate analysis):
+    {parsed_data}
+
+    JOB DESCRIPTION TO MATCH AGAINST:
+    {job_description}
+    """
+)
+
 class JDSpecificATSService:
     """
     Job Description Specific ATS analysis service
@@ -1951,7 +2528,7 @@ class JDSpecificATSService:
             "model_name": self.model_name
         }
 
-    def analyze_resume_for_jd(self, resume_text: str, job_description: str, parsed_data: Dict[str, Any] = None) -> Dict[str, Any]:
+    def analyze_resume_for_jd(self, resume_text: str, job_description: str, parsed_data: Dict[str, Any] = None, use_cache: bool = True) -> Dict[str, Any]:
         """
         Analyze resume for specific job description and provide comprehensive feedback
         
@@ -1959,12 +2536,254 @@ class JDSpecificATSService:
             resume_text: Raw resume text to analyze
             job_description: Job description text to match against
             parsed_data: Optional parsed resume data for more accurate analysis
+            use_cache: Serve identical requests from the LLM response cache (set False to force a fresh call)
+            
+        Returns:
+            Dictionary containing JD-specific ATS analysis results with scores and recommendations
+        """
+        logger.info(f"Starting JD-Specific ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
+        
+        request = self._build_jd_analysis_request(resume_text, job_description, parsed_data)
+
+        try:
+            logger.info(f"Generating JD-Specific ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
+            response = continued_chat_completion(self.client, use_cache=use_cache, **request["completion_kwargs"])
+            return self._finalize_jd_analysis(response.choices[0].message.content, resume_text, request)
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze resume for JD-Specific ATS: {str(e)}")
+            raise
+
+    async def aanalyze_resume_for_jd(self, resume_text: str, job_description: str, parsed_data: Dict[str, Any] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Async version of analyze_resume_for_jd
+        
+        The main analysis call goes through the shared AsyncOpenAI client; local pre-analysis
+        and post-processing (including FIX_* augmentation calls) run in a worker thread.
+        
+        Args:
+            resume_text: Raw resume text to analyze
+            job_description: Job description text to match against
+            parsed_data: Optional parsed resume data for more accurate analysis
+            use_cache: Serve identical requests from the LLM response cache (set False to force a fresh call)
             
         Returns:
             Dictionary containing JD-specific ATS analysis results with scores and recommendations
         """
         logger.info(f"Starting JD-Specific ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
         
+        request = await asyncio.to_thread(self._build_jd_analysis_request, resume_text, job_description, parsed_data)
+
+        try:
+            response = await acontinued_chat_completion(self.parser.async_client, use_cache=use_cache, **request["completion_kwargs"])
+            return await asyncio.to_thread(self._finalize_jd_analysis, response.choices[0].message.content, resume_text, request)
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze resume for JD-Specific ATS: {str(e)}")
+            raise
+
+    def analyze_resume_for_jd_stream(self, resume_text: str, job_description: str, parsed_data: Dict[str, Any] = None, use_cache: bool = True) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streaming version of analyze_resume_for_jd
+        
+        Yields local analyzer findings immediately, category blocks as the model writes them,
+        FIX_* suggestion lines as augmentation completes them, and finally the merged result.
+        
+        Args:
+            resume_text: Raw resume text to analyze
+            job_description: Job description text to match against
+            parsed_data: Optional parsed resume data for more accurate analysis
+            use_cache: Serve identical requests from the LLM response cache (set False to force a fresh call)
+            
+        Yields:
+            (event, data) tuples; the last one is ("result", <same document analyze_resume_for_jd returns>)
+        """
+        logger.info(f"Starting streamed JD-Specific ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
+        
+        request = self._build_jd_analysis_request(resume_text, job_description, parsed_data)
+
+        try:
+            yield from _stream_analysis_events(
+                self.client,
+                request,
+                lambda response_text, on_suggestion: self._finalize_jd_analysis(response_text, resume_text, request, on_suggestion),
+                use_cache=use_cache
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze resume for JD-Specific ATS: {str(e)}")
+            raise
+
+    def analyze_resumes_for_jd_stream(self, resumes: List[Dict[str, Any]], job_description: str, max_concurrency: Optional[int] = None, min_prescore: Optional[float] = None, top_k: Optional[int] = None, use_cache: bool = True) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Screen many resumes against one job description
+        
+        The job description is digested once for local pre-scoring. Resume files are extracted in
+        parallel, optionally filtered by pre-score, then analyzed with analyze_resume_for_jd under
+        a concurrency cap. Results are yielded as each analysis finishes.
+        
+        Args:
+            resumes: Items with 'name' and either 'text' or 'path' (PDF, DOCX or TXT)
+            job_description: Job description text to match against
+            max_concurrency: Resumes analyzed at the same time (default and upper limit BULK_MAX_CONCURRENCY)
+            min_prescore: Skip resumes whose local pre-score (0-100) is below this value
+            top_k: Only analyze the k best resumes by pre-score
+            use_cache: Serve identical requests from the LLM response cache
+            
+        Yields:
+            ("prescore", {...}) once with every resume's local score and whether it was selected,
+            ("resume", {...}) per finished analysis with its current rank among finished resumes,
+            ("resume_error", {...}) per failed resume, and finally ("result", <ranked summary>)
+        """
+        import time
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from utils.jd_match import JobDescriptionProfile
+        from utils.pdf_extractor import DocumentExtractor
+
+        if not job_description or not job_description.strip():
+            raise ValueError("Job description is required")
+        if not resumes:
+            raise ValueError("At least one resume is required")
+        if len(resumes) > OpenAIConfig.BULK_MAX_RESUMES:
+            raise ValueError(f"Too many resumes: {len(resumes)} (limit {OpenAIConfig.BULK_MAX_RESUMES})")
+        # Callers (e.g. a form field) can lower the concurrency but never raise it past the configured cap
+        if max_concurrency is None or max_concurrency > OpenAIConfig.BULK_MAX_CONCURRENCY:
+            max_concurrency = OpenAIConfig.BULK_MAX_CONCURRENCY
+        max_concurrency = max(1, max_concurrency)
+
+        started = time.time()
+        profile = JobDescriptionProfile(job_description)
+        logger.info(f"📋 Bulk JD screening: {len(resumes)} resumes, {len(profile.weights)} JD key terms, concurrency={max_concurrency}")
+
+        # Extract resume text in parallel (items that already carry text are used as-is)
+        def _extract(item: Dict[str, Any]) -> str:
+            if item.get("text") is not None:
+                return item["text"]
+            return DocumentExtractor.extract_text(item["path"])
+
+        candidates: List[Dict[str, Any]] = []
+        failed: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=max(1, min(OpenAIConfig.BULK_EXTRACTION_WORKERS, len(resumes)))) as executor:
+            futures = [executor.submit(_extract, item) for item in resumes]
+            for index, (item, future) in enumerate(zip(resumes, futures)):
+                name = item.get("name") or f"resume_{index + 1}"
+                try:
+                    text = future.result()
+                    if not text.strip():
+                        raise ValueError("No text extracted from resume file")
+                except Exception as e:
+                    failed.append({"id": index, "name": name, "error": str(e)})
+                    continue
+                candidates.append({"id": index, "name": name, "text": text})
+        extracted_at = time.time()
+
+        # One vectorized pass scores every extracted resume against the JD
+        for candidate, score in zip(candidates, profile.prescore_many([c["text"] for c in candidates])):
+            candidate["prescore"] = round(float(score), 1)
+
+        # Local pre-score decides which resumes are worth an LLM analysis
+        ordered = sorted(candidates, key=lambda c: -c["prescore"])
+        selected = [c for c in ordered if min_prescore is None or c["prescore"] >= min_prescore]
+        if top_k is not None:
+            selected = selected[:max(0, top_k)]
+        selected_ids = {c["id"] for c in selected}
+        skipped = [
+            {"id": c["id"], "name": c["name"], "prescore": c["prescore"]}
+            for c in ordered if c["id"] not in selected_ids
+        ]
+        yield "prescore", {
+            "job_description_terms": profile.key_terms,
+            "resumes": [
+                {"id": c["id"], "name": c["name"], "prescore": c["prescore"], "selected": c["id"] in selected_ids}
+                for c in ordered
+            ],
+            "failed": failed
+        }
+        for item in failed:
+            yield "resume_error", item
+
+        def _rank_key(entry: Dict[str, Any]):
+            return (-entry["match_percentage"], -entry["overall_score"], -entry["prescore"])
+
+        ranking: List[Dict[str, Any]] = []
+        if selected:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(selected)))) as executor:
+                futures = {
+                    executor.submit(self.analyze_resume_for_jd, c["text"], profile.text, None, use_cache): c
+                    for c in selected
+                }
+                try:
+                    for future in as_completed(futures):
+                        candidate = futures[future]
+                        try:
+                            analysis = future.result()
+                        except Exception as e:
+                            logger.warning(f"Bulk JD analysis failed for {candidate['name']}: {e}")
+                            error = {"id": candidate["id"], "name": candidate["name"], "error": str(e)}
+                            failed.append(error)
+                            yield "resume_error", error
+                            continue
+                        entry = {
+                            "id": candidate["id"],
+                            "name": candidate["name"],
+                            "prescore": candidate["prescore"],
+                            "overall_score": self._validate_score(analysis.get("overall_score", 0)),
+                            "match_percentage": self._validate_score(analysis.get("match_percentage", 0)),
+                            "missing_keywords": analysis.get("missing_keywords", [])
+                        }
+                        ranking.append(entry)
+                        ranking.sort(key=_rank_key)
+                        yield "resume", {**entry, "rank": ranking.index(entry) + 1, "analysis": analysis}
+                finally:
+                    # A client that stops reading should not keep queued analyses spending LLM calls
+                    for future in futures:
+                        future.cancel()
+
+        finished = time.time()
+        logger.info(f"✅ Bulk JD screening finished: {len(ranking)} analyzed, {len(skipped)} skipped, {len(failed)} failed in {finished - started:.1f}s")
+        yield "result", {
+            "ranking": [{**entry, "rank": position + 1} for position, entry in enumerate(ranking)],
+            "skipped": skipped,
+            "failed": failed,
+            "stats": {
+                "total": len(resumes),
+                "analyzed": len(ranking),
+                "skipped": len(skipped),
+                "failed": len(failed),
+                "extraction_seconds": round(extracted_at - started, 2),
+                "analysis_seconds": round(finished - extracted_at, 2),
+                "total_seconds": round(finished - started, 2)
+            }
+        }
+
+    def analyze_resumes_for_jd(self, resumes: List[Dict[str, Any]], job_description: str, max_concurrency: Optional[int] = None, min_prescore: Optional[float] = None, top_k: Optional[int] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Non-streaming version of analyze_resumes_for_jd_stream
+
+        Args:
+            resumes: Items with 'name' and either 'text' or 'path' (PDF, DOCX or TXT)
+            job_description: Job description text to match against
+            max_concurrency: Resumes analyzed at the same time (default and upper limit BULK_MAX_CONCURRENCY)
+            min_prescore: Skip resumes whose local pre-score (0-100) is below this value
+            top_k: Only analyze the k best resumes by pre-score
+            use_cache: Serve identical requests from the LLM response cache
+
+        Returns:
+            Ranked summary with each ranking entry's full analysis under 'analysis'
+        """
+        analyses: Dict[int, Dict[str, Any]] = {}
+        result: Dict[str, Any] = {}
+        for event, data in self.analyze_resumes_for_jd_stream(resumes, job_description, max_concurrency, min_prescore, top_k, use_cache):
+            if event == "resume":
+                analyses[data["id"]] = data["analysis"]
+            elif event == "result":
+                result = data
+        for entry in result.get("ranking", []):
+            entry["analysis"] = analyses.get(entry["id"])
+        return result
+
+    def _build_jd_analysis_request(self, resume_text: str, job_description: str, parsed_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run the local pre-analysis and build the chat completion arguments for the analysis request"""
         # Validate parsed data if provided
         if parsed_data:
             parsed_data = self._validate_parsed_data(parsed_data)
@@ -1976,495 +2795,87 @@ class JDSpecificATSService:
         # Still need repetition analysis for the suggestions (but without debug logging)
         repetition_debug = self._analyze_repetitions_debug(resume_text)
         
-        prompt = f"""
-        You are an expert ATS (Applicant Tracking System) analyst and job matching specialist with 10+ years of experience in recruitment technology and resume optimization.
-        
-        TASK: Perform a comprehensive job-specific ATS analysis comparing the resume against the provided job description with precise, consistent scoring and HIGHLY SPECIFIC, ACTIONABLE feedback that will increase both the overall score and job match percentage by 10-15 points when applied.
-        
-        CRITICAL REQUIREMENTS - MANDATORY COMPLIANCE:
-        - Return ONLY valid JSON (no markdown, no code fences, no explanations, no additional text)
-        - NEVER omit any section - if no issues exist, return empty arrays/strings but keep the section structure
-        - ALWAYS include ALL required sections: overall_score, match_percentage, missing_keywords, category_scores, detailed_feedback, extracted_text, strengths, weaknesses, recommendations
-        - Ensure all scores are integers between 0-100 (never "NA", "N/A", "None", "Null", "Unknown", or text)
-        - NEVER use placeholder values - provide specific, actionable content
-        - LANGUAGE VARIETY: Use varied language within same sections, allow appropriate repetition across different sections
-        - PERFECT GRAMMAR: All content must have flawless spelling, grammar, and professional language
-        - CONSISTENT SCORING: Apply the same rigorous standards across all categories
-        - COMPREHENSIVE REPETITION ANALYSIS: For repetition_avoidance section, analyze ALL repeated words and provide individual FIX_REPETITION suggestions for EACH repeated word - if 15 words are repeated, provide 15 specific FIX_REPETITION suggestions
-        
-        PRECISE SCORING CRITERIA - APPLY CONSISTENTLY:
-        
-        DYNAMIC SCORING RULES:
-        - Use precise scores (not just multiples of 5) - e.g., 87, 93, 76, 84
-        - Count total issues/problems found across all categories
-        - If total issues = 0: Apply 1.15x bonus multiplier to all category scores
-        - If total issues = 1-2: Apply 1.10x bonus multiplier to all category scores  
-        - If total issues = 3-4: Apply 1.05x bonus multiplier to all category scores
-        - If total issues = 5+: No bonus multiplier (use base scores)
-        - Final scores must be integers between 0-100 (cap at 100 if bonus exceeds)
-        
-        KEYWORD_MATCH_SKILLS (0-100):
-        - 90-100: Perfect keyword alignment, all required skills present, industry terms matched
-        - 80-89: Excellent keyword match with minor gaps in skill alignment
-        - 70-79: Good keyword coverage but missing some important job-specific terms
-        - 60-69: Fair keyword match, missing several critical skills/terms
-        - 50-59: Poor keyword alignment, significant gaps in required skills
-        - 0-49: Very poor keyword match, minimal alignment with job requirements
-        
-        EXPERIENCE_RELEVANCE (0-100):
-        - 90-100: Perfect experience alignment, exact role match, relevant industry background
-        - 80-89: Excellent experience match with minor gaps in role relevance
-        - 70-79: Good experience alignment but some gaps in role-specific experience
-        - 60-69: Fair experience match, missing some relevant experience areas
-        - 50-59: Poor experience alignment, significant gaps in relevant experience
-        - 0-49: Very poor experience match, minimal relevant experience
-        
-        EDUCATION_CERTIFICATIONS (0-100):
-        - 90-100: Perfect education match, all required qualifications present
-        - 80-89: Excellent education alignment with minor gaps
-        - 70-79: Good education match but missing some preferred qualifications
-        - 60-69: Fair education alignment, missing important qualifications
-        - 50-59: Poor education match, significant gaps in required qualifications
-        - 0-49: Very poor education alignment, minimal required qualifications
-        
-        ACHIEVEMENTS_IMPACT (0-100):
-        - 90-100: Quantified achievements directly relevant to job requirements
-        - 80-89: Good achievement alignment with some relevant metrics
-        - 70-79: Fair achievement relevance but missing some job-specific impact
-        - 60-69: Limited achievement alignment with job requirements
-        - 50-59: Poor achievement relevance, minimal job-specific impact
-        - 0-49: Very poor achievement alignment, no relevant impact shown
-        
-        FORMATTING_STRUCTURE (0-100):
-        - 90-100: Perfect ATS format, clear structure, job-relevant organization
-        - 80-89: Excellent formatting with minor ATS optimization issues
-        - 70-79: Good formatting but some ATS compatibility concerns
-        - 60-69: Fair formatting with significant ATS issues
-        - 50-59: Poor formatting, major ATS compatibility problems
-        - 0-49: Very poor formatting, completely ATS-incompatible
-        
-        SOFT_SKILLS_MATCH (0-100):
-        - 90-100: Perfect soft skills alignment with job requirements
-        - 80-89: Excellent soft skills match with minor gaps
-        - 70-79: Good soft skills alignment but missing some required traits
-        - 60-69: Fair soft skills match, missing important job-relevant skills
-        - 50-59: Poor soft skills alignment, significant gaps
-        - 0-49: Very poor soft skills match, minimal alignment
-        
-        REPETITION_AVOIDANCE (0-100):
-        - 90-100: Perfect varied language, no unnecessary repetitions within same section, professional diversity across all sections
-        - 80-89: Excellent language variety with minor repetitive elements within sections, good cross-section diversity
-        - 70-79: Good variety but some repetitive action verbs or phrases within same section, acceptable cross-section repetition
-        - 60-69: Fair variety, noticeable repetition within same section affecting quality, some cross-section repetition acceptable
-        - 50-59: Poor variety, significant repetitive language within same section, limited cross-section diversity
-        - 0-49: Very poor variety, excessive repetition within same section, minimal cross-section language diversity
-        
-        COMPREHENSIVE REPETITION DETECTION REQUIREMENTS - MANDATORY:
-        - FOCUS ON ACTION VERBS AND PROFESSIONAL LANGUAGE: Only detect repeated action verbs, professional terms, and descriptive words that affect resume quality
-        - IGNORE COMMON WORDS: Do not flag repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
-        - IGNORE PROPER NOUNS: Do not flag repetitions of names, locations, company names, technologies, skills, universities, dates
-        - DETECT ACTION VERB REPETITIONS: Find action verbs that appear 2+ times within the same section (implemented, managed, developed, created, built, designed, etc.)
-        - DETECT PROFESSIONAL TERM REPETITIONS: Find professional descriptive words that appear 2+ times (scalable, secure, efficient, optimized, etc.)
-        - COUNT EXACT OCCURRENCES: For each relevant repeated word, count exactly how many times it appears in each section
-        - IDENTIFY WORD LOCATIONS: Note the exact context and position of each repeated word instance
-        - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternative words/phrases
-        - DEBUG OUTPUT: Log only relevant repetitions (action verbs and professional terms) with counts and locations
-        
-        CONTACT_INFORMATION_COMPLETENESS (0-100):
-        - 90-100: Complete contact info (name, phone, email, LinkedIn, location) with proper formatting
-        - 80-89: Missing 1-2 non-critical contact elements, good overall contact presentation
-        - 70-79: Missing important contact details (email/phone), some formatting issues
-        - 60-69: Multiple missing contact elements, poor contact information organization
-        - 50-59: Major contact information gaps, significant formatting problems
-        - 0-49: Critical contact information missing, completely inadequate contact section
-        
-        RESUME_LENGTH_OPTIMIZATION (0-100):
-        - 90-100: Perfect length for experience level, optimal content density
-        - 80-89: Appropriate length with minor adjustments needed, good content balance
-        - 70-79: Fair length optimization, some content could be condensed or expanded
-        - 60-69: Length issues (too short/long), content density problems
-        - 50-59: Poor length optimization, significant content balance issues
-        - 0-49: Inappropriate resume length, major content organization problems
-        
-        RESUME TEXT TO ANALYZE:
-        {resume_text}
-        
-        REPETITION DEBUG ANALYSIS RESULTS:
-        {repetition_debug}
-        
-        IMPORTANT: Use the repetition debug analysis results above to determine if repetitions exist. 
-        - If repetitions_found is empty or shows 0 repeated words, DO NOT generate any FIX_REPETITION suggestions
-        - Only generate FIX_REPETITION suggestions for words that are actually listed in the repetitions_found section
-        - If no repetitions are detected, focus on other aspects of language variety and professional presentation
-        
-        PARSED RESUME DATA (for accurate analysis):
-        {json.dumps(parsed_data, indent=2) if parsed_data else "No parsed data provided"}
-        
-        JOB DESCRIPTION TO MATCH AGAINST:
-        {job_description}
-        
-        CRITICAL ANALYSIS REQUIREMENTS:
-        - FIRST analyze the PARSED DATA to understand what information is actually present
-        - THEN analyze the raw text for formatting, grammar, and presentation issues
-        - ONLY suggest missing elements that are genuinely absent from the parsed data
-        - PROJECT DESCRIPTION LENGTH ENFORCEMENT: For ALL projects, count the number of statements (sentences ending with period, exclamation, or question mark) - if less than 6 statements, you MUST suggest expansion to exactly 6-7 statements - if more than 7 statements, you MUST suggest reduction to exactly 6-7 statements - this is MANDATORY and CRITICAL
-        - DO NOT suggest missing elements that already exist in the parsed data
-        - Cross-reference parsed data with job requirements to identify gaps
-        - Focus on job-relevant missing elements and improvements
-        - SECTION-SPECIFIC ANALYSIS: Each section should ONLY contain suggestions relevant to that specific section
-        - NO CROSS-SECTION SUGGESTIONS: Do not include suggestions from other sections in any section's feedback
-        - IF SECTION IS COMPLETE: If a section has all required elements and is well-formatted, return empty arrays for negatives, suggestions, and specific_issues
-        - SECTION ISOLATION: Each detailed_feedback section must be completely independent and self-contained
-        - MANDATORY PROJECT DESCRIPTION LENGTH: ALL project descriptions MUST be exactly 6-7 statements - NO EXCEPTIONS - if less than 6 statements, MUST expand to 6-7 statements - if more than 7 statements, MUST condense to 6-7 statements - this is a CRITICAL REQUIREMENT
-        - PROJECT DESCRIPTION ENFORCEMENT: For EVERY project with less than 6 statements, you MUST generate exactly 6-7 statements in your suggestions - COUNT the statements and ensure they are exactly 6-7 - this is MANDATORY
-        - PROJECT DESCRIPTION COUNTING: When analyzing projects, count each statement (each sentence ending with period, exclamation, or question mark) - if count is less than 6, you MUST suggest expansion to exactly 6-7 statements - if count is more than 7, you MUST suggest reduction to exactly 6-7 statements
-        
-        COMPREHENSIVE REPETITION ANALYSIS REQUIREMENTS - MANDATORY:
-        - FOCUS ON ACTION VERBS AND PROFESSIONAL TERMS: Only analyze repeated action verbs and professional descriptive words that impact resume quality
-        - IGNORE COMMON WORDS: Do not analyze repetitions of common words like "and", "in", "with", "of", "to", "for", "on", "by", "the", "a", "an"
-        - IGNORE PROPER NOUNS: Do not analyze repetitions of names, locations, company names, technologies, skills, universities, dates
-        - DETECT ACTION VERB REPETITIONS: Find action verbs that appear 2+ times within the same section (implemented, managed, developed, created, built, designed, etc.)
-        - DETECT PROFESSIONAL TERM REPETITIONS: Find professional descriptive words that appear 2+ times (scalable, secure, efficient, optimized, etc.)
-        - COUNT EXACT FREQUENCY: For each relevant repeated word, count exactly how many times it appears in each section
-        - IDENTIFY CONTEXT: Note the exact context and sentence where each repeated word appears
-        - PROVIDE SPECIFIC ALTERNATIVES: For each repeated action verb/professional term, suggest 3-5 specific alternative words/phrases
-        - DEBUG LOGGING: Include detailed debug information showing only relevant repetitions with counts and locations
-        - ENHANCEMENT EXAMPLES: Show before/after examples for every repeated action verb/professional term with specific replacements
-        - COMPREHENSIVE COVERAGE: Find ALL repeated action verbs and professional terms in the resume
-        - MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, you MUST provide a specific recommendation in the suggestions section
-        - NO PARTIAL ANALYSIS: If 12 repeated words are detected, you MUST provide 12 specific recommendations - NO EXCEPTIONS
-        - COMPLETE ISSUE COUNTING: Count ALL repeated words as issues - if 12 words are repeated, show 12 issues to fix
-        
-        SECTION DETECTION REQUIREMENTS:
-        - Check PARSED DATA for projects: Look for "projects", "project", "portfolio" keys with actual content
-        - Check PARSED DATA for certificates: Look for "certificates", "certifications", "certificate" keys with actual content
-        - Check PARSED DATA for experience: Look for "experience", "work_experience" with company, position, dates
-        - Check PARSED DATA for education: Look for "education", "academic" with institution, degree, year
-        - Check PARSED DATA for contact: Look for "contact", "basic_details" with phone, email, location
-        - Check PARSED DATA for skills: Look for "skills", "competencies" with actual skill lists
-        - Check PARSED DATA for summary: Look for "summary", "objective", "profile" with actual content
-        - If sections exist in parsed data but are empty/incomplete, suggest job-relevant improvements rather than additions
-        - If sections are completely missing from parsed data, then suggest job-relevant additions
-        - Include specific feedback about missing sections in weaknesses and recommendations
-        
-        SECTION-SPECIFIC FEEDBACK RULES:
-        - KEYWORD MATCH SECTION: Only suggest keyword-related improvements (missing job keywords, skill terms, industry terminology)
-        - EXPERIENCE RELEVANCE SECTION: Only suggest experience-related improvements (job relevance, role alignment, industry experience)
-        - EDUCATION SECTION: Only suggest education-related improvements (degrees, certifications, qualifications for the role)
-        - ACHIEVEMENTS SECTION: Only suggest achievement-related improvements (quantified results, job-relevant impact metrics)
-        - FORMATTING SECTION: Only suggest formatting-related improvements (layout, ATS compatibility, structure)
-        - SOFT SKILLS SECTION: Only suggest soft skills-related improvements (leadership, communication, teamwork for the role)
-        - REPETITION SECTION: Only suggest repetition-related improvements within the same section
-        - CONTACT SECTION: Only suggest contact-related improvements (phone, email, LinkedIn, location, formatting)
-        - LENGTH SECTION: Only suggest length-related improvements (content density, section optimization)
-        - If a section is complete and well-formatted, return empty arrays for that section's feedback
-        
-        REQUIRED OUTPUT SCHEMA (MUST INCLUDE ALL SECTIONS):
-        {{
-            "overall_score": <calculate_weighted_average_of_all_category_scores>,
-            "match_percentage": <percentage_of_job_requirements_met>,
-            "missing_keywords": ["Specific missing keyword 1", "Specific missing keyword 2"],
-            "analysis_timestamp": "{datetime.datetime.utcnow().isoformat()}Z",
-            "category_scores": {{
-                "keyword_match_skills": <exact_score_based_on_criteria_above>,
-                "experience_relevance": <exact_score_based_on_criteria_above>,
-                "education_certifications": <exact_score_based_on_criteria_above>,
-                "achievements_impact": <exact_score_based_on_criteria_above>,
-                "formatting_structure": <exact_score_based_on_criteria_above>,
-                "soft_skills_match": <exact_score_based_on_criteria_above>,
-                "repetition_avoidance": <exact_score_based_on_criteria_above>,
-                "contact_information_completeness": <exact_score_based_on_criteria_above>,
-                "resume_length_optimization": <exact_score_based_on_criteria_above>
-            }},
-            "detailed_feedback": {{
-                "keyword_match_skills": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Keyword Match & Skills",
-                    "description": "Specific analysis of keyword alignment with job requirements - ONLY keyword and skills-related feedback. Do NOT include proficiency-level qualifiers (Advanced/Intermediate/Beginner/Expert) in skills. Emphasize core designation-aligned skills.",
-                    "positives": ["Quote specific job-relevant keywords found in resume", "Reference specific sections with strong job keyword alignment"],
-                    "negatives": ["Quote specific missing job keywords", "Identify specific sections lacking required job terms", "List missing core skills (bare names only) aligned with the job designation"],
-                    "suggestions": ["Provide exact job keyword additions needed", "Specify which sections need job-specific terminology", "ADD_SKILLS: Core Skills - Add: [list 10-15 core skills (bare names only, no proficiency)"]],
-                    "specific_issues": ["List exact missing job keywords found", "Identify specific sections needing job terms with locations"],
-                    "improvement_examples": ["Show before/after job keyword examples", "Provide specific job-relevant additions needed"],
-                    "section_isolation_note": "ONLY include keyword and skills-related suggestions. Do not suggest contact, formatting, experience, or other section improvements in this keyword section feedback."
-                }},
-                "experience_relevance": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Experience Relevance",
-                    "description": "Specific analysis of experience alignment with job requirements - ONLY experience-related feedback",
-                    "positives": ["Quote specific job-relevant experience from resume", "Reference specific roles that align with job requirements"],
-                    "negatives": ["Quote specific experience that lacks job relevance", "Identify specific roles missing job-required experience"],
-                    "suggestions": ["Provide exact experience additions needed", "Specify which roles need job-relevant enhancements"],
-                    "specific_issues": ["List exact experience gaps found", "Identify specific roles needing job alignment with locations"],
-                    "improvement_examples": ["Show before/after experience examples", "Provide specific job-relevant experience improvements needed"],
-                    "section_isolation_note": "ONLY include experience-related suggestions. Do not suggest contact, formatting, skills, or other section improvements in this experience section feedback."
-                }},
-                "education_certifications": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Education & Certifications",
-                    "description": "Specific analysis of educational background match with job requirements",
-                    "positives": ["Quote specific job-relevant education from resume", "Reference specific certifications that match job requirements"],
-                    "negatives": ["Quote specific missing job-required education", "Identify specific certifications needed for the role"],
-                    "suggestions": ["Provide exact education additions needed", "Specify which certifications to pursue for this role"],
-                    "specific_issues": ["List exact education gaps found", "Identify specific missing qualifications with locations"],
-                    "improvement_examples": ["Show before/after education examples", "Provide specific job-relevant education improvements needed"]
-                }},
-                "achievements_impact": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Achievements & Impact",
-                    "description": "Specific analysis of quantified achievements and job-relevant impact",
-                    "positives": ["Quote specific job-relevant achievements from resume", "Reference specific quantified results that align with job requirements"],
-                    "negatives": ["Quote specific achievements lacking job relevance", "Identify specific results that need job-focused metrics"],
-                    "suggestions": ["Provide exact job-relevant achievement additions needed", "Specify which achievements need job-focused quantification"],
-                    "specific_issues": ["List exact achievement gaps found", "Identify specific results needing job relevance with locations"],
-                    "improvement_examples": ["Show before/after achievement examples", "Provide specific job-relevant achievement improvements needed"]
-                }},
-                "formatting_structure": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Formatting & Structure",
-                    "description": "Specific analysis of resume format and ATS compatibility for job application",
-                    "positives": ["Quote specific well-formatted sections from resume", "Reference specific formatting that enhances job application"],
-                    "negatives": ["Quote specific formatting problems found", "Identify specific sections with ATS compatibility issues"],
-                    "suggestions": ["Provide exact formatting fixes needed for job application", "Specify which sections need job-focused formatting"],
-                    "specific_issues": ["List exact formatting problems found in resume", "Identify specific ATS issues with locations"],
-                    "improvement_examples": ["Show before/after formatting examples", "Provide specific job application formatting improvements needed"]
-                }},
-                "soft_skills_match": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Soft Skills Match",
-                    "description": "Specific analysis of soft skills alignment with job requirements",
-                    "positives": ["Quote specific job-relevant soft skills from resume", "Reference specific sections with strong soft skills presentation"],
-                    "negatives": ["Quote specific missing job-required soft skills", "Identify specific sections lacking soft skills alignment"],
-                    "suggestions": ["Provide exact soft skills additions needed for this role", "Specify which sections need job-relevant soft skills"],
-                    "specific_issues": ["List exact soft skills gaps found", "Identify specific sections needing soft skills with locations"],
-                    "improvement_examples": ["Show before/after soft skills examples", "Provide specific job-relevant soft skills improvements needed"]
-                }},
-                "repetition_avoidance": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Repetition Avoidance",
-                    "description": "Specific analysis of varied language and minimal unnecessary repetitions within same section, allowing legitimate repetition across different sections",
-                    "positives": ["Quote specific varied language examples from resume", "Reference specific sections with good word variety", "Note acceptable cross-section repetition where appropriate"],
-                    "negatives": ["Quote specific repetitive action verbs found within same section", "Identify specific sections with excessive action verb repetition", "DEBUG: List ALL detected repeated action verbs with exact counts: Action Verb '[word]' appears [X] times in [Section]: [Context1], [Context2], [Context3]", "DEBUG: Categorize repetitions by type: Action Verbs: [list], Professional Terms: [list]", "MANDATORY: List EVERY repeated word as a separate issue - if 12 words are repeated, list ALL 12 as separate issues"],
-                    "suggestions": ["Provide exact action verb replacements needed within same section", "Specify which sections need internal action verb variety", "FIX_REPETITION: [Section] - Action Verb '[repeated action verb]' used [X] times - Replace instances: [Instance 1: '[exact context]' → '[alternative1]'], [Instance 2: '[exact context]' → '[alternative2]'], [Instance 3: '[exact context]' → '[alternative3]']", "ENHANCE_VARIETY: For each repeated action verb, provide 3-5 specific professional alternatives with context", "DEBUG: Show complete action verb frequency analysis for each section", "MANDATORY COMPLETE COVERAGE: For EVERY repeated word detected, provide a specific FIX_REPETITION recommendation", "NO PARTIAL ANALYSIS: If 12 repeated words are detected, provide 12 specific FIX_REPETITION recommendations", "COMPREHENSIVE RECOMMENDATIONS: Include recommendations for ALL action verbs AND professional terms", "CRITICAL: Generate ONE FIX_REPETITION suggestion for EACH repeated word - if 'created' appears 3 times, generate 1 FIX_REPETITION suggestion for 'created' with 3 specific replacements", "CRITICAL: Generate ONE FIX_REPETITION suggestion for EACH professional term - if 'scalable' appears 3 times, generate 1 FIX_REPETITION suggestion for 'scalable' with 3 specific replacements", "MANDATORY: Based on the repetition debug analysis, generate FIX_REPETITION suggestions for ALL detected repeated words", "CRITICAL: If repetition_debug_analysis shows 17 repeated words, generate 17 FIX_REPETITION suggestions", "REQUIRED: For each word in the repetition analysis, create: FIX_REPETITION: [Section] - [Word Type] '[word]' used [X] times - Replace instances: [specific replacements]", "Note that cross-section repetition is acceptable when contextually appropriate"],
-                    "specific_issues": ["List exact repetitive action verbs found within same section in resume", "Identify specific sections needing internal action verb variety with locations", "DEBUG: Complete action verb inventory: [Section1]: [action_verb1: X times], [action_verb2: Y times], [Section2]: [action_verb3: Z times]", "DEBUG: Highlight problematic repetitions: Action verbs appearing 3+ times in same section"],
-                    "improvement_examples": ["Show before/after repetition examples within same section", "Provide specific action verb variety improvements needed within sections", "DEBUG: Before/After examples: 'Current: [exact repeated action verb]' → 'Improved: [varied action verb alternatives]'", "DEBUG: Show action verb replacement mapping: [Original Action Verb] → [Alternative 1, Alternative 2, Alternative 3]"]
-                }},
-                "contact_information_completeness": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Contact Information Completeness",
-                    "description": "Specific analysis of contact details presence, formatting, and professional presentation - ONLY contact-related feedback",
-                    "positives": ["Quote specific well-formatted contact information from resume", "Reference specific contact elements that are complete"],
-                    "negatives": ["Quote specific missing contact information", "Identify specific contact formatting problems"],
-                    "suggestions": ["Provide exact contact additions needed", "Specify which contact elements need formatting fixes"],
-                    "specific_issues": ["List exact missing contact information found", "Identify specific contact formatting problems with locations"],
-                    "improvement_examples": ["Show before/after contact information examples", "Provide specific contact improvements needed"],
-                    "section_isolation_note": "ONLY include contact-related suggestions. Do not suggest skills, experience, education, or other section improvements in this contact section feedback."
-                }},
-                "resume_length_optimization": {{
-                    "score": <exact_score_based_on_criteria_above>,
-                    "title": "Resume Length Optimization",
-                    "description": "Specific analysis of resume length appropriateness for experience level and content density",
-                    "positives": ["Quote specific sections with appropriate length", "Reference specific content that is well-balanced"],
-                    "negatives": ["Quote specific sections that are too long/short", "Identify specific content that needs length adjustment"],
-                    "suggestions": ["Provide exact content additions/removals needed", "Specify which sections need length optimization"],
-                    "specific_issues": ["List exact length problems found in resume", "Identify specific sections needing length adjustment with locations"],
-                    "improvement_examples": ["Show before/after length optimization examples", "Provide specific content density improvements needed"]
-                }}
-            }},
-            "extracted_text": "Complete text content extracted from the resume",
-            "strengths": [
-                "Specific strength 1 with job relevance details",
-                "Specific strength 2 with job relevance details",
-                "Specific strength 3 with job relevance details"
-            ],
-            "weaknesses": [
-                "Specific weakness 1 with job impact details",
-                "Specific weakness 2 with job impact details",
-                "Specific weakness 3 with job impact details"
-            ],
-            "recommendations": [
-                "Priority recommendation 1 with specific job-focused action",
-                "Priority recommendation 2 with specific job-focused action", 
-                "Priority recommendation 3 with specific job-focused action",
-                "Priority recommendation 4 with specific job-focused action",
-                "Priority recommendation 5 with specific job-focused action"
-            ]
-        }}
-        
-        FINAL INSTRUCTIONS - CRITICAL FOR CONSISTENCY:
-        - NEVER omit sections - return empty values instead of missing sections!
-        - overall_score MUST be a weighted average of all category scores (integer 0-100)
-        - match_percentage MUST be calculated based on job requirements met (integer 0-100)
-        - All category scores MUST be integers between 0-100 based on precise criteria above!
-        - Provide specific, actionable recommendations with clear job-focused next steps!
-        - Focus on job-specific optimization, ATS compatibility, and measurable improvements!
-        - Use varied, professional language - avoid repetition across sections!
-        - Ensure all feedback is specific to the actual resume and job description analyzed!
-        - Calculate scores based on objective job matching criteria, not subjective opinions!
-        - Maintain consistency in scoring methodology across all categories!
-        - Analyze how well the resume matches the specific job requirements with precision!
-        
-        DETAILED FEEDBACK REQUIREMENTS - MANDATORY:
-        - For POSITIVES: Quote specific phrases, sentences, or sections from the actual resume that demonstrate job-relevant strengths
-        - For NEGATIVES: Quote specific problematic text, missing elements, or job-matching issues found in the resume
-        - For SUGGESTIONS: Provide exact text replacements, specific additions, or precise modifications needed for job alignment
-        - Always reference actual content from the resume being analyzed, not generic advice
-        - Point to specific sections (e.g., "In your Experience section under 'Software Engineer'...")
-        - Quote exact text that needs improvement (e.g., "The phrase 'did stuff' should be replaced with...")
-        - Identify specific missing job-relevant elements (e.g., "Your skills section is missing 'Python' which is required for this role")
-        - Reference specific job-matching issues (e.g., "Your experience description lacks the 'team leadership' mentioned in the job requirements")
-        - Provide concrete examples of what to add, remove, or modify in the actual resume content to better match the job
-        - For REPETITION ANALYSIS: Focus on repetition within the same section, not across different sections (e.g., using "implemented" in two different projects is acceptable)
-        
-        SPECIFIC SECTION ANALYSIS REQUIREMENTS:
-        - EXPERIENCE SECTION: Check for missing company names, job titles, dates, descriptions, locations, job-relevant keywords
-        - EDUCATION SECTION: Check for missing institution names, degrees, graduation years, GPAs, locations, job-relevant qualifications
-        - CONTACT SECTION: Check for missing phone, email, LinkedIn, location, professional title
-        - SKILLS SECTION: Check for missing technical skills, soft skills, job-required competencies, skill categorization
-        - PROJECTS SECTION: Check for missing project names, descriptions, tech stacks, dates, links, job-relevant technologies, project description length validation (MANDATORY: exactly 6-7 statements required - count each statement and ensure exactly 6-7)
-        - TECH STACK EXTRACTION: For projects with missing or empty tech stacks, analyze the project description to extract relevant technologies, frameworks, programming languages, and tools mentioned
-        - CERTIFICATIONS SECTION: Check for missing certificate names, issuing organizations, dates, job-relevant certifications
-        - SUMMARY SECTION: Check for missing professional summary or objective that aligns with job requirements
-        - LANGUAGES SECTION: Check for missing language proficiency levels, job-relevant languages
-        - REFERENCES SECTION: Check for missing reference contact information
-        
-        SUGGESTION FORMAT REQUIREMENTS:
-        - Use specific format: "MISSING: [Section] - [Specific Element] - [Job-Relevant Action Required]"
-        - Use specific format: "IMPROVE: [Section] - [Current Text] - [Job-Aligned Improvement]"
-        - Use specific format: "ADD: [Section] - [Missing Element] - [Job-Specific Addition Needed]"
-        - Use specific format: "FIX: [Section] - [Issue Description] - [Job-Matching Fix Required]"
-        - Always specify the exact section and field that needs attention
-        - Always provide the exact text or element that needs to be added/changed for job alignment
-        - Always explain what specific action is required to better match the job requirements
-        
-        PARSED DATA ANALYSIS RULES:
-        - If parsed data shows projects with dates, DO NOT suggest missing project dates
-        - If parsed data shows experience with company names, DO NOT suggest missing company names
-        - If parsed data shows education with degrees, DO NOT suggest missing degrees
-        - If parsed data shows contact info, DO NOT suggest missing contact information
-        - If parsed data shows skills, DO NOT suggest missing skills section
-        - Only suggest missing elements if they are genuinely absent from the parsed data
-        - Focus on job-relevant quality improvements for existing elements rather than suggesting missing elements
-        - Check for job relevance: if a field exists but lacks job-relevant content, suggest job-aligned improvements
-        - Check for completeness: if a field exists but is empty or incomplete, suggest job-relevant improvements
-        - Check for accuracy: if a field exists but has poor content, suggest better job-matching content
+        return {
+            "achievement_debug": achievement_debug,
+            "repetition_debug": repetition_debug,
+            "completion_kwargs": with_response_format({
+                "model": self.model_name,
+                "messages": JD_SPECIFIC_ATS_PROMPT.messages(
+                    resume_text=resume_text,
+                    repetition_debug=repetition_debug,
+                    parsed_data=json.dumps(parsed_data, indent=2) if parsed_data else "No parsed data provided",
+                    job_description=job_description
+                ),
+                "temperature": self.temperature,
+                "top_p": self.top_p,
+                "max_tokens": adaptive_max_tokens(resume_text, JDSpecificATSResponse, base_tokens=2800, output_ratio=0.25)
+            }, JDSpecificATSResponse, "jd_ats_analysis")
+        }
+
+    def _finalize_jd_analysis(self, response_text: str, resume_text: str, request: Dict[str, Any], on_suggestion: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
         """
+        Parse the analysis output and apply schema enforcement, suggestion augmentation and scoring
 
+        on_suggestion, if given, is called with (category, line) for every FIX_* line added by augmentation.
+        """
+        achievement_debug = request["achievement_debug"]
+        repetition_debug = request["repetition_debug"]
+        
         try:
-            logger.info(f"Generating JD-Specific ATS analysis with temperature={self.temperature}, top_p={self.top_p}")
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "You are an expert ATS (Applicant Tracking System) analyst and job matching specialist with 10+ years of experience in recruitment technology and resume optimization."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                max_tokens=4000
-            )
-            cleaned_response = self._clean_openai_response(response.choices[0].message.content)
-            
-            # Parse the JSON response
-            jd_ats_response = json.loads(cleaned_response)
-            
-            # Enforce schema compliance
-            jd_ats_response = self._enforce_jd_ats_schema_compliance(jd_ats_response)
-            
-            # Augment repetition suggestions using internal debug analysis so ALL repeated words are covered
-            jd_ats_response = _augment_repetition_suggestions_with_debug(
-                jd_ats_response,
-                repetition_debug,
-                resume_text,
-                self.client,
-                self.model_name,
-                self.temperature,
-                self.top_p
-            )
-
-            # Augment achievement suggestions using internal debug analysis so ALL unquantified achievements are covered
-            jd_ats_response = _augment_achievement_suggestions_with_debug(
-                jd_ats_response,
-                achievement_debug,
-                resume_text,
-                self.client,
-                self.model_name,
-                self.temperature,
-                self.top_p
-            )
-
-            # Mirror skills-related suggestions into top-level recommendations for full coverage
-            jd_ats_response = _mirror_skill_suggestions_into_recommendations(jd_ats_response)
-
-            # Apply dynamic scoring based on issues count
-            jd_ats_response = self._apply_dynamic_scoring(jd_ats_response)
-            
-            # Add achievement debug information
-            jd_ats_response["achievement_debug_analysis"] = achievement_debug
-            
-            # Final validation
-            jd_ats_response = self._final_ats_validation(jd_ats_response)
-            
-            logger.info(f"✅ JD-Specific ATS analysis completed successfully with overall score: {jd_ats_response.get('overall_score', 'N/A')}")
-            return jd_ats_response
-            
+            # Structured outputs parse directly; the tolerant parser only runs if that fails
+            jd_ats_response = parse_structured(response_text, "ats.jd_specific", repair_json)
         except json.JSONDecodeError as json_error:
             logger.error(f"Failed to parse OpenAI JSON response for JD-Specific ATS analysis: {str(json_error)}")
-            logger.error(f"Raw response: {cleaned_response}")
+            logger.error(f"Raw response: {response_text}")
             raise Exception(f"Invalid JSON response from AI: {str(json_error)}")
-        except Exception as e:
-            logger.error(f"Failed to analyze resume for JD-Specific ATS: {str(e)}")
-            raise
+        
+        # Stamp server-side so the prompt stays byte-identical (and cacheable) across calls
+        jd_ats_response["analysis_timestamp"] = datetime.datetime.utcnow().isoformat() + "Z"
+        
+        # The model is never asked to echo the resume; attach the input text instead
+        jd_ats_response["extracted_text"] = resume_text
+        
+        # Enforce schema compliance
+        jd_ats_response = self._enforce_jd_ats_schema_compliance(jd_ats_response)
+        
+        # Augment repetition suggestions using internal debug analysis so ALL repeated words are covered
+        jd_ats_response = _augment_repetition_suggestions_with_debug(
+            jd_ats_response,
+            repetition_debug,
+            resume_text,
+            self.client,
+            self.model_name,
+            self.temperature,
+            self.top_p,
+            on_line=_suggestion_callback(on_suggestion, "repetition_avoidance")
+        )
 
-    def _clean_openai_response(self, response_text: str) -> str:
-        """Clean OpenAI API response to extract valid JSON"""
-        import re
-        import json
-        
-        logger.info(f"🧹 Cleaning OpenAI JD-ATS response of {len(response_text)} characters")
-        
-        # Remove markdown code blocks
-        if response_text.startswith("```json"):
-            response_text = response_text.replace("```json", "").replace("```", "")
-        elif response_text.startswith("```"):
-            response_text = response_text.replace("```", "")
-
-        response_text = response_text.strip()
-        
-        # Try to find JSON content within markdown blocks first
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            try:
-                parsed = json.loads(json_content)
-                logger.info(f"✅ Successfully extracted JSON from markdown block: {len(json_content)} characters")
-                return json_content
-            except json.JSONDecodeError:
-                logger.warning("❌ Extracted JSON from markdown block is invalid")
-        
-        # Try to find the complete JSON response
-        if response_text.startswith('{') and response_text.endswith('}'):
-            try:
-                parsed = json.loads(response_text)
-                logger.info(f"✅ Successfully parsed complete JSON: {len(response_text)} characters")
-                return response_text
-            except json.JSONDecodeError:
-                logger.warning("❌ Complete JSON parsing failed")
-        
-        # Try to find JSON object in the text
-        json_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            try:
-                parsed = json.loads(json_content)
-                logger.info(f"✅ Successfully extracted JSON object: {len(json_content)} characters")
-                return json_content
-            except json.JSONDecodeError:
-                logger.warning("❌ Extracted JSON object is invalid")
-        
-        logger.warning("Could not extract valid JSON from AI response")
-        return '{"error": "Invalid JSON response", "message": "Could not parse AI response"}'
+        # Augment achievement suggestions using internal debug analysis so ALL unquantified achievements are covered
+        jd_ats_response = _augment_achievement_suggestions_with_debug(
+            jd_ats_response,
+            achievement_debug,
+            resume_text,
+            self.client,
+            self.model_name,
+            self.temperature,
+            self.top_p,
+            on_line=_suggestion_callback(on_suggestion, "achievements_impact_metrics")
+        )
+
+        # Mirror skills-related suggestions into top-level recommendations for full coverage
+        jd_ats_response = _mirror_skill_suggestions_into_recommendations(jd_ats_response)
+
+        # Apply dynamic scoring based on issues count
+        jd_ats_response = self._apply_dynamic_scoring(jd_ats_response)
+        
+        # Add achievement debug information
+        jd_ats_response["achievement_debug_analysis"] = achievement_debug
+        
+        # Final validation
+        jd_ats_response = self._final_ats_validation(jd_ats_response)
+        
+        logger.info(f"✅ JD-Specific ATS analysis completed successfully with overall score: {jd_ats_response.get('overall_score', 'N/A')}")
+        return jd_ats_response
 
     def _enforce_jd_ats_schema_compliance(self, jd_ats_response: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -2759,113 +3170,28 @@ class JDSpecificATSService:
         Returns:
             Dictionary containing repetition analysis with debug information
         """
-        # Removed debug logging to reduce console output - analysis runs silently
-        
-        import re
-        from collections import defaultdict, Counter
-        
-        # Define action verbs and professional terms to focus on
-        action_verbs = {
-            'implemented', 'managed', 'developed', 'created', 'built', 'designed', 'led', 'executed', 'delivered',
-            'optimized', 'improved', 'enhanced', 'streamlined', 'automated', 'deployed', 'integrated', 'configured',
-            'maintained', 'monitored', 'analyzed', 'resolved', 'coordinated', 'collaborated', 'mentored', 'trained',
-            'established', 'initiated', 'launched', 'completed', 'achieved', 'increased', 'reduced', 'saved',
-            'transformed', 'migrated', 'upgraded', 'refactored', 'debugged', 'tested', 'validated', 'verified',
-            'documented', 'presented', 'communicated', 'facilitated', 'supervised', 'directed', 'guided', 'influenced',
-            'negotiated', 'planned', 'organized', 'scheduled', 'prioritized', 'evaluated', 'assessed', 'reviewed',
-            'recommended', 'proposed', 'suggested', 'identified', 'discovered', 'investigated', 'researched',
-            'studied', 'learned', 'acquired', 'gained', 'obtained', 'secured', 'earned', 'won', 'received', 'utilized'
-        }
-        
-        professional_terms = {
-            'scalable', 'secure', 'efficient', 'robust', 'reliable', 'flexible', 'comprehensive', 'advanced',
-            'innovative', 'cutting-edge', 'state-of-the-art', 'high-performance', 'enterprise-grade', 'mission-critical',
-            'cost-effective', 'user-friendly', 'intuitive', 'seamless', 'integrated', 'automated', 'streamlined',
-            'optimized', 'enhanced', 'improved', 'upgraded', 'modernized', 'standardized', 'centralized',
-            'distributed', 'cloud-based', 'web-based', 'mobile-first', 'responsive', 'cross-platform',
-            'real-time', 'high-availability', 'fault-tolerant', 'load-balanced', 'microservices', 'api-driven'
-        }
-        
-        # Common words to ignore
-        common_words = {
-            'and', 'in', 'with', 'of', 'to', 'for', 'on', 'by', 'the', 'a', 'an', 'is', 'are', 'was', 'were',
-            'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'may', 'might', 'can', 'must', 'shall', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she',
-            'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
-        }
-        
         # Split resume into sections (basic section detection)
         sections = self._split_resume_into_sections(resume_text)
-        
-        repetition_analysis = {
-            "total_words_analyzed": 0,
-            "action_verb_repetitions": {},
-            "professional_term_repetitions": {},
-            "section_analysis": {},
-            "summary": {
-                "total_action_verb_repetitions": 0,
-                "total_professional_term_repetitions": 0,
-                "most_repeated_action_verb": None,
-                "most_repeated_professional_term": None
-            }
+        repetition_analysis = _analyze_power_word_repetitions(sections)
+        
+        # Aggregate repetitions across sections
+        action_verb_repetitions: Dict[str, int] = {}
+        professional_term_repetitions: Dict[str, int] = {}
+        for section_result in repetition_analysis["section_analysis"].values():
+            for word, count in section_result["action_verb_repetitions"].items():
+                action_verb_repetitions[word] = action_verb_repetitions.get(word, 0) + count
+            for word, count in section_result["professional_term_repetitions"].items():
+                professional_term_repetitions[word] = professional_term_repetitions.get(word, 0) + count
+        
+        repetition_analysis["action_verb_repetitions"] = action_verb_repetitions
+        repetition_analysis["professional_term_repetitions"] = professional_term_repetitions
+        repetition_analysis["summary"] = {
+            "total_action_verb_repetitions": sum(action_verb_repetitions.values()),
+            "total_professional_term_repetitions": sum(professional_term_repetitions.values()),
+            "most_repeated_action_verb": max(action_verb_repetitions.items(), key=lambda x: x[1]) if action_verb_repetitions else None,
+            "most_repeated_professional_term": max(professional_term_repetitions.items(), key=lambda x: x[1]) if professional_term_repetitions else None
         }
         
-        # Analyze each section
-        for section_name, section_text in sections.items():
-            if not section_text.strip():
-                continue
-                
-            # Clean and tokenize section text
-            words = re.findall(r'\b[a-zA-Z]+\b', section_text.lower())
-            repetition_analysis["total_words_analyzed"] += len(words)
-            
-            # Count action verbs and professional terms
-            action_verb_counts = Counter()
-            professional_term_counts = Counter()
-            
-            for word in words:
-                if word in action_verbs:
-                    action_verb_counts[word] += 1
-                elif word in professional_terms:
-                    professional_term_counts[word] += 1
-            
-            # Store repetitions (only words that appear more than once)
-            section_action_repetitions = {word: count for word, count in action_verb_counts.items() if count > 1}
-            section_professional_repetitions = {word: count for word, count in professional_term_counts.items() if count > 1}
-            
-            repetition_analysis["section_analysis"][section_name] = {
-                "action_verb_repetitions": section_action_repetitions,
-                "professional_term_repetitions": section_professional_repetitions,
-                "total_words": len(words)
-            }
-            
-            # Add to global counts
-            for word, count in section_action_repetitions.items():
-                if word not in repetition_analysis["action_verb_repetitions"]:
-                    repetition_analysis["action_verb_repetitions"][word] = 0
-                repetition_analysis["action_verb_repetitions"][word] += count
-                
-            for word, count in section_professional_repetitions.items():
-                if word not in repetition_analysis["professional_term_repetitions"]:
-                    repetition_analysis["professional_term_repetitions"][word] = 0
-                repetition_analysis["professional_term_repetitions"][word] += count
-        
-        # Calculate summary statistics
-        repetition_analysis["summary"]["total_action_verb_repetitions"] = sum(repetition_analysis["action_verb_repetitions"].values())
-        repetition_analysis["summary"]["total_professional_term_repetitions"] = sum(repetition_analysis["professional_term_repetitions"].values())
-        
-        if repetition_analysis["action_verb_repetitions"]:
-            repetition_analysis["summary"]["most_repeated_action_verb"] = max(
-                repetition_analysis["action_verb_repetitions"].items(), 
-                key=lambda x: x[1]
-            )
-        
-        if repetition_analysis["professional_term_repetitions"]:
-            repetition_analysis["summary"]["most_repeated_professional_term"] = max(
-                repetition_analysis["professional_term_repetitions"].items(), 
-                key=lambda x: x[1]
-            )
-        
         return repetition_analysis
 
     def _analyze_achievements_debug(self, resume_text: str) -> Dict[str, Any]:
@@ -0,0 +1,256 @@
+import asyncio
+import datetime
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Union
+
+from config.config import OpenAIConfig
+from utils.pdf_extractor import DocumentExtractor
+from .openai_parser_service import OpenAIResumeParser
+from .ats_service import StandardATSService
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("extract", "parse", "ats")
+
+
+def _extract_text(file_path: str) -> str:
+    """Extract resume text in a worker process (module-level so it can be pickled)"""
+    return DocumentExtractor.extract_text(file_path)
+
+
+def collect_resume_files(source: Union[str, Path]) -> List[Path]:
+    """
+    Resolve a batch source into the list of resume files to process
+
+    Args:
+        source: Directory (searched recursively for supported formats) or manifest file
+            listing one path per line; blank lines and '#' comments are ignored and relative
+            paths are resolved against the manifest's directory
+
+    Returns:
+        Resolved file paths in a stable order, without duplicates
+    """
+    source = Path(source)
+    if source.is_dir():
+        files = sorted(
+            path for path in source.rglob("*")
+            if path.is_file() and path.suffix.lower() in OpenAIConfig.SUPPORTED_FORMATS
+        )
+    elif source.is_file():
+        files = []
+        with open(source, "r", encoding="utf-8") as manifest:
+            for line in manifest:
+                entry = line.strip()
+                if not entry or entry.startswith("#"):
+                    continue
+                path = Path(entry)
+                files.append(path if path.is_absolute() else source.parent / path)
+    else:
+        raise FileNotFoundError(f"Batch source not found: {source}")
+
+    unique: Dict[str, Path] = {}
+    for path in files:
+        unique.setdefault(str(path.resolve()), path.resolve())
+    return list(unique.values())
+
+
+def load_checkpoint(output_path: Union[str, Path]) -> Set[str]:
+    """
+    Read the files already processed successfully from an existing JSONL output
+
+    A line cut off by an interrupted run is ignored, so that file is processed again.
+
+    Args:
+        output_path: JSONL results file
+
+    Returns:
+        Set of file paths whose latest record has status 'ok'
+    """
+    output_path = Path(output_path)
+    done: Set[str] = set()
+    if not output_path.exists():
+        return done
+    # errors="replace": a record cut inside a multi-byte character is just an invalid line
+    with open(output_path, "r", encoding="utf-8", errors="replace") as results:
+        for line in results:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict) or "file" not in record:
+                continue
+            if record.get("status") == "ok":
+                done.add(record["file"])
+            else:
+                done.discard(record["file"])
+    return done
+
+
+class ResumeBatchProcessor:
+    """Parse (and optionally ATS-score) many resumes into a resumable JSONL file"""
+
+    def __init__(self, api_key: Optional[str] = None, with_ats: bool = False, concurrency: Optional[int] = None, extraction_workers: Optional[int] = None, progress_every: int = 25):
+        """
+        Initialize the batch processor
+
+        Args:
+            api_key: OpenAI API key (if not provided, will use environment variable)
+            with_ats: Also run the standard ATS analysis for every resume
+            concurrency: Resumes in the LLM stages at the same time (default BATCH_CONCURRENCY)
+            extraction_workers: Processes used for text extraction (default BATCH_EXTRACTION_WORKERS)
+            progress_every: Log progress after this many finished resumes
+        """
+        self.parser = OpenAIResumeParser(api_key=api_key)
+        self.ats_service = StandardATSService(api_key=api_key) if with_ats else None
+        self.concurrency = max(1, concurrency or OpenAIConfig.BATCH_CONCURRENCY)
+        self.extraction_workers = max(1, extraction_workers or OpenAIConfig.BATCH_EXTRACTION_WORKERS)
+        self.progress_every = max(1, progress_every)
+
+    def run(self, source: Union[str, Path], output_path: Union[str, Path], resume: bool = True) -> Dict[str, Any]:
+        """
+        Process every resume of a directory or manifest
+
+        Results are appended to the JSONL file one line per resume as soon as each one
+        finishes. With resume=True, files that already have a successful record are skipped,
+        so an interrupted run continues where it stopped; failed files are retried.
+
+        Args:
+            source: Directory or manifest file (see collect_resume_files)
+            output_path: JSONL results file
+            resume: Skip files already processed successfully in output_path
+
+        Returns:
+            Run report with counts, throughput and per-stage timing
+        """
+        files = collect_resume_files(source)
+        output_path = Path(output_path)
+        if not resume and output_path.exists():
+            output_path.unlink()
+        done = load_checkpoint(output_path) if resume else set()
+        pending = [path for path in files if str(path) not in done]
+        logger.info(f"📦 Batch: {len(files)} resumes found, {len(files) - len(pending)} already done, {len(pending)} to process")
+        return asyncio.run(self._run(pending, output_path, total=len(files), already_done=len(files) - len(pending)))
+
+    async def _run(self, files: List[Path], output_path: Path, total: int, already_done: int) -> Dict[str, Any]:
+        started = time.time()
+        stats = {"ok": 0, "failed": 0}
+        stage_seconds = {stage: 0.0 for stage in STAGES}
+        stage_counts = {stage: 0 for stage in STAGES}
+
+        path_queue: asyncio.Queue = asyncio.Queue()
+        for path in files:
+            path_queue.put_nowait(path)
+        # Bounded hand-off keeps extraction just ahead of the LLM stages
+        text_queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        loop = asyncio.get_running_loop()
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Terminate a line cut off by an interrupted run before appending; checked in binary
+        # because the cut may fall inside a multi-byte character
+        with open(output_path, "ab+") as raw:
+            if raw.tell() > 0:
+                raw.seek(-1, os.SEEK_END)
+                if raw.read(1) != b"\n":
+                    raw.write(b"\n")
+        output = open(output_path, "a", encoding="utf-8")
+
+        def _record_stage(stage: str, seconds: float):
+            stage_seconds[stage] += seconds
+            stage_counts[stage] += 1
+
+        def _write(record: Dict[str, Any]):
+            record["completed_at"] = datetime.datetime.utcnow().isoformat() + "Z"
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+            stats["ok" if record["status"] == "ok" else "failed"] += 1
+            finished = stats["ok"] + stats["failed"]
+            if finished % self.progress_every == 0 or finished == len(files):
+                elapsed = max(time.time() - started, 1e-9)
+                logger.info(
+                    f"📦 Batch progress: {already_done + finished}/{total} "
+                    f"({stats['failed']} failed) - {finished / elapsed:.2f} resumes/s"
+                )
+
+        async def _extract_worker(pool: ProcessPoolExecutor):
+            while True:
+                try:
+                    path = path_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                stage_start = time.time()
+                try:
+                    text = await loop.run_in_executor(pool, _extract_text, str(path))
+                    if not text.strip():
+                        raise ValueError("No text extracted from file")
+                except Exception as e:
+                    _write({"file": str(path), "status": "error", "stage": "extract", "error": str(e)})
+                    continue
+                seconds = time.time() - stage_start
+                _record_stage("extract", seconds)
+                await text_queue.put((path, text, seconds))
+
+        async def _llm_worker():
+            while True:
+                item = await text_queue.get()
+                if item is None:
+                    return
+                path, text, extract_seconds = item
+                record: Dict[str, Any] = {"file": str(path), "status": "ok", "timings": {"extract": round(extract_seconds, 3)}}
+                stage = "parse"
+                try:
+                    stage_start = time.time()
+                    record["parsed_data"] = await self.parser.aparse_resume_text(text)
+                    record["timings"]["parse"] = round(time.time() - stage_start, 3)
+                    _record_stage("parse", time.time() - stage_start)
+
+                    if self.ats_service is not None:
+                        stage = "ats"
+                        stage_start = time.time()
+                        record["ats_analysis"] = await self.ats_service.aanalyze_resume(text, record["parsed_data"])
+                        record["timings"]["ats"] = round(time.time() - stage_start, 3)
+                        _record_stage("ats", time.time() - stage_start)
+                except Exception as e:
+                    record.update({"status": "error", "stage": stage, "error": str(e)})
+                _write(record)
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.extraction_workers) as pool:
+                llm_workers = [asyncio.create_task(_llm_worker()) for _ in range(self.concurrency)]
+                try:
+                    await asyncio.gather(*(_extract_worker(pool) for _ in range(self.extraction_workers)))
+                    for _ in llm_workers:
+                        await text_queue.put(None)
+                    await asyncio.gather(*llm_workers)
+                finally:
+                    for task in llm_workers:
+                        task.cancel()
+        finally:
+            output.close()
+
+        elapsed = time.time() - started
+        processed = stats["ok"] + stats["failed"]
+        report = {
+            "total": total,
+            "skipped_already_done": already_done,
+            "processed": processed,
+            "succeeded": stats["ok"],
+            "failed": stats["failed"],
+            "elapsed_seconds": round(elapsed, 2),
+            "throughput_per_minute": round(processed / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "stages": {
+                stage: {
+                    "count": stage_counts[stage],
+                    "total_seconds": round(stage_seconds[stage], 2),
+                    "avg_seconds": round(stage_seconds[stage] / stage_counts[stage], 3) if stage_counts[stage] else 0.0
+                }
+                for stage in STAGES if stage != "ats" or self.ats_service is not None
+            },
+            "output_file": str(output_path)
+        }
+        logger.info(f"✅ Batch finished: {stats['ok']} ok, {stats['failed']} failed in {elapsed:.1f}s")
+        return report
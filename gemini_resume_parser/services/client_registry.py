@@ -0,0 +1,204 @@
+"""
+Process-wide registry for pooled OpenAI clients and long-lived service instances
+Keeps keep-alive HTTP connections open across requests instead of rebuilding
+an OpenAI client (and its connection pool) for every service construction
+"""
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional, Type, TypeVar
+
+import httpx
+from openai import OpenAI, AsyncOpenAI
+
+from config.config import OpenAIConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_lock = threading.RLock()
+_clients: Dict[str, OpenAI] = {}
+_async_clients: Dict[str, AsyncOpenAI] = {}
+_services: Dict[tuple, Any] = {}
+_stats = {
+    "clients_created": 0,
+    "client_reuses": 0,
+    "services_created": 0,
+    "service_reuses": 0
+}
+
+
+def _client_key(api_key: str) -> str:
+    """Registry key for an API key (never store or report the raw key)"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def _pool_limits() -> httpx.Limits:
+    """Connection pool limits from configuration"""
+    return httpx.Limits(
+        max_connections=OpenAIConfig.OPENAI_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=OpenAIConfig.OPENAI_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=OpenAIConfig.OPENAI_POOL_KEEPALIVE_EXPIRY
+    )
+
+
+def _pool_timeout() -> httpx.Timeout:
+    """Request timeouts from configuration"""
+    return httpx.Timeout(
+        OpenAIConfig.OPENAI_TIMEOUT_SECONDS,
+        connect=OpenAIConfig.OPENAI_CONNECT_TIMEOUT_SECONDS
+    )
+
+
+def _build_http_client() -> httpx.Client:
+    """Build an httpx client with the configured pool size and timeouts"""
+    return httpx.Client(limits=_pool_limits(), timeout=_pool_timeout())
+
+
+def get_openai_client(api_key: Optional[str] = None) -> OpenAI:
+    """
+    Get the shared OpenAI client for an API key, creating it on first use
+
+    Args:
+        api_key: OpenAI API key (if not provided, will use environment variable)
+
+    Returns:
+        OpenAI client backed by a pooled keep-alive HTTP client
+    """
+    api_key = api_key or OpenAIConfig.OPENAI_API_KEY
+    if not api_key:
+        raise ValueError("OpenAI API key is required")
+
+    key = _client_key(api_key)
+    with _lock:
+        client = _clients.get(key)
+        if client is not None:
+            _stats["client_reuses"] += 1
+            return client
+
+        client = OpenAI(
+            api_key=api_key,
+            http_client=_build_http_client(),
+            max_retries=OpenAIConfig.OPENAI_MAX_RETRIES
+        )
+        _clients[key] = client
+        _stats["clients_created"] += 1
+        logger.info(f"Created pooled OpenAI client (max_connections={OpenAIConfig.OPENAI_POOL_MAX_CONNECTIONS}, keepalive={OpenAIConfig.OPENAI_POOL_MAX_KEEPALIVE})")
+        return client
+
+
+def get_async_openai_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Get the shared AsyncOpenAI client for an API key, creating it on first use
+
+    Args:
+        api_key: OpenAI API key (if not provided, will use environment variable)
+
+    Returns:
+        AsyncOpenAI client backed by a pooled keep-alive async HTTP client
+    """
+    api_key = api_key or OpenAIConfig.OPENAI_API_KEY
+    if not api_key:
+        raise ValueError("OpenAI API key is required")
+
+    key = _client_key(api_key)
+    with _lock:
+        client = _async_clients.get(key)
+        if client is not None:
+            _stats["client_reuses"] += 1
+            return client
+
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(limits=_pool_limits(), timeout=_pool_timeout()),
+            max_retries=OpenAIConfig.OPENAI_MAX_RETRIES
+        )
+        _async_clients[key] = client
+        _stats["clients_created"] += 1
+        logger.info(f"Created pooled AsyncOpenAI client (max_connections={OpenAIConfig.OPENAI_POOL_MAX_CONNECTIONS})")
+        return client
+
+
+def get_service(service_cls: Type[T], **kwargs) -> T:
+    """
+    Get a shared instance of a service class, constructing it once per distinct set of arguments
+
+    Services in this package keep no per-request state, so a single instance can
+    serve concurrent requests.
+
+    Args:
+        service_cls: Service class to instantiate (e.g. StandardATSService)
+        **kwargs: Constructor arguments; each distinct combination gets its own instance
+
+    Returns:
+        Shared service instance
+    """
+    key = (service_cls, tuple(sorted(kwargs.items())))
+    with _lock:
+        service = _services.get(key)
+        if service is not None:
+            _stats["service_reuses"] += 1
+            return service
+
+        service = service_cls(**kwargs)
+        _services[key] = service
+        _stats["services_created"] += 1
+        logger.info(f"Registered shared {service_cls.__name__} instance")
+        return service
+
+
+def _connection_pool_stats(client: OpenAI) -> Dict[str, int]:
+    """Best-effort connection counts from the underlying httpx/httpcore pool"""
+    try:
+        http_client = getattr(client, "_client", None)
+        pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return {
+            "open_connections": len(connections),
+            "idle_connections": idle,
+            "active_connections": len(connections) - idle
+        }
+    except Exception as e:
+        logger.debug(f"Could not read connection pool stats: {e}")
+        return {}
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Get registry and connection pool statistics
+
+    Returns:
+        Dictionary with pool configuration, reuse counters and per-client connection counts
+    """
+    with _lock:
+        return {
+            "config": {
+                "max_connections": OpenAIConfig.OPENAI_POOL_MAX_CONNECTIONS,
+                "max_keepalive_connections": OpenAIConfig.OPENAI_POOL_MAX_KEEPALIVE,
+                "keepalive_expiry": OpenAIConfig.OPENAI_POOL_KEEPALIVE_EXPIRY,
+                "timeout_seconds": OpenAIConfig.OPENAI_TIMEOUT_SECONDS,
+                "connect_timeout_seconds": OpenAIConfig.OPENAI_CONNECT_TIMEOUT_SECONDS,
+                "max_retries": OpenAIConfig.OPENAI_MAX_RETRIES
+            },
+            **_stats,
+            "clients": {key: _connection_pool_stats(client) for key, client in _clients.items()},
+            "async_clients": len(_async_clients),
+            "services": sorted({cls.__name__ for cls, _ in _services.keys()})
+        }
+
+
+def reset_registry():
+    """Close all pooled sync clients and forget cached services and async clients"""
+    with _lock:
+        for client in _clients.values():
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close pooled OpenAI client: {e}")
+        _clients.clear()
+        _async_clients.clear()
+        _services.clear()
+        for counter in _stats:
+            _stats[counter] = 0
@@ -7,12 +7,65 @@ import logging
 import datetime
 import sys
 from typing import Dict, Any, Optional
-from openai import OpenAI
 import os
+from utils.prompt_registry import register_prompt
+from .client_registry import get_openai_client, get_async_openai_client
 
 logger = logging.getLogger(__name__)
 
 
+_ENHANCEMENT_USER_TEMPLATE = """
+    Current Description:
+    {description}
+    
+    Enhancement Request:
+    {enhancement_prompt}
+    
+    Please enhance the description based on the user's request while following the guidelines above.
+"""
+
+ENHANCE_EXPERIENCE_PROMPT = register_prompt(
+    "enhancement.experience",
+    system="""
+    You are an expert resume writer and career coach. Your task is to enhance work experience descriptions based on user prompts while maintaining professionalism and accuracy.
+    
+    Guidelines:
+    1. Keep the enhanced description factual and truthful
+    2. Use action verbs and quantify achievements where possible
+    3. Make the description more compelling and ATS-friendly
+    4. Maintain the original meaning while improving clarity and impact
+    5. Use industry-standard terminology
+    6. Keep descriptions concise but impactful
+    7. Focus on results and achievements rather than just responsibilities
+    8. Format each statement on a new line - start each new statement with a line break
+    
+    Return only the enhanced description text with each statement on a new line, nothing else.
+    """,
+    user_template=_ENHANCEMENT_USER_TEMPLATE
+)
+
+ENHANCE_PROJECT_PROMPT = register_prompt(
+    "enhancement.project",
+    system="""
+    You are an expert resume writer and career coach. Your task is to enhance project descriptions based on user prompts while maintaining professionalism and accuracy.
+    
+    Guidelines:
+    1. Keep the enhanced description factual and truthful
+    2. Highlight technical skills, methodologies, and tools used
+    3. Quantify results and impact where possible
+    4. Make the description more compelling and ATS-friendly
+    5. Use industry-standard terminology
+    6. Keep descriptions concise but impactful
+    7. Focus on technical achievements and problem-solving
+    8. Include relevant technologies and frameworks
+    9. Format each statement on a new line - start each new statement with a line break
+    
+    Return only the enhanced description text with each statement on a new line, nothing else.
+    """,
+    user_template=_ENHANCEMENT_USER_TEMPLATE
+)
+
+
 class ContentEnhancementService:
     """
     Service for enhancing experience and project descriptions based on user prompts
@@ -35,7 +88,7 @@ class ContentEnhancementService:
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.model_name = model_name
         self.temperature = temperature
         self.top_p = top_p
@@ -59,76 +112,67 @@ class ContentEnhancementService:
             logger.info(f"Original description length: {len(description)} characters")
             logger.info(f"Enhancement prompt: {enhancement_prompt}")
             
-            # Create enhancement prompt based on content type
-            if content_type == "experience":
-                enhancement_system_prompt = """You are an expert resume writer and career coach. Your task is to enhance work experience descriptions based on user prompts while maintaining professionalism and accuracy.
-
-Guidelines:
-1. Keep the enhanced description factual and truthful
-2. Use action verbs and quantify achievements where possible
-3. Make the description more compelling and ATS-friendly
-4. Maintain the original meaning while improving clarity and impact
-5. Use industry-standard terminology
-6. Keep descriptions concise but impactful
-7. Focus on results and achievements rather than just responsibilities
-8. Format each statement on a new line - start each new statement with a line break
-
-Return only the enhanced description text with each statement on a new line, nothing else."""
-            else:  # project
-                enhancement_system_prompt = """You are an expert resume writer and career coach. Your task is to enhance project descriptions based on user prompts while maintaining professionalism and accuracy.
-
-Guidelines:
-1. Keep the enhanced description factual and truthful
-2. Highlight technical skills, methodologies, and tools used
-3. Quantify results and impact where possible
-4. Make the description more compelling and ATS-friendly
-5. Use industry-standard terminology
-6. Keep descriptions concise but impactful
-7. Focus on technical achievements and problem-solving
-8. Include relevant technologies and frameworks
-9. Format each statement on a new line - start each new statement with a line break
-
-Return only the enhanced description text with each statement on a new line, nothing else."""
-
-            user_prompt = f"""
-Current Description:
-{description}
-
-Enhancement Request:
-{enhancement_prompt}
-
-Please enhance the description based on the user's request while following the guidelines above.
-"""
-
             # Generate enhanced description
             response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": enhancement_system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                max_tokens=1000
+                **self._build_enhancement_request(description, enhancement_prompt, content_type)
             )
+            return self._build_enhancement_result(description, enhancement_prompt, response)
             
-            enhanced_description = response.choices[0].message.content.strip()
-            
-            # Return simplified response
-            result = {
-                "original_content": description,
-                "enhanced_content": enhanced_description,
-                "prompt_used": enhancement_prompt
-            }
+        except Exception as e:
+            logger.error(f"Error enhancing description: {str(e)}")
+            raise Exception(f"Failed to enhance description: {str(e)}")
+
+    async def aenhance_description(self, description: str, enhancement_prompt: str, content_type: str = "experience") -> Dict[str, Any]:
+        """
+        Async version of enhance_description using the shared AsyncOpenAI client
+        
+        Args:
+            description: The original description text to enhance
+            enhancement_prompt: User's prompt for enhancement
+            content_type: Type of content ("experience" or "project")
             
-            logger.info("Successfully enhanced description")
-            logger.info(f"Enhanced description length: {len(enhanced_description)} characters")
-            return result
+        Returns:
+            Dictionary containing original content, enhanced content, and prompt used
+        """
+        try:
+            logger.info(f"Enhancing {content_type} description (async)")
+            response = await get_async_openai_client(self.api_key).chat.completions.create(
+                **self._build_enhancement_request(description, enhancement_prompt, content_type)
+            )
+            return self._build_enhancement_result(description, enhancement_prompt, response)
             
         except Exception as e:
             logger.error(f"Error enhancing description: {str(e)}")
             raise Exception(f"Failed to enhance description: {str(e)}")
 
+    def _build_enhancement_request(self, description: str, enhancement_prompt: str, content_type: str) -> Dict[str, Any]:
+        """Build the chat completion arguments for an enhancement request"""
+        # Static guidelines per content type; the description and request go in the user message
+        template = ENHANCE_EXPERIENCE_PROMPT if content_type == "experience" else ENHANCE_PROJECT_PROMPT
+
+        return {
+            "model": self.model_name,
+            "messages": template.messages(description=description, enhancement_prompt=enhancement_prompt),
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "max_tokens": 1000
+        }
+
+    def _build_enhancement_result(self, description: str, enhancement_prompt: str, response: Any) -> Dict[str, Any]:
+        """Build the enhancement response from the model output"""
+        enhanced_description = response.choices[0].message.content.strip()
+        
+        # Return simplified response
+        result = {
+            "original_content": description,
+            "enhanced_content": enhanced_description,
+            "prompt_used": enhancement_prompt
+        }
+        
+        logger.info("Successfully enhanced description")
+        logger.info(f"Enhanced description length: {len(enhanced_description)} characters")
+        return result
+
     def enhance_experience_description(self, experience_data: Dict[str, Any], enhancement_prompt: str) -> Dict[str, Any]:
         """
         Enhance an experience description based on user prompt (legacy method)
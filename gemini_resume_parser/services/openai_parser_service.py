@@ -1,17 +1,76 @@
+import asyncio
 import json
 import logging
+import textwrap
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
 
-from openai import OpenAI
-
 from config.config import OpenAIConfig
 from utils.pdf_extractor import DocumentExtractor
+from utils.continuation import adaptive_max_tokens, continued_chat_completion, acontinued_chat_completion
+from utils.prompt_registry import register_prompt
+from utils.structured_output import with_response_format, parse_structured
+from utils.json_stream import repair_json
+from utils.keyword_matcher import KeywordMatcher
+from models.resume_models import ParsedResumeResponse
+from .client_registry import get_openai_client, get_async_openai_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_PARSER_ROLE = "You are an advanced resume parsing system that handles all types of resumes including academic, professional, student, and non-standard formats. Extract structured data from resume text and return valid JSON only."
+
+PARSE_PROMPT = register_prompt(
+    "parse.resume",
+    system=_PARSER_ROLE + "\n\n" + textwrap.dedent(OpenAIConfig.DEFAULT_PROMPT_TEMPLATE).strip(),
+    user_template="""
+    {format_instructions}
+
+    Resume text:
+    {resume_text}
+    """
+)
+
+# Caller-supplied templates are rendered whole into the user message
+CUSTOM_PARSE_PROMPT = register_prompt("parse.resume_custom", system=_PARSER_ROLE, user_template="{prompt}")
+
+# Format-specific instructions, sent with the resume text in the user message
+_FORMAT_INSTRUCTIONS = {
+    "academic": """
+    **ACADEMIC RESUME DETECTED**
+    - Focus on extracting academic projects, coursework, and research
+    - Map "COURSE:" sections to projects, not experience
+    - Include relevant coursework in education descriptions
+    - Handle incomplete academic dates gracefully
+    """,
+    "professional": """
+    **PROFESSIONAL RESUME DETECTED**
+    - Focus on work experience and professional achievements
+    - Distinguish between technical skills and communication languages
+    - Extract complete employment history
+    """,
+    "mixed": """
+    **MIXED FORMAT RESUME DETECTED**
+    - Handle both academic and professional sections
+    - Distinguish between course projects and work experience
+    - Extract all available information from both formats
+    """
+}
+
+# Indicators counted by _detect_resume_format (whole words and phrases)
+_ACADEMIC_INDICATORS = KeywordMatcher([
+    'course:', 'research project:', 'thesis:', 'academic project',
+    'master of science', 'bachelor of science', 'phd', 'graduate',
+    'relevant coursework', 'coursework:', 'academic background',
+    'education and credentials', 'student', 'university project'
+])
+_PROFESSIONAL_INDICATORS = KeywordMatcher([
+    'work experience', 'employment history', 'professional experience',
+    'career history', 'job experience', 'employment:', 'work history',
+    'years of experience', 'professional background', 'career'
+])
+
 class OpenAIResumeParser:
     """Main service class for parsing resumes using OpenAI API"""
     
@@ -32,9 +91,9 @@ class OpenAIResumeParser:
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
         
-        # Initialize OpenAI client
+        # Get the shared, pooled OpenAI client
         try:
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = get_openai_client(self.api_key)
             self.model = self.client  # Add model attribute for compatibility
             self.temperature = temperature
             self.top_p = top_p
@@ -43,6 +102,11 @@ class OpenAIResumeParser:
             logger.error(f"Failed to initialize OpenAI client: {str(e)}")
             raise
 
+    @property
+    def async_client(self):
+        """Shared AsyncOpenAI client for the same API key (used by the async a* methods)"""
+        return get_async_openai_client(self.api_key)
+
     def parse_resume_from_file(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """
         Parse resume from file using OpenAI API
@@ -68,73 +132,118 @@ class OpenAIResumeParser:
             logger.error(f"Failed to parse resume from file {file_path}: {str(e)}")
             raise
     
-    def parse_resume_text(self, resume_text: str, custom_prompt: Optional[str] = None) -> Dict[str, Any]:
+    def parse_resume_text(self, resume_text: str, custom_prompt: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
         """
         Parse resume text using OpenAI API with format detection
         
         Args:
             resume_text: Raw resume text
             custom_prompt: Custom prompt template (optional)
+            use_cache: Serve identical requests from the LLM response cache (set False to force a fresh call)
             
         Returns:
             Parsed resume data as dictionary
         """
         try:
-            # Detect resume format and prepare appropriate prompt
-            resume_type = self._detect_resume_format(resume_text)
-            logger.info(f"Detected resume type: {resume_type}")
-            
-            # Prepare prompt based on detected format
-            prompt = self._prepare_prompt(resume_text, custom_prompt, resume_type)
+            resume_type, completion_kwargs = self._build_parse_request(resume_text, custom_prompt)
             
             # Generate content using OpenAI
             logger.info("Sending request to OpenAI API")
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "You are an advanced resume parsing system that handles all types of resumes including academic, professional, student, and non-standard formats. Extract structured data from resume text and return valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                max_tokens=4000
-            )
+            response = continued_chat_completion(self.client, use_cache=use_cache, **completion_kwargs)
             
-            # Parse response
-            parsed_data = self._parse_response(response.choices[0].message.content)
+            return self._finalize_parse(response.choices[0].message.content, resume_type)
             
-            # Enforce schema compliance with format-specific handling
-            parsed_data = self._enforce_schema_compliance(parsed_data, resume_type)
+        except Exception as e:
+            logger.error(f"Failed to parse resume text: {str(e)}")
+            raise
+
+    async def aparse_resume_from_file(self, file_path: Union[str, Path], executor=None) -> Dict[str, Any]:
+        """
+        Async version of parse_resume_from_file
+        
+        Args:
+            file_path: Path to resume file (PDF, DOCX, or TXT)
+            executor: Thread pool used for text extraction (default loop executor if not provided)
             
-            logger.info("✅ Resume parsing completed successfully")
-            return parsed_data
+        Returns:
+            Parsed resume data as dictionary
+        """
+        try:
+            logger.info(f"Extracting text from file: {file_path}")
+            loop = asyncio.get_running_loop()
+            resume_text = await loop.run_in_executor(executor, DocumentExtractor.extract_text, file_path)
+            
+            if not resume_text.strip():
+                raise ValueError("No text extracted from file")
+            
+            return await self.aparse_resume_text(resume_text)
+            
+        except Exception as e:
+            logger.error(f"Failed to parse resume from file {file_path}: {str(e)}")
+            raise
+
+    async def aparse_resume_text(self, resume_text: str, custom_prompt: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Async version of parse_resume_text using the shared AsyncOpenAI client
+        
+        Args:
+            resume_text: Raw resume text
+            custom_prompt: Custom prompt template (optional)
+            use_cache: Serve identical requests from the LLM response cache (set False to force a fresh call)
+            
+        Returns:
+            Parsed resume data as dictionary
+        """
+        try:
+            resume_type, completion_kwargs = self._build_parse_request(resume_text, custom_prompt)
+            
+            logger.info("Sending async request to OpenAI API")
+            response = await acontinued_chat_completion(self.async_client, use_cache=use_cache, **completion_kwargs)
+            
+            return self._finalize_parse(response.choices[0].message.content, resume_type)
             
         except Exception as e:
             logger.error(f"Failed to parse resume text: {str(e)}")
             raise
 
-    def _detect_resume_format(self, resume_text: str) -> str:
-        """Detect the type of resume format"""
-        text_lower = resume_text.lower()
-        
-        # Academic/Student resume indicators
-        academic_indicators = [
-            'course:', 'research project:', 'thesis:', 'academic project',
-            'master of science', 'bachelor of science', 'phd', 'graduate',
-            'relevant coursework', 'coursework:', 'academic background',
-            'education and credentials', 'student', 'university project'
-        ]
+    def _build_parse_request(self, resume_text: str, custom_prompt: Optional[str] = None):
+        """Detect the resume format and build the chat completion arguments for parsing"""
+        # Detect resume format and prepare appropriate prompt
+        resume_type = self._detect_resume_format(resume_text)
+        logger.info(f"Detected resume type: {resume_type}")
+        
+        # Static instructions go first; the format addendum and resume text trail in the user message
+        messages = self._prepare_messages(resume_text, custom_prompt, resume_type)
+        
+        completion_kwargs = {
+            "model": self.model_name,
+            "messages": messages,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            # The parsed JSON restates the resume, so the budget grows with it
+            "max_tokens": adaptive_max_tokens(resume_text, ParsedResumeResponse, base_tokens=200, output_ratio=1.2)
+        }
+        # Custom templates may ask for a different structure, so only the built-in prompt is schema-bound
+        if not custom_prompt:
+            with_response_format(completion_kwargs, ParsedResumeResponse, "parsed_resume")
+        return resume_type, completion_kwargs
+
+    def _finalize_parse(self, response_text: str, resume_type: str) -> Dict[str, Any]:
+        """Parse the model output and enforce the resume schema"""
+        # Parse response
+        parsed_data = self._parse_response(response_text)
         
-        # Professional resume indicators
-        professional_indicators = [
-            'work experience', 'employment history', 'professional experience',
-            'career history', 'job experience', 'employment:', 'work history',
-            'years of experience', 'professional background', 'career'
-        ]
+        # Enforce schema compliance with format-specific handling
+        parsed_data = self._enforce_schema_compliance(parsed_data, resume_type)
         
-        # Count indicators
-        academic_score = sum(1 for indicator in academic_indicators if indicator in text_lower)
-        professional_score = sum(1 for indicator in professional_indicators if indicator in text_lower)
+        logger.info("✅ Resume parsing completed successfully")
+        return parsed_data
+
+    def _detect_resume_format(self, resume_text: str) -> str:
+        """Detect the type of resume format"""
+        # Count distinct indicators, each compiled dictionary scanned in one pass
+        academic_score = len(_ACADEMIC_INDICATORS.find_keywords(resume_text))
+        professional_score = len(_PROFESSIONAL_INDICATORS.find_keywords(resume_text))
         
         # Determine format
         if academic_score > professional_score:
@@ -144,49 +253,19 @@ class OpenAIResumeParser:
         else:
             return "mixed"
     
-    def _prepare_prompt(self, resume_text: str, custom_prompt: Optional[str] = None, resume_type: str = "mixed") -> str:
-        """Prepare the prompt for resume parsing based on detected format"""
+    def _prepare_messages(self, resume_text: str, custom_prompt: Optional[str] = None, resume_type: str = "mixed") -> list:
+        """Build the parsing messages: static system prefix, then format-specific instructions and the resume text"""
         if custom_prompt:
-            return custom_prompt.format(resume_text=resume_text)
-        
-        # Add format-specific instructions to the base template
-        format_instructions = ""
-        if resume_type == "academic":
-            format_instructions = """
-            **ACADEMIC RESUME DETECTED**
-            - Focus on extracting academic projects, coursework, and research
-            - Map "COURSE:" sections to projects, not experience
-            - Include relevant coursework in education descriptions
-            - Handle incomplete academic dates gracefully
-            """
-        elif resume_type == "professional":
-            format_instructions = """
-            **PROFESSIONAL RESUME DETECTED**
-            - Focus on work experience and professional achievements
-            - Distinguish between technical skills and communication languages
-            - Extract complete employment history
-            """
-        else:
-            format_instructions = """
-            **MIXED FORMAT RESUME DETECTED**
-            - Handle both academic and professional sections
-            - Distinguish between course projects and work experience
-            - Extract all available information from both formats
-            """
+            return CUSTOM_PARSE_PROMPT.messages(prompt=custom_prompt.format(resume_text=resume_text))
         
-        base_template = OpenAIConfig.DEFAULT_PROMPT_TEMPLATE
-        enhanced_template = base_template + format_instructions
-        
-        return enhanced_template.format(resume_text=resume_text)
+        format_instructions = textwrap.dedent(_FORMAT_INSTRUCTIONS.get(resume_type, _FORMAT_INSTRUCTIONS["mixed"])).strip()
+        return PARSE_PROMPT.messages(format_instructions=format_instructions, resume_text=resume_text)
 
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """Parse OpenAI response and extract JSON"""
         try:
-            # Clean the response text
-            cleaned_response = self._clean_response(response_text)
-            
-            # Parse JSON
-            parsed_data = json.loads(cleaned_response)
+            # Structured outputs parse directly; the tolerant parser only runs if that fails
+            parsed_data = parse_structured(response_text, "parse.resume", repair_json)
             logger.info("Successfully parsed JSON response")
             return parsed_data
             
@@ -195,51 +274,6 @@ class OpenAIResumeParser:
             logger.error(f"Raw response: {response_text}")
             raise ValueError(f"Invalid JSON response from AI: {str(e)}")
 
-    def _clean_response(self, response_text: str) -> str:
-        """Clean OpenAI response to extract valid JSON"""
-        import re
-        
-        # Remove markdown code blocks
-        if response_text.startswith("```json"):
-            response_text = response_text.replace("```json", "").replace("```", "")
-        elif response_text.startswith("```"):
-            response_text = response_text.replace("```", "")
-
-        response_text = response_text.strip()
-        
-        # Try to find JSON content within markdown blocks
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            try:
-                json.loads(json_content)
-                return json_content
-            except json.JSONDecodeError:
-                pass
-        
-        # Try to find JSON object in the text
-        json_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            try:
-                json.loads(json_content)
-                return json_content
-            except json.JSONDecodeError:
-                pass
-        
-        # If response starts and ends with braces, use as is
-        if response_text.startswith('{') and response_text.endswith('}'):
-            try:
-                json.loads(response_text)
-                return response_text
-            except json.JSONDecodeError:
-                pass
-        
-        logger.warning("Could not extract valid JSON from AI response")
-        return '{"error": "Invalid JSON response", "message": "Could not parse AI response"}'
-
     def _enforce_schema_compliance(self, parsed_data: Dict[str, Any], resume_type: str = "mixed") -> Dict[str, Any]:
         """Enforce schema compliance for parsed resume data with format-specific handling"""
         logger.info("Enforcing schema compliance")
@@ -454,7 +488,7 @@ class OpenAIResumeParser:
             for i, project in enumerate(parsed_data["projects"]):
                 if isinstance(project, dict):
                     # Convert tech stack to string if it's an array
-                    tech_stack = project.get("tech_stack", project.get("technologies", ""))
+                    tech_stack = project.get("techStack", project.get("tech_stack", project.get("technologies", "")))
                     if isinstance(tech_stack, list):
                         tech_stack = ", ".join(tech_stack)
                     
@@ -520,6 +554,13 @@ class OpenAIResumeParser:
                 # This preserves the original categorization from the AI response
                 skills_obj = {}
                 for skill in parsed_data["skills"]:
+                    # Structured output returns [{"category": ..., "skills": [...]}]
+                    if isinstance(skill, dict) and "category" in skill:
+                        category = skill.get("category") or "Other Tools"
+                        items = [item for item in skill.get("skills", []) if isinstance(item, str) and item.strip()]
+                        if items:
+                            skills_obj.setdefault(category, []).extend(items)
+                        continue
                     if isinstance(skill, str) and skill.strip():
                         # If skills come as a flat list, put them in "Other Tools" as fallback
                         # This should rarely happen with the updated prompt
@@ -4,10 +4,467 @@ import datetime
 import re
 from typing import Dict, Any, Optional, List
 from google.generativeai import GenerativeModel
+from utils.power_words import find_repetitions, tokenize
+from utils.repetition_rewriter import rewrite_repetitions
+from utils.tech_stack import extract_tech_stack, format_tech_stack
+from utils.skill_taxonomy import get_skill_taxonomy
+from utils.prompt_registry import PromptTemplate, register_prompt
+from utils.structured_output import with_response_format, parse_structured
+from utils.json_stream import repair_json
+from utils.continuation import adaptive_max_tokens, continue_completion
+from utils.resume_patch import apply_resume_patch, with_item_ids
+from models.resume_models import RepetitionRephraseResponse, ResumePatchResponse, TechStackBatchResponse
+from config.config import OpenAIConfig
 from .openai_parser_service import OpenAIResumeParser
 
 logger = logging.getLogger(__name__)
 
+SKILLS_ENHANCEMENT_PROMPT = register_prompt(
+    "improvement.skills",
+    system="""
+    You are an expert resume skills specialist. Enhance the skills section based on the ATS suggestions in the user message.
+    
+    CRITICAL RULES:
+    - Return ONLY valid JSON (no markdown, no code fences, no explanations)
+    - Start your response with { and end with }
+    - Prefer adding skills to EXISTING categories shown in the resume
+    - Do NOT include proficiency modifiers or levels (e.g., "(Advanced)", "Advanced", "Intermediate", "Beginner", "Expert"). Return bare skill names only
+    - If a relevant skills category is missing but needed (e.g., "Core Skills", "Cloud", "Data Engineering"), you MAY create a NEW category object and include its skills
+    - Focus on core, designation-aligned skills first (bare names only) and then tools/frameworks
+    - In the response: Return skills as a DIRECT object with category names as keys (including any NEW categories when necessary)
+    - CRITICAL: ONLY include the NEW skills being added, NOT the existing skills
+    - Format: If existing has "Languages: JavaScript" and you need to add "Java", response should be {"Languages": "Java"} NOT {"Languages": "JavaScript, Java"}
+    - NEVER include existing skills in the response - only show the new skills being added
+    - NEVER use "General" wrapper - return skills directly as category: skills pairs
+    - If a category has no new skills to add, do NOT include that category in the response at all
+    - You MAY introduce new categories only when relevant and missing; name them clearly (e.g., "Core Skills", "Cloud", "Data Engineering")
+    - NEVER suggest "General" as a skill category - avoid generic categories
+    
+    REQUIRED OUTPUT FORMAT:
+    Return ONLY the new skills to be added in this exact format:
+    {
+        "Languages": "Java, Python",
+        "Database": "PostgreSQL",
+        "Cloud": "AWS"
+    }
+    
+    IMPORTANT: 
+    - Only include categories that have NEW skills to add
+    - Each category value should be a comma-separated string of NEW skills only
+    - Do NOT include existing skills
+    - If no new skills can be added to any category, return {}
+    """,
+    user_template="""
+    CURRENT SKILLS STRUCTURE:
+    {current_skills}
+
+    ATS SKILLS SUGGESTIONS TO APPLY:
+    {suggestions_text}
+    """
+)
+
+# Guidelines and suggestion rules shared by the full-rewrite and patch prompts
+_IMPROVEMENT_GUIDELINES = """
+    SCORE-BOOSTING IMPROVEMENT GUIDELINES (Target: 90+ ATS Score):
+    1. ACHIEVEMENTS & IMPACT METRICS (High Impact):
+       - Transform EVERY bullet point to include specific numbers, percentages, and quantifiable results
+       - Add measurable outcomes with industry-standard metrics (ROI, efficiency gains, cost savings)
+       - Include timeframes, team sizes, budget amounts, and scale of impact
+       - Use power words: "increased", "optimized", "achieved", "delivered", "exceeded"
+       - **DESCRIPTION FORMATTING**: Each responsibility/achievement should be a separate sentence ending with \\n
+    
+    2. KEYWORD OPTIMIZATION (Critical for ATS):
+       - Integrate 15-20 relevant industry keywords naturally throughout all sections
+       - Use technical terms, software names, methodologies, and industry-specific language
+       - Include variations and synonyms of important terms
+       - Add trending industry keywords and certifications
+       - Optimize for both technical and soft skills mentioned in job descriptions
+    
+    3. SECTION ENHANCEMENT (ATS Structure):
+       - Ensure every section has robust, keyword-rich content
+       - Add industry-specific terminology to job titles and descriptions
+        - Include technical skills (bare names only, no proficiency levels)
+       - Enhance education with relevant coursework and achievements
+       - Add certifications, training, and professional development
+    
+    4. CLARITY & PROFESSIONAL LANGUAGE:
+       - Rewrite weak descriptions with powerful, action-oriented language
+       - Use industry-standard terminology and professional phrasing
+       - Eliminate vague terms like "helped", "assisted", "worked on"
+       - Replace with specific action verbs and concrete accomplishments
+    
+    5. ATS COMPATIBILITY OPTIMIZATION:
+       - Use standard section headers recognized by ATS systems
+       - Ensure consistent formatting and structure
+       - Add location information where missing
+       - Include complete contact information
+       - Use standard date formats: MUST be in "MMM YYYY" format (e.g., "Jan 2025", "Dec 2024") - convert all other formats like "2025-01", "01/2025", "January 2025", "2025" to this format
+    
+    7. MISSING SECTIONS - ADD DUMMY DATA:
+       - If PROJECTS section is missing, add 2-3 realistic projects with:
+         * Project name and detailed description (8-10 lines)
+         * techStack: Comma-separated string of technologies used (e.g., "React, Node.js, MongoDB, AWS")
+         * Key achievements or outcomes with specific metrics
+         * Start date and end date (format: "Aug 2020 - Sep 2020")
+         * Detailed project description including:
+           - Project overview and objectives
+           - Technical challenges faced and solutions implemented
+           - Specific features developed
+           - Performance improvements achieved
+           - User impact and business value
+           - Lessons learned and skills gained
+         * Make projects relevant to their field and experience level
+       - If CERTIFICATES section is missing, add 2-3 relevant certifications with:
+         * Certification name and issuing organization
+         * Date obtained or expiration date
+         * Brief description of skills gained
+         * Choose certifications relevant to their industry and role
+       - Generate realistic, professional dummy data that matches the person's field/experience
+       - Ensure dummy data is relevant to their industry and skill level
+       - Make the dummy data sound authentic and professional
+       - Base dummy data on their existing skills, experience, and job titles
+       - Use appropriate project types and certification names for their field
+       - For project dates: Use realistic timeframes (1-6 months duration)
+       - Ensure project dates don't overlap with their work experience dates
+       - Make project descriptions comprehensive and detailed (8-10 lines each)
+       - Include specific technical details and business impact in descriptions
+    """
+
+_SUGGESTION_APPLICATION_RULES = """
+    CRITICAL: APPLY ONLY ATS SUGGESTIONS - NO SELF-ENHANCEMENT:
+    - Apply ONLY the specific suggestions provided in the ATS analysis
+    - Do NOT add any improvements that are not explicitly mentioned in the suggestions
+    - Do NOT enhance sections unless there is a specific suggestion to do so
+    - PRESERVE all original content unless explicitly told to change it in the suggestions
+    - Follow ATS suggestions exactly as written without adding extra improvements
+    - MANDATORY: When "OPTIMIZE_DESCRIPTION" suggestions are provided for projects, experience, or summary - apply them precisely
+    - EXPAND short descriptions by adding specific details, technical information, and quantified outcomes
+    - COMPRESS long descriptions by focusing on key achievements and removing redundant information
+    - **CRITICAL FOR REPETITION FIXES**: When FIX_REPETITION suggestions are provided:
+      * Apply EVERY single FIX_REPETITION suggestion without exception
+      * If the ATS analysis detected 15 repeated words, apply ALL 15 fixes
+      * Replace each repeated word with the exact alternatives provided in the suggestion
+      * Do NOT skip any repetition fixes - this is mandatory for ATS score improvement
+      * Do NOT introduce new repetition: For each replacement, choose alternatives that are NOT already used elsewhere in the SAME section (Experience, Projects, Summary, etc.)
+      * Distribute different alternatives across instances so that no chosen synonym appears more than once within the same section
+      * Prefer alternatives that also maintain variety across the entire resume; if an alternative appears 2+ times elsewhere in the same section after replacement, select a different synonym
+      * Verify that all repeated words have been replaced before finalizing the response
+    
+    COMPREHENSIVE SUGGESTION APPLICATION RULES:
+    - For "ADD_SKILLS" suggestions: Add ONLY the specific skills mentioned in the suggestion
+    - For "STRUCTURE_SKILLS" suggestions: Reorganize unstructured skills into proper categories (Technical, Soft Skills, Tools, Frameworks)
+    - For "ENHANCE_ACHIEVEMENT" suggestions: Replace ONLY with the exact text provided in the suggestion
+    - For "ADD_KEYWORDS" suggestions: Add ONLY the keywords explicitly mentioned in the suggestion
+    - For "IMPROVE_EXPERIENCE" suggestions: Make ONLY the changes specified in the suggestion
+    - For "ENHANCE_PROJECT" suggestions: Apply ONLY the specific enhancements mentioned
+    - For "REWRITE_SUMMARY" suggestions: Use ONLY the provided replacement text
+    - For "FIX_CONTACT" suggestions: Fix ONLY the issues specifically mentioned
+    - For "ADD_DATES" suggestions: Add missing dates to ALL sections mentioned in the suggestion
+    - For "ADD_PROJECT_DATES" suggestions: Add dummy start and end dates to projects with realistic 2-4 month durations
+    - For "ADD_ORGANIZATION" suggestions: Infer and add organizations for certificates based on certificate names
+    - For "OPTIMIZE_DESCRIPTION" suggestions: Enhance descriptions that are too short or too long as specified - expand short descriptions, compress long descriptions
+    - For "FIX_REPETITION" suggestions: **CRITICAL - REPLACE ALL INSTANCES OF EVERY REPEATED WORD**:
+      * Apply EVERY FIX_REPETITION suggestion provided in the ATS analysis
+      * If 15 repeated words are detected, apply ALL 15 fixes - NO EXCEPTIONS
+      * Replace each repeated word with the specific alternatives mentioned in the suggestion
+      * Ensure NO repeated words remain after applying fixes
+      * Use the exact replacement words provided in the FIX_REPETITION suggestions, but ensure the chosen synonyms are NOT repeated elsewhere in the same section
+      * Apply fixes to ALL sections where the repeated words appear
+      * Distribute different alternatives across multiple occurrences to maximize variety
+      * **MANDATORY**: Count and verify that ALL repeated words have been replaced and that no new synonym appears more than once per section
+    - For "FIX_FORMATTING" suggestions: Fix ONLY the formatting issues specifically mentioned
+    - For "FIX_GRAMMAR" suggestions: Fix ONLY the grammar errors specifically mentioned
+    - For "FIX_DATE_FORMAT" suggestions: Convert ALL dates to "MMM YYYY" format (e.g., "Jan 2025", "Dec 2024") - convert dates like "2025-01" to "Jan 2025", "01/2025" to "Jan 2025", "January 2025" to "Jan 2025", "2025" to "Jan 2025"
+    - CRITICAL: If no suggestion exists for a section, leave it completely unchanged
+    
+    **REPETITION FIXES VERIFICATION CHECKLIST**:
+    Before finalizing your response, verify that:
+    1. ALL FIX_REPETITION suggestions from the ATS analysis have been applied
+    2. Every repeated word mentioned in the suggestions has been replaced
+    3. No repeated words remain in the final resume
+    4. All replacement words are used exactly as specified in the suggestions
+    5. The total number of repetition fixes applied matches the number of FIX_REPETITION suggestions provided
+    """
+
+RESUME_IMPROVEMENT_PROMPT = register_prompt(
+    "improvement.resume",
+    system="""
+    You are an expert resume writer and ATS optimization specialist with 15+ years of experience in creating high-impact resumes that achieve 90+ ATS scores and impress recruiters.
+    
+    TASK: Dramatically improve the provided resume by applying SPECIFIC ATS suggestions to increase the overall score by 10-15 points while maintaining original structure and content integrity.
+    
+    CRITICAL REQUIREMENTS FOR SCORE IMPROVEMENT:
+    - Return ONLY valid JSON (no markdown, no code fences, no explanations)
+    - Maintain the exact same structure as the original parsed resume data
+    - Apply EVERY suggestion with precision and industry-specific enhancements
+    - Transform generic descriptions into quantified, keyword-rich, achievement-focused content
+    - Ensure the improved resume achieves 90+ ATS compatibility
+    - Keep the same field names and structure as the input
+    - For projects: ALWAYS include techStack as a comma-separated string of technologies
+    - MANDATORY: Apply ALL suggestions from the ATS analysis with specific improvements
+    - ENHANCE every bullet point with quantified metrics and industry keywords
+    - OPTIMIZE every section for maximum ATS score improvement
+    - **CRITICAL FORMATTING**: For ALL description fields (experience, projects, education, activities, etc.), format each sentence to end with \\n (newline character). This ensures proper bullet point formatting in the frontend.
+    
+    The user message contains the ORIGINAL RESUME DATA, the ORIGINAL RESUME TEXT, the ATS SUGGESTIONS TO APPLY, the ATS ANALYSIS SUMMARY and the MISSING SECTIONS DETECTED.
+    """ + _IMPROVEMENT_GUIDELINES + """
+    REQUIRED OUTPUT FORMAT:
+     Return the improved resume data in the EXACT format expected by the frontend ResumeBuilderPage.tsx interface:
+    
+     {
+       "basicDetails": {
+         "fullName": "string",
+         "professionalTitle": "string", 
+         "phone": "string",
+         "email": "string",
+         "location": "string",
+         "website": "string",
+         "github": "string",
+         "linkedin": "string",
+         "profilePicture": "string (optional)"
+       },
+       "summary": "string",
+       "objective": "string",
+       "experience": [
+         {
+           "id": "string",
+           "company": "string",
+           "position": "string", 
+           "startDate": "string",
+           "endDate": "string",
+           "description": "string",
+           "location": "string"
+         }
+       ],
+       "education": [
+         {
+           "id": "string",
+           "institution": "string",
+           "degree": "string",
+           "year": "string",
+           "description": "string",
+           "grade": "string",
+           "location": "string"
+         }
+       ],
+       "skills": "object or array - maintain original format",
+       "languages": [
+         {
+           "name": "string",
+           "proficiency": "string"
+         }
+       ],
+       "activities": [
+         {
+           "id": "string",
+           "title": "string",
+           "description": "string"
+         }
+       ],
+       "projects": [
+         {
+           "id": "string",
+           "name": "string",
+           "techStack": "string",
+           "startDate": "string",
+           "endDate": "string", 
+           "description": "string",
+           "link": "string"
+         }
+       ],
+       "certifications": [
+         {
+           "id": "string",
+           "certificateName": "string",
+           "link": "string",
+           "issueDate": "string",
+           "instituteName": "string"
+         }
+       ],
+       "references": [
+         {
+           "id": "string",
+           "name": "string",
+           "title": "string",
+           "company": "string",
+           "phone": "string",
+           "email": "string",
+           "relationship": "string"
+         }
+       ],
+       "customSections": [
+         {
+           "id": "string",
+           "title": "string",
+           "type": "text|list|timeline|grid|mixed",
+           "position": "number",
+           "content": {
+             "text": "string (optional)",
+             "items": [
+               {
+                 "id": "string",
+                 "title": "string (optional)",
+                 "subtitle": "string (optional)",
+                 "description": "string (optional)",
+                 "startDate": "string (optional)",
+                 "endDate": "string (optional)",
+                 "location": "string (optional)",
+                 "link": "string (optional)",
+                 "bullets": ["string"],
+                 "tags": ["string"]
+               }
+             ],
+             "columns": [
+               {
+                 "title": "string",
+                 "items": ["string"]
+               }
+             ]
+           },
+           "styling": {
+             "showBullets": "boolean (optional)",
+             "showDates": "boolean (optional)",
+             "showLocation": "boolean (optional)",
+             "showLinks": "boolean (optional)",
+             "showTags": "boolean (optional)",
+             "layout": "vertical|horizontal|grid (optional)"
+           }
+         }
+       ]
+     }
+    
+     CRITICAL REQUIREMENTS:
+     - Use EXACT field names as shown above (e.g., "basicDetails", "fullName", "professionalTitle", etc.)
+     - Generate unique IDs for all array items using uuid-like strings
+     - Maintain the exact structure and nesting as shown
+     - For missing sections, add empty arrays with proper structure
+     - Ensure all required fields are present even if empty
+     - Use the frontend's expected data types (strings, arrays, objects)
+    """ + _SUGGESTION_APPLICATION_RULES + """
+    Focus on making TRANSFORMATIVE improvements that directly address ATS scoring criteria while maintaining professional authenticity.
+    Ensure all improvements align with the specific feedback provided in the ATS analysis.
+    """,
+    user_template="""
+    ORIGINAL RESUME DATA:
+    {resume_data}
+
+    ORIGINAL RESUME TEXT:
+    {original_text}
+
+    ATS SUGGESTIONS TO APPLY:
+    {suggestions_text}
+
+    ATS ANALYSIS SUMMARY:
+    - Overall Score: {overall_score}
+    - Strengths: {strengths}
+    - Weaknesses: {weaknesses}
+
+    MISSING SECTIONS DETECTED:
+    - Projects Section Missing: {projects_missing}
+    - Certificates Section Missing: {certificates_missing}
+    """
+)
+
+RESUME_PATCH_PROMPT = register_prompt(
+    "improvement.resume_patch",
+    system="""
+    You are an expert resume writer and ATS optimization specialist with 15+ years of experience in creating high-impact resumes that achieve 90+ ATS scores and impress recruiters.
+    
+    TASK: Apply the SPECIFIC ATS suggestions to the provided resume by returning a short list of targeted edits. Do NOT return the whole resume: every field you do not edit is kept exactly as it is.
+    
+    The user message contains the ORIGINAL RESUME DATA (every list item carries an "id"), the ORIGINAL RESUME TEXT, the ATS SUGGESTIONS TO APPLY, the ATS ANALYSIS SUMMARY and the MISSING SECTIONS DETECTED.
+    """ + _IMPROVEMENT_GUIDELINES + """
+    REQUIRED OUTPUT FORMAT:
+    Return ONLY valid JSON (no markdown, no code fences, no explanations) with a list of JSON-Patch-style operations:
+    {
+      "operations": [
+        {"op": "replace", "path": "/experience/exp-0/description", "value": "Complete rewritten description.\\n"},
+        {"op": "replace", "path": "/summary", "value": "Complete rewritten summary"},
+        {"op": "add", "path": "/projects/project-1/techStack", "value": "React, Node.js, MongoDB"},
+        {"op": "add", "path": "/projects/-", "value": {"name": "string", "techStack": "string", "startDate": "Aug 2020", "endDate": "Sep 2020", "description": "string", "link": ""}},
+        {"op": "add", "path": "/certifications/-", "value": {"certificateName": "string", "link": "", "issueDate": "Jan 2024", "instituteName": "string"}},
+        {"op": "remove", "path": "/activities/activity-2"}
+      ]
+    }
+    
+    PATCH RULES:
+    - "op" is "replace" (change an existing field), "add" (set a field that is missing, or append an item with "/<section>/-") or "remove" (delete one list item or one field of an item; never a whole section)
+    - "path" is "/<section>/<item id>/<field>" for experience, education, projects, certifications, languages, activities and references; "/basicDetails/<field>"; "/summary"; "/objective"; or "/skills" (STRUCTURE_SKILLS only, with the complete reorganized skills value)
+    - Use ONLY item ids that appear in the ORIGINAL RESUME DATA; never invent ids for existing items
+    - "value" replaces the WHOLE field: always send the complete new text of a description, never a fragment or a diff
+    - Emit operations ONLY for fields a suggestion changes; do not restate unchanged fields
+    - ADD_SKILLS suggestions have already been applied to the skills in ORIGINAL RESUME DATA; do not repeat them
+    - New items for missing sections use the field names shown above for that section
+    - If no suggestion requires a change, return {"operations": []}
+    """ + _SUGGESTION_APPLICATION_RULES + """
+    Focus on making TRANSFORMATIVE improvements that directly address ATS scoring criteria while maintaining professional authenticity.
+    Ensure all improvements align with the specific feedback provided in the ATS analysis.
+    """,
+    user_template=RESUME_IMPROVEMENT_PROMPT.user_template
+)
+
+TECH_STACK_BATCH_PROMPT = register_prompt(
+    "improvement.batch_tech_stack",
+    system="""
+    Determine the tech stack of each project listed in the user message.
+    
+    For each project:
+    1. List the technologies, frameworks, programming languages, databases, cloud platforms and tools its name or description mentions.
+    2. If it mentions none, suggest 3-6 technologies that would be appropriate for it. Choose technologies that:
+       - Match the project description and requirements
+       - Are commonly used together
+       - Are relevant to the project type
+       - Include both frontend and backend technologies if applicable
+       - Prefer the AVAILABLE SKILLS of the candidate
+    
+    Examples of suggested stacks:
+    - Web app: "React, Node.js, MongoDB, Express.js, AWS"
+    - Data science: "Python, Pandas, NumPy, Jupyter, Scikit-learn"
+    - Mobile app: "React Native, JavaScript, Firebase, Redux"
+    - Backend API: "Python, Django, PostgreSQL, Docker, AWS"
+    
+    Return ONLY valid JSON with one entry per input project, using the project's index:
+    {"projects": [{"index": number, "tech_stack": ["string"]}]}
+    Use an empty list when no clear technologies can be determined.
+    """,
+    user_template="""
+    AVAILABLE SKILLS: {skills_text}
+    
+    PROJECTS:
+    {projects}
+    """
+)
+
+REPETITION_REPHRASE_PROMPT = register_prompt(
+    "improvement.rephrase_repetitions",
+    system="""
+    You rephrase resume items to remove repetition using unique synonyms within each item.
+    
+    You are refining resume text to eliminate repeated action verbs and professional terms WITHIN the same item, and also ensure cross-project uniqueness of action verbs. The items to rephrase are given as INPUT in the user message.
+    
+    RULES:
+    - Rephrase each provided item to remove all repeated words by using varied, professional synonyms.
+    - Chosen synonyms must not repeat within the same item; distribute alternatives across sentences.
+    - Across all project descriptions, ensure different action verbs are used per project. If two projects would share the same main verb (e.g., "built"), change one to a different professional verb (e.g., "engineered", "developed").
+    - When creating content for a new project (if any are missing and need to be added elsewhere), avoid reusing action verbs already present elsewhere in the resume (summary, experience, other projects). Prefer fresh, professional verbs.
+    - Do not change facts, companies, or technologies; only rephrase verbs/phrases.
+    - Keep bullets/sentences count and order consistent; end each sentence with a newline (\n).
+    - Return ONLY valid JSON with this structure and no extra commentary.
+    
+    OUTPUT FORMAT:
+    {
+      "experience": [{"index": number, "description": "string"}],
+      "projects": [{"index": number, "description": "string"}],
+      "summary": "string, or null if the summary is not in INPUT",
+      "objective": "string, or null if the objective is not in INPUT"
+    }
+    """,
+    user_template="""
+    INPUT:
+    {payload}
+    """
+)
+
 class ResumeImprovementService:
     """
     Service for applying ATS suggestions to improve resume content
@@ -210,67 +667,20 @@ class ResumeImprovementService:
             # Get current skills for context
             current_skills = parsed_resume_data.get("skills", {})
             
-            prompt = f"""
-            You are an expert resume skills specialist. Enhance the skills section based on ATS suggestions.
-            
-            CRITICAL RULES:
-            - Return ONLY valid JSON (no markdown, no code fences, no explanations)
-            - Start your response with {{ and end with }}
-            - Prefer adding skills to EXISTING categories shown in the resume
-            - Do NOT include proficiency modifiers or levels (e.g., "(Advanced)", "Advanced", "Intermediate", "Beginner", "Expert"). Return bare skill names only
-            - If a relevant skills category is missing but needed (e.g., "Core Skills", "Cloud", "Data Engineering"), you MAY create a NEW category object and include its skills
-            - Focus on core, designation-aligned skills first (bare names only) and then tools/frameworks
-            - In the response: Return skills as a DIRECT object with category names as keys (including any NEW categories when necessary)
-            - CRITICAL: ONLY include the NEW skills being added, NOT the existing skills
-            - Format: If existing has "Languages: JavaScript" and you need to add "Java", response should be {"Languages": "Java"} NOT {"Languages": "JavaScript, Java"}
-            - NEVER include existing skills in the response - only show the new skills being added
-            - NEVER use "General" wrapper - return skills directly as category: skills pairs
-            - If a category has no new skills to add, do NOT include that category in the response at all
-            - You MAY introduce new categories only when relevant and missing; name them clearly (e.g., "Core Skills", "Cloud", "Data Engineering")
-            - NEVER suggest "General" as a skill category - avoid generic categories
-            
-            CURRENT SKILLS STRUCTURE:
-            {json.dumps(current_skills, indent=2)}
-            
-            ATS SKILLS SUGGESTIONS TO APPLY:
-            {suggestions_text}
-            
-            REQUIRED OUTPUT FORMAT:
-            Return ONLY the new skills to be added in this exact format:
-            {{
-                "Languages": "Java, Python",
-                "Database": "PostgreSQL",
-                "Cloud": "AWS"
-            }}
-            
-            IMPORTANT: 
-            - Only include categories that have NEW skills to add
-            - Each category value should be a comma-separated string of NEW skills only
-            - Do NOT include existing skills
-            - If no new skills can be added to any category, return {{}}
-            """
-            
-            response = self.model.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "You are an expert resume skills specialist. Generate enhanced skills based on ATS suggestions."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                top_p=0.8,
-                max_tokens=1000
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            
-            # Clean and parse the response
-            if response_text.startswith("```json"):
-                response_text = response_text.replace("```json", "").replace("```", "").strip()
-            elif response_text.startswith("```"):
-                response_text = response_text.replace("```", "").strip()
+            # Categories are free-form keys, so this runs in JSON mode rather than against a strict schema
+            response = self.model.chat.completions.create(**with_response_format({
+                "model": self.model_name,
+                "messages": SKILLS_ENHANCEMENT_PROMPT.messages(
+                    current_skills=json.dumps(current_skills, indent=2),
+                    suggestions_text=suggestions_text
+                ),
+                "temperature": 0.3,
+                "top_p": 0.8,
+                "max_tokens": 1000
+            }, None, "skills_enhancement"))
             
             # Parse the JSON response
-            new_skills = json.loads(response_text)
+            new_skills = parse_structured(response.choices[0].message.content, "improvement.skills", repair_json)
             
             # Log the response for debugging
             logger.info(f"AI returned new skills: {new_skills}")
@@ -316,6 +726,10 @@ class ResumeImprovementService:
         
         logger.info(f"Initial merged skills: {merged_skills}")
         
+        # Canonical keys of every skill already listed, so "JS" is not added next to "JavaScript"
+        taxonomy = get_skill_taxonomy()
+        existing_keys = taxonomy.keys(str(skill) for skills_list in merged_skills.values() for skill in skills_list)
+        
         for category, skills_string in new_skills.items():
             if not skills_string or not isinstance(skills_string, str):
                 logger.info(f"Skipping empty or invalid skills string for category {category}")
@@ -339,15 +753,16 @@ class ResumeImprovementService:
                 merged_skills[category] = []
                 logger.info(f"Converted category {category} to list")
             
-            # Add new skills that don't already exist
-            existing_skills_lower = [s.lower() for s in merged_skills[category]]
+            # Add new skills that don't already exist in any category, under any spelling
             added_skills = []
             for skill in new_skills_list:
-                if skill.lower() not in existing_skills_lower:
+                key = taxonomy.key(skill)
+                if key not in existing_keys:
                     merged_skills[category].append(skill)
                     added_skills.append(skill)
+                    existing_keys.add(key)
                 else:
-                    logger.info(f"Skill '{skill}' already exists in category {category}")
+                    logger.info(f"Skill '{skill}' already exists (as '{taxonomy.display_name(skill)}')")
             
             if added_skills:
                 logger.info(f"Added skills to {category}: {added_skills}")
@@ -392,49 +807,27 @@ class ResumeImprovementService:
         # Process ADD_SKILLS suggestions first to enhance skills section
         enhanced_resume_data = self._process_skills_suggestions(parsed_resume_data, suggestions)
         
-        # Create a comprehensive prompt for resume improvement
-        prompt = self._create_improvement_prompt(enhanced_resume_data, suggestions, ats_analysis, missing_sections)
-        
-        logger.info(f"🔍 DEBUG: Generated prompt length: {len(prompt)} characters")
-        
         try:
-            logger.info("Generating improved resume with OpenAI API")
-            response = self.model.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "You are an expert resume improvement specialist. Generate enhanced resume content based on ATS analysis and suggestions."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                top_p=self.top_p,
-                max_tokens=4000
-            )
-            cleaned_response = self._clean_openai_response(response.choices[0].message.content)
-            
-            # Debug: Log the AI response for repetition analysis
-            logger.info("🔍 DEBUG: AI Response received for resume improvement")
-            logger.info(f"🔍 DEBUG: Response length: {len(cleaned_response)} characters")
-            
-            # Check if the response contains repetition-related changes
-            if "FIX_REPETITION" in cleaned_response:
-                logger.info("🔍 DEBUG: AI response contains FIX_REPETITION references")
+            if OpenAIConfig.RESUME_IMPROVEMENT_MODE == "patch":
+                improved_resume = self._generate_resume_patch(enhanced_resume_data, suggestions, ats_analysis, missing_sections)
             else:
-                logger.info("🔍 DEBUG: AI response does NOT contain FIX_REPETITION references")
-            
-            # Parse the improved resume
-            improved_resume = json.loads(cleaned_response)
-            
-            # Post-generation repetition cleanup loop: ensure no repeated words remain within the same item
-            max_refinement_iterations = 5
-            for iteration in range(max_refinement_iterations):
-                repetition_report = self._detect_repetitions_in_resume(improved_resume)
-                total_issues = sum(sum(words.values()) for words in repetition_report.get("issues_by_item", {}).values())
-                logger.info(f"🔍 DEBUG: Repetition refinement pass {iteration+1} - total repeated word counts: {total_issues}")
-                if total_issues == 0:
+                improved_resume = self._generate_full_resume(enhanced_resume_data, suggestions, ats_analysis, missing_sections)
+            
+            # Post-generation repetition cleanup: local synonym rewrite first, one LLM rephrase for leftovers
+            repetition_report = self._detect_repetitions_in_resume(improved_resume)
+            total_issues = sum(sum(words.values()) for words in repetition_report.get("issues_by_item", {}).values())
+            logger.info(f"🔍 DEBUG: Repetition cleanup - total repeated word counts: {total_issues}")
+            if total_issues:
+                leftover_report = self._rewrite_repetitions_locally(improved_resume, repetition_report)
+                if leftover_report["issues_by_item"]:
+                    logger.info(f"🔍 DEBUG: {len(leftover_report['issues_by_item'])} item(s) need the LLM rephrase")
+                    improved_resume = self._rephrase_resume_to_remove_repetition(improved_resume, leftover_report)
+                    # The rephrase can introduce new repeats; clean those up locally without another call
+                    leftover_report = self._rewrite_repetitions_locally(improved_resume, self._detect_repetitions_in_resume(improved_resume))
+                if leftover_report["issues_by_item"]:
+                    logger.info(f"🔍 DEBUG: Repetitions left after cleanup: {leftover_report['issues_by_item']}")
+                else:
                     logger.info("🔍 DEBUG: No repetition issues remain after refinement")
-                    break
-                # Ask AI to rephrase only flagged items to eliminate repetition with unique synonyms
-                improved_resume = self._rephrase_resume_to_remove_repetition(improved_resume, repetition_report)
             
             # Debug: Check if repetition changes were made
             logger.info("🔍 DEBUG: Analyzing AI response for repetition changes...")
@@ -445,25 +838,105 @@ class ResumeImprovementService:
             
             return improved_resume
             
-        except json.JSONDecodeError as json_error:
-            logger.error(f"Failed to parse improved resume JSON: {str(json_error)}")
-            logger.error(f"Raw response: {cleaned_response}")
-            raise Exception(f"Invalid JSON response from AI: {str(json_error)}")
         except Exception as e:
             logger.error(f"Failed to generate improved resume: {str(e)}")
             raise
     
-    def _create_improvement_prompt(self, parsed_resume_data: Dict[str, Any], suggestions: Dict[str, List[str]], ats_analysis: Dict[str, Any], missing_sections: Dict[str, bool]) -> str:
+    def _generate_full_resume(self, enhanced_resume_data: Dict[str, Any], suggestions: Dict[str, List[str]], ats_analysis: Dict[str, Any], missing_sections: Dict[str, bool]) -> Dict[str, Any]:
+        """
+        Have the model rewrite the whole resume with the suggestions applied (RESUME_IMPROVEMENT_MODE=full)
+        
+        Returns:
+            The rewritten resume as returned by the model
+        """
+        # Create a comprehensive prompt for resume improvement
+        messages = self._create_improvement_messages(enhanced_resume_data, suggestions, ats_analysis, missing_sections)
+        
+        logger.info(f"🔍 DEBUG: Generated prompt length: {sum(len(message['content']) for message in messages)} characters")
+        
+        logger.info("Generating improved resume with OpenAI API")
+        # The improved resume keeps the input's own structure, so this runs in JSON mode
+        completion_kwargs = with_response_format({
+            "model": self.model_name,
+            "messages": messages,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            # The improved resume is a rewrite of the input JSON, so the budget grows with it
+            "max_tokens": adaptive_max_tokens(json.dumps(enhanced_resume_data, ensure_ascii=False), base_tokens=400, output_ratio=1.3)
+        }, None, "improved_resume")
+        response = continue_completion(
+            self.model.chat.completions.create, completion_kwargs, self.model.chat.completions.create(**completion_kwargs)
+        )
+        response_text = response.choices[0].message.content or ""
+        
+        # Debug: Log the AI response for repetition analysis
+        logger.info("🔍 DEBUG: AI Response received for resume improvement")
+        logger.info(f"🔍 DEBUG: Response length: {len(response_text)} characters")
+        
+        # Check if the response contains repetition-related changes
+        if "FIX_REPETITION" in response_text:
+            logger.info("🔍 DEBUG: AI response contains FIX_REPETITION references")
+        else:
+            logger.info("🔍 DEBUG: AI response does NOT contain FIX_REPETITION references")
+        
+        try:
+            return parse_structured(response_text, "improvement.resume", repair_json)
+        except json.JSONDecodeError as json_error:
+            logger.error(f"Failed to parse improved resume JSON: {str(json_error)}")
+            logger.error(f"Raw response: {response_text}")
+            raise Exception(f"Invalid JSON response from AI: {str(json_error)}")
+    
+    def _generate_resume_patch(self, enhanced_resume_data: Dict[str, Any], suggestions: Dict[str, List[str]], ats_analysis: Dict[str, Any], missing_sections: Dict[str, bool]) -> Dict[str, Any]:
+        """
+        Apply the suggestions through targeted edits (RESUME_IMPROVEMENT_MODE=patch)
+        
+        The model returns JSON-Patch-style operations addressed by section and item id instead of
+        the whole resume; they are validated and applied locally, and invalid ones are skipped.
+        
+        Returns:
+            The patched resume
+        """
+        addressable_resume = with_item_ids(enhanced_resume_data)
+        messages = self._create_improvement_messages(addressable_resume, suggestions, ats_analysis, missing_sections, prompt=RESUME_PATCH_PROMPT)
+        
+        logger.info("Generating resume patch with OpenAI API")
+        completion_kwargs = with_response_format({
+            "model": self.model_name,
+            "messages": messages,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            # Only edited fields come back, so the budget is a fraction of the resume
+            "max_tokens": adaptive_max_tokens(json.dumps(addressable_resume, ensure_ascii=False), ResumePatchResponse, base_tokens=300, output_ratio=0.5)
+        }, ResumePatchResponse, "resume_patch")
+        response = continue_completion(
+            self.model.chat.completions.create, completion_kwargs, self.model.chat.completions.create(**completion_kwargs)
+        )
+        response_text = response.choices[0].message.content or ""
+        
+        try:
+            patch = parse_structured(response_text, "improvement.resume_patch", repair_json)
+        except json.JSONDecodeError as json_error:
+            logger.error(f"Failed to parse resume patch JSON: {str(json_error)}")
+            logger.error(f"Raw response: {response_text}")
+            raise Exception(f"Invalid JSON response from AI: {str(json_error)}")
+        
+        operations = patch.get("operations", []) if isinstance(patch, dict) else patch
+        improved_resume, report = apply_resume_patch(addressable_resume, operations)
+        logger.info(f"🩹 Resume patch: {len(response_text)} characters, {report['applied']} operation(s) applied, {len(report['rejected'])} rejected")
+        return improved_resume
+    
+    def _create_improvement_messages(self, parsed_resume_data: Dict[str, Any], suggestions: Dict[str, List[str]], ats_analysis: Dict[str, Any], missing_sections: Dict[str, bool], prompt: Optional[PromptTemplate] = None) -> List[Dict[str, str]]:
         """
-        Create a comprehensive prompt for resume improvement
+        Create the chat messages for resume improvement
         
         Args:
             parsed_resume_data: Original parsed resume data
             suggestions: Extracted suggestions
             ats_analysis: ATS analysis results
+            prompt: Prompt template (RESUME_IMPROVEMENT_PROMPT by default, RESUME_PATCH_PROMPT for patch mode)
             
         Returns:
-            Formatted prompt string
+            Static instruction prefix followed by the user message with this resume's data
         """
         # Convert suggestions to readable format
         suggestions_text = self._format_suggestions_for_prompt(suggestions)
@@ -471,298 +944,16 @@ class ResumeImprovementService:
         # Get the original resume text for context
         original_text = ats_analysis.get("extracted_text", "")
         
-        prompt = f"""
-        You are an expert resume writer and ATS optimization specialist with 15+ years of experience in creating high-impact resumes that achieve 90+ ATS scores and impress recruiters.
-
-        TASK: Dramatically improve the provided resume by applying SPECIFIC ATS suggestions to increase the overall score by 10-15 points while maintaining original structure and content integrity.
-
-        CRITICAL REQUIREMENTS FOR SCORE IMPROVEMENT:
-        - Return ONLY valid JSON (no markdown, no code fences, no explanations)
-        - Maintain the exact same structure as the original parsed resume data
-        - Apply EVERY suggestion with precision and industry-specific enhancements
-        - Transform generic descriptions into quantified, keyword-rich, achievement-focused content
-        - Ensure the improved resume achieves 90+ ATS compatibility
-        - Keep the same field names and structure as the input
-        - For projects: ALWAYS include techStack as a comma-separated string of technologies
-        - MANDATORY: Apply ALL suggestions from the ATS analysis with specific improvements
-        - ENHANCE every bullet point with quantified metrics and industry keywords
-        - OPTIMIZE every section for maximum ATS score improvement
-        - **CRITICAL FORMATTING**: For ALL description fields (experience, projects, education, activities, etc.), format each sentence to end with \\n (newline character). This ensures proper bullet point formatting in the frontend.
-
-        ORIGINAL RESUME DATA:
-        {json.dumps(parsed_resume_data, indent=2)}
-
-        ORIGINAL RESUME TEXT:
-        {original_text}
-
-        ATS SUGGESTIONS TO APPLY:
-        {suggestions_text}
-
-        ATS ANALYSIS SUMMARY:
-        - Overall Score: {ats_analysis.get('overall_score', 'N/A')}
-        - Strengths: {', '.join(ats_analysis.get('strengths', [])[:3])}
-        - Weaknesses: {', '.join(ats_analysis.get('weaknesses', [])[:3])}
-        
-        MISSING SECTIONS DETECTED:
-        - Projects Section Missing: {missing_sections.get('projects', False)}
-        - Certificates Section Missing: {missing_sections.get('certificates', False)}
-
-        SCORE-BOOSTING IMPROVEMENT GUIDELINES (Target: 90+ ATS Score):
-        1. ACHIEVEMENTS & IMPACT METRICS (High Impact):
-           - Transform EVERY bullet point to include specific numbers, percentages, and quantifiable results
-           - Add measurable outcomes with industry-standard metrics (ROI, efficiency gains, cost savings)
-           - Include timeframes, team sizes, budget amounts, and scale of impact
-           - Use power words: "increased", "optimized", "achieved", "delivered", "exceeded"
-           - **DESCRIPTION FORMATTING**: Each responsibility/achievement should be a separate sentence ending with \\n
-
-        2. KEYWORD OPTIMIZATION (Critical for ATS):
-           - Integrate 15-20 relevant industry keywords naturally throughout all sections
-           - Use technical terms, software names, methodologies, and industry-specific language
-           - Include variations and synonyms of important terms
-           - Add trending industry keywords and certifications
-           - Optimize for both technical and soft skills mentioned in job descriptions
-
-        3. SECTION ENHANCEMENT (ATS Structure):
-           - Ensure every section has robust, keyword-rich content
-           - Add industry-specific terminology to job titles and descriptions
-            - Include technical skills (bare names only, no proficiency levels)
-           - Enhance education with relevant coursework and achievements
-           - Add certifications, training, and professional development
-
-        4. CLARITY & PROFESSIONAL LANGUAGE:
-           - Rewrite weak descriptions with powerful, action-oriented language
-           - Use industry-standard terminology and professional phrasing
-           - Eliminate vague terms like "helped", "assisted", "worked on"
-           - Replace with specific action verbs and concrete accomplishments
-
-        5. ATS COMPATIBILITY OPTIMIZATION:
-           - Use standard section headers recognized by ATS systems
-           - Ensure consistent formatting and structure
-           - Add location information where missing
-           - Include complete contact information
-           - Use standard date formats: MUST be in "MMM YYYY" format (e.g., "Jan 2025", "Dec 2024") - convert all other formats like "2025-01", "01/2025", "January 2025", "2025" to this format
-
-        7. MISSING SECTIONS - ADD DUMMY DATA:
-           - If PROJECTS section is missing, add 2-3 realistic projects with:
-             * Project name and detailed description (8-10 lines)
-             * techStack: Comma-separated string of technologies used (e.g., "React, Node.js, MongoDB, AWS")
-             * Key achievements or outcomes with specific metrics
-             * Start date and end date (format: "Aug 2020 - Sep 2020")
-             * Detailed project description including:
-               - Project overview and objectives
-               - Technical challenges faced and solutions implemented
-               - Specific features developed
-               - Performance improvements achieved
-               - User impact and business value
-               - Lessons learned and skills gained
-             * Make projects relevant to their field and experience level
-           - If CERTIFICATES section is missing, add 2-3 relevant certifications with:
-             * Certification name and issuing organization
-             * Date obtained or expiration date
-             * Brief description of skills gained
-             * Choose certifications relevant to their industry and role
-           - Generate realistic, professional dummy data that matches the person's field/experience
-           - Ensure dummy data is relevant to their industry and skill level
-           - Make the dummy data sound authentic and professional
-           - Base dummy data on their existing skills, experience, and job titles
-           - Use appropriate project types and certification names for their field
-           - For project dates: Use realistic timeframes (1-6 months duration)
-           - Ensure project dates don't overlap with their work experience dates
-           - Make project descriptions comprehensive and detailed (8-10 lines each)
-           - Include specific technical details and business impact in descriptions
-
-        REQUIRED OUTPUT FORMAT:
-         Return the improved resume data in the EXACT format expected by the frontend ResumeBuilderPage.tsx interface:
-
-         {{
-           "basicDetails": {{
-             "fullName": "string",
-             "professionalTitle": "string", 
-             "phone": "string",
-             "email": "string",
-             "location": "string",
-             "website": "string",
-             "github": "string",
-             "linkedin": "string",
-             "profilePicture": "string (optional)"
-           }},
-           "summary": "string",
-           "objective": "string",
-           "experience": [
-             {{
-               "id": "string",
-               "company": "string",
-               "position": "string", 
-               "startDate": "string",
-               "endDate": "string",
-               "description": "string",
-               "location": "string"
-             }}
-           ],
-           "education": [
-             {{
-               "id": "string",
-               "institution": "string",
-               "degree": "string",
-               "year": "string",
-               "description": "string",
-               "grade": "string",
-               "location": "string"
-             }}
-           ],
-           "skills": "object or array - maintain original format",
-           "languages": [
-             {{
-               "name": "string",
-               "proficiency": "string"
-             }}
-           ],
-           "activities": [
-             {{
-               "id": "string",
-               "title": "string",
-               "description": "string"
-             }}
-           ],
-           "projects": [
-             {{
-               "id": "string",
-               "name": "string",
-               "techStack": "string",
-               "startDate": "string",
-               "endDate": "string", 
-               "description": "string",
-               "link": "string"
-             }}
-           ],
-           "certifications": [
-             {{
-               "id": "string",
-               "certificateName": "string",
-               "link": "string",
-               "issueDate": "string",
-               "instituteName": "string"
-             }}
-           ],
-           "references": [
-             {{
-               "id": "string",
-               "name": "string",
-               "title": "string",
-               "company": "string",
-               "phone": "string",
-               "email": "string",
-               "relationship": "string"
-             }}
-           ],
-           "customSections": [
-             {{
-               "id": "string",
-               "title": "string",
-               "type": "text|list|timeline|grid|mixed",
-               "position": "number",
-               "content": {{
-                 "text": "string (optional)",
-                 "items": [
-                   {{
-                     "id": "string",
-                     "title": "string (optional)",
-                     "subtitle": "string (optional)",
-                     "description": "string (optional)",
-                     "startDate": "string (optional)",
-                     "endDate": "string (optional)",
-                     "location": "string (optional)",
-                     "link": "string (optional)",
-                     "bullets": ["string"],
-                     "tags": ["string"]
-                   }}
-                 ],
-                 "columns": [
-                   {{
-                     "title": "string",
-                     "items": ["string"]
-                   }}
-                 ]
-               }},
-               "styling": {{
-                 "showBullets": "boolean (optional)",
-                 "showDates": "boolean (optional)",
-                 "showLocation": "boolean (optional)",
-                 "showLinks": "boolean (optional)",
-                 "showTags": "boolean (optional)",
-                 "layout": "vertical|horizontal|grid (optional)"
-               }}
-             }}
-           ]
-         }}
-
-         CRITICAL REQUIREMENTS:
-         - Use EXACT field names as shown above (e.g., "basicDetails", "fullName", "professionalTitle", etc.)
-         - Generate unique IDs for all array items using uuid-like strings
-         - Maintain the exact structure and nesting as shown
-         - For missing sections, add empty arrays with proper structure
-         - Ensure all required fields are present even if empty
-         - Use the frontend's expected data types (strings, arrays, objects)
-
-        CRITICAL: APPLY ONLY ATS SUGGESTIONS - NO SELF-ENHANCEMENT:
-        - Apply ONLY the specific suggestions provided in the ATS analysis
-        - Do NOT add any improvements that are not explicitly mentioned in the suggestions
-        - Do NOT enhance sections unless there is a specific suggestion to do so
-        - PRESERVE all original content unless explicitly told to change it in the suggestions
-        - Follow ATS suggestions exactly as written without adding extra improvements
-        - MANDATORY: When "OPTIMIZE_DESCRIPTION" suggestions are provided for projects, experience, or summary - apply them precisely
-        - EXPAND short descriptions by adding specific details, technical information, and quantified outcomes
-        - COMPRESS long descriptions by focusing on key achievements and removing redundant information
-        - **CRITICAL FOR REPETITION FIXES**: When FIX_REPETITION suggestions are provided:
-          * Apply EVERY single FIX_REPETITION suggestion without exception
-          * If the ATS analysis detected 15 repeated words, apply ALL 15 fixes
-          * Replace each repeated word with the exact alternatives provided in the suggestion
-          * Do NOT skip any repetition fixes - this is mandatory for ATS score improvement
-          * Do NOT introduce new repetition: For each replacement, choose alternatives that are NOT already used elsewhere in the SAME section (Experience, Projects, Summary, etc.)
-          * Distribute different alternatives across instances so that no chosen synonym appears more than once within the same section
-          * Prefer alternatives that also maintain variety across the entire resume; if an alternative appears 2+ times elsewhere in the same section after replacement, select a different synonym
-          * Verify that all repeated words have been replaced before finalizing the response
-
-        COMPREHENSIVE SUGGESTION APPLICATION RULES:
-        - For "ADD_SKILLS" suggestions: Add ONLY the specific skills mentioned in the suggestion
-        - For "STRUCTURE_SKILLS" suggestions: Reorganize unstructured skills into proper categories (Technical, Soft Skills, Tools, Frameworks)
-        - For "ENHANCE_ACHIEVEMENT" suggestions: Replace ONLY with the exact text provided in the suggestion
-        - For "ADD_KEYWORDS" suggestions: Add ONLY the keywords explicitly mentioned in the suggestion
-        - For "IMPROVE_EXPERIENCE" suggestions: Make ONLY the changes specified in the suggestion
-        - For "ENHANCE_PROJECT" suggestions: Apply ONLY the specific enhancements mentioned
-        - For "REWRITE_SUMMARY" suggestions: Use ONLY the provided replacement text
-        - For "FIX_CONTACT" suggestions: Fix ONLY the issues specifically mentioned
-        - For "ADD_DATES" suggestions: Add missing dates to ALL sections mentioned in the suggestion
-        - For "ADD_PROJECT_DATES" suggestions: Add dummy start and end dates to projects with realistic 2-4 month durations
-        - For "ADD_ORGANIZATION" suggestions: Infer and add organizations for certificates based on certificate names
-        - For "OPTIMIZE_DESCRIPTION" suggestions: Enhance descriptions that are too short or too long as specified - expand short descriptions, compress long descriptions
-        - For "FIX_REPETITION" suggestions: **CRITICAL - REPLACE ALL INSTANCES OF EVERY REPEATED WORD**:
-          * Apply EVERY FIX_REPETITION suggestion provided in the ATS analysis
-          * If 15 repeated words are detected, apply ALL 15 fixes - NO EXCEPTIONS
-          * Replace each repeated word with the specific alternatives mentioned in the suggestion
-          * Ensure NO repeated words remain after applying fixes
-          * Use the exact replacement words provided in the FIX_REPETITION suggestions, but ensure the chosen synonyms are NOT repeated elsewhere in the same section
-          * Apply fixes to ALL sections where the repeated words appear
-          * Distribute different alternatives across multiple occurrences to maximize variety
-          * **MANDATORY**: Count and verify that ALL repeated words have been replaced and that no new synonym appears more than once per section
-        - For "FIX_FORMATTING" suggestions: Fix ONLY the formatting issues specifically mentioned
-        - For "FIX_GRAMMAR" suggestions: Fix ONLY the grammar errors specifically mentioned
-        - For "FIX_DATE_FORMAT" suggestions: Convert ALL dates to "MMM YYYY" format (e.g., "Jan 2025", "Dec 2024") - convert dates like "2025-01" to "Jan 2025", "01/2025" to "Jan 2025", "January 2025" to "Jan 2025", "2025" to "Jan 2025"
-        - CRITICAL: If no suggestion exists for a section, leave it completely unchanged
-
-        **REPETITION FIXES VERIFICATION CHECKLIST**:
-        Before finalizing your response, verify that:
-        1. ALL FIX_REPETITION suggestions from the ATS analysis have been applied
-        2. Every repeated word mentioned in the suggestions has been replaced
-        3. No repeated words remain in the final resume
-        4. All replacement words are used exactly as specified in the suggestions
-        5. The total number of repetition fixes applied matches the number of FIX_REPETITION suggestions provided
-
-        Focus on making TRANSFORMATIVE improvements that directly address ATS scoring criteria while maintaining professional authenticity.
-        Ensure all improvements align with the specific feedback provided in the ATS analysis.
-        """
-
-        return prompt
+        return (prompt or RESUME_IMPROVEMENT_PROMPT).messages(
+            resume_data=json.dumps(parsed_resume_data, indent=2),
+            original_text=original_text,
+            suggestions_text=suggestions_text,
+            overall_score=ats_analysis.get('overall_score', 'N/A'),
+            strengths=', '.join(ats_analysis.get('strengths', [])[:3]),
+            weaknesses=', '.join(ats_analysis.get('weaknesses', [])[:3]),
+            projects_missing=missing_sections.get('projects', False),
+            certificates_missing=missing_sections.get('certificates', False)
+        )
     
     def _format_suggestions_for_prompt(self, suggestions: Dict[str, List[str]]) -> str:
         """
@@ -847,54 +1038,6 @@ class ResumeImprovementService:
         
         return formatted_text
     
-    def _clean_openai_response(self, response_text: str) -> str:
-        """Clean OpenAI API response to extract valid JSON"""
-        logger.info(f"Cleaning OpenAI response of {len(response_text)} characters")
-        
-        # Remove markdown code blocks
-        if response_text.startswith("```json"):
-            response_text = response_text.replace("```json", "").replace("```", "")
-        elif response_text.startswith("```"):
-            response_text = response_text.replace("```", "")
-
-        response_text = response_text.strip()
-        
-        # Try to find JSON content within markdown blocks
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            try:
-                parsed = json.loads(json_content)
-                logger.info(f"Successfully extracted JSON from markdown block: {len(json_content)} characters")
-                return json_content
-            except json.JSONDecodeError:
-                logger.warning("Extracted JSON from markdown block is invalid")
-        
-        # Try to find the complete JSON response
-        if response_text.startswith('{') and response_text.endswith('}'):
-            try:
-                parsed = json.loads(response_text)
-                logger.info(f"Successfully parsed complete JSON: {len(response_text)} characters")
-                return response_text
-            except json.JSONDecodeError:
-                logger.warning("Complete JSON parsing failed")
-        
-        # Try to find JSON object in the text
-        json_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            json_content = match.group(1).strip()
-            try:
-                parsed = json.loads(json_content)
-                logger.info(f"Successfully extracted JSON object: {len(json_content)} characters")
-                return json_content
-            except json.JSONDecodeError:
-                logger.warning("Extracted JSON object is invalid")
-        
-        logger.warning("Could not extract valid JSON from AI response")
-        return '{"error": "Invalid JSON response", "message": "Could not parse AI response"}'
-    
     def _validate_improved_resume(self, improved_resume: Dict[str, Any], original_resume: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and enhance the improved resume to match frontend format exactly
@@ -1043,25 +1186,11 @@ class ResumeImprovementService:
         
         # Map projects with IDs - prioritize improved data
         if "projects" in improved_resume and isinstance(improved_resume["projects"], list):
+            # Empty tech stacks are filled locally, with one batched LLM call for the rest
+            tech_stacks = self._resolve_project_tech_stacks(improved_resume["projects"], frontend_format.get("skills"))
             for i, project in enumerate(improved_resume["projects"]):
                 if isinstance(project, dict):
-                    # Convert tech stack to string if it's an array
-                    tech_stack = project.get("tech_stack", project.get("technologies", project.get("techStack", "")))
-                    if isinstance(tech_stack, list):
-                        tech_stack = ", ".join(tech_stack)
-                    
-                    # If tech stack is empty, try to extract from description
-                    if not tech_stack or tech_stack.strip() == "":
-                        description = project.get("description", "")
-                        if description:
-                            tech_stack = self._extract_tech_stack_from_description(description)
-                    
-                    # If still empty, generate tech stack based on project name and description
-                    if not tech_stack or tech_stack.strip() == "":
-                        project_name = project.get("name", "")
-                        description = project.get("description", "")
-                        if project_name or description:
-                            tech_stack = self._generate_tech_stack_for_project(project_name, description, frontend_format.get("skills"))
+                    tech_stack = tech_stacks[i]
                     
                     # Ensure project dates are present - add dummy dates if missing
                     start_date = project.get("start_date", project.get("startDate", ""))
@@ -1082,25 +1211,10 @@ class ResumeImprovementService:
                     })
         elif "projects" in original_resume and isinstance(original_resume["projects"], list):
             # Fallback to original projects if no improved projects
+            tech_stacks = self._resolve_project_tech_stacks(original_resume["projects"], frontend_format.get("skills"))
             for i, project in enumerate(original_resume["projects"]):
                 if isinstance(project, dict):
-                    # Convert tech stack to string if it's an array
-                    tech_stack = project.get("tech_stack", project.get("technologies", project.get("techStack", "")))
-                    if isinstance(tech_stack, list):
-                        tech_stack = ", ".join(tech_stack)
-                    
-                    # If tech stack is empty, try to extract from description
-                    if not tech_stack or tech_stack.strip() == "":
-                        description = project.get("description", "")
-                        if description:
-                            tech_stack = self._extract_tech_stack_from_description(description)
-                    
-                    # If still empty, generate tech stack based on project name and description
-                    if not tech_stack or tech_stack.strip() == "":
-                        project_name = project.get("name", "")
-                        description = project.get("description", "")
-                        if project_name or description:
-                            tech_stack = self._generate_tech_stack_for_project(project_name, description, frontend_format.get("skills"))
+                    tech_stack = tech_stacks[i]
                     
                     frontend_format["projects"].append({
                         "id": str(uuid.uuid4()),
@@ -1307,76 +1421,45 @@ class ResumeImprovementService:
         
         return resume_data
 
-    def _extract_tech_stack_from_description(self, description: str) -> str:
+    def _resolve_project_tech_stacks(self, projects: List[Any], skills: Any = None) -> List[str]:
         """
-        Extract tech stack from project description using AI analysis
+        Tech stack string for every project, filling empty ones without a call per project
         
-        Args:
-            description: Project description text
-            
-        Returns:
-            Comma-separated string of technologies found
-        """
-        if not description or not description.strip():
-            return ""
-        
-        try:
-            prompt = f"""
-            Analyze the following project description and extract all technologies, frameworks, programming languages, tools, and platforms mentioned.
-            
-            PROJECT DESCRIPTION:
-            {description}
-            
-            Return ONLY a comma-separated list of technologies found. Do not include explanations or additional text.
-            Examples of what to extract:
-            - Programming languages: Python, JavaScript, Java, C++, etc.
-            - Frameworks: React, Angular, Django, Spring, etc.
-            - Databases: MySQL, MongoDB, PostgreSQL, etc.
-            - Cloud platforms: AWS, Azure, GCP, etc.
-            - Tools: Docker, Kubernetes, Git, Jenkins, etc.
-            - Libraries: NumPy, Pandas, Express.js, etc.
-            
-            If no technologies are found, return an empty string.
-            """
-            
-            response = self.model.chat.completions.create(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                top_p=0.8,
-                max_tokens=200
-            )
-            
-            tech_stack = response.choices[0].message.content.strip()
-            
-            # Clean up the response
-            tech_stack = tech_stack.replace('"', '').replace("'", "").strip()
-            
-            # Remove any non-technology words and clean up
-            tech_terms = []
-            for term in tech_stack.split(','):
-                term = term.strip()
-                if term and len(term) > 1 and not term.lower() in ['and', 'or', 'with', 'using', 'built', 'developed', 'created']:
-                    tech_terms.append(term)
-            
-            return ', '.join(tech_terms) if tech_terms else ""
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract tech stack from description: {e}")
-            return ""
-
-    def _generate_tech_stack_for_project(self, project_name: str, description: str, skills: Any = None) -> str:
-        """
-        Generate appropriate tech stack for a project based on name, description, and existing skills
+        A stack the project already has is kept. Empty ones are extracted from the name and
+        description with the local technology dictionary; projects that mention no known
+        technology are sent to the LLM together in one request.
         
         Args:
-            project_name: Name of the project
-            description: Project description
-            skills: Existing skills from resume (optional)
+            projects: Project entries (non-dict entries get an empty string)
+            skills: Skills from the resume, offered to the LLM for projects it has to suggest a stack for
             
         Returns:
-            Comma-separated string of suggested technologies
+            Comma-separated tech stacks, aligned with projects
         """
+        tech_stacks: List[str] = []
+        pending: List[Dict[str, Any]] = []
+        for index, project in enumerate(projects):
+            if not isinstance(project, dict):
+                tech_stacks.append("")
+                continue
+            # Convert tech stack to string if it's an array
+            tech_stack = project.get("tech_stack", project.get("technologies", project.get("techStack", "")))
+            if isinstance(tech_stack, list):
+                tech_stack = ", ".join(str(item) for item in tech_stack)
+            tech_stack = tech_stack if isinstance(tech_stack, str) else ""
+            
+            if not tech_stack.strip():
+                project_name = project.get("name", "") or ""
+                description = project.get("description", "") or ""
+                tech_stack = format_tech_stack(extract_tech_stack(f"{project_name}\n{description}"))
+                if not tech_stack and (project_name or description):
+                    pending.append({"index": index, "name": project_name, "description": description})
+            tech_stacks.append(tech_stack)
+        
+        logger.info(f"🧰 Tech stacks: {len(projects) - len(pending)} project(s) resolved locally, {len(pending)} sent to the LLM")
+        if not pending:
+            return tech_stacks
+        
         try:
             # Extract skills from the skills object if provided
             skill_list = []
@@ -1384,61 +1467,36 @@ class ResumeImprovementService:
                 if isinstance(skills, dict):
                     for category, skill_array in skills.items():
                         if isinstance(skill_array, list):
-                            skill_list.extend(skill_array)
+                            skill_list.extend(str(skill) for skill in skill_array)
                 elif isinstance(skills, list):
-                    skill_list = skills
+                    skill_list = [str(skill) for skill in skills]
             
             skills_text = ", ".join(skill_list) if skill_list else "No specific skills mentioned"
             
-            prompt = f"""
-            Based on the project name, description, and available skills, suggest an appropriate tech stack.
-            
-            PROJECT NAME: {project_name}
-            PROJECT DESCRIPTION: {description}
-            AVAILABLE SKILLS: {skills_text}
-            
-            Return ONLY a comma-separated list of 3-6 relevant technologies that would be appropriate for this project.
-            Choose technologies that:
-            1. Match the project description and requirements
-            2. Are commonly used together
-            3. Are relevant to the project type
-            4. Include both frontend and backend technologies if applicable
-            
-            Examples:
-            - Web app: "React, Node.js, MongoDB, Express.js, AWS"
-            - Data science: "Python, Pandas, NumPy, Jupyter, Scikit-learn"
-            - Mobile app: "React Native, JavaScript, Firebase, Redux"
-            - Backend API: "Python, Django, PostgreSQL, Docker, AWS"
-            
-            If no clear technologies can be determined, return an empty string.
-            """
-            
-            response = self.model.chat.completions.create(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                top_p=0.8,
-                max_tokens=150
-            )
-            
-            tech_stack = response.choices[0].message.content.strip()
-            
-            # Clean up the response
-            tech_stack = tech_stack.replace('"', '').replace("'", "").strip()
-            
-            # Remove any non-technology words and clean up
-            tech_terms = []
-            for term in tech_stack.split(','):
-                term = term.strip()
-                if term and len(term) > 1 and not term.lower() in ['and', 'or', 'with', 'using', 'built', 'developed', 'created']:
-                    tech_terms.append(term)
-            
-            return ', '.join(tech_terms) if tech_terms else ""
-            
+            response = self.model.chat.completions.create(**with_response_format({
+                "model": self.model_name,
+                "messages": TECH_STACK_BATCH_PROMPT.messages(skills_text=skills_text, projects=json.dumps(pending, ensure_ascii=False)),
+                "temperature": 0.2,
+                "top_p": 0.8,
+                "max_tokens": 80 * len(pending) + 100
+            }, TechStackBatchResponse, "tech_stack_batch"))
+            
+            result = parse_structured(response.choices[0].message.content, "improvement.batch_tech_stack", repair_json)
+            pending_indices = {entry["index"] for entry in pending}
+            for entry in result.get("projects") or []:
+                if not isinstance(entry, dict):
+                    continue
+                index = entry.get("index")
+                technologies = entry.get("tech_stack")
+                if isinstance(technologies, str):
+                    technologies = technologies.split(",")
+                if index in pending_indices and isinstance(technologies, list):
+                    tech_stacks[index] = format_tech_stack(technologies)
         except Exception as e:
-            logger.warning(f"Failed to generate tech stack for project: {e}")
-            return ""
-    
+            logger.warning(f"Failed to generate tech stacks for {len(pending)} project(s): {e}")
+        
+        return tech_stacks
+
     def get_improvement_summary(self, original_resume: Dict[str, Any], improved_resume: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate a summary of improvements made to the resume
@@ -1582,43 +1640,11 @@ class ResumeImprovementService:
         Detect repeated action verbs and professional terms within the same item (experience/project/summary).
         Returns a report with per-item repeated words and counts.
         """
-        import re
-        from collections import Counter
-        action_verbs = {
-            'implemented', 'managed', 'developed', 'created', 'built', 'designed', 'led', 'executed', 'delivered',
-            'optimized', 'improved', 'enhanced', 'streamlined', 'automated', 'deployed', 'integrated', 'configured',
-            'maintained', 'monitored', 'analyzed', 'resolved', 'coordinated', 'collaborated', 'mentored', 'trained',
-            'established', 'initiated', 'launched', 'completed', 'achieved', 'increased', 'reduced', 'saved',
-            'transformed', 'migrated', 'upgraded', 'refactored', 'debugged', 'tested', 'validated', 'verified',
-            'documented', 'presented', 'communicated', 'facilitated', 'supervised', 'directed', 'guided', 'influenced',
-            'negotiated', 'planned', 'organized', 'scheduled', 'prioritized', 'evaluated', 'assessed', 'reviewed',
-            'recommended', 'proposed', 'suggested', 'identified', 'discovered', 'investigated', 'researched',
-            'studied', 'learned', 'acquired', 'gained', 'obtained', 'secured', 'earned', 'won', 'received'
-        }
-        professional_terms = {
-            'scalable', 'secure', 'efficient', 'robust', 'reliable', 'flexible', 'comprehensive', 'advanced',
-            'innovative', 'cutting-edge', 'state-of-the-art', 'high-performance', 'enterprise-grade', 'mission-critical',
-            'cost-effective', 'user-friendly', 'intuitive', 'seamless', 'integrated', 'automated', 'streamlined',
-            'optimized', 'enhanced', 'improved', 'upgraded', 'modernized', 'standardized', 'centralized',
-            'distributed', 'cloud-based', 'web-based', 'mobile-first', 'responsive', 'cross-platform',
-            'real-time', 'high-availability', 'fault-tolerant', 'load-balanced', 'microservices', 'api-driven'
-        }
-        common_words = {
-            'and', 'in', 'with', 'of', 'to', 'for', 'on', 'by', 'the', 'a', 'an', 'is', 'are', 'was', 'were',
-            'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'may', 'might', 'can', 'must', 'shall', 'this', 'that', 'these', 'those'
-        }
-
         def count_repeats(text: str) -> Dict[str, int]:
             if not text:
                 return {}
-            words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-            counts = Counter(words)
-            repeats = {}
-            for w, c in counts.items():
-                if c >= 2 and w not in common_words and (w in action_verbs or w in professional_terms):
-                    repeats[w] = c
-            return repeats
+            action_verb_reps, professional_term_reps = find_repetitions(tokenize(text))
+            return {**action_verb_reps, **professional_term_reps}
 
         issues_by_item: Dict[str, Dict[str, int]] = {}
 
@@ -1655,6 +1681,47 @@ class ResumeImprovementService:
 
         return {"issues_by_item": issues_by_item}
 
+    def _rewrite_repetitions_locally(self, resume: Dict[str, Any], repetition_report: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rewrite flagged items in place with the deterministic synonym rewriter
+
+        Synonyms chosen for one item are avoided in the next where possible, so items of the
+        same resume do not all end up with the same replacement verbs.
+
+        Args:
+            resume: Resume to rewrite (modified in place)
+            repetition_report: Report from _detect_repetitions_in_resume
+
+        Returns:
+            Report in the same format with only the repetitions the rewriter could not fix
+        """
+        leftovers: Dict[str, Dict[str, int]] = {}
+        chosen: set = set()
+        for key, words in repetition_report.get("issues_by_item", {}).items():
+            match = re.match(r'^(\w+)\[(\d+)\]$', key)
+            if match:
+                items = resume.get(match.group(1))
+                index = int(match.group(2))
+                if not isinstance(items, list) or index >= len(items) or not isinstance(items[index], dict):
+                    leftovers[key] = words
+                    continue
+                container, field = items[index], "description"
+            else:
+                container, field = resume, key
+            text = container.get(field)
+            if not isinstance(text, str):
+                leftovers[key] = words
+                continue
+
+            rewritten, report = rewrite_repetitions(text, avoid=chosen)
+            container[field] = rewritten
+            for synonyms in report["replacements"].values():
+                chosen.update(synonyms)
+            if report["unresolved"]:
+                leftovers[key] = report["unresolved"]
+        logger.info(f"🔍 DEBUG: Local repetition rewrite fixed {len(repetition_report.get('issues_by_item', {})) - len(leftovers)} item(s), {len(leftovers)} left")
+        return {"issues_by_item": leftovers}
+
     def _rephrase_resume_to_remove_repetition(self, resume: Dict[str, Any], repetition_report: Dict[str, Any]) -> Dict[str, Any]:
         """
         Ask the model to rephrase only the flagged items to eliminate repeated words with unique synonyms.
@@ -1708,43 +1775,15 @@ class ResumeImprovementService:
                     if isinstance(resume.get(alt_key), list):
                         _append_all_projects_from(alt_key)
 
-            prompt = f"""
-            You are refining resume text to eliminate repeated action verbs and professional terms WITHIN the same item, and also ensure cross-project uniqueness of action verbs.
-            
-            RULES:
-            - Rephrase each provided item to remove all repeated words by using varied, professional synonyms.
-            - Chosen synonyms must not repeat within the same item; distribute alternatives across sentences.
-            - Across all project descriptions, ensure different action verbs are used per project. If two projects would share the same main verb (e.g., "built"), change one to a different professional verb (e.g., "engineered", "developed").
-            - When creating content for a new project (if any are missing and need to be added elsewhere), avoid reusing action verbs already present elsewhere in the resume (summary, experience, other projects). Prefer fresh, professional verbs.
-            - Do not change facts, companies, or technologies; only rephrase verbs/phrases.
-            - Keep bullets/sentences count and order consistent; end each sentence with a newline (\n).
-            - Return ONLY valid JSON with this structure and no extra commentary.
-            
-            INPUT:
-            {json.dumps(payload, ensure_ascii=False)}
-            
-            OUTPUT FORMAT:
-            {{
-              "experience": [{{"index": number, "description": "string"}}],
-              "projects": [{{"index": number, "description": "string"}}],
-              "summary": "string",
-              "objective": "string"
-            }}
-            """
-
-            response = self.model.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "You rephrase resume items to remove repetition using unique synonyms within each item."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                top_p=0.8,
-                max_tokens=1200
-            )
+            response = self.model.chat.completions.create(**with_response_format({
+                "model": self.model_name,
+                "messages": REPETITION_REPHRASE_PROMPT.messages(payload=json.dumps(payload, ensure_ascii=False)),
+                "temperature": 0.2,
+                "top_p": 0.8,
+                "max_tokens": 1200
+            }, RepetitionRephraseResponse, "repetition_rephrase"))
 
-            text = self._clean_openai_response(response.choices[0].message.content)
-            patch = json.loads(text)
+            patch = parse_structured(response.choices[0].message.content, "improvement.rephrase_repetitions", repair_json)
 
             # Apply returned descriptions
             if isinstance(patch.get("experience"), list):
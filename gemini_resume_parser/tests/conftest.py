@@ -0,0 +1,13 @@
+"""
+Shared pytest setup
+The package modules import each other as top-level packages (config, services, utils), so the
+package directory goes on sys.path. The LLM response cache is disabled so timings and call
+counts see every request.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["LLM_CACHE_BACKEND"] = "none"
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
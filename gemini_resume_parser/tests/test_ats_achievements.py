@@ -0,0 +1,81 @@
+"""
+Batched FIX_ACHIEVEMENT generation: one request for every achievement, and only the items that
+come back missing or malformed are retried one by one.
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+from services.ats_service import _augment_achievement_suggestions_with_debug
+
+ACHIEVEMENTS = [
+    "Improved the onboarding flow for new customers",
+    "Reduced support tickets by reworking the help center",
+    "Migrated the billing system to a new provider",
+    "Mentored junior developers on the platform team",
+]
+
+
+def _response(content: str):
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+class FakeClient:
+    """Answers the batch with a1 valid, a2 malformed, a3 multi-line, a4 missing (plus an unknown id)"""
+
+    def __init__(self, batch_content=None):
+        self.batch_calls = 0
+        self.single_excerpts = []
+        self.batch_content = batch_content
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        user = kwargs["messages"][-1]["content"]
+        if user.startswith("Achievements:"):
+            self.batch_calls += 1
+            if self.batch_content is not None:
+                return _response(self.batch_content)
+            return _response(json.dumps({"lines": [
+                {"id": "a1", "line": "FIX_ACHIEVEMENT: Experience - Achievement 'Improved' lacks metrics - Add quantified impact: 'batched one'"},
+                {"id": "a2", "line": "Here is your suggestion"},
+                {"id": "a3", "line": "FIX_ACHIEVEMENT: first line\nsecond line"},
+                {"id": "a9", "line": "FIX_ACHIEVEMENT: unknown id"},
+            ]}))
+        excerpt = re.search(r"Achievement excerpt: (.*?)\.\.\.", user).group(1)
+        self.single_excerpts.append(excerpt)
+        return _response(f"FIX_ACHIEVEMENT: Experience - Achievement '{excerpt}' lacks metrics - Add quantified impact: 'single'")
+
+
+def _augment(client, batched=True):
+    debug = {"unquantified_achievements": {"experience": list(ACHIEVEMENTS)}, "debug_info": {}}
+    response = _augment_achievement_suggestions_with_debug(
+        {"category_scores": {}}, debug, "", client, "fake-model", 0.1, 0.8, batched=batched
+    )
+    return response["detailed_feedback"]["achievements_impact_metrics"]["suggestions"]
+
+
+def test_only_malformed_batch_items_are_retried_individually():
+    client = FakeClient()
+    suggestions = _augment(client)
+    assert client.batch_calls == 1
+    assert client.single_excerpts == [achievement[:50] for achievement in ACHIEVEMENTS[1:]]
+    assert len(suggestions) == len(ACHIEVEMENTS)
+    assert suggestions[0].endswith("'batched one'")
+    assert all(line.startswith("FIX_ACHIEVEMENT:") and "\n" not in line for line in suggestions)
+
+
+def test_unparseable_batch_falls_back_to_every_item():
+    client = FakeClient(batch_content="not json at all")
+    suggestions = _augment(client)
+    assert client.batch_calls == 1
+    assert len(client.single_excerpts) == len(ACHIEVEMENTS)
+    assert len(suggestions) == len(ACHIEVEMENTS)
+
+
+def test_unbatched_mode_makes_one_call_per_achievement():
+    client = FakeClient()
+    suggestions = _augment(client, batched=False)
+    assert client.batch_calls == 0
+    assert len(client.single_excerpts) == len(suggestions) == len(ACHIEVEMENTS)
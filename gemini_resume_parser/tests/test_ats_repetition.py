@@ -0,0 +1,121 @@
+"""
+FIX_REPETITION augmentation against a fake OpenAI client: concurrent generation is faster
+than sequential, and alternatives stay unique across words even when the model repeats itself
+(including with the LLM response cache enabled, which must not answer repairs).
+"""
+
+import itertools
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+import utils.response_cache
+from services.ats_service import FIX_REPETITION_REPAIR_ATTEMPTS, _augment_repetition_suggestions_with_debug
+from utils.response_cache import MemoryResponseCache
+
+LATENCY = 0.1
+WORDS = ["developed", "managed", "implemented", "created", "led", "designed", "built", "improved"]
+
+
+class FakeClient:
+    """chat.completions.create with a fixed latency; alternatives come from alternative_for(word)"""
+
+    def __init__(self, alternative_for):
+        self.alternative_for = alternative_for
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls += 1
+        time.sleep(LATENCY)
+        word = re.search(r"word: (\S+)", kwargs["messages"][-1]["content"]).group(1)
+        line = f"FIX_REPETITION: Experience - Word '{word}' used 3 times - Replace with: '{word}' → '{self.alternative_for(word)}'"
+        message = SimpleNamespace(content=line)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+def _augment(client, max_concurrency):
+    repetition_debug = {
+        "repetitions_found": {"experience": {word: 3 for word in WORDS}},
+        "debug_info": {},
+        "action_verbs_found": {"experience": {word: 3 for word in WORDS}},
+    }
+    response = _augment_repetition_suggestions_with_debug(
+        {}, repetition_debug, "", client, "fake-model", 0.1, 0.8, max_concurrency=max_concurrency
+    )
+    return response["detailed_feedback"]["repetition_avoidance"]["suggestions"]
+
+
+def _alternatives(lines):
+    return [alt for line in lines for alt in re.findall(r"→\s*'([^']+)'", line)]
+
+
+def _unique_alternatives():
+    counter = itertools.count()
+    lock = threading.Lock()
+
+    def alternative_for(word):
+        with lock:
+            return f"alternative{next(counter)}"
+    return alternative_for
+
+
+def test_concurrent_generation_beats_sequential_wall_clock():
+    started = time.perf_counter()
+    sequential = _augment(FakeClient(_unique_alternatives()), max_concurrency=1)
+    sequential_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    concurrent = _augment(FakeClient(_unique_alternatives()), max_concurrency=4)
+    concurrent_seconds = time.perf_counter() - started
+
+    assert len(sequential) == len(concurrent) == len(WORDS)
+    assert sequential_seconds >= LATENCY * len(WORDS)
+    assert concurrent_seconds < sequential_seconds / 2
+
+
+def test_colliding_alternatives_are_never_kept():
+    # The model proposes the same alternative for every word; only the first word may keep it
+    for max_concurrency in (1, 4):
+        client = FakeClient(lambda word: "spearheaded")
+        lines = _augment(client, max_concurrency=max_concurrency)
+        alternatives = _alternatives(lines)
+        assert alternatives == ["spearheaded"]
+        assert client.calls <= len(WORDS) * (1 + FIX_REPETITION_REPAIR_ATTEMPTS)
+
+
+def _collide_first_time():
+    # Each word's first answer collides; any later request for the same word is unique
+    seen = set()
+    lock = threading.Lock()
+
+    def alternative_for(word):
+        with lock:
+            if word in seen:
+                return f"{word}-fresh"
+            seen.add(word)
+            return "spearheaded"
+    return alternative_for
+
+
+def test_repaired_lines_are_kept_when_unique():
+    lines = _augment(FakeClient(_collide_first_time()), max_concurrency=4)
+    alternatives = _alternatives(lines)
+    assert len(lines) == len(WORDS)
+    assert len(set(alternatives)) == len(alternatives)
+
+
+def test_repairs_bypass_the_response_cache(monkeypatch):
+    for max_concurrency in (1, 4):
+        cache = MemoryResponseCache()
+        monkeypatch.setattr(utils.response_cache, "get_response_cache", lambda: cache)
+        client = FakeClient(_collide_first_time())
+        lines = _augment(client, max_concurrency=max_concurrency)
+        alternatives = _alternatives(lines)
+        assert len(lines) == len(WORDS)
+        assert len(set(alternatives)) == len(alternatives)
+        # One original call per word plus one uncached repair for every word after the first
+        assert client.calls == 2 * len(WORDS) - 1
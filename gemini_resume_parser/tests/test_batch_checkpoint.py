@@ -0,0 +1,92 @@
+"""
+Batch checkpoint/resume: which JSONL records count as done, and that a rerun only processes
+failed, missing or cut-off resumes while keeping the output file valid line by line.
+"""
+
+import json
+from types import SimpleNamespace
+
+from services.batch_service import ResumeBatchProcessor, load_checkpoint
+
+NAMES = ["ana", "bruno", "chloé", "dmitri"]
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _processor(fail=()):
+    parsed = []
+
+    async def aparse_resume_text(text, custom_prompt=None, use_cache=True):
+        name = text.strip()
+        parsed.append(name)
+        if name in fail:
+            raise RuntimeError("model timeout")
+        return {"name": name}
+
+    processor = ResumeBatchProcessor(api_key="sk-test", concurrency=2, extraction_workers=1)
+    processor.parser = SimpleNamespace(aparse_resume_text=aparse_resume_text)
+    return processor, parsed
+
+
+def _resume_dir(tmp_path):
+    source = tmp_path / "resumes"
+    source.mkdir()
+    for name in NAMES:
+        (source / f"{name}.txt").write_text(name, encoding="utf-8")
+    return source
+
+
+def test_load_checkpoint_uses_the_latest_record_per_file(tmp_path):
+    output = tmp_path / "results.jsonl"
+    assert load_checkpoint(output) == set()
+    output.write_bytes(b"\n".join([
+        json.dumps({"file": "a", "status": "ok"}).encode(),
+        json.dumps({"file": "b", "status": "error"}).encode(),
+        json.dumps({"file": "b", "status": "ok"}).encode(),
+        json.dumps({"file": "c", "status": "ok"}).encode(),
+        json.dumps({"file": "c", "status": "error"}).encode(),
+        b"[1, 2]",
+        json.dumps({"file": "d", "status": "ok", "name": "Zoë"}, ensure_ascii=False).encode()[:-8],
+    ]))
+    assert load_checkpoint(output) == {"a", "b"}
+
+
+def test_rerun_only_processes_failed_resumes(tmp_path):
+    source, output = _resume_dir(tmp_path), tmp_path / "out" / "results.jsonl"
+    processor, parsed = _processor(fail={"bruno"})
+    report = processor.run(source, output)
+    assert (report["succeeded"], report["failed"]) == (3, 1)
+    assert sorted(parsed) == sorted(NAMES)
+
+    processor, parsed = _processor()
+    report = processor.run(source, output)
+    assert parsed == ["bruno"]
+    assert (report["skipped_already_done"], report["succeeded"], report["failed"]) == (3, 1, 0)
+    assert len(load_checkpoint(output)) == len(NAMES)
+
+    processor, parsed = _processor()
+    report = processor.run(source, output, resume=False)
+    assert sorted(parsed) == sorted(NAMES) and len(_records(output)) == len(NAMES)
+
+
+def test_record_cut_inside_a_multibyte_character_is_redone(tmp_path):
+    source, output = _resume_dir(tmp_path), tmp_path / "results.jsonl"
+    processor, _ = _processor()
+    processor.run(source, output)
+
+    # Simulate a crash while writing chloé's record, mid-way through the "é"
+    lines = output.read_bytes().splitlines(keepends=True)
+    cut_line = next(line for line in lines if "é".encode("utf-8") in line)
+    kept = [line for line in lines if line is not cut_line]
+    output.write_bytes(b"".join(kept) + cut_line[:cut_line.index("é".encode("utf-8")) + 1])
+    assert len(load_checkpoint(output)) == len(NAMES) - 1
+
+    processor, parsed = _processor()
+    processor.run(source, output)
+    assert parsed == ["chloé"]
+    records = output.read_bytes().split(b"\n")
+    assert records[-1] == b""
+    assert json.loads(records[-2])["parsed_data"] == {"name": "chloé"}
+    assert load_checkpoint(output) == {str(path.resolve()) for path in source.iterdir()}
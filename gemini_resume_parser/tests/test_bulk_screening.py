@@ -0,0 +1,51 @@
+"""
+Bulk JD screening never runs more LLM analyses at once than BULK_MAX_CONCURRENCY, whatever
+concurrency the caller asks for.
+"""
+
+import threading
+import time
+
+from config.config import OpenAIConfig
+from services.ats_service import JDSpecificATSService
+
+JOB_DESCRIPTION = "Senior Python developer with Django, PostgreSQL, AWS and Docker experience."
+
+
+class _ConcurrencyProbe:
+    """Stand-in for analyze_resume_for_jd that records the peak number of concurrent calls"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, resume_text, job_description, parsed_data=None, use_cache=True):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return {"overall_score": 70, "match_percentage": 60}
+
+
+def _run(max_concurrency, monkeypatch, limit=3, resumes=12):
+    monkeypatch.setattr(OpenAIConfig, "BULK_MAX_CONCURRENCY", limit)
+    service = JDSpecificATSService(api_key="sk-test")
+    probe = _ConcurrencyProbe()
+    service.analyze_resume_for_jd = probe
+    items = [{"name": f"r{i}.txt", "text": f"EXPERIENCE\nPython Django developer number {i} on AWS."} for i in range(resumes)]
+    result = service.analyze_resumes_for_jd(items, JOB_DESCRIPTION, max_concurrency=max_concurrency)
+    return probe.peak, result
+
+
+def test_requested_concurrency_is_capped_at_the_configured_limit(monkeypatch):
+    peak, result = _run(100, monkeypatch)
+    assert peak <= 3
+    assert len(result["ranking"]) == 12
+
+
+def test_lower_requested_concurrency_is_honoured(monkeypatch):
+    assert _run(1, monkeypatch)[0] == 1
+    assert _run(0, monkeypatch)[0] == 1
@@ -0,0 +1,134 @@
+"""
+Continuation of truncated completions: seam stitching, the continuation request, the round
+loop (sync and async, including caching of the assembled answer), and adaptive max_tokens.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import utils.response_cache
+from config.config import OpenAIConfig
+from models.ats_models import ATSAnalysisResponse
+from utils.continuation import (
+    CONTINUE_INSTRUCTION,
+    acontinued_chat_completion,
+    adaptive_max_tokens,
+    continuation_kwargs,
+    continued_chat_completion,
+    schema_skeleton_tokens,
+    stitch_continuation,
+)
+from utils.response_cache import MemoryResponseCache
+
+DOCUMENT = json.dumps({"name": "Jane Doe", "skills": ["Python", "SQL", "Docker"], "summary": "Backend engineer who shipped billing, search and onboarding services for a payments startup."})
+REQUEST = {"model": "m", "messages": [{"role": "user", "content": "Parse"}], "temperature": 0.0, "max_tokens": 10}
+
+
+def _response(content, finish_reason):
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=finish_reason)])
+
+
+class TruncatingClient:
+    """Writes DOCUMENT `size` characters per round, repeating `overlap` characters at each seam"""
+
+    def __init__(self, size=60, overlap=0, fence=False):
+        self.size, self.overlap, self.fence = size, overlap, fence
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def _answer(self, kwargs):
+        self.requests.append(kwargs)
+        messages = kwargs["messages"]
+        start = len(messages[-2]["content"]) if messages[-1]["content"] == CONTINUE_INSTRUCTION else 0
+        start = max(0, start - (self.overlap if start else 0))
+        piece = DOCUMENT[start:start + self.size]
+        finish_reason = "stop" if start + self.size >= len(DOCUMENT) else "length"
+        return _response(("```json\n" if self.fence and start else "") + piece, finish_reason)
+
+    def create(self, **kwargs):
+        return self._answer(kwargs)
+
+
+class AsyncTruncatingClient(TruncatingClient):
+    async def create(self, **kwargs):
+        return self._answer(kwargs)
+
+
+def test_stitch_drops_repeated_seam_and_reopened_fence():
+    assert stitch_continuation('{"name": "Jane Doe", "ski', '"Jane Doe", "skills": []}') == '{"name": "Jane Doe", "skills": []}'
+    assert stitch_continuation('{"a": "x', '```json\n", "b": 1}') == '{"a": "x", "b": 1}'
+    # Seams shorter than the minimum overlap are legitimate text, not repeats
+    assert stitch_continuation('{"a": "aa', 'aa"}') == '{"a": "aaaa"}'
+
+
+def test_continuation_request_keeps_the_prefix_and_drops_the_schema():
+    original = {**REQUEST, "response_format": {"type": "json_schema"}}
+    kwargs = continuation_kwargs(original, '{"name": "Ja')
+    assert "response_format" not in kwargs and kwargs["max_tokens"] == 10
+    assert kwargs["messages"][:1] == REQUEST["messages"]
+    assert kwargs["messages"][1:] == [
+        {"role": "assistant", "content": '{"name": "Ja'},
+        {"role": "user", "content": CONTINUE_INSTRUCTION},
+    ]
+    assert len(original["messages"]) == 1
+
+
+def test_truncated_output_is_continued_until_the_document_closes(monkeypatch):
+    monkeypatch.setattr(OpenAIConfig, "COMPLETION_CONTINUATION_ROUNDS", 5)
+    for overlap, fence in ((0, False), (20, True)):
+        client = TruncatingClient(overlap=overlap, fence=fence)
+        result = continued_chat_completion(client, **REQUEST)
+        assert len(client.requests) > 2
+        assert result.continuation_rounds == len(client.requests) - 1
+        assert result.choices[0].finish_reason == "stop"
+        assert result.choices[0].message.content == DOCUMENT
+
+
+def test_rounds_are_capped_and_the_cut_off_text_is_returned(monkeypatch):
+    monkeypatch.setattr(OpenAIConfig, "COMPLETION_CONTINUATION_ROUNDS", 1)
+    client = TruncatingClient(size=20)
+    result = continued_chat_completion(client, **REQUEST)
+    assert len(client.requests) == 2
+    assert result.choices[0].finish_reason == "length"
+    assert result.choices[0].message.content == DOCUMENT[:40]
+
+    monkeypatch.setattr(OpenAIConfig, "COMPLETION_CONTINUATION_ROUNDS", 0)
+    client = TruncatingClient(size=20)
+    assert continued_chat_completion(client, **REQUEST).choices[0].message.content == DOCUMENT[:20]
+    assert len(client.requests) == 1
+
+
+def test_assembled_answer_is_cached_under_the_original_request(monkeypatch):
+    monkeypatch.setattr(OpenAIConfig, "COMPLETION_CONTINUATION_ROUNDS", 5)
+    cache = MemoryResponseCache()
+    monkeypatch.setattr(utils.response_cache, "get_response_cache", lambda: cache)
+    client = TruncatingClient()
+    continued_chat_completion(client, **REQUEST)
+    calls = len(client.requests)
+    assert calls > 1
+    again = continued_chat_completion(client, **REQUEST)
+    assert len(client.requests) == calls
+    assert again.choices[0].message.content == DOCUMENT and again.choices[0].finish_reason == "stop"
+
+
+def test_async_continuation_matches_sync(monkeypatch):
+    monkeypatch.setattr(OpenAIConfig, "COMPLETION_CONTINUATION_ROUNDS", 5)
+    client = AsyncTruncatingClient(overlap=12)
+    result = asyncio.run(acontinued_chat_completion(client, **REQUEST))
+    assert result.choices[0].message.content == DOCUMENT
+    assert result.continuation_rounds == len(client.requests) - 1
+
+
+def test_adaptive_max_tokens_scales_with_input_and_is_clamped():
+    short, long = "x" * 400, "x" * 40000
+    assert adaptive_max_tokens(short) == 512
+    assert adaptive_max_tokens(short, floor=100) == 100
+    assert adaptive_max_tokens(long, output_ratio=0.5) > adaptive_max_tokens(long, output_ratio=0.25) > 512
+    assert adaptive_max_tokens(long, output_ratio=10) == OpenAIConfig.COMPLETION_MAX_TOKENS_CEILING
+    assert adaptive_max_tokens(long, output_ratio=10, ceiling=3000) == 3000
+    skeleton = schema_skeleton_tokens(ATSAnalysisResponse)
+    assert skeleton > 0
+    assert adaptive_max_tokens("", ATSAnalysisResponse, base_tokens=2000, floor=0) == \
+        int((2000 + skeleton) * OpenAIConfig.COMPLETION_TOKEN_HEADROOM)
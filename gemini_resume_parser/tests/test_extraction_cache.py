@@ -0,0 +1,89 @@
+"""
+Extraction cache: content-addressed keys, memory and disk hits, misses, LRU eviction in
+memory, and size-capped eviction on disk without rescanning the directory on every write.
+"""
+
+import os
+
+from utils.extraction_cache import DISK_LOW_WATER, ExtractionCache
+
+
+def test_key_depends_on_content_and_extension_only():
+    key = ExtractionCache.make_key(b"resume bytes", ".PDF")
+    assert key == ExtractionCache.make_key(b"resume bytes", ".pdf")
+    assert key != ExtractionCache.make_key(b"resume bytes", ".docx")
+    assert key != ExtractionCache.make_key(b"other bytes", ".pdf")
+
+
+def test_memory_hit_and_miss():
+    cache = ExtractionCache(max_entries=4)
+    assert cache.get("a.pdf") is None
+    cache.put("a.pdf", "text")
+    assert cache.get("a.pdf") == "text"
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["memory_hits"], stats["misses"], stats["stores"]) == (1, 1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["disk_enabled"] is False
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ExtractionCache(max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+    cache.put("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("a") == "A" and cache.get("c") == "C"
+    assert cache.get_stats()["memory_evictions"] == 1
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    ExtractionCache(disk_dir=tmp_path).put("a.pdf", "résumé text")
+    cache = ExtractionCache(disk_dir=tmp_path)
+    assert cache.get_stats()["disk_bytes"] == len("résumé text".encode("utf-8"))
+    assert cache.get("a.pdf") == "résumé text"
+    assert cache.get("a.pdf") == "résumé text"
+    stats = cache.get_stats()
+    assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+
+
+def test_disk_tier_evicts_oldest_down_to_the_low_water_mark(tmp_path):
+    cache = ExtractionCache(max_entries=1, disk_dir=tmp_path, max_disk_bytes=1000)
+    for index in range(10):
+        cache.put(f"k{index}", "x" * 100)
+        os.utime(tmp_path / f"k{index}.txt", (index, index))
+    assert cache.get_stats()["disk_evictions"] == 0
+
+    cache.put("k10", "x" * 100)
+    stats = cache.get_stats()
+    assert stats["disk_evictions"] == 2
+    assert stats["disk_bytes"] == sum(entry.stat().st_size for entry in tmp_path.glob("*.txt"))
+    assert stats["disk_bytes"] <= 1000 * DISK_LOW_WATER
+    assert not (tmp_path / "k0.txt").exists() and not (tmp_path / "k1.txt").exists()
+    assert cache.get("k10") is not None
+
+
+def test_writes_under_the_limit_do_not_scan_the_directory(tmp_path, monkeypatch):
+    cache = ExtractionCache(disk_dir=tmp_path, max_disk_bytes=1000)
+    scans = []
+    original = ExtractionCache._scan_disk
+    monkeypatch.setattr(ExtractionCache, "_scan_disk", lambda self: scans.append(1) or original(self))
+
+    for index in range(9):
+        cache.put(f"k{index}", "x" * 100)
+    cache.put("k0", "y" * 50)  # Overwrites are tracked as a size change, not a new entry
+    assert scans == []
+    assert cache.get_stats()["disk_bytes"] == 850
+
+    cache.put("k9", "x" * 200)
+    assert scans == [1]
+    assert cache.get_stats()["disk_bytes"] <= 1000 * DISK_LOW_WATER
+
+
+def test_clear_empties_both_tiers(tmp_path):
+    cache = ExtractionCache(disk_dir=tmp_path)
+    cache.put("a", "A")
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.get_stats()["disk_bytes"] == 0
+    assert list(tmp_path.glob("*.txt")) == []
@@ -0,0 +1,95 @@
+"""
+Local JD match scoring: term extraction, vectorized coverage against a plain-Python
+reference in both orientations, pre-score explanations, and the single-resume latency
+budget. See benchmarks/bench_jd_match.py for batch timings.
+"""
+
+import random
+import statistics
+import time
+
+import numpy as np
+
+from utils.jd_match import (
+    JobDescriptionProfile,
+    TermVectorizer,
+    coverage_matrix,
+    extract_terms,
+    jd_match_components,
+    score_resumes_against_jds,
+)
+
+JD = """Senior Backend Engineer. We are looking for a Python developer with machine learning
+experience, strong SQL, Docker and Kubernetes on AWS. Leadership and communication required."""
+WORDS = ["python", "sql", "docker", "kubernetes", "aws", "java", "react", "terraform", "kafka", "spark",
+         "leadership", "communication", "machine", "learning", "pipelines", "latency", "billing", "search"]
+
+
+def _reference_coverage(vectorizer, query_text, target_text, max_terms=None):
+    query = vectorizer.term_weights(query_text, max_terms)
+    target_columns = {vectorizer.column(term) for term in vectorizer.term_weights(target_text)}
+    columns = {}
+    for term, weight in query.items():
+        columns[vectorizer.column(term)] = columns.get(vectorizer.column(term), 0.0) + weight
+    total = sum(columns.values()) or 1.0
+    return sum(weight for column, weight in columns.items() if column in target_columns) / total
+
+
+def _random_text(rnd, size):
+    return " ".join(rnd.choice(WORDS) for _ in range(size))
+
+
+def test_extract_terms_drops_stopwords_and_counts_phrases():
+    terms = extract_terms("Experience with C, R and Node.js; machine learning and CI/CD for 5 years", frozenset({"machine learning"}), 2)
+    assert terms["c"] == terms["r"] == terms["node.js"] == terms["ci/cd"] == 1
+    assert terms["machine learning"] == 1 and terms["machine"] == 1
+    assert "experience" not in terms and "years" not in terms and "5" not in terms and "with" not in terms
+
+
+def test_whole_tokens_only():
+    jd = "AI engineer with maintenance skills"
+    assert jd_match_components("Maintained legacy systems", "Maintenance", jd)["matched_skills"] == []
+    components = jd_match_components("Maintained legacy systems", "AI, maintenance", jd)
+    assert components["required_skills"] == components["matched_skills"] == ["Artificial Intelligence"]
+    assert "ai" not in extract_terms("maintain the airflow")
+
+
+def test_coverage_matches_the_reference_in_both_orientations():
+    rnd = random.Random(3)
+    vectorizer = TermVectorizer(hash_features=64)  # Small column space so hash collisions are exercised
+    jds = [_random_text(rnd, rnd.randint(5, 30)) for _ in range(4)]
+    resumes = [_random_text(rnd, rnd.randint(0, 40)) for _ in range(9)]
+    expected = np.array([[_reference_coverage(vectorizer, jd, resume) for resume in resumes] for jd in jds])
+
+    jd_matrix, resume_matrix = vectorizer.transform(jds), vectorizer.transform(resumes)
+    assert np.allclose(coverage_matrix(jd_matrix, resume_matrix), expected)  # Loops over the JDs
+    assert np.allclose(coverage_matrix(jd_matrix, vectorizer.transform(resumes[:2])), expected[:, :2])  # Loops over the resumes
+    assert np.allclose(score_resumes_against_jds(resumes, jds, vectorizer, max_jd_terms=1000), 100 * expected.T)
+
+
+def test_empty_inputs():
+    vectorizer = TermVectorizer()
+    assert coverage_matrix(vectorizer.transform([]), vectorizer.transform(["python"])).shape == (0, 1)
+    assert score_resumes_against_jds(["python"], [""]).tolist() == [[0.0]]
+
+
+def test_profile_prescore_explains_matched_and_missing_terms():
+    profile = JobDescriptionProfile(JD)
+    result = profile.prescore("Python engineer: SQL, Docker on AWS, machine learning pipelines, leadership")
+    assert {"python", "sql", "docker", "aws", "machine learning", "leadership"} <= set(result["matched_terms"])
+    assert {"kubernetes", "communication"} <= set(result["missing_terms"])
+    assert 0 < result["score"] < 100
+    scores = profile.prescore_many(["", JD, "python"])
+    assert scores[0] == 0 and scores[1] == 100 and 0 < scores[2] < 100
+
+
+def test_prescore_of_one_resume_stays_under_10_ms():
+    rnd = random.Random(5)
+    resume = "\n".join(_random_text(rnd, 14) for _ in range(70))  # Roughly two pages
+    profile = JobDescriptionProfile(JD)
+    timings = []
+    for _ in range(20):
+        started = time.perf_counter()
+        profile.prescore(resume)
+        timings.append(time.perf_counter() - started)
+    assert statistics.median(timings) < 0.010
@@ -0,0 +1,133 @@
+"""
+Tolerant JSON repair and member streaming: known model mistakes, randomized round-trip and
+truncation fuzzing, and linear-time behaviour on adversarial inputs up to 1 MB.
+See benchmarks/bench_json_stream.py for timings.
+"""
+
+import json
+import random
+import time
+
+import pytest
+
+from utils.json_stream import JsonMemberStream, TolerantJsonParser, repair_json
+
+MB = 1 << 20
+
+REPAIR_CASES = [
+    ('```json\n{"a": 1, "b": [1,2,]}\n```', {"a": 1, "b": [1, 2]}),
+    ('Sure! Here: {"a": "x"} hope it helps {"no"', {"a": "x"}),
+    ('{"a": "hel', {"a": "hel"}),
+    ('{"a": 1, "b', {"a": 1}),
+    ('{"a": 1, "b":', {"a": 1}),
+    ('{"a": 12.', {"a": 12}),
+    ('{"a": {"b": [1, {"c": "d', {"a": {"b": [1, {"c": "d"}]}}),
+    ("{a: 'single', b: True, c: None}", {"a": "single", "b": True, "c": None}),
+    ('{"a": 1 "b": 2}', {"a": 1, "b": 2}),
+    ('{"a": "line1\nline2\t"}', {"a": "line1\nline2\t"}),
+    ('{"a": [1, 2}', {"a": [1, 2]}),
+    ('{"a": , "b": 2}', {"b": 2}),
+    ('{"a": "x\\u00', {"a": "x"}),
+]
+
+# Inputs built to defeat backtracking regexes and repeated rescans
+ADVERSARIAL = {
+    "deep_open": lambda size: "[" * size,
+    "deep_object": lambda size: '{"a":' * (size // 5),
+    "stray_closers": lambda size: "{" + "}]" * (size // 2),
+    "mismatched": lambda size: "{" + "[" * (size // 2) + "}" * (size // 2),
+    "backslashes": lambda size: '{"a": "' + "\\" * size,
+    "unicode_escapes": lambda size: '{"a":"' + "\\u00e9" * (size // 6),
+    "commas": lambda size: "{" + "," * size,
+    "atoms": lambda size: "[" + "1," * (size // 2),
+    "long_string": lambda size: '{"a": "' + "x" * size + '"}',
+    "whitespace": lambda size: "{" + " " * size,
+    "leading_prose": lambda size: "x" * size + "{}",
+    "many_keys": lambda size: "{" + '"k":1,' * (size // 6),
+    "single_quotes": lambda size: "{" + "'" * size,
+}
+
+
+def _random_value(rnd: random.Random, depth: int = 0):
+    roll = rnd.random()
+    if depth > 4 or roll < 0.3:
+        return rnd.choice([1, -2.5, 0, 1e10, True, None, "", 'str "q" \\ é\n😀', "héllo ☃"])
+    if roll < 0.65:
+        return [_random_value(rnd, depth + 1) for _ in range(rnd.randint(0, 4))]
+    return {f'k{i}"': _random_value(rnd, depth + 1) for i in range(rnd.randint(0, 4))}
+
+
+def _feed_in_chunks(rnd: random.Random, text: str, feed):
+    index = 0
+    while index < len(text):
+        size = rnd.randint(1, 7)
+        feed(text[index:index + size])
+        index += size
+
+
+@pytest.mark.parametrize("text,expected", REPAIR_CASES)
+def test_repairs_common_model_mistakes(text, expected):
+    assert repair_json(text) == expected
+
+
+def test_array_root_and_missing_json():
+    assert repair_json('here [1, {"a": 2}, 3', allow_array_root=True) == [1, {"a": 2}, 3]
+    with pytest.raises(json.JSONDecodeError):
+        repair_json("no json here")
+
+
+def test_fuzz_valid_documents_round_trip_in_any_chunking():
+    rnd = random.Random(1)
+    for _ in range(1500):
+        document = {f"s{i}": _random_value(rnd) for i in range(rnd.randint(1, 5))}
+        text = json.dumps(document, indent=rnd.choice([None, 2]), ensure_ascii=rnd.random() < 0.5)
+        assert repair_json(text) == document
+
+        parser = TolerantJsonParser()
+        _feed_in_chunks(rnd, text, parser.feed)
+        assert parser.finish() == document
+
+        stream = JsonMemberStream(max_depth=1)
+        members = {}
+        _feed_in_chunks(rnd, text, lambda chunk: members.update((path[-1], value) for path, value in stream.feed(chunk)))
+        assert members == document
+
+
+def test_fuzz_truncated_and_mutated_output():
+    rnd = random.Random(2)
+    for _ in range(1500):
+        text = json.dumps({"root": _random_value(rnd)}, ensure_ascii=rnd.random() < 0.5)
+        cut = text[:rnd.randint(1, len(text))]
+        # Chunked and one-shot repair agree on every truncation point
+        parser = TolerantJsonParser()
+        _feed_in_chunks(rnd, cut, parser.feed)
+        assert parser.finish() == repair_json(cut)
+
+        # Arbitrary corruption only ever fails with JSONDecodeError
+        mutated = list(text)
+        for _ in range(5):
+            mutated[rnd.randrange(len(mutated))] = rnd.choice("{}[]\",:\\' x1")
+        try:
+            repair_json("".join(mutated), allow_array_root=True)
+        except json.JSONDecodeError:
+            pass
+
+
+def _best_time(text: str) -> float:
+    best = float("inf")
+    for _ in range(2):
+        started = time.perf_counter()
+        try:
+            repair_json(text, allow_array_root=True)
+        except json.JSONDecodeError:
+            pass
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.mark.parametrize("name", sorted(ADVERSARIAL))
+def test_adversarial_inputs_scale_linearly(name):
+    build = ADVERSARIAL[name]
+    small, large = _best_time(build(MB // 4)), _best_time(build(MB))
+    # 4x the input: linear time costs ~4x, quadratic ~16x (the floor absorbs timer noise on tiny runs)
+    assert large < 8 * small + 0.05, f"{name}: {small:.3f}s for 256 KB, {large:.3f}s for 1 MB"
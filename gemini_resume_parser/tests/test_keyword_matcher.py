@@ -0,0 +1,80 @@
+"""
+Aho-Corasick keyword matcher: whole-word boundaries, leftmost-longest resolution,
+case-sensitive keywords, whitespace runs inside phrases, and agreement with a brute-force
+scan on random texts.
+"""
+
+import random
+
+from utils.keyword_matcher import KeywordMatcher
+
+
+def _spans(matches):
+    return [(hit.start, hit.end, hit.keyword) for hit in matches]
+
+
+def test_keywords_only_match_whole_words():
+    matcher = KeywordMatcher(["ai", "java", "lead"])
+    assert matcher.find_all("Maintain the Javascript mileage; misleading") == []
+    assert _spans(matcher.find_all("AI-driven, (Java) and lead.")) == [(0, 2, "ai"), (12, 16, "java"), (22, 26, "lead")]
+
+
+def test_symbols_count_as_word_characters_at_boundaries():
+    matcher = KeywordMatcher(["c", "c++", "c#", "node.js"])
+    assert matcher.find_keywords("C++ and C# but not c_sharp") == {"c++", "c#"}
+    assert matcher.find_keywords("Node.js, C.") == {"node.js", "c"}
+
+
+def test_overlapping_hits_resolve_leftmost_longest():
+    matcher = KeywordMatcher({"machine learning": "ML", "learning": "learning", "machine": "machine", "deep learning": "DL"})
+    assert matcher.find_values("Deep learning and machine learning; learning") == ["DL", "ML", "learning"]
+    assert matcher.find_keywords("machine learning") == {"machine learning", "machine", "learning"}
+    assert matcher.first_value("no match here, then machine learning") == "ML"
+    assert matcher.first_value("nothing") is None
+
+
+def test_case_sensitive_keywords_need_exact_capitalization():
+    matcher = KeywordMatcher({"Go": "Go", "python": "Python"}, case_sensitive=["Go"])
+    assert matcher.find_values("go live with python") == ["Python"]
+    assert matcher.find_values("Go and PYTHON") == ["Go", "Python"]
+
+
+def test_whitespace_runs_match_a_single_space_and_spans_use_original_offsets():
+    matcher = KeywordMatcher(["project  management"])
+    text = "Led   project \n\t management."
+    assert _spans(matcher.find_all(text)) == [(6, 27, "project  management")]
+    assert text[6:27] == "project \n\t management"
+    assert not matcher.contains_any("projectmanagement")
+
+
+def test_empty_inputs():
+    assert KeywordMatcher([]).find_all("anything") == []
+    assert len(KeywordMatcher(["", "  ", "x"])) == 1
+    assert KeywordMatcher(["x"]).find_all("") == []
+
+
+def _brute_force(keywords, text):
+    lowered = text.lower()
+    hits = set()
+    for keyword in keywords:
+        start = lowered.find(keyword)
+        while start != -1:
+            end = start + len(keyword)
+            before_ok = start == 0 or not (text[start - 1].isalnum() or text[start - 1] in "_+#")
+            after_ok = end == len(text) or not (text[end].isalnum() or text[end] in "_+#")
+            if before_ok and after_ok:
+                hits.add((start, end, keyword))
+            start = lowered.find(keyword, start + 1)
+    return hits
+
+
+def test_agrees_with_a_brute_force_scan():
+    rnd = random.Random(13)
+    alphabet = "aab c+#."
+    for _ in range(300):
+        keywords = {"".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 4))).strip() for _ in range(8)} - {""}
+        keywords = {keyword for keyword in keywords if "  " not in keyword}
+        # Single spaces only, so the brute force's offsets line up with the matcher's
+        text = " ".join("".join(rnd.choice("aabAB+#.c") for _ in range(rnd.randint(1, 5))) for _ in range(rnd.randint(0, 8)))
+        matcher = KeywordMatcher(keywords)
+        assert set(_spans(matcher.find_all(text, overlapping=True))) == _brute_force(keywords, text)
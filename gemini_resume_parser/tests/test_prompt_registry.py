@@ -0,0 +1,64 @@
+"""
+Static prompt prefixes stay byte-stable: the system message of every registered prompt is the
+same whatever the request data, and its hash is the same in every process.
+"""
+
+import hashlib
+import json
+import os
+import string
+import subprocess
+import sys
+
+import pytest
+
+import services.ai_suggestion_service_optimized  # noqa: F401  (modules register their prompts on import)
+import services.ats_service  # noqa: F401
+import services.content_enhancement_service  # noqa: F401
+import services.openai_parser_service  # noqa: F401
+import services.resume_improvement_service  # noqa: F401
+from utils.prompt_registry import get_prompt, prompt_prefix_hashes
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPT_NAMES = sorted(prompt_prefix_hashes())
+
+
+def _user_values(template, marker: str):
+    fields = {field for _, field, _, _ in string.Formatter().parse(template.user_template) if field}
+    return {field: f"{marker} {field} {{not a placeholder}} é" for field in fields}
+
+
+def test_services_register_prompts():
+    assert len(PROMPT_NAMES) >= 10
+
+
+@pytest.mark.parametrize("name", PROMPT_NAMES)
+def test_system_prefix_is_independent_of_user_data(name):
+    template = get_prompt(name)
+    first = template.messages(**_user_values(template, "Alice Python 2019"))
+    second = template.messages(**_user_values(template, "Bob Marketing 2024"))
+
+    assert first[0] == second[0]
+    assert first[0]["content"].encode("utf-8") == template.system.encode("utf-8")
+    assert "Alice" not in first[0]["content"] and "Bob" not in second[0]["content"]
+    assert hashlib.sha256(first[0]["content"].encode("utf-8")).hexdigest()[:16] == template.prefix_hash
+    if template.user_template:
+        assert first[1] != second[1]
+
+
+def _prefix_hashes_in_subprocess(hash_seed: str):
+    script = (
+        "import json, services.ai_suggestion_service_optimized, services.ats_service, "
+        "services.content_enhancement_service, services.openai_parser_service, "
+        "services.resume_improvement_service\n"
+        "from utils.prompt_registry import prompt_prefix_hashes\n"
+        "print(json.dumps(prompt_prefix_hashes()))"
+    )
+    env = dict(os.environ, PYTHONHASHSEED=hash_seed, PYTHONPATH=os.pathsep.join([PACKAGE_DIR, *sys.path]))
+    output = subprocess.run([sys.executable, "-c", script], cwd=PACKAGE_DIR, env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def test_prefix_hashes_are_identical_across_processes():
+    # Different hash seeds change set and dict-of-set iteration order; prefixes must not depend on it
+    assert _prefix_hashes_in_subprocess("1") == _prefix_hashes_in_subprocess("2") == prompt_prefix_hashes()
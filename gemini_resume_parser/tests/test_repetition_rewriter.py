@@ -0,0 +1,75 @@
+"""
+Deterministic repetition rewriter: which occurrences change, synonym uniqueness, inflection,
+capitalization and articles, and the avoid list.
+"""
+
+from services.resume_improvement_service import ResumeImprovementService
+from utils.repetition_rewriter import SYNONYM_GRAPH, _assign_synonyms, rewrite_repetitions
+
+
+def test_first_occurrence_is_kept_and_later_ones_get_distinct_synonyms():
+    text, report = rewrite_repetitions("Led the team. Led the migration. Led the rollout.")
+    sentences = text.split(". ")
+    assert sentences[0] == "Led the team"
+    replacements = report["replacements"]["led"]
+    assert len(replacements) == 2 and len(set(replacements)) == 2
+    assert all(synonym in SYNONYM_GRAPH["led"] for synonym in replacements)
+    assert report["unresolved"] == {}
+
+
+def test_synonyms_already_in_the_text_are_not_used():
+    text, report = rewrite_repetitions("Led the team. Led the rollout. Directed the budget.")
+    assert "directed" not in report["replacements"]["led"]
+    assert text.lower().count("directed") == 1
+
+
+def test_irregular_participle_after_auxiliary():
+    text, _ = rewrite_repetitions("Managed payroll. Has managed vendors. Was managed well.")
+    assert text == "Managed payroll. Has directed vendors. Was overseen well."
+
+
+def test_capitalization_follows_the_replaced_word():
+    text, _ = rewrite_repetitions("LED the team and LED the rollout.")
+    assert text == "LED the team and HEADED the rollout."
+
+
+def test_article_is_fixed_before_the_synonym():
+    text, _ = rewrite_repetitions("Built a scalable API and a scalable queue.")
+    assert text == "Built a scalable API and an extensible queue."
+
+
+def test_avoided_synonyms_are_only_a_fallback():
+    everything_but_guided = [synonym for synonym in SYNONYM_GRAPH["led"] if synonym != "guided"]
+    text, _ = rewrite_repetitions("Led the team. Led the rollout.", avoid=everything_but_guided)
+    assert text == "Led the team. Guided the rollout."
+
+    text, report = rewrite_repetitions("Led the team. Led the rollout.", avoid=SYNONYM_GRAPH["led"])
+    assert report["replacements"]["led"][0] in SYNONYM_GRAPH["led"]
+    assert report["unresolved"] == {}
+
+
+def test_repetitions_without_enough_synonyms_are_reported_unresolved():
+    text = " ".join(["Led the work."] * (len(SYNONYM_GRAPH["led"]) + 3))
+    _, report = rewrite_repetitions(text)
+    assert report["unresolved"]["led"] >= 2
+
+
+def test_assign_synonyms_is_a_maximal_distinct_matching():
+    # Greedy in slot order would give slot 0 "a" and leave "y" with nothing
+    assert _assign_synonyms(["x", "x", "y"], {"x": ["a", "b"], "y": ["a"]}) == ["b", None, "a"]
+    assignment = _assign_synonyms(["x", "x", "x"], {"x": ["a", "b"]})
+    assert sorted(filter(None, assignment)) == ["a", "b"] and assignment.count(None) == 1
+
+
+def test_local_rewrite_keeps_unreachable_items_in_leftovers():
+    service = object.__new__(ResumeImprovementService)
+    resume = {"experience": [{"description": "Led a team. Led a rollout."}], "projects": ["not an item"]}
+    report = {"issues_by_item": {
+        "experience[0]": {"led": 2},
+        "experience[5]": {"built": 2},
+        "projects[0]": {"built": 2},
+    }}
+    leftovers = service._rewrite_repetitions_locally(resume, report)["issues_by_item"]
+    assert leftovers == {"experience[5]": {"built": 2}, "projects[0]": {"built": 2}}
+    assert resume["experience"][0]["description"].startswith("Led a team. ")
+    assert "Led a rollout" not in resume["experience"][0]["description"]
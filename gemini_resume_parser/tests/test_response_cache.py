@@ -0,0 +1,151 @@
+"""
+LLM response cache: TTL expiry and LRU eviction for both backends, and which requests
+cached_chat_completion / stream_chat_completion may serve from or store into the cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import utils.response_cache
+from config.config import OpenAIConfig
+from utils.response_cache import (
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    cached_chat_completion,
+    make_cache_key,
+    stream_chat_completion,
+)
+
+MESSAGES = [{"role": "user", "content": "Parse this resume"}]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class FakeClient:
+    """Counts chat.completions.create calls and answers "answer <n>" (streamed when asked)"""
+
+    def __init__(self, finish_reason="stop"):
+        self.calls = 0
+        self.finish_reason = finish_reason
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, stream=False, **kwargs):
+        self.calls += 1
+        content = f"answer {self.calls}"
+        if stream:
+            return iter([
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content[:3]), finish_reason=None)]),
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content[3:]), finish_reason=self.finish_reason)]),
+            ])
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=self.finish_reason)])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(utils.response_cache, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "sqlite":
+            return SQLiteResponseCache(str(tmp_path / "cache.sqlite3"), **kwargs)
+        return MemoryResponseCache(**kwargs)
+    return make
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    cache = MemoryResponseCache()
+    monkeypatch.setattr(utils.response_cache, "get_response_cache", lambda: cache)
+    return cache
+
+
+def test_entries_expire_after_the_ttl(make_cache, clock):
+    cache = make_cache(ttl_seconds=60)
+    cache.put("k", {"content": "v"})
+    clock.now += 60
+    assert cache.get("k") == {"content": "v"}
+    clock.now += 1
+    assert cache.get("k") is None
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["expired"], stats["entries"]) == (1, 1, 1, 0)
+
+
+def test_least_recently_used_entry_is_evicted(make_cache, clock):
+    cache = make_cache(max_entries=2)
+    cache.put("a", {"content": "A"})
+    clock.now += 1
+    cache.put("b", {"content": "B"})
+    clock.now += 1
+    assert cache.get("a") == {"content": "A"}
+    clock.now += 1
+    cache.put("c", {"content": "C"})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"content": "A"} and cache.get("c") == {"content": "C"}
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    SQLiteResponseCache(path).put("k", {"content": "café"})
+    assert SQLiteResponseCache(path).get("k") == {"content": "café"}
+
+
+def test_key_covers_every_generation_parameter():
+    key = make_cache_key("m", MESSAGES, 0.1, 0.8, 100)
+    assert key == make_cache_key("m", list(MESSAGES), 0.1, 0.8, 100)
+    assert len({
+        key,
+        make_cache_key("other", MESSAGES, 0.1, 0.8, 100),
+        make_cache_key("m", MESSAGES, 0.0, 0.8, 100),
+        make_cache_key("m", MESSAGES, 0.1, 0.9, 100),
+        make_cache_key("m", MESSAGES, 0.1, 0.8, 200),
+        make_cache_key("m", MESSAGES, 0.1, 0.8, 100, {"type": "json_object"}),
+    }) == 6
+
+
+def test_low_temperature_requests_are_served_from_the_cache(memory_cache):
+    client = FakeClient()
+    first = cached_chat_completion(client, model="m", messages=MESSAGES, temperature=OpenAIConfig.LLM_CACHE_MAX_TEMPERATURE)
+    second = cached_chat_completion(client, model="m", messages=MESSAGES, temperature=OpenAIConfig.LLM_CACHE_MAX_TEMPERATURE)
+    assert client.calls == 1
+    assert second.cached is True
+    assert second.choices[0].message.content == first.choices[0].message.content == "answer 1"
+
+
+def test_requests_outside_the_temperature_gate_are_not_cached(memory_cache):
+    client = FakeClient()
+    for _ in range(2):
+        cached_chat_completion(client, model="m", messages=MESSAGES, temperature=OpenAIConfig.LLM_CACHE_MAX_TEMPERATURE + 0.1)
+        cached_chat_completion(client, model="m", messages=MESSAGES)
+        cached_chat_completion(client, model="m", messages=MESSAGES, temperature=0.0, stream=True)
+        cached_chat_completion(client, use_cache=False, model="m", messages=MESSAGES, temperature=0.0)
+    assert client.calls == 8
+    assert memory_cache.get_stats()["stores"] == 0
+
+
+def test_truncated_completions_are_not_stored(memory_cache):
+    client = FakeClient(finish_reason="length")
+    cached_chat_completion(client, model="m", messages=MESSAGES, temperature=0.0)
+    cached_chat_completion(client, model="m", messages=MESSAGES, temperature=0.0)
+    assert client.calls == 2
+
+
+def test_streamed_completion_shares_the_cache_with_plain_calls(memory_cache):
+    client = FakeClient()
+    assert "".join(stream_chat_completion(client, model="m", messages=MESSAGES, temperature=0.0)) == "answer 1"
+    assert list(stream_chat_completion(client, model="m", messages=MESSAGES, temperature=0.0)) == ["answer 1"]
+    response = cached_chat_completion(client, model="m", messages=MESSAGES, temperature=0.0)
+    assert response.choices[0].message.content == "answer 1"
+    assert client.calls == 1
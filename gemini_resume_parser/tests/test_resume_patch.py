@@ -0,0 +1,100 @@
+"""
+Resume patch operations: id addressing, valid replace/append/remove, and rejection of edits
+that would drop sections or corrupt their shape.
+"""
+
+from utils.resume_patch import apply_resume_patch, with_item_ids
+
+RESUME = {
+    "basicDetails": {"fullName": "Ada Lovelace", "email": "ada@example.com"},
+    "summary": "Engineer.",
+    "skills": {"Languages": ["Python", "SQL"]},
+    "experience": [
+        {"company": "Acme", "position": "Developer", "description": "Built things.", "location": "Remote"},
+        {"id": "custom", "company": "Initech", "position": "Intern", "description": "Fixed printers."},
+    ],
+    "projects": [{"name": "Shop", "description": "Online shop."}],
+}
+
+
+def _patch(*operations):
+    return apply_resume_patch(with_item_ids(RESUME), list(operations))
+
+
+def test_with_item_ids_keeps_existing_ids_and_fills_missing_ones():
+    resume = with_item_ids(RESUME)
+    assert [item["id"] for item in resume["experience"]] == ["exp-0", "custom"]
+    assert resume["projects"][0]["id"] == "project-0"
+    assert "id" not in RESUME["experience"][0]
+
+
+def test_replace_by_id_and_by_index():
+    patched, report = _patch(
+        {"op": "replace", "path": "/experience/exp-0/description", "value": "Shipped a billing API."},
+        {"op": "replace", "path": "/experience/1/position", "value": "Support Engineer"},
+        {"op": "replace", "path": "/summary", "value": "Backend engineer."},
+    )
+    assert report == {"applied": 3, "rejected": []}
+    assert patched["experience"][0]["description"] == "Shipped a billing API."
+    assert patched["experience"][1]["position"] == "Support Engineer"
+    assert patched["summary"] == "Backend engineer."
+
+
+def test_replacing_an_item_keeps_its_id():
+    patched, report = _patch({"op": "replace", "path": "/experience/custom", "value": {"company": "Initrode"}})
+    assert report["applied"] == 1
+    assert patched["experience"][1] == {"company": "Initrode", "id": "custom"}
+
+
+def test_append_item_and_add_missing_section():
+    patched, report = _patch(
+        {"op": "add", "path": "/projects/-", "value": {"name": "Blog", "description": "A blog."}},
+        {"op": "add", "path": "/certifications", "value": [{"name": "AWS SAA"}]},
+    )
+    assert report["applied"] == 2
+    assert [project["name"] for project in patched["projects"]] == ["Shop", "Blog"]
+    assert patched["certifications"] == [{"name": "AWS SAA"}]
+
+
+def test_remove_list_item_and_item_field():
+    patched, report = _patch(
+        {"op": "remove", "path": "/experience/exp-0/location"},
+        {"op": "remove", "path": "/projects/project-0"},
+        {"op": "remove", "path": "/skills/Languages/1"},
+    )
+    assert report["applied"] == 3
+    assert "location" not in patched["experience"][0]
+    assert patched["projects"] == []
+    assert patched["skills"]["Languages"] == ["Python"]
+
+
+def test_remove_never_deletes_sections_or_top_level_fields():
+    patched, report = _patch(
+        {"op": "remove", "path": "/experience"},
+        {"op": "remove", "path": "/summary"},
+        {"op": "remove", "path": "/skills/Languages"},
+        {"op": "remove", "path": "/basicDetails/email"},
+    )
+    assert report["applied"] == 0
+    assert len(report["rejected"]) == 4
+    assert patched == with_item_ids(RESUME)
+
+
+def test_dash_only_appends_to_lists():
+    patched, report = _patch({"op": "add", "path": "/skills/-", "value": ["Go"]})
+    assert report["applied"] == 0
+    assert "-" not in patched["skills"]
+
+
+def test_invalid_operations_are_reported_without_discarding_the_others():
+    patched, report = _patch(
+        {"op": "replace", "path": "/experience/missing/description", "value": "x"},
+        {"op": "replace", "path": "/summary", "value": ["not", "text"]},
+        {"op": "add", "path": "/experience/exp-0", "value": {}},
+        {"op": "move", "path": "/summary"},
+        {"op": "add", "path": "/hobbies", "value": "chess"},
+        {"op": "replace", "path": "/basicDetails/fullName", "value": "Ada King"},
+    )
+    assert report["applied"] == 1
+    assert len(report["rejected"]) == 5
+    assert patched["basicDetails"]["fullName"] == "Ada King"
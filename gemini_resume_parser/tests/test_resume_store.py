@@ -0,0 +1,117 @@
+"""
+Resume session store: create/get/update round trips, per-analysis merging, sliding TTL
+expiry and LRU eviction, for both the memory and SQLite backends.
+"""
+
+import pytest
+
+import utils.resume_store
+from utils.resume_store import MemoryResumeStore, SQLiteResumeStore, save_analysis
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(utils.resume_store, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "sqlite":
+            return SQLiteResumeStore(str(tmp_path / "sessions.sqlite3"), **kwargs)
+        return MemoryResumeStore(**kwargs)
+    return make
+
+
+def test_create_and_get_round_trip(make_store):
+    store = make_store()
+    session = store.create("Jane Doe\nEngineer", filename="jane.pdf")
+    stored = store.get(session["resume_id"])
+    assert stored == session
+    assert stored["extracted_text"] == "Jane Doe\nEngineer" and stored["filename"] == "jane.pdf"
+    assert stored["parsed_data"] is None and stored["analyses"] == {}
+    assert store.get("missing") is None
+    stats = store.get_stats()
+    assert (stats["created"], stats["hits"], stats["misses"], stats["sessions"]) == (1, 1, 1, 1)
+
+
+def test_returned_sessions_are_copies(make_store):
+    store = make_store()
+    resume_id = store.create("text")["resume_id"]
+    store.get(resume_id)["analyses"]["standard"] = {"score": 1}
+    assert store.get(resume_id)["analyses"] == {}
+
+
+def test_update_merges_analyses_per_name(make_store):
+    store = make_store()
+    resume_id = store.create("text")["resume_id"]
+    assert store.update(resume_id, parsed_data={"name": "Jane"}, analyses={"standard": {"score": 70}})
+    assert store.update(resume_id, analyses={"jd_specific": {"score": 80}})
+    session = store.get(resume_id)
+    assert session["resume_id"] == resume_id
+    assert session["parsed_data"] == {"name": "Jane"}
+    assert session["analyses"] == {"standard": {"score": 70}, "jd_specific": {"score": 80}}
+    assert not store.update("missing", parsed_data={})
+
+
+def test_idle_sessions_expire_and_access_slides_the_ttl(make_store, clock):
+    store = make_store(ttl_seconds=60)
+    resume_id = store.create("text")["resume_id"]
+    clock.now += 50
+    assert store.get(resume_id) is not None
+    clock.now += 50
+    assert store.update(resume_id, parsed_data={})
+    clock.now += 61
+    assert store.get(resume_id) is None
+    assert store.get_stats()["expired"] == 1
+
+
+def test_least_recently_used_session_is_evicted(make_store, clock):
+    store = make_store(max_entries=2)
+    first = store.create("first")["resume_id"]
+    clock.now += 1
+    second = store.create("second")["resume_id"]
+    clock.now += 1
+    assert store.get(first) is not None
+    clock.now += 1
+    third = store.create("third")["resume_id"]
+    assert store.get(second) is None
+    assert store.get(first) is not None and store.get(third) is not None
+    assert store.get_stats()["evictions"] == 1
+
+
+def test_delete_and_clear(make_store):
+    store = make_store()
+    first = store.create("first")["resume_id"]
+    second = store.create("second")["resume_id"]
+    assert store.delete(first) and not store.delete(first)
+    store.clear()
+    assert store.get(second) is None
+
+
+def test_sqlite_sessions_are_shared_between_instances(tmp_path):
+    path = str(tmp_path / "sessions.sqlite3")
+    resume_id = SQLiteResumeStore(path).create("Renée")["resume_id"]
+    assert SQLiteResumeStore(path).get(resume_id)["extracted_text"] == "Renée"
+
+
+def test_save_analysis_marks_the_latest_analysis(monkeypatch):
+    store = MemoryResumeStore()
+    monkeypatch.setattr(utils.resume_store, "get_resume_store", lambda: store)
+    resume_id = store.create("text")["resume_id"]
+    save_analysis(resume_id, "standard", {"score": 70})
+    save_analysis(resume_id, "jd_specific", {"score": 80})
+    save_analysis(None, "standard", {"score": 0})
+    session = store.get(resume_id)
+    assert session["latest_analysis"] == "jd_specific"
+    assert session["analyses"] == {"standard": {"score": 70}, "jd_specific": {"score": 80}}
@@ -0,0 +1,91 @@
+"""
+Skill taxonomy: alias resolution to canonical skills, comparison keys, free-text detection
+with case-sensitive aliases, and extension from TSV/JSON data files.
+"""
+
+import json
+
+import pytest
+
+from utils.skill_taxonomy import PROFESSIONAL_SKILLS, SkillTaxonomy, get_skill_taxonomy, normalize_skill
+from utils.tech_stack import TECHNOLOGIES
+
+
+@pytest.fixture
+def taxonomy():
+    taxonomy = SkillTaxonomy(TECHNOLOGIES)
+    taxonomy.add_skills(PROFESSIONAL_SKILLS)
+    return taxonomy
+
+
+@pytest.mark.parametrize("alias, canonical", [
+    ("JS", "JavaScript"),
+    ("javascript", "JavaScript"),
+    ("k8s", "Kubernetes"),
+    ("Node", "Node.js"),
+    ("nodejs", "Node.js"),
+    ("Golang", "Go"),
+    ("dotnet", ".NET"),
+    (".NET", ".NET"),
+    ("cpp", "C++"),
+    ("C++", "C++"),
+    ("Excel", "Microsoft Excel"),
+    ("MS Excel", "Microsoft Excel"),
+    ("  machine   learning ", "Machine Learning"),
+    ("CI CD", "CI/CD"),
+])
+def test_aliases_resolve_to_the_canonical_skill(taxonomy, alias, canonical):
+    assert taxonomy.display_name(alias) == canonical
+    assert taxonomy.key(alias) == taxonomy.key(canonical)
+
+
+def test_normalization_keeps_meaningful_punctuation():
+    assert normalize_skill(" • Python, ") == "python"
+    assert normalize_skill("C++") == "c++" and normalize_skill(".NET") == ".net"
+    assert normalize_skill("Kubernetes.") == "kubernetes"
+
+
+def test_unknown_skills_compare_by_normalized_name(taxonomy):
+    assert taxonomy.canonical_id("Underwater Basket Weaving") is None
+    assert taxonomy.display_name("  Underwater  Basket Weaving ") == "Underwater Basket Weaving"
+    assert taxonomy.keys(["JS", "JavaScript", "ecmascript", "Zig lang", "zig  LANG", "", " "]) == {
+        taxonomy.key("JavaScript"), "zig lang"
+    }
+
+
+def test_free_text_detection_respects_word_boundaries_and_case(taxonomy):
+    found = taxonomy.find_in_text("Maintained k8s clusters with Golang and C++; will go to Excel training, uses excel daily")
+    names = [taxonomy.display_name(skill_id) for skill_id in found]
+    assert names == ["Kubernetes", "Go", "C++", "Microsoft Excel"]
+    assert "Artificial Intelligence" not in names
+    assert taxonomy.find_in_text("let's go and excel") == []
+
+
+def test_aliases_keep_their_first_owner(taxonomy):
+    taxonomy.add_skill("JavaScript Essentials", ["js"])
+    assert taxonomy.display_name("js") == "JavaScript"
+    assert taxonomy.display_name("JavaScript Essentials") == "JavaScript Essentials"
+
+
+def test_load_tsv_and_json_extensions(taxonomy, tmp_path):
+    tsv = tmp_path / "skills.tsv"
+    tsv.write_text("# canonical\taliases\nTerraform\ttf, hcl\nPrompt Engineering\tprompting\n\n", encoding="utf-8")
+    assert taxonomy.load(str(tsv)) == 2
+    assert taxonomy.display_name("HCL") == "Terraform"
+    assert taxonomy.display_name("prompting") == "Prompt Engineering"
+    assert taxonomy.find_in_text("Wrote prompting guides") == [taxonomy.key("Prompt Engineering")]
+
+    data = tmp_path / "skills.json"
+    data.write_text(json.dumps({"Retrieval-Augmented Generation": ["RAG"], "LangChain": "langchain"}), encoding="utf-8")
+    assert taxonomy.load(str(data)) == 2
+    assert taxonomy.display_name("rag") == "Retrieval-Augmented Generation"
+    assert taxonomy.display_name("LANGCHAIN") == "LangChain"
+
+    data.write_text("[]", encoding="utf-8")
+    with pytest.raises(ValueError):
+        taxonomy.load(str(data))
+
+
+def test_process_wide_taxonomy_is_built_once():
+    assert get_skill_taxonomy() is get_skill_taxonomy()
+    assert get_skill_taxonomy().display_name("k8s") == "Kubernetes"
@@ -0,0 +1,127 @@
+"""
+Streamed ATS analysis: event order (local findings, fields and categories as the model writes
+them, suggestions, then the result), the SSE wire format, and that the streamed result equals
+the non-streaming analysis.
+"""
+
+import json
+from types import SimpleNamespace
+
+from services.ats_service import StandardATSService, _stream_analysis_events
+from utils.sse import format_sse, sse_response_body, wants_event_stream
+
+DOCUMENT = {
+    "overall_score": 70,
+    "category_scores": {"repetition_avoidance": 60},
+    "detailed_feedback": {
+        "repetition_avoidance": {"score": 60, "title": "Repetition", "description": "", "positives": [], "negatives": [],
+                                 "suggestions": [], "specific_issues": [], "improvement_examples": []},
+        "achievements_impact_metrics": {"score": 50, "title": "Achievements", "description": "", "positives": [], "negatives": [],
+                                        "suggestions": [], "specific_issues": [], "improvement_examples": []},
+    },
+    "strengths": ["Clear layout"],
+    "weaknesses": ["Few metrics"],
+    "recommendations": ["Quantify impact"],
+}
+RESUME = """John Doe
+EXPERIENCE
+Managed a team. Managed budgets. Managed vendors and developed tools.
+Built stuff for the company. Developed internal tools. Developed apis.
+"""
+
+
+def _chunk(content, finish_reason=None):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)])
+
+
+class FakeClient:
+    """Answers the analysis with DOCUMENT (in small chunks when streamed) and FIX_* prompts with valid lines"""
+
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, stream=False, **kwargs):
+        system, prompt = kwargs["messages"][0]["content"], kwargs["messages"][-1]["content"]
+        if "FIX_REPETITION" in prompt:
+            content = "FIX_REPETITION: Experience - Word 'managed' used 3 times - Replace with: 'managed' → 'steered'"
+        elif prompt.strip().startswith("Achievements:"):
+            items = json.loads(prompt.strip()[len("Achievements:"):])
+            content = json.dumps({"lines": [
+                {"id": item["id"], "line": f"FIX_ACHIEVEMENT: Experience - Achievement '{item['achievement'][:20]}' lacks metrics - Add quantified impact: 'x'"}
+                for item in items
+            ]})
+        elif "FIX_ACHIEVEMENT" in prompt or "FIX_ACHIEVEMENT" in system:
+            content = "FIX_ACHIEVEMENT: Experience - Achievement 'Built stuff' lacks metrics - Add quantified impact: 'x'"
+        else:
+            content = json.dumps(DOCUMENT)
+        if stream:
+            return iter([_chunk(content[i:i + 16]) for i in range(0, len(content), 16)] + [_chunk(None, "stop")])
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+def test_events_arrive_in_order_and_finish_with_the_result():
+    request = {
+        "repetition_debug": {"repetitions_found": {"experience": {"managed": 3}}},
+        "achievement_debug": {"unquantified_achievements": {}, "summary": {}},
+        "completion_kwargs": {"model": "m", "messages": [{"role": "user", "content": "Analyze"}], "temperature": 0.0},
+    }
+
+    def finalize(response_text, on_suggestion):
+        on_suggestion("repetition_avoidance", "FIX_REPETITION: one")
+        on_suggestion("repetition_avoidance", "FIX_REPETITION: two")
+        return {**json.loads(response_text), "finalized": True}
+
+    events = list(_stream_analysis_events(FakeClient(), request, finalize, use_cache=False))
+    names = [event for event, _ in events]
+    assert names == ["local"] + ["field"] * 2 + ["category"] * 2 + ["field"] * 3 + ["suggestion"] * 2 + ["result"]
+    assert events[0][1]["repetitions_found"] == {"experience": {"managed": 3}}
+    assert [data["name"] for event, data in events if event in ("field", "category")] == [
+        "overall_score", "category_scores", "repetition_avoidance", "achievements_impact_metrics",
+        "strengths", "weaknesses", "recommendations",
+    ]
+    assert events[4][1]["feedback"] == DOCUMENT["detailed_feedback"]["achievements_impact_metrics"]
+    assert [data["line"] for event, data in events if event == "suggestion"] == ["FIX_REPETITION: one", "FIX_REPETITION: two"]
+    assert events[-1][1] == {**DOCUMENT, "finalized": True}
+
+
+def test_finalize_errors_propagate_after_queued_suggestions():
+    request = {"repetition_debug": {}, "achievement_debug": {}, "completion_kwargs": {"model": "m", "messages": [{"role": "user", "content": "Analyze"}]}}
+
+    def finalize(response_text, on_suggestion):
+        on_suggestion("repetition_avoidance", "FIX_REPETITION: one")
+        raise RuntimeError("scoring failed")
+
+    body = list(sse_response_body(_stream_analysis_events(FakeClient(), request, finalize, use_cache=False)))
+    assert body[-2].startswith("event: suggestion\n")
+    assert body[-1] == format_sse("error", {"success": False, "error": "scoring failed"})
+
+
+def test_sse_frames_wrap_the_result_like_the_json_endpoints():
+    events = [("local", {"a": "é"}), ("result", {"score": 1})]
+    body = list(sse_response_body(events, on_result=lambda data: {**data, "saved": True}, extra={"resume_id": "r1"}))
+    assert body == [
+        'event: local\ndata: {"a": "é"}\n\n',
+        'event: result\ndata: {"success": true, "data": {"score": 1, "saved": true}, "resume_id": "r1"}\n\n',
+    ]
+
+
+def test_streaming_is_opt_in():
+    assert wants_event_stream("true", None)
+    assert wants_event_stream(None, "text/event-stream")
+    assert not wants_event_stream("0", "application/json")
+    assert not wants_event_stream(None, None)
+
+
+def test_streamed_result_matches_the_plain_analysis():
+    service = StandardATSService(api_key="sk-test")
+    service.client = FakeClient()
+    events = list(service.analyze_resume_stream(RESUME, use_cache=False))
+    assert events[0][0] == "local" and events[-1][0] == "result"
+    assert any(event == "suggestion" for event, _ in events)
+
+    streamed = events[-1][1]
+    plain = service.analyze_resume(RESUME, use_cache=False)
+    streamed.pop("analysis_timestamp", None)
+    plain.pop("analysis_timestamp", None)
+    assert streamed == plain
@@ -0,0 +1,29 @@
+"""
+Local tech-stack extraction: hyphenated compounds, lowercase mentions and ambiguous words
+"""
+
+from utils.tech_stack import extract_tech_stack, format_tech_stack
+
+
+def test_hyphenated_compounds_match():
+    text = "Python-based ETL on AWS-hosted Spark with TensorFlow-powered models"
+    assert extract_tech_stack(text) == ["Python", "AWS", "Apache Spark", "TensorFlow"]
+
+
+def test_lowercase_technology_mentions_match():
+    text = "a react app using node and express with mongodb"
+    assert extract_tech_stack(text) == ["React", "Node.js", "Express.js", "MongoDB"]
+
+
+def test_symbols_and_hyphens_inside_names_stay_whole():
+    text = "Objective-C, scikit-learn and Material-UI; C++ and C# on ASP.NET-based services"
+    assert extract_tech_stack(text) == ["Objective-C", "scikit-learn", "Material UI", "C++", "C#", ".NET"]
+
+
+def test_ambiguous_words_need_their_usual_capitalization():
+    assert extract_tech_stack("we go live after rust removal and a spark of swift change") == []
+    assert extract_tech_stack("Go services on Snowflake") == ["Go", "Snowflake"]
+
+
+def test_format_tech_stack_canonicalizes_and_deduplicates():
+    assert format_tech_stack(["reactjs", "React", "and", "k8s", "Kubernetes"]) == "React, Kubernetes"
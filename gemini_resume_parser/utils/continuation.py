@@ -0,0 +1,230 @@
+"""
+Adaptive output budgets and continuation of truncated chat completions.
+
+max_tokens is sized from the input and the expected response schema instead of a fixed 4000.
+A completion that still stops at max_tokens (finish_reason == 'length') is continued from the
+cut point rather than regenerated: the partial answer goes back as an assistant turn (so the
+static prompt prefix stays cacheable), the model writes only the remainder, and the pieces are
+stitched and fed through TolerantJsonParser. The parser stops the loop as soon as the document
+is complete and closes it if the last round is still cut off.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from config.config import OpenAIConfig
+from utils.json_stream import TolerantJsonParser
+from utils.structured_output import json_schema_for
+from utils.response_cache import cached_chat_completion, acached_chat_completion, cache_completion
+
+logger = logging.getLogger(__name__)
+
+_CHARS_PER_TOKEN = 4  # Conservative average for English prose and JSON
+_MIN_OVERLAP = 8  # Shorter repeats at the seam are treated as legitimate text
+_MAX_OVERLAP = 400
+_LEADING_FENCE = re.compile(r'^\s*```(?:json)?[ \t]*\n?', re.IGNORECASE)
+
+CONTINUE_INSTRUCTION = (
+    "Your previous message was cut off by the output limit. Continue exactly where it stopped: "
+    "output only the remaining characters, without repeating anything, restarting the JSON, "
+    "adding code fences or commenting."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budget sizing (no tokenizer dependency)"""
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def _skeleton_chars(node: Any) -> int:
+    """Characters of keys and punctuation in a document matching a JSON schema (each array once)"""
+    if not isinstance(node, dict):
+        return 0
+    if "anyOf" in node:
+        return max((_skeleton_chars(option) for option in node["anyOf"]), default=0)
+    if node.get("type") == "array":
+        return 2 + _skeleton_chars(node.get("items"))
+    properties = node.get("properties") or {}
+    return 2 + sum(len(key) + 6 + _skeleton_chars(value) for key, value in properties.items())
+
+
+@lru_cache(maxsize=None)
+def schema_skeleton_tokens(model_cls: Type[BaseModel]) -> int:
+    """Tokens spent on keys and punctuation of a response of model_cls, before any content"""
+    schema, _ = json_schema_for(model_cls)
+    return _skeleton_chars(schema) // _CHARS_PER_TOKEN + 1
+
+
+def adaptive_max_tokens(input_text: str, model_cls: Optional[Type[BaseModel]] = None, base_tokens: int = 0,
+                        output_ratio: float = 0.0, floor: int = 512, ceiling: Optional[int] = None) -> int:
+    """
+    Size max_tokens for a call from its input and expected response schema
+
+    Args:
+        input_text: The part of the input the output scales with (resume text, resume JSON, ...)
+        model_cls: Response model; its empty skeleton is always part of the output
+        base_tokens: Fixed content the schema asks for regardless of input (feedback, lists, ...)
+        output_ratio: Output tokens expected per input token
+        floor: Smallest budget returned
+        ceiling: Largest budget returned (COMPLETION_MAX_TOKENS_CEILING by default)
+
+    Returns:
+        The estimate times COMPLETION_TOKEN_HEADROOM, clamped to [floor, ceiling]
+    """
+    ceiling = ceiling or OpenAIConfig.COMPLETION_MAX_TOKENS_CEILING
+    expected = base_tokens + output_ratio * estimate_tokens(input_text)
+    if model_cls is not None:
+        expected += schema_skeleton_tokens(model_cls)
+    return max(floor, min(ceiling, int(expected * OpenAIConfig.COMPLETION_TOKEN_HEADROOM)))
+
+
+def continuation_kwargs(completion_kwargs: Dict[str, Any], partial_text: str) -> Dict[str, Any]:
+    """
+    Build the request that continues partial_text
+
+    response_format is dropped: a schema-constrained response would have to start a new
+    JSON document, while the continuation is the raw remainder of the old one.
+    """
+    kwargs = {key: value for key, value in completion_kwargs.items() if key != "response_format"}
+    kwargs["messages"] = list(completion_kwargs["messages"]) + [
+        {"role": "assistant", "content": partial_text},
+        {"role": "user", "content": CONTINUE_INSTRUCTION}
+    ]
+    return kwargs
+
+
+def stitch_continuation(text: str, continuation: str) -> str:
+    """
+    Append a continuation, dropping a re-opened code fence and any text repeated across the seam
+
+    Args:
+        text: Output so far
+        continuation: Next round's output
+
+    Returns:
+        The combined text
+    """
+    continuation = _LEADING_FENCE.sub("", continuation, count=1)
+    for size in range(min(len(text), len(continuation), _MAX_OVERLAP), _MIN_OVERLAP - 1, -1):
+        if text.endswith(continuation[:size]):
+            return text + continuation[size:]
+    return text + continuation
+
+
+def _completion(content: str, finish_reason: Optional[str], rounds: int) -> SimpleNamespace:
+    message = SimpleNamespace(content=content, role="assistant")
+    choice = SimpleNamespace(index=0, message=message, finish_reason=finish_reason)
+    return SimpleNamespace(choices=[choice], continuation_rounds=rounds)
+
+
+class _Assembler:
+    """Stitched text plus the tolerant parser that tracks whether the document is complete"""
+
+    def __init__(self, response: Any):
+        choice = response.choices[0]
+        self.text = choice.message.content or ""
+        self.finish_reason = choice.finish_reason
+        self.rounds = 0
+        self.parser = TolerantJsonParser(allow_array_root=True)
+        self.parser.feed(self.text)
+
+    def needs_round(self, max_rounds: int) -> bool:
+        return self.finish_reason == "length" and self.rounds < max_rounds and not self.parser.done
+
+    def add(self, response: Any):
+        choice = response.choices[0]
+        stitched = stitch_continuation(self.text, choice.message.content or "")
+        self.parser.feed(stitched[len(self.text):])
+        self.text = stitched
+        self.finish_reason = choice.finish_reason
+        self.rounds += 1
+
+    def result(self) -> SimpleNamespace:
+        finish_reason = self.finish_reason
+        if finish_reason == "length" and self.parser.done:
+            finish_reason = "stop"  # Cut off after the document closed (trailing fence or whitespace)
+        if finish_reason == "length":
+            logger.warning(f"✂️ Completion still truncated after {self.rounds} continuation round(s); the tolerant parser will close it")
+        elif self.rounds:
+            logger.info(f"🧵 Completion assembled from {self.rounds + 1} rounds ({len(self.text)} characters)")
+        return _completion(self.text, finish_reason, self.rounds)
+
+
+def continue_completion(create: Callable[..., Any], completion_kwargs: Dict[str, Any], response: Any,
+                        max_rounds: Optional[int] = None) -> Any:
+    """
+    Continue a completion that stopped at max_tokens from its cut point
+
+    Args:
+        create: Function called with chat.completions.create arguments for each continuation round
+        completion_kwargs: Arguments of the original request
+        response: The original response
+        max_rounds: Continuation rounds allowed (COMPLETION_CONTINUATION_ROUNDS by default)
+
+    Returns:
+        response unchanged if it was not truncated, otherwise a response-like object with the
+        stitched content and the last round's finish_reason
+    """
+    max_rounds = OpenAIConfig.COMPLETION_CONTINUATION_ROUNDS if max_rounds is None else max_rounds
+    if not response.choices or response.choices[0].finish_reason != "length" or max_rounds <= 0:
+        return response
+
+    assembler = _Assembler(response)
+    while assembler.needs_round(max_rounds):
+        logger.warning(f"✂️ Completion hit max_tokens={completion_kwargs.get('max_tokens')}, continuing from the cut point (round {assembler.rounds + 1})")
+        assembler.add(create(**continuation_kwargs(completion_kwargs, assembler.text)))
+    return assembler.result()
+
+
+async def acontinue_completion(create: Callable[..., Awaitable[Any]], completion_kwargs: Dict[str, Any], response: Any,
+                               max_rounds: Optional[int] = None) -> Any:
+    """Async counterpart of continue_completion; create is awaited for each round"""
+    max_rounds = OpenAIConfig.COMPLETION_CONTINUATION_ROUNDS if max_rounds is None else max_rounds
+    if not response.choices or response.choices[0].finish_reason != "length" or max_rounds <= 0:
+        return response
+
+    assembler = _Assembler(response)
+    while assembler.needs_round(max_rounds):
+        logger.warning(f"✂️ Completion hit max_tokens={completion_kwargs.get('max_tokens')}, continuing from the cut point (round {assembler.rounds + 1})")
+        assembler.add(await create(**continuation_kwargs(completion_kwargs, assembler.text)))
+    return assembler.result()
+
+
+def continued_chat_completion(client: Any, use_cache: bool = True, **kwargs) -> Any:
+    """
+    cached_chat_completion that continues truncated output instead of returning it cut off
+
+    A completion assembled from several rounds is cached under the original request once it
+    finished normally.
+
+    Args:
+        client: OpenAI client
+        use_cache: Set to False to bypass the cache for this call
+        **kwargs: Arguments for chat.completions.create (model, messages, temperature, ...)
+
+    Returns:
+        The OpenAI response, or an equivalent object with the stitched content
+    """
+    response = cached_chat_completion(client, use_cache=use_cache, **kwargs)
+    result = continue_completion(lambda **round_kwargs: cached_chat_completion(client, use_cache=use_cache, **round_kwargs), kwargs, response)
+    if result is not response and result.choices[0].finish_reason == "stop":
+        cache_completion(result.choices[0].message.content, use_cache=use_cache, **kwargs)
+    return result
+
+
+async def acontinued_chat_completion(client: Any, use_cache: bool = True, **kwargs) -> Any:
+    """Async counterpart of continued_chat_completion for AsyncOpenAI clients"""
+    response = await acached_chat_completion(client, use_cache=use_cache, **kwargs)
+
+    async def _create(**round_kwargs):
+        return await acached_chat_completion(client, use_cache=use_cache, **round_kwargs)
+
+    result = await acontinue_completion(_create, kwargs, response)
+    if result is not response and result.choices[0].finish_reason == "stop":
+        cache_completion(result.choices[0].message.content, use_cache=use_cache, **kwargs)
+    return result
@@ -0,0 +1,199 @@
+"""
+Content-addressed cache for extracted document text
+Keys are the SHA-256 of the uploaded file's bytes plus its extension, so re-uploading the same
+resume under any filename skips PDF/DOCX extraction. Texts live in an in-memory LRU tier and,
+optionally, in a size-capped directory shared across processes. The disk tier's size is tracked
+incrementally; the directory is only rescanned to evict once the cap is crossed, and eviction
+then frees down to DISK_LOW_WATER of the cap so the next writes do not rescan again.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Fraction of max_disk_bytes the disk tier is trimmed to when it overflows
+DISK_LOW_WATER = 0.9
+
+class ExtractionCache:
+    """Content-addressed cache for extracted document text (in-memory LRU + optional on-disk tier)"""
+
+    def __init__(self, max_entries: int = 256, disk_dir: Optional[Union[str, Path]] = None, max_disk_bytes: int = 100 * 1024 * 1024):
+        """
+        Initialize the extraction cache
+
+        Args:
+            max_entries: Maximum number of texts kept in the in-memory LRU tier
+            disk_dir: Directory for the on-disk tier (disabled if not provided)
+            max_disk_bytes: Size limit for the on-disk tier; oldest entries are evicted first
+        """
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0
+        }
+
+        self._disk_bytes = 0  # Estimated size of the disk tier; resynchronized on every eviction scan
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+
+    @staticmethod
+    def make_key(content: bytes, extension: str) -> str:
+        """
+        Build a cache key from file bytes and extension
+
+        Args:
+            content: Raw file bytes
+            extension: File extension (text extraction depends on the format)
+
+        Returns:
+            SHA-256 hex digest of the content, suffixed with the extension
+        """
+        return f"{hashlib.sha256(content).hexdigest()}{extension.lower()}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up extracted text, promoting disk hits into memory"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["hits"] += 1
+                self._stats["memory_hits"] += 1
+                return self._memory[key]
+
+        text = self._read_disk(key)
+        with self._lock:
+            if text is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._stats["disk_hits"] += 1
+            self._put_memory(key, text)
+            return text
+
+    def put(self, key: str, text: str):
+        """Store extracted text in both tiers"""
+        with self._lock:
+            self._put_memory(key, text)
+            self._stats["stores"] += 1
+        self._write_disk(key, text)
+
+    def clear(self):
+        """Drop all entries from both tiers"""
+        with self._lock:
+            self._memory.clear()
+        if self.disk_dir:
+            for entry in self.disk_dir.glob("*.txt"):
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+            with self._lock:
+                self._disk_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and tier sizes"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            if self.disk_dir:
+                stats["disk_bytes"] = self._disk_bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["disk_enabled"] = self.disk_dir is not None
+        return stats
+
+    def _put_memory(self, key: str, text: str):
+        """Insert into the LRU tier (caller holds the lock)"""
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["memory_evictions"] += 1
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.txt"
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)  # Refresh mtime so eviction stays least-recently-used
+            return text
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to read extraction cache entry {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, text: str):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            tmp_path.write_text(text, encoding="utf-8")
+            written = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._disk_bytes += written - replaced
+                overflow = self._disk_bytes > self.max_disk_bytes
+            if overflow:
+                self._evict_disk()
+        except OSError as e:
+            logger.warning(f"Failed to write extraction cache entry {key}: {e}")
+
+    def _scan_disk(self):
+        """(mtime, size, path) of every disk entry"""
+        entries = []
+        for entry in self.disk_dir.glob("*.txt"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        return entries
+
+    def _evict_disk(self):
+        """
+        Remove least recently used files until the disk tier is under the low-water mark
+
+        Only called once the tracked size crosses the limit; the scan also resynchronizes the
+        tracked size with what other processes sharing the directory have written or removed.
+        """
+        entries = self._scan_disk()
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_disk_bytes * DISK_LOW_WATER) if total > self.max_disk_bytes else total
+        evicted = 0
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= target:
+                break
+            try:
+                entry.unlink()
+                total -= size
+                evicted += 1
+            except FileNotFoundError:
+                continue
+        with self._lock:
+            self._disk_bytes = total
+            self._stats["disk_evictions"] += evicted
@@ -0,0 +1,309 @@
+"""
+Local job-description match scoring (no LLM).
+
+Resumes and job descriptions are turned into sparse term vectors: a fixed vocabulary of
+skills and keywords (multi-word terms included) gets dedicated columns, every other term
+is hashed into a shared column space. Scores are the share of a job description's weighted
+term mass that a resume covers, computed with NumPy over whole batches - one JD against
+thousands of resumes, or one resume against many JDs, in a single call.
+"""
+
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.power_words import COMMON_WORDS
+from utils.skill_taxonomy import get_skill_taxonomy
+
+# Words, including skill spellings such as c++, c#, node.js, ci/cd
+_TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./-][a-z0-9+#]+)*")
+
+# Words that appear in almost every job description and say nothing about the role
+_JD_STOPWORDS: FrozenSet[str] = COMMON_WORDS | frozenset({
+    'about', 'ability', 'able', 'across', 'all', 'also', 'any', 'as', 'at', 'based', 'both', 'candidate',
+    'company', 'experience', 'experienced', 'from', 'good', 'great', 'help', 'if', 'including', 'into',
+    'job', 'join', 'knowledge', 'looking', 'more', 'new', 'not', 'or', 'other', 'over', 'plus', 'preferred',
+    'required', 'requirements', 'responsibilities', 'role', 'skills', 'so', 'strong', 'such', 'team',
+    'than', 'understanding', 'up', 'using', 'well', 'what', 'which', 'who', 'within', 'work', 'working',
+    'year', 'years', 'you', 'your', 'etc', 'e.g', 'i.e'
+})
+
+# Skills a job description is checked for when scoring skills coverage
+SKILL_TERMS: Tuple[str, ...] = (
+    'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'aws', 'docker',
+    'kubernetes', 'machine learning', 'ai', 'data analysis', 'excel', 'tableau',
+    'power bi', 'salesforce', 'marketing', 'seo', 'content creation', 'project management'
+)
+
+# Soft-skill keywords counted when they appear in both the resume and the job description
+KEYWORD_TERMS: Tuple[str, ...] = (
+    'leadership', 'management', 'strategy', 'innovation', 'collaboration',
+    'communication', 'problem solving', 'analytical', 'creative', 'detail-oriented',
+    'results-driven', 'customer-focused', 'team player', 'self-motivated'
+)
+
+# Hashed columns for terms outside the vocabulary
+DEFAULT_HASH_FEATURES = 1 << 18
+
+# JD terms kept (by weight) when a job description is digested
+DEFAULT_MAX_JD_TERMS = 60
+
+
+def _keep_term(term: str) -> bool:
+    return not (term in _JD_STOPWORDS or (len(term) < 2 and term not in ('c', 'r')) or term.isdigit())
+
+
+def extract_terms(text: str, phrases: Optional[FrozenSet[str]] = None, max_phrase_words: int = 1) -> Counter:
+    """
+    Count the meaningful lowercase terms in a text
+
+    Args:
+        text: Resume or job description text
+        phrases: Multi-word terms to count as single terms when their words appear consecutively
+        max_phrase_words: Length of the longest phrase in 'phrases'
+
+    Returns:
+        Counter of terms (stopwords and single characters other than skill names like 'c' or 'r' dropped)
+    """
+    tokens = _TERM_PATTERN.findall((text or "").lower())
+    terms = Counter(token for token in tokens if _keep_term(token))
+    if phrases:
+        for size in range(2, max_phrase_words + 1):
+            for start in range(len(tokens) - size + 1):
+                candidate = " ".join(tokens[start:start + size])
+                if candidate in phrases:
+                    terms[candidate] += 1
+    return terms
+
+
+class SparseTermMatrix:
+    """Rows of term weights in compressed sparse row layout (one row per document)"""
+
+    __slots__ = ("data", "indices", "indptr", "n_cols", "terms")
+
+    def __init__(self, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, n_cols: int, terms: List[Dict[str, float]]):
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.n_cols = n_cols
+        self.terms = terms  # Per-row term -> weight, kept for explanations (matched / missing terms)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def row_ids(self) -> np.ndarray:
+        """Row index of every stored entry"""
+        return np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+
+    def row_sums(self) -> np.ndarray:
+        return np.bincount(self.row_ids(), weights=self.data, minlength=self.n_rows)
+
+
+class TermVectorizer:
+    """Map documents to sparse term vectors over a fixed vocabulary plus hashed columns"""
+
+    def __init__(self, vocabulary: Iterable[str] = SKILL_TERMS + KEYWORD_TERMS, hash_features: int = DEFAULT_HASH_FEATURES):
+        """
+        Args:
+            vocabulary: Terms with dedicated columns; multi-word entries are matched as phrases
+            hash_features: Number of hashed columns shared by all other terms
+        """
+        self.vocabulary: Dict[str, int] = {}
+        for term in vocabulary:
+            self.vocabulary.setdefault(term.lower(), len(self.vocabulary))
+        self.hash_features = hash_features
+        self.n_cols = len(self.vocabulary) + hash_features
+        self.phrases = frozenset(term for term in self.vocabulary if " " in term)
+        self.max_phrase_words = max((len(term.split()) for term in self.phrases), default=1)
+
+    def column(self, term: str) -> int:
+        """Column of a term (crc32 keeps hashed columns stable across processes)"""
+        index = self.vocabulary.get(term)
+        if index is not None:
+            return index
+        return len(self.vocabulary) + zlib.crc32(term.encode("utf-8")) % self.hash_features
+
+    def term_weights(self, text: str, max_terms: Optional[int] = None) -> Dict[str, float]:
+        """
+        Sublinear term weights (1 + log tf) for one document
+
+        Args:
+            text: Document text
+            max_terms: Keep only the highest-weight terms (ties broken alphabetically)
+        """
+        counts = extract_terms(text, self.phrases, self.max_phrase_words)
+        weights = {term: 1.0 + math.log(count) for term, count in counts.items()}
+        if max_terms is not None and len(weights) > max_terms:
+            weights = dict(sorted(weights.items(), key=lambda item: (-item[1], item[0]))[:max_terms])
+        return weights
+
+    def transform(self, texts: Sequence[str], max_terms: Optional[int] = None) -> SparseTermMatrix:
+        """
+        Vectorize a batch of documents
+
+        Args:
+            texts: Documents, one row each
+            max_terms: Keep only each document's highest-weight terms (used for job descriptions)
+        """
+        data: List[float] = []
+        indices: List[int] = []
+        indptr = [0]
+        terms: List[Dict[str, float]] = []
+        for text in texts:
+            weights = self.term_weights(text, max_terms)
+            columns: Dict[int, float] = {}
+            for term, weight in weights.items():
+                column = self.column(term)
+                columns[column] = columns.get(column, 0.0) + weight
+            indices.extend(columns.keys())
+            data.extend(columns.values())
+            indptr.append(len(indices))
+            terms.append(weights)
+        return SparseTermMatrix(
+            np.asarray(data, dtype=np.float64),
+            np.asarray(indices, dtype=np.int64),
+            np.asarray(indptr, dtype=np.int64),
+            self.n_cols,
+            terms
+        )
+
+
+def coverage_matrix(queries: SparseTermMatrix, targets: SparseTermMatrix) -> np.ndarray:
+    """
+    Share of each query row's weight whose terms are present in each target row
+
+    Loops over the smaller side only; the other side is reduced in one vectorized pass
+    per iteration, so scoring one JD against N resumes (or one resume against N JDs) is a
+    single gather + bincount over all N documents.
+
+    Args:
+        queries: Weighted terms to be covered (typically job descriptions)
+        targets: Documents whose term presence is checked (typically resumes)
+
+    Returns:
+        Array of shape (queries.n_rows, targets.n_rows) with values in [0, 1]
+    """
+    result = np.zeros((queries.n_rows, targets.n_rows))
+    if queries.n_rows == 0 or targets.n_rows == 0:
+        return result
+    totals = queries.row_sums()
+    totals[totals == 0] = 1.0
+    buffer = np.zeros(queries.n_cols)
+
+    if queries.n_rows <= targets.n_rows:
+        target_rows = targets.row_ids()
+        for q in range(queries.n_rows):
+            start, end = queries.indptr[q], queries.indptr[q + 1]
+            columns = queries.indices[start:end]
+            buffer[columns] = queries.data[start:end]
+            covered = np.bincount(target_rows, weights=buffer[targets.indices], minlength=targets.n_rows)
+            result[q] = covered / totals[q]
+            buffer[columns] = 0.0
+    else:
+        query_rows = queries.row_ids()
+        for t in range(targets.n_rows):
+            columns = targets.indices[targets.indptr[t]:targets.indptr[t + 1]]
+            buffer[columns] = 1.0
+            covered = np.bincount(query_rows, weights=queries.data * buffer[queries.indices], minlength=queries.n_rows)
+            result[:, t] = covered / totals
+            buffer[columns] = 0.0
+    return result
+
+
+DEFAULT_VECTORIZER = TermVectorizer()
+
+
+def score_resumes_against_jds(resume_texts: Sequence[str], jd_texts: Sequence[str], vectorizer: Optional[TermVectorizer] = None, max_jd_terms: int = DEFAULT_MAX_JD_TERMS) -> np.ndarray:
+    """
+    Score every resume against every job description
+
+    Args:
+        resume_texts: Resume texts
+        jd_texts: Job description texts
+        vectorizer: Term vectorizer (default: shared skills/keywords vocabulary)
+        max_jd_terms: Highest-weight JD terms used for scoring
+
+    Returns:
+        Array of shape (len(resume_texts), len(jd_texts)) with scores from 0 to 100
+    """
+    vectorizer = vectorizer or DEFAULT_VECTORIZER
+    jds = vectorizer.transform(jd_texts, max_terms=max_jd_terms)
+    resumes = vectorizer.transform(resume_texts)
+    return 100.0 * coverage_matrix(jds, resumes).T
+
+
+def jd_match_components(resume_text: str, resume_skills_text: str, job_description: str, vectorizer: Optional[TermVectorizer] = None) -> Dict[str, object]:
+    """
+    Skills and keyword overlap between one resume and one job description
+
+    Args:
+        resume_text: Full resume text (used for keyword overlap)
+        resume_skills_text: Text of the resume's skills section (used for skills coverage)
+        job_description: Job description text
+
+    Returns:
+        Dictionary with 'required_skills' (taxonomy skills named in the JD), 'matched_skills'
+        (those found in the skills section under any alias) and 'matched_keywords' (keywords in both texts)
+    """
+    vectorizer = vectorizer or DEFAULT_VECTORIZER
+    jd_terms, resume_terms = (vectorizer.term_weights(text) for text in (job_description, resume_text))
+    taxonomy = get_skill_taxonomy()
+    required_ids = taxonomy.find_in_text(job_description)
+    resume_skill_ids = set(taxonomy.find_in_text(resume_skills_text))
+    return {
+        "required_skills": [taxonomy.display_name(skill_id) for skill_id in required_ids],
+        "matched_skills": [taxonomy.display_name(skill_id) for skill_id in required_ids if skill_id in resume_skill_ids],
+        "matched_keywords": [keyword for keyword in KEYWORD_TERMS if keyword in jd_terms and keyword in resume_terms]
+    }
+
+
+class JobDescriptionProfile:
+    """Job description digested once for scoring many resumes"""
+
+    def __init__(self, job_description: str, max_terms: int = DEFAULT_MAX_JD_TERMS, vectorizer: Optional[TermVectorizer] = None):
+        """
+        Args:
+            job_description: Job description text
+            max_terms: Number of highest-weight JD terms kept for scoring
+            vectorizer: Term vectorizer (default: shared skills/keywords vocabulary)
+        """
+        self.text = (job_description or "").strip()
+        self.vectorizer = vectorizer or DEFAULT_VECTORIZER
+        self.matrix = self.vectorizer.transform([self.text], max_terms=max_terms)
+        self.weights: Dict[str, float] = self.matrix.terms[0]
+
+    @property
+    def key_terms(self) -> List[str]:
+        """JD terms in descending weight order"""
+        return sorted(self.weights, key=lambda term: (-self.weights[term], term))
+
+    def prescore_many(self, resume_texts: Sequence[str]) -> np.ndarray:
+        """
+        Score many resumes against the digested job description in one vectorized pass
+
+        Returns:
+            Array of scores from 0 to 100, one per resume
+        """
+        return 100.0 * coverage_matrix(self.matrix, self.vectorizer.transform(resume_texts))[0]
+
+    def prescore(self, resume_text: str) -> Dict[str, object]:
+        """
+        Score a resume against the digested job description
+
+        Args:
+            resume_text: Resume text
+
+        Returns:
+            Dictionary with 'score' (0-100), 'matched_terms' and 'missing_terms'
+        """
+        resume_terms = self.vectorizer.term_weights(resume_text)
+        return {
+            "score": round(float(self.prescore_many([resume_text])[0]), 1),
+            "matched_terms": [term for term in self.key_terms if term in resume_terms],
+            "missing_terms": [term for term in self.key_terms if term not in resume_terms]
+        }
@@ -0,0 +1,456 @@
+"""
+Incremental JSON scanning and repair for model output.
+
+JsonMemberStream feeds text chunks as they arrive from a streaming chat completion and
+reports each object member as soon as its value is complete, so callers can act on the
+first sections of a large JSON document before the model has finished writing it.
+
+TolerantJsonParser (and repair_json) is the shared repair path for responses that are not
+plain JSON: it skips prose and code fences, tolerates the usual model mistakes and closes
+whatever a truncated completion left open, in a single forward pass.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Frame:
+    """One open object or array on the scanner stack"""
+
+    __slots__ = ("kind", "name", "key", "expect_key", "value_start")
+
+    def __init__(self, kind: str, name: Optional[str]):
+        self.kind = kind
+        self.name = name  # Key this container is stored under in its parent object
+        self.key = None  # Key of the member currently being read (objects only)
+        self.expect_key = kind == "{"
+        self.value_start = None  # Buffer offset where the current member value starts
+
+
+class JsonMemberStream:
+    """
+    Report completed object members of a JSON document while it is being streamed.
+
+    Text before the first '{' (prose, code fences) is skipped. Each character is scanned
+    once, and only completed member values are handed to json.loads.
+
+    Example:
+        stream = JsonMemberStream(max_depth=2)
+        for chunk in chunks:
+            for path, value in stream.feed(chunk):
+                ...  # path is ("detailed_feedback", "formatting_layout"), ("overall_score",), ...
+    """
+
+    def __init__(self, max_depth: int = 1):
+        """
+        Args:
+            max_depth: Deepest object nesting level whose members are reported (1 = top-level members only)
+        """
+        self.max_depth = max_depth
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._started = False
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self.done = False
+
+    @property
+    def text(self) -> str:
+        """All text fed so far"""
+        return self._text
+
+    def feed(self, chunk: str) -> List[Tuple[Tuple[str, ...], Any]]:
+        """
+        Scan a new chunk of text
+
+        Args:
+            chunk: Next piece of the streamed document
+
+        Returns:
+            List of (path, value) tuples for members completed within this chunk
+        """
+        if not chunk:
+            return []
+        self._text += chunk
+        completed: List[Tuple[Tuple[str, ...], Any]] = []
+        text = self._text
+        stack = self._stack
+
+        for i in range(self._pos, len(text)):
+            if self.done:
+                break
+            c = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    top = stack[-1]
+                    if top.kind == "{" and top.expect_key:
+                        try:
+                            top.key = json.loads(text[self._string_start:i + 1])
+                        except ValueError:
+                            top.key = text[self._string_start + 1:i]
+                continue
+
+            if not self._started:
+                if c == "{":
+                    self._started = True
+                    stack.append(_Frame("{", None))
+                continue
+
+            top = stack[-1]
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+                self._mark_value_start(top, i)
+            elif c == "{" or c == "[":
+                self._mark_value_start(top, i)
+                stack.append(_Frame(c, top.key if top.kind == "{" else None))
+            elif c == ":":
+                top.expect_key = False
+            elif c == ",":
+                self._finish_member(top, i, completed)
+                if top.kind == "{":
+                    top.expect_key = True
+            elif c == "}" or c == "]":
+                self._finish_member(top, i, completed)
+                stack.pop()
+                if not stack:
+                    self.done = True
+                    break
+                # A closed container completes its parent's member immediately
+                self._finish_member(stack[-1], i + 1, completed)
+            elif c not in _WHITESPACE:
+                self._mark_value_start(top, i)
+
+        self._pos = len(text)
+        return completed
+
+    @staticmethod
+    def _mark_value_start(frame: _Frame, index: int):
+        if frame.kind == "{" and not frame.expect_key and frame.value_start is None:
+            frame.value_start = index
+
+    def _finish_member(self, frame: _Frame, end: int, completed: List[Tuple[Tuple[str, ...], Any]]):
+        if frame.kind != "{" or frame.value_start is None:
+            return
+        start, key = frame.value_start, frame.key
+        frame.value_start = None
+        frame.key = None
+        # Members are only ever finished on the innermost open frame
+        depth = len(self._stack)
+        if key is None or depth > self.max_depth:
+            return
+        try:
+            value = json.loads(self._text[start:end])
+        except ValueError:
+            logger.debug(f"Skipping unparseable streamed member '{key}'")
+            return
+        path = tuple(f.name for f in self._stack[1:]) + (key,)
+        completed.append((path, value))
+
+
+_STRING_RUNS = {'"': re.compile(r'[^"\\]+'), "'": re.compile(r"[^'\\]+")}
+_ATOM_RUN = re.compile(r'[^\s,:\[\]{}"\'`]+')
+_SEPARATOR_RUN = re.compile(r'[\s:]+')
+_ESCAPE = re.compile(r'\\(u[0-9a-fA-F]{4}|.)', re.DOTALL)
+_SURROGATE = re.compile('[\ud800-\udfff]')
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+_NUMBER = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?')
+_LOOSE_NUMBER = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_LITERALS = {"true": True, "false": False, "null": None, "True": True, "False": False, "None": None}
+_MISSING = object()
+
+
+def _unescape(raw: str) -> str:
+    """Decode escape sequences leniently (unknown escapes keep the escaped character)"""
+    def _replace(match):
+        escape = match.group(1)
+        if len(escape) == 5:
+            return chr(int(escape[1:], 16))
+        return _ESCAPES.get(escape, escape)
+
+    value = _ESCAPE.sub(_replace, raw)
+    if _SURROGATE.search(value):
+        value = value.encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+    return value
+
+
+def _decode_string(raw: str, quote: str) -> str:
+    if quote == '"':
+        try:
+            return json.loads('"' + raw + '"', strict=False)
+        except ValueError:
+            pass
+    return _unescape(raw)
+
+
+def _atom_value(text: str, truncated: bool = False) -> Any:
+    """
+    Interpret an unquoted token: JSON or Python literal, number, or bare word
+
+    Returns:
+        The value, or _MISSING for a literal or number cut off by truncation
+    """
+    if text in _LITERALS:
+        return _LITERALS[text]
+    if truncated:
+        if any(literal.startswith(text) for literal in _LITERALS):
+            return _MISSING
+        text = text.rstrip(".eE+-")
+        if not text or text == "-":
+            return _MISSING
+    if _NUMBER.fullmatch(text):
+        return json.loads(text)
+    if _LOOSE_NUMBER.fullmatch(text):
+        number = float(text)
+        return int(number) if number.is_integer() and not any(char in text for char in ".eE") else number
+    return text
+
+
+class _RepairFrame:
+    """One open object or array of TolerantJsonParser"""
+
+    __slots__ = ("kind", "container", "key")
+
+    def __init__(self, kind: str, container: Any):
+        self.kind = kind
+        self.container = container  # None when the container is discarded (no key, or too deep)
+        self.key = None  # Pending key of an object member whose value has not been read yet
+
+
+class TolerantJsonParser:
+    """
+    Single-pass, incremental JSON parser that repairs common defects in model output.
+
+    Handles prose and code fences around the document, trailing and missing commas, unquoted
+    keys and bare-word values, single-quoted strings, Python literals, raw control characters
+    and invalid escapes in strings, mismatched closing brackets and truncation (open strings,
+    arrays and objects are closed; a key without a value is dropped).
+
+    Every character is consumed once and string/token runs are matched with anchored character
+    classes, so the cost is linear in the input regardless of how malformed it is. Containers
+    are attached to their parent when they open, so value holds a usable partial document at
+    any point of a stream.
+
+    Example:
+        parser = TolerantJsonParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+        data = parser.finish()
+    """
+
+    def __init__(self, allow_array_root: bool = False, max_depth: int = 512):
+        """
+        Args:
+            allow_array_root: Also start at a '[' (by default prose is skipped up to the first '{')
+            max_depth: Containers nested deeper than this are parsed but discarded
+        """
+        self.allow_array_root = allow_array_root
+        self.max_depth = max_depth
+        self._stack: List[_RepairFrame] = []
+        self._open_counts: Dict[str, int] = {"{": 0, "[": 0}
+        self._root: Any = _MISSING
+        self._string_quote: Optional[str] = None
+        self._string_parts: List[str] = []
+        self._atom_parts: List[str] = []
+        self._carry = ""  # Escape sequence split across chunks
+        self.done = False
+
+    @property
+    def value(self) -> Any:
+        """The document parsed so far (None before the root container has started)"""
+        return None if self._root is _MISSING else self._root
+
+    def feed(self, chunk: str):
+        """
+        Consume the next piece of the document
+
+        Args:
+            chunk: Text in arrival order; anything after the root container closes is ignored
+        """
+        if self.done or not chunk:
+            return
+        text = self._carry + chunk
+        self._carry = ""
+        end = len(text)
+        i = 0
+
+        if self._root is _MISSING and not self._stack:
+            i = self._find_root(text)
+            if i < 0:
+                return
+
+        while i < end and not self.done:
+            if self._string_quote is not None:
+                i = self._scan_string(text, i, end)
+                continue
+            if self._atom_parts:
+                match = _ATOM_RUN.match(text, i)
+                if match:
+                    self._atom_parts.append(match.group())
+                    i = match.end()
+                if i < end:
+                    self._finish_atom(truncated=text[i] == "`")
+                continue
+
+            char = text[i]
+            if char == "{" or char == "[":
+                self._open(char)
+                i += 1
+            elif char == "}" or char == "]":
+                self._close(char)
+                i += 1
+            elif char == '"' or char == "'":
+                self._string_quote = char
+                self._string_parts = []
+                i += 1
+            elif char == "`":
+                # A closing code fence inside the document means the completion was cut off before it
+                self._stack.clear()
+                self.done = True
+            elif char == ",":
+                top = self._stack[-1]
+                if top.kind == "{":
+                    top.key = None  # A key followed directly by ',' has no value
+                i += 1
+            else:
+                match = _SEPARATOR_RUN.match(text, i)
+                if match:
+                    i = match.end()
+                    continue
+                match = _ATOM_RUN.match(text, i)
+                self._atom_parts.append(match.group())
+                i = match.end()
+                if i < end:
+                    self._finish_atom()
+
+    def finish(self) -> Any:
+        """
+        Close whatever is still open and return the document
+
+        Raises:
+            json.JSONDecodeError: If no JSON container was found at all
+        """
+        if not self.done:
+            self._carry = ""
+            if self._string_quote is not None:
+                self._finish_string()
+            elif self._atom_parts:
+                self._finish_atom(truncated=True)
+            self._stack.clear()
+            self.done = True
+        if self._root is _MISSING:
+            raise json.JSONDecodeError("No JSON object found in response", "", 0)
+        return self._root
+
+    def _find_root(self, text: str) -> int:
+        start = text.find("{")
+        if self.allow_array_root:
+            array_start = text.find("[")
+            if array_start != -1 and (start == -1 or array_start < start):
+                start = array_start
+        return start
+
+    def _scan_string(self, text: str, i: int, end: int) -> int:
+        quote = self._string_quote
+        match = _STRING_RUNS[quote].match(text, i)
+        if match:
+            self._string_parts.append(match.group())
+            i = match.end()
+        if i >= end:
+            return i
+        if text[i] == quote:
+            self._finish_string()
+            return i + 1
+        # Backslash: keep the escape sequence raw, waiting for the rest if the chunk ends inside it
+        length = 6 if i + 1 < end and text[i + 1] == "u" else 2
+        if i + length > end:
+            self._carry = text[i:]
+            return end
+        self._string_parts.append(text[i:i + length])
+        return i + length
+
+    def _finish_string(self):
+        value = _decode_string("".join(self._string_parts), self._string_quote)
+        self._string_quote = None
+        self._string_parts = []
+        self._add_scalar(value, value)
+
+    def _finish_atom(self, truncated: bool = False):
+        text = "".join(self._atom_parts)
+        self._atom_parts = []
+        self._add_scalar(text, _atom_value(text, truncated))
+
+    def _add_scalar(self, key: str, value: Any):
+        top = self._stack[-1]
+        if top.kind == "{" and top.key is None:
+            top.key = key
+        elif value is not _MISSING:
+            self._attach(top, value)
+
+    def _attach(self, frame: _RepairFrame, value: Any):
+        if frame.kind == "{":
+            if frame.container is not None:
+                frame.container[frame.key] = value
+            frame.key = None
+        elif frame.container is not None:
+            frame.container.append(value)
+
+    def _open(self, kind: str):
+        container = {} if kind == "{" else []
+        if not self._stack:
+            self._root = container
+        else:
+            parent = self._stack[-1]
+            if len(self._stack) >= self.max_depth or (parent.kind == "{" and parent.key is None):
+                container = None
+            elif parent.container is None:
+                container = None
+            else:
+                self._attach(parent, container)
+        self._stack.append(_RepairFrame(kind, container))
+        self._open_counts[kind] += 1
+
+    def _close(self, closer: str):
+        kind = "{" if closer == "}" else "["
+        if not self._open_counts[kind]:
+            return  # Stray closer
+        while True:
+            frame = self._stack.pop()
+            self._open_counts[frame.kind] -= 1
+            if frame.kind == kind:
+                break
+        if not self._stack:
+            self.done = True
+
+
+def repair_json(text: str, allow_array_root: bool = False) -> Any:
+    """
+    Parse model output that is not plain JSON with TolerantJsonParser
+
+    Args:
+        text: Raw response text (may contain prose, code fences or be truncated)
+        allow_array_root: Accept a top-level array as well as an object
+
+    Returns:
+        The repaired document
+
+    Raises:
+        json.JSONDecodeError: If the text contains no JSON container
+    """
+    parser = TolerantJsonParser(allow_array_root=allow_array_root)
+    parser.feed(text)
+    return parser.finish()
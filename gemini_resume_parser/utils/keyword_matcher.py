@@ -0,0 +1,164 @@
+"""
+Aho-Corasick keyword matcher with word-boundary semantics
+A dictionary of keywords and phrases is compiled once into an automaton; each text is then
+scanned in a single pass whatever the dictionary size, instead of one substring check per
+keyword. Hits must be whole words ("ai" does not match inside "maintain"), matching is
+case-insensitive unless a keyword is registered as case-sensitive, and any run of
+whitespace in the text matches a single space in a phrase.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+# Characters besides letters and digits that count as part of a word at a match boundary,
+# so "c" does not match inside "c++" or "c#"
+DEFAULT_WORD_CHARS = "_+#"
+
+
+class KeywordMatch:
+    """One keyword occurrence: character span in the original text, keyword and its value"""
+
+    __slots__ = ("start", "end", "keyword", "value")
+
+    def __init__(self, start: int, end: int, keyword: str, value: Any):
+        self.start = start
+        self.end = end
+        self.keyword = keyword
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"KeywordMatch({self.start}, {self.end}, {self.keyword!r}, {self.value!r})"
+
+
+class KeywordMatcher:
+    """Compiled multi-keyword matcher; build once at import time and reuse for every text"""
+
+    def __init__(self, keywords: Union[Iterable[str], Mapping[str, Any]], case_sensitive: Iterable[str] = (),
+                 word_chars: str = DEFAULT_WORD_CHARS):
+        """
+        Args:
+            keywords: Keywords and phrases, or a mapping of keyword -> value reported with each hit
+                (a plain iterable reports the keyword itself as the value)
+            case_sensitive: Keywords that only match with exactly this capitalization
+                ("Go" the language, not "go" the verb)
+            word_chars: Non-alphanumeric characters treated as part of a word at boundaries
+        """
+        if not isinstance(keywords, Mapping):
+            keywords = {keyword: keyword for keyword in keywords}
+        self.word_chars = frozenset(word_chars)
+        self._case_sensitive: Set[str] = set(case_sensitive)
+
+        # Trie over folded keywords; a node's outputs are (keyword length, keyword, value) tuples
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[List[Tuple[int, str, Any]]] = [[]]
+        self._size = 0
+        for keyword, value in keywords.items():
+            folded = " ".join(keyword.lower().split())
+            if not folded:
+                continue
+            node = 0
+            for char in folded:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._outputs.append([])
+                node = next_node
+            self._outputs[node].append((len(folded), keyword, value))
+            self._size += 1
+
+        # Failure links in breadth-first order; outputs of the fallback state are inherited
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _is_word_char(self, char: str) -> bool:
+        return char.isalnum() or char in self.word_chars
+
+    def find_all(self, text: str, overlapping: bool = False) -> List[KeywordMatch]:
+        """
+        Find keyword occurrences in one pass over text
+
+        Args:
+            text: Text to scan
+            overlapping: Return every hit; by default overlapping hits are resolved
+                leftmost-longest ("machine learning" wins over "learning")
+
+        Returns:
+            Matches ordered by start offset
+        """
+        if not text or not self._size:
+            return []
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        # Positions in the original text of each scanned character (whitespace runs scan as one space)
+        positions: List[int] = []
+        hits: List[KeywordMatch] = []
+        node = 0
+        previous_space = True
+        for index, char in enumerate(text):
+            if char.isspace():
+                if previous_space:
+                    continue
+                char = " "
+                previous_space = True
+            else:
+                previous_space = False
+                lowered = char.lower()
+                char = lowered if len(lowered) == 1 else char
+            positions.append(index)
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, keyword, value in outputs[node]:
+                start = positions[len(positions) - length]
+                end = index + 1
+                if start > 0 and self._is_word_char(text[start - 1]):
+                    continue
+                if end < len(text) and self._is_word_char(text[end]):
+                    continue
+                if keyword in self._case_sensitive and " ".join(text[start:end].split()) != " ".join(keyword.split()):
+                    continue
+                hits.append(KeywordMatch(start, end, keyword, value))
+
+        if overlapping:
+            hits.sort(key=lambda hit: (hit.start, -hit.end))
+            return hits
+        hits.sort(key=lambda hit: (hit.start, -(hit.end - hit.start)))
+        selected: List[KeywordMatch] = []
+        covered_until = 0
+        for hit in hits:
+            if hit.start >= covered_until:
+                selected.append(hit)
+                covered_until = hit.end
+        return selected
+
+    def find_keywords(self, text: str) -> Set[str]:
+        """Distinct keywords present in text (every whole-word hit, overlapping included)"""
+        return {hit.keyword for hit in self.find_all(text, overlapping=True)}
+
+    def find_values(self, text: str) -> List[Any]:
+        """Values of the leftmost-longest hits, in order of first appearance, without duplicates"""
+        values: Dict[Any, None] = {}
+        for hit in self.find_all(text):
+            values.setdefault(hit.value, None)
+        return list(values)
+
+    def contains_any(self, text: str) -> bool:
+        """True if any keyword occurs in text"""
+        return bool(self.find_all(text, overlapping=True))
+
+    def first_value(self, text: str) -> Optional[Any]:
+        """Value of the first hit in text, or None"""
+        hits = self.find_all(text)
+        return hits[0].value if hits else None
@@ -2,9 +2,19 @@ import os
 import pdfplumber
 import docx2txt
 import re
-from typing import Optional, Union
+from typing import Optional, Union, Dict, Any
 from pathlib import Path
 
+from config.config import OpenAIConfig
+from utils.extraction_cache import ExtractionCache
+
+# Process-wide cache of normalized text keyed by SHA-256 of the file bytes
+_extraction_cache = ExtractionCache(
+    max_entries=OpenAIConfig.EXTRACTION_CACHE_MAX_ENTRIES,
+    disk_dir=OpenAIConfig.EXTRACTION_CACHE_DIR or None,
+    max_disk_bytes=OpenAIConfig.EXTRACTION_CACHE_MAX_DISK_MB * 1024 * 1024
+)
+
 class DocumentExtractor:
     """Utility class for extracting text from various document formats (PDF, DOCX, TXT)"""
     
@@ -158,12 +168,16 @@ class DocumentExtractor:
             raise ValueError(f"Failed to read text file: {str(e)}")
     
     @staticmethod
-    def extract_text(file_path: Union[str, Path]) -> str:
+    def extract_text(file_path: Union[str, Path], use_cache: bool = True) -> str:
         """
         Extract text from file based on its extension
         
+        Identical files (same SHA-256 of their bytes) are served from the extraction
+        cache, skipping PDF/DOCX parsing and text normalization entirely.
+        
         Args:
             file_path: Path to the file
+            use_cache: Whether to consult and populate the extraction cache
             
         Returns:
             Extracted text as string
@@ -171,6 +185,31 @@ class DocumentExtractor:
         file_path = Path(file_path)
         extension = file_path.suffix.lower()
         
+        if not use_cache or not OpenAIConfig.EXTRACTION_CACHE_ENABLED or not file_path.exists():
+            return DocumentExtractor._extract_text_uncached(file_path, extension)
+        
+        cache_key = ExtractionCache.make_key(file_path.read_bytes(), extension)
+        cached_text = _extraction_cache.get(cache_key)
+        if cached_text is not None:
+            return cached_text
+        
+        text = DocumentExtractor._extract_text_uncached(file_path, extension)
+        _extraction_cache.put(cache_key, text)
+        return text
+    
+    @staticmethod
+    def get_cache_stats() -> Dict[str, Any]:
+        """Get hit/miss counters for the extraction cache"""
+        return _extraction_cache.get_stats()
+    
+    @staticmethod
+    def clear_cache():
+        """Drop all cached extraction results"""
+        _extraction_cache.clear()
+    
+    @staticmethod
+    def _extract_text_uncached(file_path: Path, extension: str) -> str:
+        """Dispatch to the format-specific extractor"""
         if extension == '.pdf':
             return DocumentExtractor.extract_text_from_pdf(file_path)
         elif extension == '.docx':
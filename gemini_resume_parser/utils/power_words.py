@@ -0,0 +1,247 @@
+"""
+Shared power-word lexicon and single-pass tokenizer
+Action verbs, professional terms and the precompiled patterns used by the repetition
+analysis in the ATS and resume improvement services
+"""
+import re
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Action verbs checked for repetition
+ACTION_VERBS: FrozenSet[str] = frozenset({
+    'implemented', 'managed', 'developed', 'created', 'built', 'designed', 'led', 'executed', 'delivered',
+    'optimized', 'improved', 'enhanced', 'streamlined', 'automated', 'deployed', 'integrated', 'configured',
+    'maintained', 'monitored', 'analyzed', 'resolved', 'coordinated', 'collaborated', 'mentored', 'trained',
+    'established', 'initiated', 'launched', 'completed', 'achieved', 'increased', 'reduced', 'saved',
+    'transformed', 'migrated', 'upgraded', 'refactored', 'debugged', 'tested', 'validated', 'verified',
+    'documented', 'presented', 'communicated', 'facilitated', 'supervised', 'directed', 'guided', 'influenced',
+    'negotiated', 'planned', 'organized', 'scheduled', 'prioritized', 'evaluated', 'assessed', 'reviewed',
+    'recommended', 'proposed', 'suggested', 'identified', 'discovered', 'investigated', 'researched',
+    'studied', 'learned', 'acquired', 'gained', 'obtained', 'secured', 'earned', 'won', 'received', 'utilized'
+})
+
+# Professional terms checked for repetition
+PROFESSIONAL_TERMS: FrozenSet[str] = frozenset({
+    'scalable', 'secure', 'efficient', 'robust', 'reliable', 'flexible', 'comprehensive', 'advanced',
+    'innovative', 'cutting-edge', 'state-of-the-art', 'high-performance', 'enterprise-grade', 'mission-critical',
+    'cost-effective', 'user-friendly', 'intuitive', 'seamless', 'integrated', 'automated', 'streamlined',
+    'optimized', 'enhanced', 'improved', 'upgraded', 'modernized', 'standardized', 'centralized',
+    'distributed', 'cloud-based', 'web-based', 'mobile-first', 'responsive', 'cross-platform',
+    'real-time', 'high-availability', 'fault-tolerant', 'load-balanced', 'microservices', 'api-driven'
+})
+
+# Wider synonym pool: words already in the resume that suggestions must not reuse
+EXTENDED_ACTION_VERBS: FrozenSet[str] = ACTION_VERBS | frozenset({
+    'accomplished', 'adapted', 'adjusted', 'administered', 'advanced', 'advocated', 'aided', 'allocated',
+    'allowed', 'altered', 'appointed', 'approved', 'architected', 'assembled', 'assigned', 'assisted',
+    'attained', 'authenticated', 'authorized', 'backed', 'balanced', 'boosted', 'captured', 'carried',
+    'certified', 'championed', 'changed', 'chased', 'checked', 'chosen', 'cleaned', 'cleared', 'conceived',
+    'concluded', 'conducted', 'confirmed', 'conserved', 'constructed', 'contributed', 'controlled',
+    'converted', 'conveyed', 'corrected', 'crafted', 'customized', 'cut', 'decided', 'decontaminated',
+    'decreased', 'defended', 'deleted', 'designated', 'determined', 'devised', 'diminished', 'disinfected',
+    'distributed', 'donated', 'elected', 'eliminated', 'enabled', 'endorsed', 'engineered', 'enlarged',
+    'erased', 'examined', 'expanded', 'explored', 'extended', 'fabricated', 'fashioned', 'finalized',
+    'financed', 'finished', 'fitted', 'fixed', 'followed', 'forged', 'formed', 'funded', 'generated',
+    'governed', 'grasped', 'gripped', 'guarded', 'harmonized', 'held', 'helped', 'hunted', 'innovated',
+    'inspected', 'invented', 'invested', 'lessened', 'lowered', 'manufactured', 'maximized', 'mended',
+    'minimized', 'modified', 'molded', 'moved', 'neutralized', 'observed', 'orchestrated', 'oversaw',
+    'patched', 'perfected', 'permitted', 'personalized', 'picked', 'pioneered', 'polished', 'preserved',
+    'produced', 'progressed', 'promoted', 'proportioned', 'protected', 'provided', 'purified', 'pursued',
+    'reached', 'reassembled', 'rebuilt', 'reconstructed', 'refined', 'refreshed', 'regenerated',
+    'regulated', 'rejuvenated', 'relocated', 'removed', 'renewed', 'repaired', 'restored', 'retained',
+    'revitalized', 'safeguarded', 'sanctioned', 'sanitized', 'scaled', 'searched', 'seized', 'selected',
+    'settled', 'shaped', 'shielded', 'shifted', 'sized', 'slashed', 'spearheaded', 'sponsored', 'spread',
+    'stabilized', 'sterilized', 'supplied', 'supported', 'synchronized', 'tailored', 'tracked',
+    'transferred', 'transported', 'trimmed', 'voted', 'watched', 'wiped'
+})
+
+EXTENDED_PROFESSIONAL_TERMS: FrozenSet[str] = PROFESSIONAL_TERMS | frozenset({
+    'administered', 'agile-driven', 'architecture-driven', 'balanced', 'behavior-driven', 'business-driven',
+    'cloud-driven', 'compliance-driven', 'component-based', 'conducted', 'controlled', 'coordinated',
+    'customer-driven', 'data-driven', 'declarative', 'defended', 'design-driven', 'devops-driven',
+    'directed', 'domain-driven', 'event-driven', 'followed', 'fortified', 'functional', 'governed',
+    'guarded', 'hardened', 'harmonized', 'imperative', 'lean-driven', 'managed', 'market-driven',
+    'message-driven', 'model-driven', 'modular', 'monitored', 'object-oriented', 'orchestrated', 'oversaw',
+    'performance-driven', 'procedural', 'protected', 'quality-driven', 'reactive', 'regulated',
+    'reinforced', 'safe', 'secured', 'security-driven', 'service-oriented', 'shielded', 'solidified',
+    'stabilized', 'strengthened', 'supervised', 'synchronized', 'test-driven', 'toughened', 'tracked',
+    'user-driven'
+})
+
+# Common words never reported as repetitions
+COMMON_WORDS: FrozenSet[str] = frozenset({
+    'and', 'in', 'with', 'of', 'to', 'for', 'on', 'by', 'the', 'a', 'an', 'is', 'are', 'was', 'were',
+    'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'may', 'might', 'can', 'must', 'shall', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she',
+    'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'
+})
+
+# Hyphenated lexicon entries are kept as one token; other hyphenated words are split into parts
+_HYPHENATED_TERMS: FrozenSet[str] = frozenset(
+    word for word in EXTENDED_ACTION_VERBS | EXTENDED_PROFESSIONAL_TERMS if '-' in word
+)
+
+# One scan finds words and sentence terminators (same boundaries as re.split(r'[.!?]+'))
+_SCAN_PATTERN = re.compile(r"(?P<word>[a-zA-Z]+(?:-[a-zA-Z]+)*)|(?P<stop>[.!?]+)")
+
+ACTION_VERB = "Action Verb"
+PROFESSIONAL_TERM = "Professional Term"
+
+
+class TokenizedText:
+    """Tokens, counts and sentence spans produced by one pass over a block of text"""
+
+    __slots__ = ("text", "tokens", "token_sentences", "sentence_offsets", "counts", "_sentence_index")
+
+    def __init__(self, text: str, tokens: List[str], token_sentences: List[int], sentence_offsets: List[Tuple[int, int]]):
+        """
+        Args:
+            text: Original text
+            tokens: Lowercased word tokens in order
+            token_sentences: Sentence index of each token
+            sentence_offsets: (start, end) character span of each sentence in text
+        """
+        self.text = text
+        self.tokens = tokens
+        self.token_sentences = token_sentences
+        self.sentence_offsets = sentence_offsets
+        self.counts = Counter(tokens)
+        self._sentence_index: Optional[Dict[str, List[int]]] = None
+
+    def sentence(self, index: int) -> str:
+        """Text of a sentence, stripped"""
+        start, end = self.sentence_offsets[index]
+        return self.text[start:end].strip()
+
+    def sentence_index(self) -> Dict[str, List[int]]:
+        """Inverted index of word -> ascending indices of the sentences containing it (built once)"""
+        if self._sentence_index is None:
+            index: Dict[str, List[int]] = {}
+            for token, sentence_number in zip(self.tokens, self.token_sentences):
+                positions = index.setdefault(token, [])
+                if not positions or positions[-1] != sentence_number:
+                    positions.append(sentence_number)
+            self._sentence_index = index
+        return self._sentence_index
+
+    def contexts(self, word: str, limit: int = 3, max_length: int = 100) -> List[str]:
+        """
+        Sentences containing word as a whole token, in order of appearance
+
+        Args:
+            word: Lowercase word to look up
+            limit: Maximum number of sentences to return
+            max_length: Sentences longer than this are truncated with "..."
+
+        Returns:
+            List of stripped (possibly truncated) sentences
+        """
+        contexts = []
+        for sentence_number in self.sentence_index().get(word, [])[:limit]:
+            sentence = self.sentence(sentence_number)
+            contexts.append(sentence[:max_length] + "..." if len(sentence) > max_length else sentence)
+        return contexts
+
+
+def tokenize(text: str) -> TokenizedText:
+    """
+    Tokenize text into lowercase words and sentence spans in a single pass
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        TokenizedText with tokens, per-token sentence indices, sentence offsets and counts
+    """
+    text = text or ""
+    tokens: List[str] = []
+    token_sentences: List[int] = []
+    sentence_offsets: List[Tuple[int, int]] = []
+    sentence_start = 0
+
+    for match in _SCAN_PATTERN.finditer(text):
+        word = match.group("word")
+        if word is None:
+            sentence_offsets.append((sentence_start, match.start()))
+            sentence_start = match.end()
+            continue
+
+        word = word.lower()
+        sentence_index = len(sentence_offsets)
+        if '-' in word and word not in _HYPHENATED_TERMS:
+            for part in word.split('-'):
+                tokens.append(part)
+                token_sentences.append(sentence_index)
+        else:
+            tokens.append(word)
+            token_sentences.append(sentence_index)
+
+    sentence_offsets.append((sentence_start, len(text)))
+    return TokenizedText(text, tokens, token_sentences, sentence_offsets)
+
+
+def tokenize_sections(sections: Dict[str, str]) -> Dict[str, TokenizedText]:
+    """Tokenize each section of a resume (per-section counts are available on each result)"""
+    return {name: tokenize(section_text) for name, section_text in sections.items()}
+
+
+def power_word_type(word: str) -> Optional[str]:
+    """Return "Action Verb", "Professional Term" or None for a lowercase word"""
+    if word in ACTION_VERBS:
+        return ACTION_VERB
+    if word in PROFESSIONAL_TERMS:
+        return PROFESSIONAL_TERM
+    return None
+
+
+def find_repetitions(tokenized: TokenizedText, min_count: int = 2) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Find repeated action verbs and professional terms
+
+    Words in both sets are reported as action verbs only.
+
+    Args:
+        tokenized: Tokenized text (usually one resume section or item)
+        min_count: Minimum occurrences to count as a repetition
+
+    Returns:
+        Tuple of (action verb counts, professional term counts) for repeated words
+    """
+    action_verb_repetitions: Dict[str, int] = {}
+    professional_term_repetitions: Dict[str, int] = {}
+    for word, count in tokenized.counts.items():
+        if count < min_count or word in COMMON_WORDS:
+            continue
+        if word in ACTION_VERBS:
+            action_verb_repetitions[word] = count
+        elif word in PROFESSIONAL_TERMS:
+            professional_term_repetitions[word] = count
+    return action_verb_repetitions, professional_term_repetitions
+
+
+def collect_used_power_words(text: str) -> List[str]:
+    """
+    Collect action verbs and professional terms (extended pool) already present in text
+
+    Base forms with -ed, -ing or -s stripped are matched as well.
+
+    Args:
+        text: Resume text
+
+    Returns:
+        Sorted list of power words found
+    """
+    all_words = set()
+    for token in tokenize(text).counts:
+        all_words.add(token)
+        # Strip common verb endings to get base form
+        if token.endswith('ed'):
+            if len(token) > 4:
+                all_words.add(token[:-2])
+        elif token.endswith('ing'):
+            if len(token) > 5:
+                all_words.add(token[:-3])
+        elif token.endswith('s') and len(token) > 3:
+            all_words.add(token[:-1])
+
+    return sorted(word for word in all_words if word in EXTENDED_ACTION_VERBS or word in EXTENDED_PROFESSIONAL_TERMS)
@@ -0,0 +1,98 @@
+"""
+Prompt-template registry.
+
+Every service prompt is split into a static system prefix (instructions, scoring rules,
+output schema) and a trailing user message that carries the per-request data. The prefix
+is byte-identical on every call, so provider-side prompt caching can reuse it; its hash is
+reported so a change that breaks caching is visible.
+"""
+
+import hashlib
+import textwrap
+import threading
+from typing import Dict, List
+
+_registry: Dict[str, "PromptTemplate"] = {}
+_registry_lock = threading.Lock()
+
+
+class PromptTemplate:
+    """A static system prefix plus a str.format template for the dynamic user message"""
+
+    __slots__ = ("name", "system", "user_template", "prefix_hash")
+
+    def __init__(self, name: str, system: str, user_template: str):
+        """
+        Args:
+            name: Registry key, e.g. 'ats.standard'
+            system: Static instructions; never formatted, so braces are literal
+            user_template: Dynamic part, rendered with str.format(**values)
+        """
+        self.name = name
+        self.system = textwrap.dedent(system).strip()
+        self.user_template = textwrap.dedent(user_template).strip()
+        self.prefix_hash = hashlib.sha256(self.system.encode("utf-8")).hexdigest()[:16]
+
+    def render_user(self, **values) -> str:
+        """Render the dynamic user message"""
+        return self.user_template.format(**values)
+
+    def messages(self, **values) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for one call
+
+        Returns:
+            [system prefix, rendered user message]
+        """
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.render_user(**values)}
+        ]
+
+
+def register_prompt(name: str, system: str, user_template: str) -> PromptTemplate:
+    """
+    Register a prompt template (idempotent for identical content)
+
+    Args:
+        name: Registry key
+        system: Static system prefix
+        user_template: Dynamic user message template
+
+    Returns:
+        The registered PromptTemplate
+
+    Raises:
+        ValueError: If a different template is already registered under the same name
+    """
+    template = PromptTemplate(name, system, user_template)
+    with _registry_lock:
+        existing = _registry.get(name)
+        if existing is not None:
+            if existing.system != template.system or existing.user_template != template.user_template:
+                raise ValueError(f"Prompt template '{name}' is already registered with different content")
+            return existing
+        _registry[name] = template
+    return template
+
+
+def get_prompt(name: str) -> PromptTemplate:
+    """Get a registered prompt template by name"""
+    with _registry_lock:
+        if name not in _registry:
+            raise KeyError(f"Unknown prompt template: {name}")
+        return _registry[name]
+
+
+def prompt_prefix_hashes() -> Dict[str, Dict[str, object]]:
+    """
+    Report the static prefix of every registered prompt
+
+    Returns:
+        {name: {'prefix_sha256': 16-hex-digit hash, 'prefix_chars': length}}
+    """
+    with _registry_lock:
+        return {
+            name: {"prefix_sha256": template.prefix_hash, "prefix_chars": len(template.system)}
+            for name, template in sorted(_registry.items())
+        }
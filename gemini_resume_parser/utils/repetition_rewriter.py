@@ -0,0 +1,271 @@
+"""
+Deterministic repetition rewriter
+Replaces repeated action verbs and professional terms inside one resume item with synonyms from
+a curated graph, so the LLM rephrase is only needed for what the graph cannot fix.
+
+The first occurrence of a repeated word is kept and every later one gets a synonym. Synonyms
+are assigned per item by bipartite matching, so no synonym is used twice and none collides
+with a word the item already contains. Graph entries share the inflection of their key
+(simple past for verbs), participles are swapped in after an auxiliary ("has grown", not
+"has grew"), capitalization follows the replaced word and "a"/"an" is fixed before it.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.power_words import find_repetitions, tokenize
+
+# Curated synonyms for ACTION_VERBS and PROFESSIONAL_TERMS, in the inflection of the key.
+# "microservices" is a noun with no drop-in synonym and is left to the LLM.
+SYNONYM_GRAPH: Dict[str, Tuple[str, ...]] = {
+    # Action verbs
+    'implemented': ('executed', 'introduced', 'instituted', 'deployed', 'delivered', 'applied'),
+    'managed': ('oversaw', 'directed', 'supervised', 'administered', 'coordinated', 'headed', 'ran'),
+    'developed': ('built', 'engineered', 'created', 'authored', 'produced', 'crafted', 'devised'),
+    'created': ('built', 'designed', 'developed', 'produced', 'established', 'authored', 'crafted'),
+    'built': ('constructed', 'developed', 'engineered', 'assembled', 'created', 'crafted'),
+    'designed': ('architected', 'devised', 'planned', 'modeled', 'conceived', 'drafted', 'shaped'),
+    'led': ('headed', 'directed', 'spearheaded', 'steered', 'guided', 'championed', 'drove'),
+    'executed': ('performed', 'conducted', 'completed', 'implemented', 'accomplished', 'delivered'),
+    'delivered': ('shipped', 'provided', 'released', 'produced', 'completed', 'supplied'),
+    'optimized': ('tuned', 'refined', 'streamlined', 'improved', 'enhanced', 'accelerated'),
+    'improved': ('enhanced', 'strengthened', 'boosted', 'elevated', 'refined', 'upgraded', 'advanced'),
+    'enhanced': ('improved', 'strengthened', 'augmented', 'elevated', 'enriched', 'refined'),
+    'streamlined': ('simplified', 'optimized', 'consolidated', 'accelerated', 'expedited', 'refined'),
+    'automated': ('scripted', 'mechanized', 'systematized', 'streamlined', 'programmed'),
+    'deployed': ('released', 'shipped', 'launched', 'installed', 'provisioned', 'published'),
+    'integrated': ('incorporated', 'combined', 'unified', 'connected', 'merged', 'embedded'),
+    'configured': ('customized', 'tuned', 'provisioned', 'adjusted', 'tailored', 'calibrated'),
+    'maintained': ('sustained', 'supported', 'preserved', 'upheld', 'serviced', 'kept'),
+    'monitored': ('tracked', 'observed', 'supervised', 'watched', 'audited', 'measured'),
+    'analyzed': ('examined', 'evaluated', 'assessed', 'studied', 'investigated', 'interpreted', 'reviewed'),
+    'resolved': ('fixed', 'solved', 'addressed', 'remedied', 'settled', 'corrected', 'troubleshot'),
+    'coordinated': ('organized', 'orchestrated', 'arranged', 'synchronized', 'aligned', 'managed'),
+    'collaborated': ('partnered', 'cooperated', 'teamed', 'worked', 'liaised', 'engaged'),
+    'mentored': ('coached', 'guided', 'tutored', 'advised', 'trained', 'counseled'),
+    'trained': ('coached', 'educated', 'instructed', 'taught', 'mentored', 'prepared'),
+    'established': ('founded', 'instituted', 'created', 'launched', 'formed', 'introduced'),
+    'initiated': ('launched', 'started', 'introduced', 'instigated', 'pioneered', 'originated'),
+    'launched': ('introduced', 'released', 'initiated', 'unveiled', 'debuted', 'started'),
+    'completed': ('finished', 'finalized', 'concluded', 'accomplished', 'fulfilled', 'delivered'),
+    'achieved': ('attained', 'reached', 'accomplished', 'realized', 'secured', 'earned'),
+    'increased': ('boosted', 'raised', 'grew', 'expanded', 'elevated', 'amplified', 'lifted'),
+    'reduced': ('decreased', 'lowered', 'cut', 'minimized', 'trimmed', 'lessened', 'shrank'),
+    'saved': ('conserved', 'preserved', 'recovered', 'reclaimed', 'spared', 'retained'),
+    'transformed': ('overhauled', 'revamped', 'reshaped', 'modernized', 'converted', 'reinvented'),
+    'migrated': ('moved', 'transferred', 'ported', 'relocated', 'transitioned', 'shifted'),
+    'upgraded': ('modernized', 'updated', 'improved', 'enhanced', 'refreshed', 'advanced'),
+    'refactored': ('restructured', 'reworked', 'rewrote', 'reorganized', 'simplified', 'redesigned'),
+    'debugged': ('troubleshot', 'diagnosed', 'fixed', 'resolved', 'corrected', 'traced'),
+    'tested': ('verified', 'validated', 'checked', 'evaluated', 'examined', 'trialed'),
+    'validated': ('verified', 'confirmed', 'tested', 'checked', 'certified', 'substantiated'),
+    'verified': ('confirmed', 'validated', 'checked', 'tested', 'authenticated', 'audited'),
+    'documented': ('recorded', 'described', 'catalogued', 'chronicled', 'detailed', 'wrote'),
+    'presented': ('demonstrated', 'showcased', 'delivered', 'introduced', 'pitched', 'briefed'),
+    'communicated': ('conveyed', 'shared', 'relayed', 'reported', 'articulated', 'explained'),
+    'facilitated': ('enabled', 'supported', 'moderated', 'hosted', 'led', 'coordinated'),
+    'supervised': ('oversaw', 'managed', 'directed', 'led', 'monitored', 'headed'),
+    'directed': ('led', 'managed', 'oversaw', 'steered', 'headed', 'guided'),
+    'guided': ('steered', 'directed', 'led', 'advised', 'coached', 'mentored'),
+    'influenced': ('shaped', 'swayed', 'persuaded', 'drove', 'informed', 'affected'),
+    'negotiated': ('brokered', 'arranged', 'secured', 'mediated', 'settled', 'bargained'),
+    'planned': ('designed', 'mapped', 'organized', 'scheduled', 'charted', 'outlined'),
+    'organized': ('arranged', 'coordinated', 'structured', 'orchestrated', 'planned', 'assembled'),
+    'scheduled': ('planned', 'arranged', 'booked', 'timetabled', 'slotted', 'organized'),
+    'prioritized': ('ranked', 'sequenced', 'triaged', 'ordered', 'focused', 'emphasized'),
+    'evaluated': ('assessed', 'appraised', 'reviewed', 'analyzed', 'measured', 'examined'),
+    'assessed': ('evaluated', 'appraised', 'gauged', 'reviewed', 'measured', 'analyzed'),
+    'reviewed': ('examined', 'audited', 'inspected', 'evaluated', 'assessed', 'checked'),
+    'recommended': ('proposed', 'advised', 'suggested', 'advocated', 'endorsed', 'urged'),
+    'proposed': ('suggested', 'recommended', 'presented', 'pitched', 'advocated', 'submitted'),
+    'suggested': ('proposed', 'recommended', 'advised', 'offered', 'advocated', 'submitted'),
+    'identified': ('pinpointed', 'detected', 'discovered', 'recognized', 'uncovered', 'spotted'),
+    'discovered': ('uncovered', 'found', 'identified', 'detected', 'unearthed', 'revealed'),
+    'investigated': ('examined', 'researched', 'probed', 'explored', 'analyzed', 'studied'),
+    'researched': ('investigated', 'explored', 'studied', 'examined', 'surveyed', 'analyzed'),
+    'studied': ('examined', 'researched', 'analyzed', 'explored', 'reviewed', 'investigated'),
+    'learned': ('mastered', 'acquired', 'absorbed', 'studied', 'grasped', 'gained'),
+    'acquired': ('obtained', 'gained', 'secured', 'earned', 'attained', 'procured'),
+    'gained': ('acquired', 'obtained', 'earned', 'attained', 'secured', 'built'),
+    'obtained': ('acquired', 'secured', 'earned', 'gained', 'attained', 'procured'),
+    'secured': ('obtained', 'won', 'earned', 'landed', 'acquired', 'clinched'),
+    'earned': ('gained', 'achieved', 'attained', 'won', 'secured', 'obtained'),
+    'won': ('earned', 'secured', 'captured', 'gained', 'clinched', 'landed'),
+    'received': ('earned', 'obtained', 'gained', 'accepted', 'collected', 'secured'),
+    'utilized': ('used', 'applied', 'employed', 'leveraged', 'harnessed', 'adopted'),
+    # Professional terms
+    'scalable': ('extensible', 'elastic', 'expandable', 'adaptable', 'growth-ready'),
+    'secure': ('protected', 'hardened', 'safeguarded', 'safe', 'locked-down'),
+    'efficient': ('lean', 'economical', 'productive', 'performant', 'effective'),
+    'robust': ('resilient', 'sturdy', 'durable', 'solid', 'dependable', 'hardened'),
+    'reliable': ('dependable', 'consistent', 'stable', 'trustworthy', 'resilient', 'proven'),
+    'flexible': ('adaptable', 'versatile', 'configurable', 'extensible', 'agile', 'modular'),
+    'comprehensive': ('thorough', 'complete', 'extensive', 'end-to-end', 'exhaustive', 'full'),
+    'advanced': ('sophisticated', 'modern', 'leading-edge', 'progressive', 'next-generation', 'complex'),
+    'innovative': ('inventive', 'novel', 'creative', 'pioneering', 'original', 'groundbreaking'),
+    'cutting-edge': ('leading-edge', 'state-of-the-art', 'modern', 'next-generation', 'advanced', 'pioneering'),
+    'state-of-the-art': ('cutting-edge', 'leading-edge', 'modern', 'next-generation', 'latest', 'advanced'),
+    'high-performance': ('high-throughput', 'low-latency', 'fast', 'performant', 'efficient', 'optimized'),
+    'enterprise-grade': ('production-grade', 'industrial-strength', 'production-ready', 'large-scale', 'corporate-scale'),
+    'mission-critical': ('business-critical', 'essential', 'core', 'vital', 'key', 'high-stakes'),
+    'cost-effective': ('economical', 'affordable', 'low-cost', 'cost-efficient', 'budget-friendly', 'efficient'),
+    'user-friendly': ('intuitive', 'accessible', 'easy-to-use', 'approachable', 'ergonomic', 'usable'),
+    'intuitive': ('user-friendly', 'straightforward', 'accessible', 'clear', 'easy-to-use', 'natural'),
+    'seamless': ('smooth', 'frictionless', 'uninterrupted', 'fluid', 'unified', 'transparent'),
+    'modernized': ('updated', 'upgraded', 'refreshed', 'revamped', 'overhauled', 'renewed'),
+    'standardized': ('unified', 'normalized', 'harmonized', 'systematized', 'regularized', 'consolidated'),
+    'centralized': ('consolidated', 'unified', 'pooled', 'merged', 'concentrated', 'combined'),
+    'distributed': ('decentralized', 'clustered', 'federated', 'partitioned', 'multi-node', 'sharded'),
+    'cloud-based': ('cloud-hosted', 'cloud-native', 'hosted', 'online', 'remote'),
+    'web-based': ('browser-based', 'online', 'web-hosted', 'internet-based', 'hosted'),
+    'mobile-first': ('mobile-optimized', 'mobile-centric', 'mobile-friendly', 'touch-first', 'responsive'),
+    'responsive': ('adaptive', 'fluid', 'mobile-friendly', 'device-agnostic', 'flexible'),
+    'cross-platform': ('multi-platform', 'platform-independent', 'portable', 'platform-agnostic', 'universal'),
+    'real-time': ('live', 'instant', 'low-latency', 'streaming', 'on-the-fly', 'immediate'),
+    'high-availability': ('fault-tolerant', 'always-on', 'redundant', 'resilient', 'failover-ready'),
+    'fault-tolerant': ('resilient', 'redundant', 'self-healing', 'failure-resistant', 'robust'),
+    'load-balanced': ('traffic-balanced', 'horizontally-scaled', 'replicated', 'clustered', 'redundant'),
+    'api-driven': ('api-first', 'api-centric', 'interface-driven', 'contract-first', 'service-driven'),
+}
+
+# Irregular simple pasts in the graph whose participle differs
+_PARTICIPLES: Dict[str, str] = {
+    'drove': 'driven', 'grew': 'grown', 'shrank': 'shrunk', 'rewrote': 'rewritten',
+    'oversaw': 'overseen', 'ran': 'run', 'wrote': 'written'
+}
+_AUXILIARIES = frozenset({'has', 'have', 'had', 'having', 'was', 'were', 'is', 'are', 'be', 'been', 'being'})
+
+_WORD_PATTERN = re.compile(r"[a-zA-Z]+(?:-[a-zA-Z]+)*")
+_PREVIOUS_WORD = re.compile(r"([a-zA-Z]+)(\s+)$")
+_VOWEL_SOUND = re.compile(r"^(?:[aeio]|u(?![bcdfgklmnprstvxz][aeiouy])|hour|honest)", re.IGNORECASE)
+_occurrence_patterns: Dict[str, "re.Pattern[str]"] = {}
+
+
+def _occurrences(word: str) -> "re.Pattern[str]":
+    """Whole-token pattern for a word (hyphenated compounds containing it are not matched)"""
+    pattern = _occurrence_patterns.get(word)
+    if pattern is None:
+        pattern = re.compile(rf"(?<![a-zA-Z-]){re.escape(word)}(?![a-zA-Z-])", re.IGNORECASE)
+        _occurrence_patterns[word] = pattern
+    return pattern
+
+
+def _stem(word: str) -> str:
+    """Crude base form so "tested" also rules out "testing" and "tests" """
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+    return word
+
+
+def _vocabulary(text: str) -> Set[str]:
+    """Words, hyphen parts and stems present in text"""
+    vocabulary: Set[str] = set()
+    for match in _WORD_PATTERN.finditer(text):
+        word = match.group().lower()
+        vocabulary.add(word)
+        vocabulary.update(word.split('-'))
+    vocabulary.update([_stem(word) for word in vocabulary])
+    return vocabulary
+
+
+def _match_case(template: str, word: str) -> str:
+    if template.isupper() and len(template) > 1:
+        return word.upper()
+    if template[:1].isupper():
+        return word[:1].upper() + word[1:]
+    return word
+
+
+def _assign_synonyms(slots: List[str], candidates: Dict[str, List[str]]) -> List[Optional[str]]:
+    """
+    Give each slot a distinct synonym by augmenting-path bipartite matching
+
+    Slots are tried most-constrained first and candidates in preference order, so the
+    result is deterministic and maximal: a slot stays None only if no assignment exists.
+    """
+    owner: Dict[str, int] = {}
+
+    def augment(slot: int, seen: Set[str]) -> bool:
+        for synonym in candidates[slots[slot]]:
+            if synonym in seen:
+                continue
+            seen.add(synonym)
+            if synonym not in owner or augment(owner[synonym], seen):
+                owner[synonym] = slot
+                return True
+        return False
+
+    for slot in sorted(range(len(slots)), key=lambda index: (len(candidates[slots[index]]), index)):
+        augment(slot, set())
+
+    assignment: List[Optional[str]] = [None] * len(slots)
+    for synonym, slot in owner.items():
+        assignment[slot] = synonym
+    return assignment
+
+
+def rewrite_repetitions(text: str, avoid: Iterable[str] = ()) -> Tuple[str, Dict[str, Any]]:
+    """
+    Replace repeated action verbs and professional terms in one item with unique synonyms
+
+    Args:
+        text: Item text (one experience or project description, summary or objective)
+        avoid: Words to use only when nothing else fits (e.g. synonyms other items already chose)
+
+    Returns:
+        (rewritten text, {"replacements": {word: [synonyms]}, "unresolved": {word: count}})
+        where unresolved holds the repetitions that remain for the LLM
+    """
+    report: Dict[str, Any] = {"replacements": {}, "unresolved": {}}
+    if not text:
+        return text, report
+    action_verb_reps, professional_term_reps = find_repetitions(tokenize(text))
+    repeated = {**action_verb_reps, **professional_term_reps}
+    if not repeated:
+        return text, report
+
+    # One slot per occurrence after the first, in text order
+    slots: List[Tuple[int, int, str]] = []
+    for word in repeated:
+        matches = list(_occurrences(word).finditer(text))
+        slots.extend((match.start(), match.end(), word) for match in matches[1:])
+    slots.sort()
+
+    present = _vocabulary(text)
+    avoided = {word.lower() for word in avoid}
+    candidates: Dict[str, List[str]] = {}
+    for word in repeated:
+        usable = [synonym for synonym in SYNONYM_GRAPH.get(word, ())
+                  if synonym not in present and _stem(synonym) not in present]
+        candidates[word] = [s for s in usable if s not in avoided] + [s for s in usable if s in avoided]
+
+    assignment = _assign_synonyms([word for _, _, word in slots], candidates)
+
+    parts: List[str] = []
+    position = 0
+    for (start, end, word), synonym in zip(slots, assignment):
+        if synonym is None:
+            continue
+        before = text[position:start]
+        previous = _PREVIOUS_WORD.search(before)
+        if previous and previous.group(1).lower() in _AUXILIARIES:
+            synonym_form = _PARTICIPLES.get(synonym, synonym)
+        else:
+            synonym_form = synonym
+        if previous and previous.group(1).lower() in ('a', 'an'):
+            article = 'an' if _VOWEL_SOUND.match(synonym_form) else 'a'
+            before = before[:previous.start()] + _match_case(previous.group(1), article) + previous.group(2)
+        parts.append(before)
+        parts.append(_match_case(text[start:end], synonym_form))
+        position = end
+        report["replacements"].setdefault(word, []).append(synonym)
+    parts.append(text[position:])
+    rewritten = "".join(parts)
+
+    if report["replacements"]:
+        action_verb_reps, professional_term_reps = find_repetitions(tokenize(rewritten))
+        report["unresolved"] = {**action_verb_reps, **professional_term_reps}
+    else:
+        report["unresolved"] = repeated
+    return rewritten, report
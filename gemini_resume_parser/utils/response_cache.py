@@ -0,0 +1,319 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+
+from config.config import OpenAIConfig
+
+logger = logging.getLogger(__name__)
+
+class MemoryResponseCache:
+    """In-process LLM response cache with TTL and LRU eviction"""
+
+    backend = "memory"
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 86400):
+        """
+        Initialize the in-memory response cache
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Time after which an entry is treated as a miss
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            created, value = entry
+            if time.time() - created > self.ttl_seconds:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            self._stats["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"backend": self.backend, "entries": len(self._entries), **self._stats}
+
+
+class SQLiteResponseCache:
+    """SQLite-file LLM response cache with TTL and LRU eviction, shared across processes"""
+
+    backend = "sqlite"
+
+    def __init__(self, path: str, max_entries: int = 512, ttl_seconds: float = 86400):
+        """
+        Initialize the SQLite response cache
+
+        Args:
+            path: Path of the SQLite database file
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Time after which an entry is treated as a miss
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0}
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed ON llm_responses (accessed)")
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            value, created = row
+            if now - created > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE llm_responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._stats["hits"] += 1
+        return json.loads(value)
+
+    def put(self, key: str, value: Dict[str, Any]):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            cursor = self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                "SELECT key FROM llm_responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+            self._stats["stores"] += 1
+            self._stats["evictions"] += max(cursor.rowcount, 0)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            return {"backend": self.backend, "path": self.path, "entries": entries, **self._stats}
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """
+    Get the process-wide response cache configured by LLM_CACHE_BACKEND
+
+    Returns:
+        MemoryResponseCache, SQLiteResponseCache, or None when caching is disabled
+    """
+    global _response_cache
+    backend = OpenAIConfig.LLM_CACHE_BACKEND
+    if backend == "none":
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            if backend == "sqlite":
+                _response_cache = SQLiteResponseCache(
+                    OpenAIConfig.LLM_CACHE_PATH,
+                    max_entries=OpenAIConfig.LLM_CACHE_MAX_ENTRIES,
+                    ttl_seconds=OpenAIConfig.LLM_CACHE_TTL_SECONDS
+                )
+            else:
+                _response_cache = MemoryResponseCache(
+                    max_entries=OpenAIConfig.LLM_CACHE_MAX_ENTRIES,
+                    ttl_seconds=OpenAIConfig.LLM_CACHE_TTL_SECONDS
+                )
+            logger.info(f"LLM response cache initialized with {_response_cache.backend} backend")
+        return _response_cache
+
+
+def make_cache_key(model: str, messages: List[Dict[str, Any]], temperature: Optional[float], top_p: Optional[float], max_tokens: Optional[int], response_format: Optional[Dict[str, Any]] = None) -> str:
+    """Hash the parameters that determine a chat completion into a cache key"""
+    params = {"model": model, "messages": messages, "temperature": temperature, "top_p": top_p, "max_tokens": max_tokens}
+    if response_format is not None:
+        params["response_format"] = response_format
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cached_completion(content: str, finish_reason: str) -> SimpleNamespace:
+    """Wrap cached content so callers can read it like an OpenAI response"""
+    message = SimpleNamespace(content=content, role="assistant")
+    choice = SimpleNamespace(index=0, message=message, finish_reason=finish_reason)
+    return SimpleNamespace(choices=[choice], cached=True)
+
+
+def _cache_lookup(use_cache: bool, kwargs: Dict[str, Any]) -> Tuple[Any, Optional[str], Optional[Dict[str, Any]]]:
+    """Resolve the cache, key and any cached entry for a chat completion request"""
+    temperature = kwargs.get("temperature")
+    cache = get_response_cache() if use_cache else None
+    cacheable = cache is not None and temperature is not None and temperature <= OpenAIConfig.LLM_CACHE_MAX_TEMPERATURE \
+        and not kwargs.get("stream")
+    if not cacheable:
+        return None, None, None
+
+    key = make_cache_key(kwargs.get("model"), kwargs.get("messages"), temperature, kwargs.get("top_p"), kwargs.get("max_tokens"), kwargs.get("response_format"))
+    return cache, key, cache.get(key)
+
+
+def _cache_store(cache: Any, key: str, response: Any):
+    """Store a completion that finished normally"""
+    try:
+        choice = response.choices[0]
+        if choice.finish_reason == "stop" and choice.message.content:
+            cache.put(key, {"content": choice.message.content, "finish_reason": choice.finish_reason})
+    except (AttributeError, IndexError) as e:
+        logger.warning(f"Could not cache LLM response: {e}")
+
+
+def cache_completion(content: str, use_cache: bool = True, **kwargs):
+    """
+    Store content as the finished completion for a request assembled outside a single call
+
+    Used for continued completions, so the next identical request is a cache hit instead of
+    another truncated first round.
+
+    Args:
+        content: Complete response text
+        use_cache: Set to False to skip storing
+        **kwargs: The original chat.completions.create arguments
+    """
+    cache, key, _ = _cache_lookup(use_cache, kwargs)
+    if cache is not None:
+        _cache_store(cache, key, _cached_completion(content, "stop"))
+
+
+def cached_chat_completion(client: Any, use_cache: bool = True, **kwargs) -> Any:
+    """
+    Call client.chat.completions.create, serving low-temperature requests from the response cache
+
+    Only requests at or below LLM_CACHE_MAX_TEMPERATURE are cached, and only completions
+    that finished normally are stored.
+
+    Args:
+        client: OpenAI client
+        use_cache: Set to False to bypass the cache for this call
+        **kwargs: Arguments for chat.completions.create (model, messages, temperature, ...)
+
+    Returns:
+        The OpenAI response, or an equivalent object when served from the cache
+    """
+    cache, key, cached = _cache_lookup(use_cache, kwargs)
+    if cache is None:
+        return client.chat.completions.create(**kwargs)
+
+    if cached is not None:
+        logger.info(f"⚡ LLM response cache hit ({cache.backend})")
+        return _cached_completion(cached["content"], cached.get("finish_reason", "stop"))
+
+    response = client.chat.completions.create(**kwargs)
+    _cache_store(cache, key, response)
+    return response
+
+
+async def acached_chat_completion(client: Any, use_cache: bool = True, **kwargs) -> Any:
+    """
+    Async counterpart of cached_chat_completion for AsyncOpenAI clients
+
+    Args:
+        client: AsyncOpenAI client
+        use_cache: Set to False to bypass the cache for this call
+        **kwargs: Arguments for chat.completions.create (model, messages, temperature, ...)
+
+    Returns:
+        The OpenAI response, or an equivalent object when served from the cache
+    """
+    cache, key, cached = _cache_lookup(use_cache, kwargs)
+    if cache is None:
+        return await client.chat.completions.create(**kwargs)
+
+    if cached is not None:
+        logger.info(f"⚡ LLM response cache hit ({cache.backend})")
+        return _cached_completion(cached["content"], cached.get("finish_reason", "stop"))
+
+    response = await client.chat.completions.create(**kwargs)
+    _cache_store(cache, key, response)
+    return response
+
+
+def stream_chat_completion(client: Any, use_cache: bool = True, **kwargs) -> Iterator[str]:
+    """
+    Stream a chat completion as text deltas, sharing the response cache with cached_chat_completion
+
+    A cache hit is yielded as a single chunk. On a miss the completion is streamed and,
+    if it finished normally, stored under the same key a non-streaming call would use.
+
+    Args:
+        client: OpenAI client
+        use_cache: Set to False to bypass the cache for this call
+        **kwargs: Arguments for chat.completions.create (model, messages, temperature, ...)
+
+    Yields:
+        Content deltas in arrival order
+    """
+    cache, key, cached = _cache_lookup(use_cache, kwargs)
+    if cached is not None:
+        logger.info(f"⚡ LLM response cache hit ({cache.backend})")
+        yield cached["content"]
+        return
+
+    parts: List[str] = []
+    finish_reason = None
+    for chunk in client.chat.completions.create(stream=True, **kwargs):
+        if not chunk.choices:
+            continue
+        choice = chunk.choices[0]
+        delta = getattr(choice.delta, "content", None)
+        if delta:
+            parts.append(delta)
+            yield delta
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+
+    if cache is not None:
+        _cache_store(cache, key, _cached_completion("".join(parts), finish_reason))
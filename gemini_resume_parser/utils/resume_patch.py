@@ -0,0 +1,193 @@
+"""
+JSON-Patch-style edits for parsed resumes.
+
+The improvement model can return a short list of operations instead of rewriting the whole
+resume. Paths are JSON Pointers (RFC 6901 escaping) whose list segments address items by their
+"id", with the numeric index as a fallback:
+
+    {"op": "replace", "path": "/experience/exp-0/description", "value": "..."}
+    {"op": "add", "path": "/projects/-", "value": {"name": "...", ...}}
+    {"op": "remove", "path": "/activities/activity-2"}
+
+Every operation is validated against the resume before it is applied (the path must exist,
+values keep the type of what they replace, "remove" only deletes list items and fields of list
+items, never whole sections); invalid operations are skipped and reported, so one bad edit
+never discards the others.
+"""
+
+import copy
+import logging
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+PATCH_OPS = ("add", "replace", "remove")
+
+# List sections whose items are addressed by id, with the prefix used for ids the parser did not set
+LIST_SECTIONS = {
+    "experience": "exp",
+    "education": "edu",
+    "projects": "project",
+    "certifications": "cert",
+    "languages": "lang",
+    "activities": "activity",
+    "references": "ref"
+}
+
+# Top-level keys an "add" may create
+RESUME_SECTIONS = ("basicDetails", "summary", "objective", "skills", *LIST_SECTIONS)
+
+
+def with_item_ids(resume: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a resume so every item of a list section has an "id" the model can address
+
+    Existing ids are kept; missing ones become '<prefix>-<index>' as the parser assigns them.
+    """
+    resume = dict(resume)
+    for section, prefix in LIST_SECTIONS.items():
+        items = resume.get(section)
+        if isinstance(items, list):
+            resume[section] = [
+                {**item, "id": str(item.get("id") or f"{prefix}-{index}")} if isinstance(item, dict) else item
+                for index, item in enumerate(items)
+            ]
+    return resume
+
+
+def parse_pointer(path: Any) -> List[str]:
+    """
+    Split a JSON Pointer into unescaped segments
+
+    Raises:
+        ValueError: If the path is not a non-root pointer
+    """
+    if not isinstance(path, str) or not path.startswith("/") or path == "/":
+        raise ValueError("path must be a JSON Pointer below the resume root")
+    return [segment.replace("~1", "/").replace("~0", "~") for segment in path[1:].split("/")]
+
+
+def _child(container: Any, segment: str) -> Tuple[bool, Any]:
+    """Resolve one segment; list items match on "id" first, then on a numeric index"""
+    if isinstance(container, dict):
+        return (segment in container), container.get(segment)
+    if isinstance(container, list):
+        for item in container:
+            if isinstance(item, dict) and str(item.get("id", "")) == segment:
+                return True, item
+        if segment.isdigit() and int(segment) < len(container):
+            return True, container[int(segment)]
+    return False, None
+
+
+def _list_index(container: List[Any], segment: str) -> int:
+    for index, item in enumerate(container):
+        if isinstance(item, dict) and str(item.get("id", "")) == segment:
+            return index
+    return int(segment)
+
+
+def _same_kind(old: Any, new: Any) -> bool:
+    """Values keep their shape: text stays text, lists stay lists, objects stay objects"""
+    for kind in (str, list, dict):
+        if isinstance(old, kind):
+            return isinstance(new, kind)
+    return old is None or isinstance(new, (str, int, float, bool))
+
+
+def _apply_operation(resume: Dict[str, Any], operation: Any):
+    """
+    Apply one operation in place
+
+    Raises:
+        ValueError: If the operation is malformed or its path does not exist
+    """
+    if not isinstance(operation, dict):
+        raise ValueError("operation must be an object")
+    op = operation.get("op")
+    if op not in PATCH_OPS:
+        raise ValueError(f"unsupported op {op!r}")
+    segments = parse_pointer(operation.get("path"))
+    if op != "remove" and "value" not in operation:
+        raise ValueError("missing value")
+    value = operation.get("value")
+
+    parent: Any = resume
+    in_item = False  # The path passes through a list item
+    for depth, segment in enumerate(segments[:-1]):
+        in_item = in_item or isinstance(parent, list)
+        found, parent = _child(parent, segment)
+        if not found or not isinstance(parent, (dict, list)):
+            raise ValueError(f"path does not exist at /{'/'.join(segments[:depth + 1])}")
+
+    last = segments[-1]
+    exists, current = _child(parent, last)
+
+    if isinstance(parent, list):
+        if op == "add":
+            if last != "-":
+                raise ValueError("items are appended with '-'; existing items are changed with replace")
+            if parent and isinstance(parent[0], dict) and not isinstance(value, dict):
+                raise ValueError("new item must be an object")
+            parent.append(value)
+            return
+        if not exists:
+            raise ValueError(f"no item {last!r}")
+        index = _list_index(parent, last)
+        if op == "remove":
+            del parent[index]
+        elif not _same_kind(current, value):
+            raise ValueError(f"value type {type(value).__name__} does not match {type(current).__name__}")
+        else:
+            if isinstance(current, dict) and isinstance(value, dict) and "id" in current:
+                value = {**value, "id": current["id"]}
+            parent[index] = value
+        return
+
+    if last == "-":
+        raise ValueError("'-' only appends to a list")
+    if op == "add":
+        if exists:
+            if not _same_kind(current, value):
+                raise ValueError(f"value type {type(value).__name__} does not match {type(current).__name__}")
+        elif parent is resume and last not in RESUME_SECTIONS:
+            raise ValueError(f"unknown resume section {last!r}")
+        parent[last] = value
+        return
+    if not exists:
+        raise ValueError(f"no field {last!r}")
+    if op == "remove":
+        if not in_item:
+            raise ValueError("remove only deletes list items and their fields, not sections")
+        del parent[last]
+    elif not _same_kind(current, value):
+        raise ValueError(f"value type {type(value).__name__} does not match {type(current).__name__}")
+    else:
+        parent[last] = value
+
+
+def apply_resume_patch(resume: Dict[str, Any], operations: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Apply patch operations to a copy of a resume
+
+    Args:
+        resume: Parsed resume (not modified)
+        operations: List of {"op", "path", "value"} objects, applied in order
+
+    Returns:
+        (patched resume, {"applied": int, "rejected": [{"operation", "reason"}]})
+    """
+    patched = copy.deepcopy(resume)
+    report: Dict[str, Any] = {"applied": 0, "rejected": []}
+    if not isinstance(operations, list):
+        report["rejected"].append({"operation": operations, "reason": "operations must be a list"})
+        return patched, report
+
+    for operation in operations:
+        try:
+            _apply_operation(patched, operation)
+            report["applied"] += 1
+        except ValueError as e:
+            logger.warning(f"⚠️ Skipping resume patch operation {operation!r}: {e}")
+            report["rejected"].append({"operation": operation, "reason": str(e)})
+    return patched, report
@@ -0,0 +1,256 @@
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+import datetime
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from config.config import OpenAIConfig
+
+logger = logging.getLogger(__name__)
+
+
+def _new_session(resume_text: str, filename: str) -> Dict[str, Any]:
+    """Build the record stored for a freshly uploaded resume"""
+    return {
+        "resume_id": uuid.uuid4().hex,
+        "filename": filename,
+        "extracted_text": resume_text,
+        "parsed_data": None,
+        "analyses": {},
+        "latest_analysis": None,
+        "created_at": datetime.datetime.utcnow().isoformat() + "Z"
+    }
+
+
+def _merge_session(session: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply an update to a session record; 'analyses' is merged per analysis name"""
+    for key, value in fields.items():
+        if key == "analyses":
+            session.setdefault("analyses", {}).update(value)
+        elif key != "resume_id":
+            session[key] = value
+    return session
+
+
+class MemoryResumeStore:
+    """In-process resume session store with sliding TTL and LRU eviction"""
+
+    backend = "memory"
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600):
+        """
+        Initialize the in-memory resume store
+
+        Args:
+            max_entries: Maximum number of live sessions
+            ttl_seconds: Idle time after which a session is dropped
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    def create(self, resume_text: str, filename: str = "") -> Dict[str, Any]:
+        session = _new_session(resume_text, filename)
+        with self._lock:
+            self._entries[session["resume_id"]] = (time.time(), session)
+            self._stats["created"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return copy.deepcopy(session)
+
+    def _live_entry(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(resume_id)
+        if entry is None:
+            return None
+        accessed, session = entry
+        now = time.time()
+        if now - accessed > self.ttl_seconds:
+            del self._entries[resume_id]
+            self._stats["expired"] += 1
+            return None
+        self._entries[resume_id] = (now, session)
+        self._entries.move_to_end(resume_id)
+        return session
+
+    def get(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._live_entry(resume_id)
+            if session is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            return copy.deepcopy(session)
+
+    def update(self, resume_id: str, **fields) -> bool:
+        with self._lock:
+            session = self._live_entry(resume_id)
+            if session is None:
+                return False
+            _merge_session(session, copy.deepcopy(fields))
+            return True
+
+    def delete(self, resume_id: str) -> bool:
+        with self._lock:
+            return self._entries.pop(resume_id, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"backend": self.backend, "sessions": len(self._entries), **self._stats}
+
+
+class SQLiteResumeStore:
+    """SQLite-file resume session store with sliding TTL and LRU eviction, shared across processes"""
+
+    backend = "sqlite"
+
+    def __init__(self, path: str, max_entries: int = 256, ttl_seconds: float = 3600):
+        """
+        Initialize the SQLite resume store
+
+        Args:
+            path: Path of the SQLite database file
+            max_entries: Maximum number of live sessions
+            ttl_seconds: Idle time after which a session is dropped
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS resume_sessions ("
+                "resume_id TEXT PRIMARY KEY, value TEXT NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_resume_sessions_accessed ON resume_sessions (accessed)")
+            self._conn.commit()
+
+    def create(self, resume_text: str, filename: str = "") -> Dict[str, Any]:
+        session = _new_session(resume_text, filename)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO resume_sessions (resume_id, value, accessed) VALUES (?, ?, ?)",
+                (session["resume_id"], json.dumps(session, ensure_ascii=False), now)
+            )
+            # Drop idle sessions and trim to the newest max_entries
+            expired = self._conn.execute("DELETE FROM resume_sessions WHERE accessed < ?", (now - self.ttl_seconds,))
+            evicted = self._conn.execute(
+                "DELETE FROM resume_sessions WHERE resume_id IN ("
+                "SELECT resume_id FROM resume_sessions ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+            self._stats["created"] += 1
+            self._stats["expired"] += max(expired.rowcount, 0)
+            self._stats["evictions"] += max(evicted.rowcount, 0)
+        return session
+
+    def _live_entry(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        row = self._conn.execute("SELECT value, accessed FROM resume_sessions WHERE resume_id = ?", (resume_id,)).fetchone()
+        if row is None:
+            return None
+        value, accessed = row
+        if now - accessed > self.ttl_seconds:
+            self._conn.execute("DELETE FROM resume_sessions WHERE resume_id = ?", (resume_id,))
+            self._conn.commit()
+            self._stats["expired"] += 1
+            return None
+        self._conn.execute("UPDATE resume_sessions SET accessed = ? WHERE resume_id = ?", (now, resume_id))
+        self._conn.commit()
+        return json.loads(value)
+
+    def get(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._live_entry(resume_id)
+            if session is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            return session
+
+    def update(self, resume_id: str, **fields) -> bool:
+        with self._lock:
+            session = self._live_entry(resume_id)
+            if session is None:
+                return False
+            _merge_session(session, fields)
+            self._conn.execute(
+                "UPDATE resume_sessions SET value = ? WHERE resume_id = ?",
+                (json.dumps(session, ensure_ascii=False), resume_id)
+            )
+            self._conn.commit()
+            return True
+
+    def delete(self, resume_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM resume_sessions WHERE resume_id = ?", (resume_id,))
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM resume_sessions")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sessions = self._conn.execute("SELECT COUNT(*) FROM resume_sessions").fetchone()[0]
+            return {"backend": self.backend, "path": self.path, "sessions": sessions, **self._stats}
+
+
+_resume_store = None
+_resume_store_lock = threading.Lock()
+
+
+def get_resume_store():
+    """
+    Get the process-wide resume session store configured by RESUME_STORE_BACKEND
+
+    Returns:
+        MemoryResumeStore or SQLiteResumeStore
+    """
+    global _resume_store
+    with _resume_store_lock:
+        if _resume_store is None:
+            if OpenAIConfig.RESUME_STORE_BACKEND == "sqlite":
+                _resume_store = SQLiteResumeStore(
+                    OpenAIConfig.RESUME_STORE_PATH,
+                    max_entries=OpenAIConfig.RESUME_STORE_MAX_ENTRIES,
+                    ttl_seconds=OpenAIConfig.RESUME_STORE_TTL_SECONDS
+                )
+            else:
+                _resume_store = MemoryResumeStore(
+                    max_entries=OpenAIConfig.RESUME_STORE_MAX_ENTRIES,
+                    ttl_seconds=OpenAIConfig.RESUME_STORE_TTL_SECONDS
+                )
+            logger.info(f"Resume session store initialized with {_resume_store.backend} backend")
+        return _resume_store
+
+
+def save_analysis(resume_id: Optional[str], name: str, result: Dict[str, Any]):
+    """
+    Record an analysis result on a session and mark it as the latest one
+
+    Args:
+        resume_id: Session id (no-op when None)
+        name: Analysis name, e.g. 'standard' or 'jd_specific'
+        result: Analysis document
+    """
+    if resume_id:
+        get_resume_store().update(resume_id, analyses={name: result}, latest_analysis=name)
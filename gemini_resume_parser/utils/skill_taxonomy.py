@@ -0,0 +1,209 @@
+"""
+Canonical skill taxonomy with an alias index
+Every spelling of a skill ("JS", "javascript", "JavaScript") resolves to one canonical id, so
+skill comparisons are set operations on ids instead of string loops. The built-in taxonomy
+covers the technology dictionary of utils/tech_stack.py plus common professional skills and
+can be extended from a data file (SKILL_TAXONOMY_PATH):
+
+    .tsv   one skill per line: canonical name, tab, comma-separated aliases ('#' comment lines)
+    .json  {"Canonical Name": ["alias", ...], ...}
+"""
+
+import json
+import logging
+import re
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Set
+
+from config.config import OpenAIConfig
+from utils.keyword_matcher import KeywordMatcher
+from utils.tech_stack import CASE_SENSITIVE_ALIASES, TECHNOLOGIES
+
+logger = logging.getLogger(__name__)
+
+# Skills beyond the technology dictionary: canonical name -> aliases
+PROFESSIONAL_SKILLS: Dict[str, tuple] = {
+    'Machine Learning': ('ml',),
+    'Deep Learning': (),
+    'Artificial Intelligence': ('ai',),
+    'Natural Language Processing': ('nlp',),
+    'Computer Vision': (),
+    'Generative AI': ('genai', 'gen ai'),
+    'Data Analysis': ('data analytics',),
+    'Data Science': (),
+    'Data Engineering': (),
+    'Data Visualization': ('data viz',),
+    'Statistics': ('statistical analysis',),
+    'Microsoft Excel': ('excel', 'ms excel', 'advanced excel'),
+    'Microsoft Office': ('ms office', 'office 365', 'microsoft 365'),
+    'Salesforce': ('sfdc',),
+    'Marketing': (),
+    'Digital Marketing': (),
+    'SEO': ('search engine optimization',),
+    'Content Creation': (),
+    'Project Management': (),
+    'Product Management': (),
+    'Agile': ('agile methodologies', 'agile methodology'),
+    'Scrum': (),
+    'Kanban': (),
+    'CI/CD': ('ci cd', 'cicd', 'continuous integration', 'continuous delivery', 'continuous deployment'),
+    'DevOps': (),
+    'Microservices': ('microservice', 'microservices architecture'),
+    'System Design': (),
+    'Object-Oriented Programming': ('oop', 'object oriented programming'),
+    'Data Structures and Algorithms': ('dsa', 'data structures & algorithms', 'data structures', 'algorithms'),
+    'Unit Testing': (),
+    'UI/UX Design': ('ui/ux', 'ux design', 'ui design', 'user experience design'),
+    'Cloud Computing': (),
+    'Cybersecurity': ('cyber security', 'information security'),
+    'Communication': ('communication skills',),
+    'Leadership': (),
+    'Teamwork': ('team work', 'team player'),
+    'Collaboration': (),
+    'Problem Solving': ('problem-solving',),
+    'Critical Thinking': (),
+    'Time Management': (),
+    'Stakeholder Management': (),
+}
+
+_SPACES = re.compile(r"\s+")
+_EDGE_PUNCTUATION = " ,;:!?'\"()[]{}*-•"
+
+# Aliases that are also ordinary words only count in free text with this capitalization
+CASE_SENSITIVE_SKILLS = CASE_SENSITIVE_ALIASES | frozenset({'Excel'})
+
+
+def normalize_skill(name: str) -> str:
+    """Lowercase a skill name, collapse whitespace and drop surrounding punctuation (".NET" and "C++" keep theirs)"""
+    return _SPACES.sub(" ", str(name or "")).strip(_EDGE_PUNCTUATION).rstrip(".").lower()
+
+
+class SkillTaxonomy:
+    """Canonical skills and the alias -> canonical id index used for every skill comparison"""
+
+    def __init__(self, skills: Optional[Mapping[str, Iterable[str]]] = None, case_sensitive: Iterable[str] = CASE_SENSITIVE_SKILLS):
+        """
+        Args:
+            skills: Canonical name -> aliases to start with
+            case_sensitive: Aliases that match in free text only with exactly this capitalization
+                (lookups of a single skill name are always case-insensitive)
+        """
+        self._names: Dict[str, str] = {}  # canonical id -> display name
+        self._index: Dict[str, str] = {}  # normalized alias -> canonical id
+        self._case_sensitive: Dict[str, str] = {normalize_skill(alias): alias for alias in case_sensitive}
+        self._matcher: Optional[KeywordMatcher] = None
+        if skills:
+            self.add_skills(skills)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add_skill(self, name: str, aliases: Iterable[str] = ()):
+        """
+        Register a skill and its aliases
+
+        An alias that already points at another skill keeps its first owner, so a data file can
+        add skills without silently redirecting built-in spellings.
+        """
+        skill_id = self._index.get(normalize_skill(name)) or normalize_skill(name)
+        if not skill_id:
+            return
+        self._names.setdefault(skill_id, " ".join(str(name).split()))
+        for alias in (name, *aliases):
+            alias_key = normalize_skill(alias)
+            if alias_key:
+                self._index.setdefault(alias_key, skill_id)
+        self._matcher = None
+
+    def add_skills(self, skills: Mapping[str, Iterable[str]]):
+        for name, aliases in skills.items():
+            self.add_skill(name, aliases or ())
+
+    def load(self, path: str) -> int:
+        """
+        Extend the taxonomy from a .tsv or .json data file
+
+        Returns:
+            Number of skills read from the file
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If a .json file is not an object of name -> alias list
+        """
+        with open(path, encoding="utf-8") as handle:
+            if path.lower().endswith(".json"):
+                data = json.load(handle)
+                if not isinstance(data, dict):
+                    raise ValueError("skill taxonomy JSON must be an object of canonical name -> aliases")
+                skills = {name: [aliases] if isinstance(aliases, str) else list(aliases or ()) for name, aliases in data.items()}
+            else:
+                skills = {}
+                for line in handle:
+                    if not line.strip() or line.lstrip().startswith("#"):
+                        continue
+                    name, _, aliases = line.partition("\t")
+                    skills[name.strip()] = [alias.strip() for alias in aliases.split(",") if alias.strip()]
+        self.add_skills(skills)
+        return len(skills)
+
+    def canonical_id(self, name: str) -> Optional[str]:
+        """Canonical id of a known skill, or None"""
+        return self._index.get(normalize_skill(name))
+
+    def key(self, name: str) -> str:
+        """Comparison key: the canonical id of a known skill, the normalized name otherwise"""
+        normalized = normalize_skill(name)
+        return self._index.get(normalized, normalized)
+
+    def keys(self, names: Iterable[str]) -> Set[str]:
+        """Comparison keys of many skills (empty names dropped)"""
+        return {key for key in (self.key(name) for name in names) if key}
+
+    def display_name(self, name: str) -> str:
+        """Canonical spelling of a known skill ("k8s" -> "Kubernetes"), the name as given otherwise"""
+        skill_id = self.canonical_id(name)
+        return self._names[skill_id] if skill_id else " ".join(str(name).split())
+
+    def find_in_text(self, text: str) -> List[str]:
+        """
+        Canonical ids of the skills named anywhere in free text, in order of first mention
+
+        The alias matcher is compiled on first use and again after the taxonomy is extended.
+        """
+        if self._matcher is None:
+            self._matcher = KeywordMatcher(
+                {self._case_sensitive.get(alias, alias): skill_id for alias, skill_id in self._index.items()},
+                case_sensitive=self._case_sensitive.values()
+            )
+        return self._matcher.find_values(text or "")
+
+
+_skill_taxonomy: Optional[SkillTaxonomy] = None
+_skill_taxonomy_lock = threading.Lock()
+
+
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """
+    Get the process-wide skill taxonomy (built-in skills plus SKILL_TAXONOMY_PATH, loaded once)
+
+    A data file that cannot be read is logged and skipped; the built-in taxonomy still loads.
+    """
+    global _skill_taxonomy
+    with _skill_taxonomy_lock:
+        if _skill_taxonomy is None:
+            taxonomy = SkillTaxonomy(TECHNOLOGIES)
+            taxonomy.add_skills(PROFESSIONAL_SKILLS)
+            path = OpenAIConfig.SKILL_TAXONOMY_PATH
+            if path:
+                try:
+                    logger.info(f"Skill taxonomy extended with {taxonomy.load(path)} skill(s) from {path}")
+                except (OSError, ValueError) as e:
+                    logger.warning(f"⚠️ Could not load skill taxonomy file {path}: {e}")
+            logger.info(f"Skill taxonomy loaded with {len(taxonomy)} skills")
+            _skill_taxonomy = taxonomy
+        return _skill_taxonomy
+
+
+def skill_key(name: str) -> str:
+    """Comparison key of a skill in the process-wide taxonomy"""
+    return get_skill_taxonomy().key(name)
@@ -0,0 +1,55 @@
+"""
+Server-Sent Events helpers shared by the Flask and Quart servers.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SSE_MIMETYPE = "text/event-stream"
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def wants_event_stream(stream_flag: Optional[str], accept_header: Optional[str]) -> bool:
+    """
+    Decide whether a request opted into streaming
+
+    Args:
+        stream_flag: Value of the 'stream' query/form parameter, if any
+        accept_header: Value of the Accept header, if any
+    """
+    if stream_flag and stream_flag.strip().lower() in ("1", "true", "yes"):
+        return True
+    return SSE_MIMETYPE in (accept_header or "")
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Encode one event in the text/event-stream wire format"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def sse_response_body(events: Iterable[Tuple[str, Dict[str, Any]]], on_result: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None, extra: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """
+    Turn (event, data) pairs from a streaming service call into SSE frames
+
+    The final "result" event is wrapped like the JSON endpoints ({"success": True, "data": ...});
+    a failure mid-stream is reported as an "error" event with the same shape as JSON errors.
+
+    Args:
+        events: (event, data) pairs, ending with ("result", document)
+        on_result: Optional hook to amend the final document before it is sent
+        extra: Optional top-level fields added next to "success"/"data" in the result event
+    """
+    try:
+        for event, data in events:
+            if event == "result":
+                if on_result:
+                    data = on_result(data)
+                yield format_sse("result", {"success": True, "data": data, **(extra or {})})
+            else:
+                yield format_sse(event, data)
+    except Exception as e:
+        logger.error(f"Streaming analysis failed: {str(e)}")
+        yield format_sse("error", {"success": False, "error": str(e)})
@@ -0,0 +1,183 @@
+"""
+Structured (JSON-schema) outputs for chat completions.
+
+Response formats are built from the Pydantic response models. A model whose schema has only
+fixed keys is sent as a strict JSON schema, so the provider guarantees the shape and the
+content parses with one json.loads. Models with free-form objects (Dict[str, Any]) cannot be
+strict; they are sent in JSON mode, which still guarantees syntactically valid JSON.
+
+The tolerant parser (utils.json_stream.repair_json) only runs when that single json.loads fails
+(for example a completion cut off at max_tokens), and every such fallback is counted per call site.
+"""
+
+import copy
+import json
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from config.config import OpenAIConfig
+
+logger = logging.getLogger(__name__)
+
+# Keywords strict mode rejects or ignores; they are only hints for the Pydantic validation
+_UNSUPPORTED_STRICT_KEYWORDS = (
+    "default", "title", "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+    "minLength", "maxLength", "pattern", "format", "minItems", "maxItems", "uniqueItems"
+)
+
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def _inline_refs(node: Any, defs: Dict[str, Any]) -> Any:
+    """Replace every $ref with a copy of its definition (response models are not recursive)"""
+    if isinstance(node, dict):
+        if "$ref" in node:
+            resolved = _inline_refs(copy.deepcopy(defs[node["$ref"].split("/")[-1]]), defs)
+            extra = {key: value for key, value in node.items() if key != "$ref"}
+            if extra.get("description"):
+                resolved["description"] = extra["description"]
+            return resolved
+        return {key: _inline_refs(value, defs) for key, value in node.items() if key != "$defs"}
+    if isinstance(node, list):
+        return [_inline_refs(item, defs) for item in node]
+    return node
+
+
+def _make_strict(node: Any) -> bool:
+    """
+    Rewrite a schema in place for strict mode
+
+    Every object gets additionalProperties=false and all of its properties required.
+
+    Returns:
+        False if the schema contains a free-form object or an Any-typed field and therefore cannot be strict
+    """
+    if isinstance(node, list):
+        return all([_make_strict(item) for item in node])
+    if not isinstance(node, dict):
+        return True
+
+    for keyword in _UNSUPPORTED_STRICT_KEYWORDS:
+        node.pop(keyword, None)
+
+    if not any(key in node for key in ("type", "anyOf", "enum", "const")):
+        return False  # Any-typed field
+    strict = True
+    if node.get("type") == "object":
+        properties = node.get("properties")
+        if not properties or node.get("additionalProperties") not in (None, False):
+            strict = False
+        else:
+            node["additionalProperties"] = False
+            node["required"] = list(properties)
+
+    if isinstance(node.get("properties"), dict):
+        strict = all([_make_strict(value) for value in node["properties"].values()]) and strict
+    for key in ("items", "anyOf"):
+        if key in node:
+            strict = _make_strict(node[key]) and strict
+    return strict
+
+
+@lru_cache(maxsize=None)
+def json_schema_for(model_cls: Type[BaseModel]) -> Tuple[Dict[str, Any], bool]:
+    """
+    Build the response JSON schema for a Pydantic model
+
+    Args:
+        model_cls: Pydantic response model
+
+    Returns:
+        (schema with $refs inlined, whether the schema is strict-compatible)
+    """
+    schema = model_cls.model_json_schema()
+    schema = _inline_refs(schema, schema.get("$defs", {}))
+    strict = _make_strict(schema)
+    return schema, strict
+
+
+def response_format_for(model_cls: Optional[Type[BaseModel]], name: str) -> Optional[Dict[str, Any]]:
+    """
+    Build the chat completion response_format for a response model
+
+    Args:
+        model_cls: Pydantic response model, or None for any JSON object
+        name: Schema name reported to the provider (letters, digits, '_' and '-')
+
+    Returns:
+        A strict json_schema format, JSON mode for non-strict schemas, or None when
+        STRUCTURED_OUTPUTS_ENABLED is off
+    """
+    if not OpenAIConfig.STRUCTURED_OUTPUTS_ENABLED:
+        return None
+    if model_cls is not None:
+        schema, strict = json_schema_for(model_cls)
+        if strict:
+            return {"type": "json_schema", "json_schema": {"name": name, "schema": schema, "strict": True}}
+    return {"type": "json_object"}
+
+
+def with_response_format(completion_kwargs: Dict[str, Any], model_cls: Optional[Type[BaseModel]], name: str) -> Dict[str, Any]:
+    """Add the response_format for model_cls to chat completion arguments (no-op when disabled)"""
+    response_format = response_format_for(model_cls, name)
+    if response_format is not None:
+        completion_kwargs["response_format"] = response_format
+    return completion_kwargs
+
+
+def _record(name: str, outcome: str):
+    with _stats_lock:
+        counters = _stats.setdefault(name, {"calls": 0, "direct": 0, "repaired": 0, "failed": 0})
+        counters["calls"] += 1
+        counters[outcome] += 1
+
+
+def parse_structured(content: Optional[str], name: str, recover: Callable[[str], Any]) -> Any:
+    """
+    Parse a model response, falling back to a repair function only if plain json.loads fails
+
+    Args:
+        content: Raw message content
+        name: Call site the metric is recorded under, e.g. 'ats.standard'
+        recover: Repair path (usually repair_json); receives the raw content and returns the parsed value
+
+    Returns:
+        The parsed JSON value
+
+    Raises:
+        Whatever recover raises when the response cannot be repaired either
+    """
+    try:
+        value = json.loads(content)
+        _record(name, "direct")
+        return value
+    except (TypeError, ValueError):
+        pass
+
+    logger.warning(f"🧩 Structured output for {name} did not parse directly ({len(content or '')} chars), running repair fallback")
+    try:
+        value = recover(content or "")
+    except Exception:
+        _record(name, "failed")
+        raise
+    _record(name, "repaired")
+    return value
+
+
+def structured_output_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Report how often each call site needed the repair fallback
+
+    Returns:
+        {name: {'calls', 'direct', 'repaired', 'failed', 'fallback_rate'}}
+    """
+    with _stats_lock:
+        return {
+            name: {**counters, "fallback_rate": round((counters["repaired"] + counters["failed"]) / counters["calls"], 4)}
+            for name, counters in sorted(_stats.items())
+        }
@@ -0,0 +1,212 @@
+"""
+Local technology dictionary and tech-stack extractor
+Finds the languages, frameworks, databases, cloud platforms and tools named in a project
+description with one compiled keyword automaton, so only projects that mention none need the LLM.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from utils.keyword_matcher import KeywordMatcher
+
+# Canonical name -> aliases (the canonical name itself always matches)
+TECHNOLOGIES: Dict[str, Tuple[str, ...]] = {
+    # Languages
+    'Python': ('python3',),
+    'JavaScript': ('js', 'ecmascript', 'es6'),
+    'TypeScript': ('TS',),
+    'Java': (),
+    'Kotlin': (),
+    'Scala': (),
+    'C++': ('cpp',),
+    'C#': ('c sharp', 'csharp'),
+    'Go': ('golang',),
+    'Rust': (),
+    'Ruby': (),
+    'PHP': (),
+    'Swift': (),
+    'Objective-C': ('objc',),
+    'Dart': (),
+    'Perl': (),
+    'Bash': ('shell scripting',),
+    'PowerShell': (),
+    'MATLAB': (),
+    'SQL': (),
+    'HTML': ('html5',),
+    'CSS': ('css3',),
+    'Sass': ('scss',),
+    'Solidity': (),
+    # Frontend
+    'React': ('react.js', 'reactjs'),
+    'React Native': (),
+    'Next.js': ('nextjs',),
+    'Angular': ('angularjs', 'angular.js'),
+    'Vue.js': ('vue', 'vuejs'),
+    'Nuxt.js': ('nuxt',),
+    'Svelte': (),
+    'Redux': (),
+    'jQuery': (),
+    'Bootstrap': (),
+    'Tailwind CSS': ('tailwind', 'tailwindcss'),
+    'Material UI': ('mui', 'material-ui'),
+    'Webpack': (),
+    'Vite': (),
+    'Flutter': (),
+    'Electron': (),
+    # Backend
+    'Node.js': ('Node', 'nodejs'),
+    'Express.js': ('Express', 'expressjs'),
+    'NestJS': ('nest.js',),
+    'Django': (),
+    'Django REST Framework': ('drf',),
+    'Flask': (),
+    'FastAPI': (),
+    'Spring Boot': ('springboot',),
+    'Spring': (),
+    'Hibernate': (),
+    'Ruby on Rails': ('rails', 'ror'),
+    'Laravel': (),
+    '.NET': ('dotnet', '.net core', 'asp.net', 'asp.net core'),
+    'GraphQL': (),
+    'REST API': ('rest apis', 'restful api', 'restful apis', 'restful'),
+    'gRPC': (),
+    'WebSocket': ('websockets', 'socket.io'),
+    'Celery': (),
+    # Databases and storage
+    'PostgreSQL': ('postgres', 'postgresql'),
+    'MySQL': (),
+    'SQLite': (),
+    'Oracle Database': ('oracle db',),
+    'SQL Server': ('mssql', 'microsoft sql server'),
+    'MongoDB': ('mongo',),
+    'Redis': (),
+    'Cassandra': (),
+    'DynamoDB': (),
+    'Elasticsearch': ('elastic search',),
+    'Firebase': ('firestore',),
+    'Supabase': (),
+    'Neo4j': (),
+    'Snowflake': (),
+    'BigQuery': (),
+    # Cloud and DevOps
+    'AWS': ('amazon web services',),
+    'AWS Lambda': ('lambda functions',),
+    'Amazon S3': ('s3',),
+    'Amazon EC2': ('ec2',),
+    'Azure': ('microsoft azure',),
+    'GCP': ('google cloud', 'google cloud platform'),
+    'Heroku': (),
+    'Vercel': (),
+    'Netlify': (),
+    'Docker': (),
+    'Kubernetes': ('k8s',),
+    'Helm': (),
+    'Terraform': (),
+    'Ansible': (),
+    'Jenkins': (),
+    'GitHub Actions': (),
+    'GitLab CI': ('gitlab ci/cd',),
+    'CircleCI': (),
+    'Nginx': (),
+    'Apache Kafka': ('kafka',),
+    'RabbitMQ': (),
+    'Prometheus': (),
+    'Grafana': (),
+    'Linux': ('ubuntu',),
+    'Git': (),
+    'GitHub': (),
+    # Data and ML
+    'Pandas': (),
+    'NumPy': (),
+    'SciPy': (),
+    'scikit-learn': ('sklearn', 'scikit learn'),
+    'TensorFlow': (),
+    'Keras': (),
+    'PyTorch': (),
+    'Hugging Face': ('huggingface',),
+    'OpenAI API': ('openai', 'gpt-4', 'gpt-3.5', 'chatgpt api'),
+    'LangChain': (),
+    'OpenCV': (),
+    'NLTK': (),
+    'spaCy': (),
+    'Matplotlib': (),
+    'Seaborn': (),
+    'Plotly': (),
+    'Jupyter': ('jupyter notebook', 'jupyter notebooks'),
+    'Apache Spark': ('Spark', 'pyspark'),
+    'Hadoop': (),
+    'Apache Airflow': ('airflow',),
+    'dbt': (),
+    'Tableau': (),
+    'Power BI': ('powerbi',),
+    # Testing and tools
+    'Jest': (),
+    'Cypress': (),
+    'Selenium': (),
+    'Playwright': (),
+    'pytest': (),
+    'JUnit': (),
+    'Postman': (),
+    'Figma': (),
+    'Jira': (),
+    'Unity': (),
+    'Android': (),
+    'iOS': (),
+    'Stripe': (),
+    'Twilio': (),
+}
+
+# Aliases that are far more often ordinary English words only match with this exact capitalization;
+# words mostly meant as the technology in a resume ("react", "node", "express") match in any case
+CASE_SENSITIVE_ALIASES = frozenset({
+    'Go', 'Rust', 'Swift', 'Dart', 'Spring', 'Helm', 'Unity', 'Electron', 'Celery', 'Stripe', 'Snowflake', 'Spark', 'TS'
+})
+
+# Filler an LLM sometimes returns between technologies
+_NOT_TECHNOLOGIES = frozenset({'and', 'or', 'with', 'using', 'built', 'developed', 'created', 'none', 'n/a'})
+
+
+def _alias_index(technologies: Dict[str, Tuple[str, ...]]) -> Dict[str, str]:
+    """Lowercase alias (and canonical name) -> canonical name"""
+    index: Dict[str, str] = {}
+    for canonical, aliases in technologies.items():
+        for alias in (canonical, *aliases):
+            index.setdefault(" ".join(alias.lower().split()), canonical)
+    return index
+
+
+_ALIAS_INDEX = _alias_index(TECHNOLOGIES)
+
+# "-" is a boundary so "Python-based" and "AWS-hosted" match; "+" and "#" keep "C++" and "C#" whole
+_TECH_MATCHER = KeywordMatcher(
+    {alias: canonical for canonical, aliases in TECHNOLOGIES.items() for alias in (canonical, *aliases)},
+    case_sensitive=CASE_SENSITIVE_ALIASES
+)
+
+
+def canonical_technology(name: str) -> str:
+    """Canonical spelling of a known technology ("reactjs" -> "React"), or name unchanged"""
+    name = name.strip()
+    return _ALIAS_INDEX.get(" ".join(name.lower().split()), name)
+
+
+def extract_tech_stack(text: str) -> List[str]:
+    """
+    Find the technologies named in text
+
+    Args:
+        text: Project description (or any free text)
+
+    Returns:
+        Canonical technology names in order of first mention, without duplicates
+    """
+    return _TECH_MATCHER.find_values(text or "")
+
+
+def format_tech_stack(technologies: Iterable[str]) -> str:
+    """Join technologies into the comma-separated string the frontend expects, dropping duplicates"""
+    unique: Dict[str, None] = {}
+    for technology in technologies:
+        technology = str(technology).strip().strip('"\'')
+        if (len(technology) > 1 or technology in ('C', 'R')) and technology.lower() not in _NOT_TECHNOLOGIES:
+            unique.setdefault(canonical_technology(technology), None)
+    return ", ".join(unique)
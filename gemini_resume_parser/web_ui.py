@@ -9,7 +9,7 @@ import json
 import tempfile
 import datetime
 from pathlib import Path
-from flask import Flask, render_template_string, request, jsonify, send_file
+from flask import Flask, Response, render_template_string, request, jsonify, send_file
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 import logging
@@ -18,13 +18,21 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+from config.config import OpenAIConfig
+
 # Import the OpenAI parser and ATS services
 from services.openai_parser_service import OpenAIResumeParser
 from services.ats_service import StandardATSService, JDSpecificATSService
 from services.ai_suggestion_service_optimized import AISuggestionServiceOptimized
 from services.resume_improvement_service import ResumeImprovementService
 from services.content_enhancement_service import ContentEnhancementService
+from services.client_registry import get_service, get_pool_stats
 from utils.pdf_extractor import DocumentExtractor
+from utils.response_cache import get_response_cache
+from utils.resume_store import get_resume_store, save_analysis
+from utils.prompt_registry import prompt_prefix_hashes
+from utils.structured_output import structured_output_stats
+from utils.sse import SSE_HEADERS, SSE_MIMETYPE, sse_response_body, wants_event_stream
 # from enhance_content import enhance_content
 
 # Configure logging
@@ -2061,6 +2069,65 @@ Project: "Built a full-stack e-commerce platform with user authentication, payme
 </html>
 """
 
+def load_resume_session(missing_error='No file uploaded', empty_error='No file selected'):
+    """
+    Resolve the resume for a request: a stored session via resume_id, or a newly uploaded file
+
+    An uploaded file is extracted once and stored; the returned session carries its resume_id
+    so later calls (ATS, suggestions, improvement) can skip the upload and extraction.
+
+    Args:
+        missing_error: Error message when neither resume_id nor a file was sent
+        empty_error: Error message when the file field is empty
+
+    Returns:
+        (session, error) - exactly one of them is None
+    """
+    store = get_resume_store()
+    resume_id = (request.values.get('resume_id') or '').strip()
+    if resume_id:
+        session = store.get(resume_id)
+        if session is None:
+            return None, 'Unknown or expired resume_id - please upload the resume again'
+        return session, None
+    
+    # Check if file was uploaded
+    if 'resume' not in request.files:
+        return None, missing_error
+    
+    file = request.files['resume']
+    if file.filename == '':
+        return None, empty_error
+    
+    # Save file temporarily
+    filename = secure_filename(file.filename)
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    file.save(filepath)
+    
+    try:
+        # Extract text from file
+        resume_text = DocumentExtractor.extract_text(filepath)
+    finally:
+        # Clean up temporary file
+        if os.path.exists(filepath):
+            os.unlink(filepath)
+    
+    if not resume_text.strip():
+        raise ValueError("No text extracted from file")
+    
+    session = store.create(resume_text, filename=file.filename)
+    logger.info(f"Stored resume session {session['resume_id']} for: {filename}")
+    return session, None
+
+def get_session_parsed_data(session):
+    """Return the session's parsed resume, parsing the stored text once if needed"""
+    if session.get('parsed_data') is None:
+        parser = get_service(OpenAIResumeParser)
+        logger.info(f"Parsing resume for session {session['resume_id']}")
+        session['parsed_data'] = parser.parse_resume_text(session['extracted_text'])
+        get_resume_store().update(session['resume_id'], parsed_data=session['parsed_data'])
+    return session['parsed_data']
+
 @app.route('/')
 def index():
     """Main page with the upload interface"""
@@ -2068,46 +2135,20 @@ def index():
 
 @app.route('/parse', methods=['POST'])
 def parse_resume():
-    """Parse uploaded resume file"""
+    """Parse uploaded resume file (or a stored resume referenced by resume_id)"""
     try:
-        # Check if file was uploaded
-        if 'resume' not in request.files:
-            return jsonify({'success': False, 'error': 'No file uploaded'})
-        
-        file = request.files['resume']
-        if file.filename == '':
-            return jsonify({'success': False, 'error': 'No file selected'})
-        
-        # Validate file
-        if not file:
-            return jsonify({'success': False, 'error': 'Invalid file'})
+        session, error = load_resume_session()
+        if error:
+            return jsonify({'success': False, 'error': error})
         
-        # Save file temporarily
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        # Parse the resume (served from the session when already parsed)
+        parsed_data = get_session_parsed_data(session)
         
-        try:
-            # Initialize parser
-            parser = OpenAIResumeParser()
-            
-            # Parse the resume
-            logger.info(f"Parsing resume: {filename}")
-            parsed_data = parser.parse_resume_from_file(filepath)
-            
-            # Clean up temporary file
-            os.unlink(filepath)
-            
-            return jsonify({
-                'success': True, 
-                'data': parsed_data
-            })
-            
-        except Exception as e:
-            # Clean up temporary file on error
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            raise e
+        return jsonify({
+            'success': True, 
+            'data': parsed_data,
+            'resume_id': session['resume_id']
+        })
             
     except Exception as e:
         logger.error(f"Error parsing resume: {str(e)}")
@@ -2120,50 +2161,40 @@ def parse_resume():
 def standard_ats_analysis():
     """Standard ATS analysis endpoint"""
     try:
-        # Check if file was uploaded
-        if 'resume' not in request.files:
-            return jsonify({'success': False, 'error': 'No file uploaded'})
-        
-        file = request.files['resume']
-        if file.filename == '':
-            return jsonify({'success': False, 'error': 'No file selected'})
+        session, error = load_resume_session()
+        if error:
+            return jsonify({'success': False, 'error': error})
+        
+        resume_id = session['resume_id']
+        resume_text = session['extracted_text']
+        
+        # Get shared ATS service
+        ats_service = get_service(StandardATSService, api_key=os.getenv('GEMINI_API_KEY'))
+        
+        # Opt-in streaming: send category blocks and suggestions as Server-Sent Events
+        if wants_event_stream(request.values.get('stream'), request.headers.get('Accept')):
+            def store_results(results):
+                save_analysis(resume_id, 'standard', results)
+                return results
+            
+            logger.info(f"Streaming standard ATS analysis for session: {resume_id}")
+            events = ats_service.analyze_resume_stream(resume_text)
+            return Response(
+                sse_response_body(events, on_result=store_results, extra={'resume_id': resume_id}),
+                mimetype=SSE_MIMETYPE,
+                headers=SSE_HEADERS
+            )
+        
+        # Run standard ATS analysis
+        logger.info(f"Running standard ATS analysis for session: {resume_id}")
+        results = ats_service.analyze_resume(resume_text)
+        save_analysis(resume_id, 'standard', results)
         
-        # Save file temporarily
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
-        try:
-            # Extract text from file
-            resume_text = DocumentExtractor.extract_text(filepath)
-            
-            if not resume_text.strip():
-                raise ValueError("No text extracted from file")
-            
-            # Initialize ATS service
-            ats_service = StandardATSService(api_key=os.getenv('GEMINI_API_KEY'))
-            
-            # Run standard ATS analysis
-            logger.info(f"Running standard ATS analysis for: {filename}")
-            results = ats_service.analyze_resume(resume_text)
-            
-            # Add extracted text to results if not already present
-            if 'extracted_text' not in results:
-                results['extracted_text'] = resume_text
-            
-            # Clean up temporary file
-            os.unlink(filepath)
-            
-            return jsonify({
-                'success': True,
-                'data': results
-            })
-            
-        except Exception as e:
-            # Clean up temporary file on error
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            raise e
+        return jsonify({
+            'success': True,
+            'data': results,
+            'resume_id': resume_id
+        })
             
     except Exception as e:
         logger.error(f"Standard ATS analysis failed: {str(e)}")
@@ -2176,15 +2207,6 @@ def standard_ats_analysis():
 def jd_specific_ats_analysis():
     """Job Description specific ATS analysis endpoint"""
     try:
-        # Check if file was uploaded
-        if 'resume' not in request.files:
-            return jsonify({'success': False, 'error': 'No resume file uploaded'})
-        
-        file = request.files['resume']
-        
-        if file.filename == '':
-            return jsonify({'success': False, 'error': 'No resume file selected'})
-        
         # Get job description - either from text input or PDF file
         job_description_text = request.form.get('job_description', '').strip()
         jd_file = request.files.get('job_description_file')
@@ -2196,20 +2218,16 @@ def jd_specific_ats_analysis():
         if job_description_text and jd_file:
             return jsonify({'success': False, 'error': 'Please provide either job description text OR PDF file, not both'})
         
-        # Save resume file temporarily
-        resume_filename = secure_filename(file.filename)
-        resume_filepath = os.path.join(app.config['UPLOAD_FOLDER'], resume_filename)
-        file.save(resume_filepath)
+        session, error = load_resume_session('No resume file uploaded', 'No resume file selected')
+        if error:
+            return jsonify({'success': False, 'error': error})
+        
+        resume_id = session['resume_id']
+        resume_text = session['extracted_text']
         
         jd_filepath = None
         
         try:
-            # Extract text from resume file
-            resume_text = DocumentExtractor.extract_text(resume_filepath)
-            
-            if not resume_text.strip():
-                raise ValueError("No text extracted from resume file")
-            
             # Get job description text
             if job_description_text:
                 # Use provided text job description
@@ -2236,43 +2254,128 @@ def jd_specific_ats_analysis():
                     raise ValueError("No text extracted from job description file")
                 
                 logger.info(f"Extracted job description from file: {jd_filename}")
-            
-            # Initialize ATS service
-            ats_service = JDSpecificATSService(api_key=os.getenv('GEMINI_API_KEY'))
-            
-            # Run JD-specific ATS analysis
-            logger.info(f"Running JD-specific ATS analysis for: {resume_filename}")
-            results = ats_service.analyze_resume_for_jd(resume_text, job_description)
-            
-            # Add extracted text to results if not already present
-            if 'extracted_text' not in results:
-                results['extracted_text'] = resume_text
-            
-            # Add job description source info
-            results['job_description_source'] = 'file' if jd_file else 'text'
-            if jd_file:
-                results['job_description_filename'] = jd_file.filename
-            
-            # Clean up temporary files
-            os.unlink(resume_filepath)
+        finally:
+            # Clean up temporary JD file
             if jd_filepath and os.path.exists(jd_filepath):
                 os.unlink(jd_filepath)
+        
+        jd_source_filename = jd_file.filename if jd_file else None
+        
+        def add_jd_source(results):
+            # Add job description source info
+            results['job_description_source'] = 'file' if jd_source_filename else 'text'
+            if jd_source_filename:
+                results['job_description_filename'] = jd_source_filename
+            save_analysis(resume_id, 'jd_specific', results)
+            return results
+        
+        # Get shared ATS service
+        ats_service = get_service(JDSpecificATSService, api_key=os.getenv('GEMINI_API_KEY'))
+        
+        # Opt-in streaming: send category blocks and suggestions as Server-Sent Events
+        if wants_event_stream(request.values.get('stream'), request.headers.get('Accept')):
+            logger.info(f"Streaming JD-specific ATS analysis for session: {resume_id}")
+            events = ats_service.analyze_resume_for_jd_stream(resume_text, job_description)
+            return Response(
+                sse_response_body(events, on_result=add_jd_source, extra={'resume_id': resume_id}),
+                mimetype=SSE_MIMETYPE,
+                headers=SSE_HEADERS
+            )
+        
+        # Run JD-specific ATS analysis
+        logger.info(f"Running JD-specific ATS analysis for session: {resume_id}")
+        results = add_jd_source(ats_service.analyze_resume_for_jd(resume_text, job_description))
+        
+        return jsonify({
+            'success': True,
+            'data': results,
+            'resume_id': resume_id
+        })
             
-            return jsonify({
-                'success': True,
-                'data': results
-            })
+    except Exception as e:
+        logger.error(f"JD-specific ATS analysis failed: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/ats/bulk-jd', methods=['POST'])
+def bulk_jd_ats_analysis():
+    """Recruiter bulk mode: rank many resumes against one job description"""
+    try:
+        files = [f for f in request.files.getlist('resumes') if f and f.filename]
+        if not files:
+            return jsonify({'success': False, 'error': 'No resume files uploaded'})
+        
+        # Get job description - either from text input or PDF file
+        job_description = request.form.get('job_description', '').strip()
+        jd_file = request.files.get('job_description_file')
+        if not job_description and not jd_file:
+            return jsonify({'success': False, 'error': 'Job description is required (either text or PDF file)'})
+        if job_description and jd_file:
+            return jsonify({'success': False, 'error': 'Please provide either job description text OR PDF file, not both'})
+        
+        try:
+            max_concurrency = int(request.form['max_concurrency']) if request.form.get('max_concurrency') else None
+            min_prescore = float(request.form['min_prescore']) if request.form.get('min_prescore') else None
+            top_k = int(request.form['top_k']) if request.form.get('top_k') else None
+        except ValueError:
+            return jsonify({'success': False, 'error': 'max_concurrency and top_k must be integers, min_prescore a number'})
+        
+        # Save uploads under unique names - bulk uploads often repeat filenames
+        saved_paths = []
+        
+        def save_unique(upload, prefix=''):
+            fd, path = tempfile.mkstemp(prefix=prefix, suffix=Path(secure_filename(upload.filename)).suffix, dir=app.config['UPLOAD_FOLDER'])
+            os.close(fd)
+            upload.save(path)
+            saved_paths.append(path)
+            return path
+        
+        def remove_saved():
+            for path in saved_paths:
+                if os.path.exists(path):
+                    os.unlink(path)
+        
+        try:
+            if jd_file:
+                if not secure_filename(jd_file.filename).lower().endswith(('.pdf', '.docx', '.txt')):
+                    raise ValueError("Job description file must be PDF, DOCX, or TXT format")
+                job_description = DocumentExtractor.extract_text(save_unique(jd_file, 'jd_'))
+                if not job_description.strip():
+                    raise ValueError("No text extracted from job description file")
             
-        except Exception as e:
-            # Clean up temporary files on error
-            if os.path.exists(resume_filepath):
-                os.unlink(resume_filepath)
-            if jd_filepath and os.path.exists(jd_filepath):
-                os.unlink(jd_filepath)
-            raise e
+            resumes = [{'name': f.filename, 'path': save_unique(f)} for f in files]
+        except Exception:
+            remove_saved()
+            raise
+        
+        # Get shared ATS service
+        ats_service = get_service(JDSpecificATSService, api_key=os.getenv('GEMINI_API_KEY'))
+        logger.info(f"Running bulk JD-specific ATS analysis for {len(resumes)} resumes")
+        
+        # Opt-in streaming: send the pre-score table and each finished analysis as Server-Sent Events
+        if wants_event_stream(request.values.get('stream'), request.headers.get('Accept')):
+            def events():
+                try:
+                    yield from ats_service.analyze_resumes_for_jd_stream(resumes, job_description, max_concurrency, min_prescore, top_k)
+                finally:
+                    remove_saved()
+            
+            return Response(sse_response_body(events()), mimetype=SSE_MIMETYPE, headers=SSE_HEADERS)
+        
+        try:
+            results = ats_service.analyze_resumes_for_jd(resumes, job_description, max_concurrency, min_prescore, top_k)
+        finally:
+            remove_saved()
+        
+        return jsonify({
+            'success': True,
+            'data': results
+        })
             
     except Exception as e:
-        logger.error(f"JD-specific ATS analysis failed: {str(e)}")
+        logger.error(f"Bulk JD-specific ATS analysis failed: {str(e)}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -2282,38 +2385,40 @@ def jd_specific_ats_analysis():
 def ai_suggestions():
     """AI-powered resume suggestions with job description generation"""
     try:
-        # Check if file was uploaded
-        if 'resume' not in request.files:
-            return jsonify({'success': False, 'error': 'No file uploaded'})
-        
         # Check if required parameters were provided
         if 'sector' not in request.form or 'country' not in request.form or 'designation' not in request.form:
             return jsonify({'success': False, 'error': 'Sector, country, and designation are required'})
         
-        file = request.files['resume']
         sector = request.form['sector']
         country = request.form['country']
         designation = request.form['designation']
         
-        if file.filename == '':
-            return jsonify({'success': False, 'error': 'No file selected'})
-        
         if not sector.strip() or not country.strip() or not designation.strip():
             return jsonify({'success': False, 'error': 'Sector, country, and designation cannot be empty'})
         
-        # Save file temporarily
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        session, error = load_resume_session()
+        if error:
+            return jsonify({'success': False, 'error': error})
         
-        try:
-            # Initialize optimized AI service
-            ai_service = AISuggestionServiceOptimized()
-            
-            # Step 1: Parse the resume
-            logger.info(f"Parsing resume for AI suggestions: {filename}")
-            parser = OpenAIResumeParser()
-            resume_data = parser.parse_resume_from_file(filepath)
+        resume_id = session['resume_id']
+        
+        # Get shared optimized AI service
+        ai_service = get_service(AISuggestionServiceOptimized)
+        
+        parser = get_service(OpenAIResumeParser)
+        
+        if OpenAIConfig.AI_SUGGESTIONS_PIPELINED and session.get('parsed_data') is None:
+            # Parse and generate the job description concurrently, then compare
+            logger.info(f"Running pipelined AI suggestions for {designation} in {sector} sector, {country}: session {resume_id}")
+            resume_data, job_description_response, suggestions_response = ai_service.generate_suggestions_pipelined(
+                session['extracted_text'], sector, country, designation, parser
+            )
+            get_resume_store().update(resume_id, parsed_data=resume_data)
+            job_description_dict = job_description_response.model_dump()
+        else:
+            # Step 1: Parse the resume (reused from the session when already parsed)
+            logger.info(f"Loading parsed resume for AI suggestions: session {resume_id}")
+            resume_data = get_session_parsed_data(session)
             
             # Step 2: Generate job description - let the service analyze experience level internally
             logger.info(f"Generating job description for {designation} in {sector} sector, {country}")
@@ -2325,33 +2430,25 @@ def ai_suggestions():
             # Step 3: Get AI suggestions by comparing resume with job description
             logger.info("Comparing resume with job description and generating suggestions")
             suggestions_response = ai_service.compare_resume_with_jd(resume_data, job_description_dict['jobDescription'])
-            
-            # Convert Pydantic model to dict for JSON serialization
-            suggestions_dict = suggestions_response.model_dump()
-            
-            # Clean up temporary file
-            os.unlink(filepath)
-            
-            return jsonify({
-                'success': True,
-                'data': {
-                    'resumeData': resume_data,
-                    'jobDescription': job_description_dict,
-                    'suggestions': suggestions_dict,
-                    'processedAt': str(datetime.datetime.now()),
-                    'parameters': {
-                        'sector': sector,
-                        'country': country,
-                        'designation': designation
-                    }
+        
+        # Convert Pydantic model to dict for JSON serialization
+        suggestions_dict = suggestions_response.model_dump()
+        
+        return jsonify({
+            'success': True,
+            'resume_id': resume_id,
+            'data': {
+                'resumeData': resume_data,
+                'jobDescription': job_description_dict,
+                'suggestions': suggestions_dict,
+                'processedAt': str(datetime.datetime.now()),
+                'parameters': {
+                    'sector': sector,
+                    'country': country,
+                    'designation': designation
                 }
-            })
-            
-        except Exception as e:
-            # Clean up temporary file on error
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-            raise e
+            }
+        })
             
     except Exception as e:
         logger.error(f"AI suggestions analysis failed: {str(e)}")
@@ -2373,24 +2470,35 @@ def improve_resume():
         
         data = request.get_json()
         
+        # A resume_id stands in for parsed_resume_data and ats_analysis when they are omitted
+        session = None
+        resume_id = data.get('resume_id')
+        if resume_id:
+            session = get_resume_store().get(resume_id)
+            if session is None:
+                return jsonify({
+                    "success": False,
+                    "error": "Unknown or expired resume_id - please upload the resume again"
+                }), 404
+        
         # Validate required fields
-        if 'parsed_resume_data' not in data:
+        if 'parsed_resume_data' not in data and session is None:
             return jsonify({
                 "success": False,
                 "error": "parsed_resume_data is required"
             }), 400
         
-        if 'ats_analysis' not in data:
+        if 'ats_analysis' not in data and not (session and session.get('latest_analysis')):
             return jsonify({
                 "success": False,
                 "error": "ats_analysis is required"
             }), 400
         
-        parsed_resume_data = data['parsed_resume_data']
-        ats_analysis = data['ats_analysis']
+        parsed_resume_data = data['parsed_resume_data'] if 'parsed_resume_data' in data else get_session_parsed_data(session)
+        ats_analysis = data['ats_analysis'] if 'ats_analysis' in data else session['analyses'][session['latest_analysis']]
         
-        # Initialize improvement service
-        improvement_service = ResumeImprovementService()
+        # Get shared improvement service
+        improvement_service = get_service(ResumeImprovementService)
         
         # Apply ATS suggestions
         logger.info("Applying ATS suggestions to improve resume")
@@ -2402,14 +2510,20 @@ def improve_resume():
         # Add summary to the result
         improved_resume["_improvement_summary"] = improvement_summary
         
+        if session is not None:
+            get_resume_store().update(resume_id, improved_resume=improved_resume)
+        
         logger.info("Successfully applied ATS suggestions to resume")
         
-        return jsonify({
+        response = {
             "success": True,
             "data": improved_resume,
             "improvement_summary": improvement_summary,
             "timestamp": datetime.datetime.utcnow().isoformat() + "Z"
-        })
+        }
+        if session is not None:
+            response["resume_id"] = resume_id
+        return jsonify(response)
         
     except Exception as e:
         logger.error(f"Failed to improve resume: {str(e)}")
@@ -2531,8 +2645,8 @@ def enhance_content():
                 "error": "content_type must be 'experience' or 'project'"
             }), 400
         
-        # Initialize enhancement service
-        enhancement_service = ContentEnhancementService()
+        # Get shared enhancement service
+        enhancement_service = get_service(ContentEnhancementService)
         
         # Extract description from content data
         description = content_data.get('description', '')
@@ -2568,14 +2682,19 @@ def enhance_content():
 def health():
     """Health check endpoint"""
     try:
-        # Test if parser can be initialized
-        parser = OpenAIResumeParser()
-        model_info = parser.get_model_info()
+        # Test if the shared parser can be initialized
+        parser = get_service(OpenAIResumeParser)
         
         return jsonify({
             'status': 'healthy',
-            'openai_model': model_info['model_name'],
-            'api_key_configured': model_info['api_key_configured']
+            'openai_model': parser.model_name,
+            'api_key_configured': bool(parser.api_key),
+            'pool': get_pool_stats(),
+            'extraction_cache': DocumentExtractor.get_cache_stats(),
+            'llm_cache': get_response_cache().get_stats() if get_response_cache() else None,
+            'resume_store': get_resume_store().get_stats(),
+            'prompt_prefixes': prompt_prefix_hashes(),
+            'structured_outputs': structured_output_stats()
         })
     except Exception as e:
         return jsonify({
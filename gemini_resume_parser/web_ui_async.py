@@ -0,0 +1,701 @@
+#!/usr/bin/env python3
+"""
+Async (ASGI) API server for the Resume Parser and ATS Analysis services
+Exposes the same JSON routes as web_ui.py, but LLM calls are awaited on the shared
+AsyncOpenAI client instead of blocking a worker thread, so one process can hold
+hundreds of in-flight requests.
+
+Run with:
+    hypercorn web_ui_async:app --bind 0.0.0.0:5000
+or for local development:
+    python web_ui_async.py
+"""
+
+import os
+import asyncio
+import tempfile
+import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from quart import Quart, Response, request, jsonify
+from werkzeug.utils import secure_filename
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+from config.config import OpenAIConfig
+from services.openai_parser_service import OpenAIResumeParser
+from services.ats_service import StandardATSService, JDSpecificATSService
+from services.ai_suggestion_service_optimized import AISuggestionServiceOptimized
+from services.resume_improvement_service import ResumeImprovementService
+from services.content_enhancement_service import ContentEnhancementService
+from services.client_registry import get_service, get_pool_stats
+from utils.pdf_extractor import DocumentExtractor
+from utils.response_cache import get_response_cache
+from utils.resume_store import get_resume_store, save_analysis
+from utils.prompt_registry import prompt_prefix_hashes
+from utils.structured_output import structured_output_stats
+from utils.sse import SSE_HEADERS, SSE_MIMETYPE, sse_response_body, wants_event_stream
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+app = Quart(__name__)
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['UPLOAD_FOLDER'] = tempfile.gettempdir()
+
+# Enable CORS for all routes - read URLs from environment variables
+frontend_url = os.getenv('FRONTEND_URL', 'http://localhost:3000')
+backend_url = os.getenv('BACKEND_URL', 'http://localhost:5006')
+cors_origins = [frontend_url, backend_url]
+try:
+    from quart_cors import cors
+    app = cors(app, allow_origin=cors_origins, allow_credentials=True)
+except ImportError:
+    logger.warning("quart-cors not installed - CORS headers will not be added")
+
+# Text extraction is CPU/IO bound library code, so it gets its own small pool
+extraction_executor = ThreadPoolExecutor(
+    max_workers=OpenAIConfig.ASYNC_EXTRACTION_WORKERS,
+    thread_name_prefix="extract"
+)
+# Multi-call pipelines that still use the sync client run here (also the loop's default executor)
+service_executor = ThreadPoolExecutor(
+    max_workers=OpenAIConfig.ASYNC_SERVICE_WORKERS,
+    thread_name_prefix="service"
+)
+
+
+@app.before_serving
+async def startup():
+    """Route asyncio.to_thread / run_in_executor(None, ...) calls to the service pool"""
+    asyncio.get_running_loop().set_default_executor(service_executor)
+    # Open the resume store up front; its calls are made with asyncio.to_thread since the SQLite backend blocks
+    await asyncio.to_thread(get_resume_store)
+    logger.info(f"Async server ready (extraction_workers={OpenAIConfig.ASYNC_EXTRACTION_WORKERS}, service_workers={OpenAIConfig.ASYNC_SERVICE_WORKERS})")
+
+
+@app.after_serving
+async def shutdown():
+    """Stop the thread pools"""
+    extraction_executor.shutdown(wait=False)
+    service_executor.shutdown(wait=False)
+
+
+async def run_in_service_pool(func, *args, **kwargs):
+    """Run a blocking service call on the service thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(service_executor, partial(func, *args, **kwargs))
+
+
+async def iterate_in_service_pool(iterator):
+    """Drain a blocking iterator on the service thread pool, one item per hop"""
+    loop = asyncio.get_running_loop()
+    done = object()
+    while True:
+        item = await loop.run_in_executor(service_executor, next, iterator, done)
+        if item is done:
+            break
+        yield item
+
+
+async def extract_text(filepath: str) -> str:
+    """Extract document text on the extraction thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(extraction_executor, DocumentExtractor.extract_text, filepath)
+
+
+async def save_upload(file, prefix: str = "") -> str:
+    """
+    Save an uploaded file under a unique temporary name
+
+    Concurrent uploads with the same filename must not overwrite each other.
+
+    Args:
+        file: Uploaded file from request.files
+        prefix: Optional filename prefix
+
+    Returns:
+        Path of the saved file
+    """
+    suffix = Path(secure_filename(file.filename)).suffix
+    fd, filepath = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=app.config['UPLOAD_FOLDER'])
+    os.close(fd)
+    await file.save(filepath)
+    return filepath
+
+
+def remove_file(filepath: str):
+    """Delete a temporary file if it still exists"""
+    if filepath and os.path.exists(filepath):
+        os.unlink(filepath)
+
+
+async def load_resume_session(files, form, missing_error='No file uploaded', empty_error='No file selected'):
+    """
+    Resolve the resume for a request: a stored session via resume_id, or a newly uploaded file
+
+    An uploaded file is extracted once and stored; the returned session carries its resume_id
+    so later calls (ATS, suggestions, improvement) can skip the upload and extraction.
+
+    Returns:
+        (session, error) - exactly one of them is None
+    """
+    store = get_resume_store()
+    resume_id = (request.args.get('resume_id') or form.get('resume_id') or '').strip()
+    if resume_id:
+        session = await asyncio.to_thread(store.get, resume_id)
+        if session is None:
+            return None, 'Unknown or expired resume_id - please upload the resume again'
+        return session, None
+
+    # Check if file was uploaded
+    if 'resume' not in files:
+        return None, missing_error
+
+    file = files['resume']
+    if file.filename == '':
+        return None, empty_error
+
+    filepath = await save_upload(file)
+    try:
+        resume_text = await extract_text(filepath)
+    finally:
+        remove_file(filepath)
+
+    if not resume_text.strip():
+        raise ValueError("No text extracted from file")
+
+    session = await asyncio.to_thread(store.create, resume_text, filename=file.filename)
+    logger.info(f"Stored resume session {session['resume_id']} for: {file.filename}")
+    return session, None
+
+
+async def get_session_parsed_data(session):
+    """Return the session's parsed resume, parsing the stored text once if needed"""
+    if session.get('parsed_data') is None:
+        parser = get_service(OpenAIResumeParser)
+        logger.info(f"Parsing resume for session {session['resume_id']}")
+        session['parsed_data'] = await parser.aparse_resume_text(session['extracted_text'])
+        await asyncio.to_thread(get_resume_store().update, session['resume_id'], parsed_data=session['parsed_data'])
+    return session['parsed_data']
+
+
+@app.route('/parse', methods=['POST'])
+async def parse_resume():
+    """Parse uploaded resume file (or a stored resume referenced by resume_id)"""
+    try:
+        files = await request.files
+        form = await request.form
+
+        session, error = await load_resume_session(files, form)
+        if error:
+            return jsonify({'success': False, 'error': error})
+
+        # Parse the resume (served from the session when already parsed)
+        parsed_data = await get_session_parsed_data(session)
+
+        return jsonify({
+            'success': True,
+            'data': parsed_data,
+            'resume_id': session['resume_id']
+        })
+
+    except Exception as e:
+        logger.error(f"Error parsing resume: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+
+@app.route('/ats/standard', methods=['POST'])
+async def standard_ats_analysis():
+    """Standard ATS analysis endpoint"""
+    try:
+        files = await request.files
+        form = await request.form
+
+        session, error = await load_resume_session(files, form)
+        if error:
+            return jsonify({'success': False, 'error': error})
+
+        resume_id = session['resume_id']
+        resume_text = session['extracted_text']
+
+        ats_service = get_service(StandardATSService, api_key=os.getenv('GEMINI_API_KEY'))
+
+        # Opt-in streaming: send category blocks and suggestions as Server-Sent Events
+        if wants_event_stream(request.args.get('stream', form.get('stream')), request.headers.get('Accept')):
+            # Result hooks run on the service pool along with the rest of the stream
+            def store_results(results):
+                save_analysis(resume_id, 'standard', results)
+                return results
+
+            logger.info(f"Streaming standard ATS analysis for session: {resume_id}")
+            frames = sse_response_body(
+                ats_service.analyze_resume_stream(resume_text), on_result=store_results, extra={'resume_id': resume_id}
+            )
+            return Response(iterate_in_service_pool(frames), mimetype=SSE_MIMETYPE, headers=SSE_HEADERS)
+
+        logger.info(f"Running standard ATS analysis for session: {resume_id}")
+        results = await ats_service.aanalyze_resume(resume_text)
+        await asyncio.to_thread(save_analysis, resume_id, 'standard', results)
+
+        return jsonify({
+            'success': True,
+            'data': results,
+            'resume_id': resume_id
+        })
+
+    except Exception as e:
+        logger.error(f"Standard ATS analysis failed: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+
+@app.route('/ats/jd-specific', methods=['POST'])
+async def jd_specific_ats_analysis():
+    """Job Description specific ATS analysis endpoint"""
+    try:
+        files = await request.files
+        form = await request.form
+
+        # Get job description - either from text input or PDF file
+        job_description_text = form.get('job_description', '').strip()
+        jd_file = files.get('job_description_file')
+
+        # Validate that we have either text job description or JD file
+        if not job_description_text and not jd_file:
+            return jsonify({'success': False, 'error': 'Job description is required (either text or PDF file)'})
+
+        if job_description_text and jd_file:
+            return jsonify({'success': False, 'error': 'Please provide either job description text OR PDF file, not both'})
+
+        jd_filepath = None
+
+        try:
+            if job_description_text:
+                job_description = job_description_text
+                logger.info("Using text job description for JD-specific ATS analysis")
+                session, error = await load_resume_session(files, form, 'No resume file uploaded', 'No resume file selected')
+            else:
+                if jd_file.filename == '':
+                    raise ValueError("No job description file selected")
+
+                # Validate JD file type
+                jd_filename = secure_filename(jd_file.filename)
+                if not jd_filename.lower().endswith(('.pdf', '.docx', '.txt')):
+                    raise ValueError("Job description file must be PDF, DOCX, or TXT format")
+
+                jd_filepath = await save_upload(jd_file, prefix="jd_")
+
+                # Resolve the resume and extract the JD concurrently
+                (session, error), job_description = await asyncio.gather(
+                    load_resume_session(files, form, 'No resume file uploaded', 'No resume file selected'),
+                    extract_text(jd_filepath)
+                )
+                if not error:
+                    if not job_description.strip():
+                        raise ValueError("No text extracted from job description file")
+                    logger.info(f"Extracted job description from file: {jd_file.filename}")
+        finally:
+            remove_file(jd_filepath)
+
+        if error:
+            return jsonify({'success': False, 'error': error})
+
+        resume_id = session['resume_id']
+        resume_text = session['extracted_text']
+
+        def add_jd_source(results):
+            # Add job description source info
+            results['job_description_source'] = 'file' if jd_file else 'text'
+            if jd_file:
+                results['job_description_filename'] = jd_file.filename
+            save_analysis(resume_id, 'jd_specific', results)
+            return results
+
+        ats_service = get_service(JDSpecificATSService, api_key=os.getenv('GEMINI_API_KEY'))
+
+        # Opt-in streaming: send category blocks and suggestions as Server-Sent Events
+        if wants_event_stream(request.args.get('stream', form.get('stream')), request.headers.get('Accept')):
+            logger.info(f"Streaming JD-specific ATS analysis for session: {resume_id}")
+            frames = sse_response_body(
+                ats_service.analyze_resume_for_jd_stream(resume_text, job_description),
+                on_result=add_jd_source,
+                extra={'resume_id': resume_id}
+            )
+            return Response(iterate_in_service_pool(frames), mimetype=SSE_MIMETYPE, headers=SSE_HEADERS)
+
+        logger.info(f"Running JD-specific ATS analysis for session: {resume_id}")
+        results = await asyncio.to_thread(add_jd_source, await ats_service.aanalyze_resume_for_jd(resume_text, job_description))
+
+        return jsonify({
+            'success': True,
+            'data': results,
+            'resume_id': resume_id
+        })
+
+    except Exception as e:
+        logger.error(f"JD-specific ATS analysis failed: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+
+@app.route('/ats/bulk-jd', methods=['POST'])
+async def bulk_jd_ats_analysis():
+    """Recruiter bulk mode: rank many resumes against one job description"""
+    try:
+        files = await request.files
+        form = await request.form
+
+        uploads = [f for f in files.getlist('resumes') if f and f.filename]
+        if not uploads:
+            return jsonify({'success': False, 'error': 'No resume files uploaded'})
+
+        # Get job description - either from text input or PDF file
+        job_description = form.get('job_description', '').strip()
+        jd_file = files.get('job_description_file')
+        if not job_description and not jd_file:
+            return jsonify({'success': False, 'error': 'Job description is required (either text or PDF file)'})
+        if job_description and jd_file:
+            return jsonify({'success': False, 'error': 'Please provide either job description text OR PDF file, not both'})
+
+        try:
+            max_concurrency = int(form['max_concurrency']) if form.get('max_concurrency') else None
+            min_prescore = float(form['min_prescore']) if form.get('min_prescore') else None
+            top_k = int(form['top_k']) if form.get('top_k') else None
+        except ValueError:
+            return jsonify({'success': False, 'error': 'max_concurrency and top_k must be integers, min_prescore a number'})
+
+        saved_paths = []
+
+        def remove_saved():
+            for path in saved_paths:
+                remove_file(path)
+
+        try:
+            if jd_file:
+                if not secure_filename(jd_file.filename).lower().endswith(('.pdf', '.docx', '.txt')):
+                    raise ValueError("Job description file must be PDF, DOCX, or TXT format")
+                jd_filepath = await save_upload(jd_file, prefix="jd_")
+                saved_paths.append(jd_filepath)
+                job_description = await extract_text(jd_filepath)
+                if not job_description.strip():
+                    raise ValueError("No text extracted from job description file")
+
+            resumes = []
+            for upload in uploads:
+                path = await save_upload(upload)
+                saved_paths.append(path)
+                resumes.append({'name': upload.filename, 'path': path})
+        except Exception:
+            remove_saved()
+            raise
+
+        ats_service = get_service(JDSpecificATSService, api_key=os.getenv('GEMINI_API_KEY'))
+        logger.info(f"Running bulk JD-specific ATS analysis for {len(resumes)} resumes")
+
+        # Opt-in streaming: send the pre-score table and each finished analysis as Server-Sent Events
+        if wants_event_stream(request.args.get('stream', form.get('stream')), request.headers.get('Accept')):
+            def events():
+                try:
+                    yield from ats_service.analyze_resumes_for_jd_stream(resumes, job_description, max_concurrency, min_prescore, top_k)
+                finally:
+                    remove_saved()
+
+            return Response(iterate_in_service_pool(sse_response_body(events())), mimetype=SSE_MIMETYPE, headers=SSE_HEADERS)
+
+        try:
+            results = await run_in_service_pool(
+                ats_service.analyze_resumes_for_jd, resumes, job_description, max_concurrency, min_prescore, top_k
+            )
+        finally:
+            remove_saved()
+
+        return jsonify({
+            'success': True,
+            'data': results
+        })
+
+    except Exception as e:
+        logger.error(f"Bulk JD-specific ATS analysis failed: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+
+@app.route('/ai/suggestions', methods=['POST'])
+async def ai_suggestions():
+    """AI-powered resume suggestions with job description generation"""
+    try:
+        files = await request.files
+        form = await request.form
+
+        # Check if required parameters were provided
+        if 'sector' not in form or 'country' not in form or 'designation' not in form:
+            return jsonify({'success': False, 'error': 'Sector, country, and designation are required'})
+
+        sector = form['sector']
+        country = form['country']
+        designation = form['designation']
+
+        if not sector.strip() or not country.strip() or not designation.strip():
+            return jsonify({'success': False, 'error': 'Sector, country, and designation cannot be empty'})
+
+        session, error = await load_resume_session(files, form)
+        if error:
+            return jsonify({'success': False, 'error': error})
+
+        resume_id = session['resume_id']
+
+        ai_service = get_service(AISuggestionServiceOptimized)
+
+        parser = get_service(OpenAIResumeParser)
+
+        if OpenAIConfig.AI_SUGGESTIONS_PIPELINED and session.get('parsed_data') is None:
+            # Start JD generation (experience level estimated from raw text) while the resume is parsed
+            resume_text = session['extracted_text']
+            experience_level = ai_service.estimate_experience_level_from_text(resume_text)
+            logger.info(f"Running pipelined AI suggestions for {designation} in {sector} sector, {country} ({experience_level})")
+            resume_data, job_description_response = await asyncio.gather(
+                parser.aparse_resume_text(resume_text),
+                run_in_service_pool(
+                    ai_service.generate_job_description, sector, country, designation, None, experience_level
+                )
+            )
+            await asyncio.to_thread(get_resume_store().update, resume_id, parsed_data=resume_data)
+        else:
+            # Step 1: Parse the resume (reused from the session when already parsed)
+            logger.info(f"Loading parsed resume for AI suggestions: session {resume_id}")
+            resume_data = await get_session_parsed_data(session)
+            experience_level = None
+
+            # Step 2: Generate job description - let the service analyze experience level internally
+            logger.info(f"Generating job description for {designation} in {sector} sector, {country}")
+            job_description_response = await run_in_service_pool(
+                ai_service.generate_job_description, sector, country, designation, resume_data
+            )
+        job_description_dict = job_description_response.model_dump()
+
+        # Step 3: Get AI suggestions by comparing resume with job description
+        logger.info("Comparing resume with job description and generating suggestions")
+        suggestions_response = await run_in_service_pool(
+            ai_service.compare_resume_with_jd, resume_data, job_description_dict['jobDescription'], experience_level
+        )
+        suggestions_dict = suggestions_response.model_dump()
+
+        return jsonify({
+            'success': True,
+            'resume_id': resume_id,
+            'data': {
+                'resumeData': resume_data,
+                'jobDescription': job_description_dict,
+                'suggestions': suggestions_dict,
+                'processedAt': str(datetime.datetime.now()),
+                'parameters': {
+                    'sector': sector,
+                    'country': country,
+                    'designation': designation
+                }
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"AI suggestions analysis failed: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+
+@app.route('/improve-resume', methods=['POST'])
+async def improve_resume():
+    """Apply ATS suggestions to improve resume"""
+    try:
+        if not request.is_json:
+            return jsonify({
+                "success": False,
+                "error": "Request must be JSON"
+            }), 400
+
+        data = await request.get_json()
+
+        # A resume_id stands in for parsed_resume_data and ats_analysis when they are omitted
+        session = None
+        resume_id = data.get('resume_id')
+        if resume_id:
+            session = await asyncio.to_thread(get_resume_store().get, resume_id)
+            if session is None:
+                return jsonify({
+                    "success": False,
+                    "error": "Unknown or expired resume_id - please upload the resume again"
+                }), 404
+
+        # Validate required fields
+        if 'parsed_resume_data' not in data and session is None:
+            return jsonify({
+                "success": False,
+                "error": "parsed_resume_data is required"
+            }), 400
+
+        if 'ats_analysis' not in data and not (session and session.get('latest_analysis')):
+            return jsonify({
+                "success": False,
+                "error": "ats_analysis is required"
+            }), 400
+
+        parsed_resume_data = data['parsed_resume_data'] if 'parsed_resume_data' in data else await get_session_parsed_data(session)
+        ats_analysis = data['ats_analysis'] if 'ats_analysis' in data else session['analyses'][session['latest_analysis']]
+
+        improvement_service = get_service(ResumeImprovementService)
+
+        logger.info("Applying ATS suggestions to improve resume")
+        improved_resume = await run_in_service_pool(
+            improvement_service.apply_ats_suggestions, parsed_resume_data, ats_analysis
+        )
+
+        # Generate improvement summary
+        improvement_summary = improvement_service.get_improvement_summary(parsed_resume_data, improved_resume)
+        improved_resume["_improvement_summary"] = improvement_summary
+
+        if session is not None:
+            await asyncio.to_thread(get_resume_store().update, resume_id, improved_resume=improved_resume)
+
+        logger.info("Successfully applied ATS suggestions to resume")
+
+        response = {
+            "success": True,
+            "data": improved_resume,
+            "improvement_summary": improvement_summary,
+            "timestamp": datetime.datetime.utcnow().isoformat() + "Z"
+        }
+        if session is not None:
+            response["resume_id"] = resume_id
+        return jsonify(response)
+
+    except Exception as e:
+        logger.error(f"Failed to improve resume: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": f"Failed to improve resume: {str(e)}"
+        }), 500
+
+
+@app.route('/enhance-content', methods=['POST'])
+async def enhance_content():
+    """Enhance experience or project description based on user prompt"""
+    try:
+        if not request.is_json:
+            return jsonify({
+                "success": False,
+                "error": "Request must be JSON"
+            }), 400
+
+        data = await request.get_json()
+
+        # Validate required fields
+        if 'content_type' not in data:
+            return jsonify({
+                "success": False,
+                "error": "content_type is required (experience or project)"
+            }), 400
+
+        if 'content_data' not in data:
+            return jsonify({
+                "success": False,
+                "error": "content_data is required"
+            }), 400
+
+        if 'enhancement_prompt' not in data:
+            return jsonify({
+                "success": False,
+                "error": "enhancement_prompt is required"
+            }), 400
+
+        content_type = data['content_type']
+        content_data = data['content_data']
+        enhancement_prompt = data['enhancement_prompt']
+
+        # Validate content type
+        if content_type not in ['experience', 'project']:
+            return jsonify({
+                "success": False,
+                "error": "content_type must be 'experience' or 'project'"
+            }), 400
+
+        enhancement_service = get_service(ContentEnhancementService)
+
+        description = content_data.get('description', '')
+
+        if not description.strip():
+            return jsonify({
+                "success": False,
+                "error": "Description is required in content_data"
+            }), 400
+
+        logger.info(f"Enhancing {content_type} description")
+        enhanced_result = await enhancement_service.aenhance_description(description, enhancement_prompt, content_type)
+
+        logger.info("Successfully enhanced content")
+
+        return jsonify({
+            "success": True,
+            "data": enhanced_result,
+            "content_type": content_type,
+            "timestamp": datetime.datetime.utcnow().isoformat() + "Z"
+        })
+
+    except Exception as e:
+        logger.error(f"Failed to enhance content: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": f"Failed to enhance content: {str(e)}"
+        }), 500
+
+
+@app.route('/health')
+async def health():
+    """Health check endpoint"""
+    try:
+        parser = get_service(OpenAIResumeParser)
+
+        return jsonify({
+            'status': 'healthy',
+            'openai_model': parser.model_name,
+            'api_key_configured': bool(parser.api_key),
+            'pool': get_pool_stats(),
+            'extraction_cache': DocumentExtractor.get_cache_stats(),
+            'llm_cache': get_response_cache().get_stats() if get_response_cache() else None,
+            'resume_store': await asyncio.to_thread(get_resume_store().get_stats),
+            'prompt_prefixes': prompt_prefix_hashes(),
+            'structured_outputs': structured_output_stats(),
+            'executors': {
+                'extraction_workers': OpenAIConfig.ASYNC_EXTRACTION_WORKERS,
+                'service_workers': OpenAIConfig.ASYNC_SERVICE_WORKERS
+            }
+        })
+    except Exception as e:
+        return jsonify({
+            'status': 'unhealthy',
+            'error': str(e)
+        }), 500
+
+
+if __name__ == '__main__':
+    print("🚀 Starting async Resume Parser & ATS Analysis API...")
+    print("📱 Listening on: http://localhost:5000")
+    print("💡 For production use: hypercorn web_ui_async:app --bind 0.0.0.0:5000")
+    print("\nPress Ctrl+C to stop the server")
+
+    app.run(host='0.0.0.0', port=5000)
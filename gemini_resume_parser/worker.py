@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Persistent Python Worker
+Long-lived process that serves the standalone scripts (parse_resume.py, ai_suggestions.py,
+ai_job_description.py, enhance_content.py) over newline-delimited JSON, so callers pay
+interpreter startup, imports and client construction once instead of on every request.
+
+Requests are handled concurrently on a thread pool (WORKER_MAX_CONCURRENCY per process), so
+responses can come back in a different order than the requests; match them by id.
+
+Protocol (one JSON object per line):
+    request:  {"id": "42", "script": "parse_resume.py", "args": ["/path/to/resume.pdf"]}
+    response: {"id": "42", "success": true, "result": {...}}
+              {"id": "42", "success": false, "error": "..."}
+
+Usage:
+    python worker.py                       # serve requests on stdin/stdout
+    python worker.py --socket /tmp/rp.sock # serve requests on a local Unix socket
+"""
+
+import argparse
+import json
+import logging
+import os
+import socketserver
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Logs must never reach the protocol stream
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    stream=sys.stderr
+)
+logger = logging.getLogger(__name__)
+
+from config.config import OpenAIConfig
+import parse_resume
+import ai_suggestions
+import ai_job_description
+import enhance_content
+
+HANDLERS: Dict[str, Callable[[List[str]], Any]] = {
+    "parse_resume.py": parse_resume.run,
+    "ai_suggestions.py": ai_suggestions.run,
+    "ai_job_description.py": ai_job_description.run,
+    "enhance_content.py": enhance_content.run,
+    "ping": lambda args: "pong"
+}
+
+def handle_request(line: str) -> Dict[str, Any]:
+    """
+    Execute one request line and build its response
+
+    Args:
+        line: JSON-encoded request
+
+    Returns:
+        Response dictionary (always carries the request id when one could be read)
+    """
+    request_id = None
+    try:
+        request = json.loads(line)
+        request_id = request.get("id")
+        script = request.get("script")
+        args = request.get("args", [])
+
+        handler = HANDLERS.get(script)
+        if handler is None:
+            raise ValueError(f"Unknown script: {script}")
+        if not isinstance(args, list):
+            raise ValueError("args must be a list")
+
+        result = handler([str(arg) for arg in args])
+        if hasattr(result, "model_dump"):
+            result = result.model_dump()
+        return {"id": request_id, "success": True, "result": result}
+
+    except Exception as e:
+        logger.error(f"Worker request {request_id} failed: {str(e)}")
+        return {"id": request_id, "success": False, "error": str(e)}
+
+def encode_response(response: Dict[str, Any]) -> str:
+    """Serialize a response as one protocol line, reporting an unserializable result as an error"""
+    try:
+        return json.dumps(response, ensure_ascii=False) + "\n"
+    except (TypeError, ValueError) as e:
+        logger.error(f"Worker request {response.get('id')} returned an unserializable result: {str(e)}")
+        return json.dumps({"id": response.get("id"), "success": False, "error": f"Unserializable result: {str(e)}"}) + "\n"
+
+def serve_stdio(max_concurrency: int = OpenAIConfig.WORKER_MAX_CONCURRENCY):
+    """
+    Serve requests from stdin on a thread pool, writing one response line per request to stdout
+
+    A slow LLM call only occupies its own thread; responses are written whole under a lock
+    as each request finishes.
+    """
+    protocol_out = sys.stdout
+    # Anything printed by services goes to stderr instead of corrupting the protocol
+    sys.stdout = sys.stderr
+    write_lock = threading.Lock()
+
+    def _respond(line: str):
+        payload = encode_response(handle_request(line))
+        with write_lock:
+            protocol_out.write(payload)
+            protocol_out.flush()
+
+    max_concurrency = max(1, max_concurrency)
+    logger.info(f"Worker {os.getpid()} ready on stdio ({max_concurrency} concurrent requests)")
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            executor.submit(_respond, line)
+
+class _SocketRequestHandler(socketserver.StreamRequestHandler):
+    """Handle newline-delimited JSON requests on one socket connection"""
+
+    def handle(self):
+        for raw_line in self.rfile:
+            line = raw_line.decode("utf-8")
+            if not line.strip():
+                continue
+            self.wfile.write(encode_response(handle_request(line)).encode("utf-8"))
+            self.wfile.flush()
+
+def serve_socket(socket_path: str):
+    """Serve requests on a local Unix socket, one thread per connection"""
+    sys.stdout = sys.stderr
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    with socketserver.ThreadingUnixStreamServer(socket_path, _SocketRequestHandler) as server:
+        server.daemon_threads = True
+        logger.info(f"Worker {os.getpid()} ready on socket {socket_path}")
+        try:
+            server.serve_forever()
+        finally:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent resume parser worker")
+    parser.add_argument('--socket', help='Serve on this Unix socket path instead of stdin/stdout')
+    parser.add_argument('--concurrency', type=int, default=OpenAIConfig.WORKER_MAX_CONCURRENCY,
+                        help='Requests handled at the same time on stdio (default WORKER_MAX_CONCURRENCY)')
+    args = parser.parse_args()
+
+    try:
+        if args.socket:
+            serve_socket(args.socket)
+        else:
+            serve_stdio(args.concurrency)
+    except KeyboardInterrupt:
+        logger.info("Worker stopped")
+
+if __name__ == "__main__":
+    main()
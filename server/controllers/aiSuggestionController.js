@@ -3,6 +3,7 @@ import path from 'path';
 import { fileURLToPath } from 'url';
 import multer from 'multer';
 import fs from 'fs';
+import { pythonWorkerPool } from '../utils/pythonWorkerPool.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -25,7 +26,12 @@ const upload = multer({
 });
 
 // Helper function to call Python service
+// Uses the persistent worker pool unless PYTHON_WORKER_MODE=spawn
 const callPythonService = (scriptName, args = []) => {
+  if (process.env.PYTHON_WORKER_MODE !== 'spawn') {
+    return pythonWorkerPool.run(scriptName, args);
+  }
+
   return new Promise((resolve, reject) => {
     const pythonPath = path.join(__dirname, '../../gemini_resume_parser');
     const scriptPath = path.join(pythonPath, scriptName);
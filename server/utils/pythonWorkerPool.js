@@ -0,0 +1,155 @@
+import { spawn } from 'child_process';
+import path from 'path';
+import readline from 'readline';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+const pythonPath = path.join(__dirname, '../../gemini_resume_parser');
+
+// A request still unanswered after this long is rejected and its worker recycled
+const REQUEST_TIMEOUT_MS = parseInt(process.env.PYTHON_WORKER_TIMEOUT_MS || '180000', 10);
+
+// Long-lived `python worker.py` process speaking newline-delimited JSON; the worker handles
+// several requests at once and answers them by id in completion order
+class PythonWorker {
+  constructor(onExit) {
+    this.pending = new Map();
+    this.onExit = onExit;
+    this.retired = false;
+
+    this.process = spawn('python', ['worker.py'], {
+      cwd: pythonPath,
+      stdio: ['pipe', 'pipe', 'pipe']
+    });
+
+    readline.createInterface({ input: this.process.stdout }).on('line', (line) => {
+      let response;
+      try {
+        response = JSON.parse(line);
+      } catch (error) {
+        console.error('Python worker sent invalid output:', line);
+        return;
+      }
+
+      const request = this.pending.get(response.id);
+      if (!request) return;
+      this.settle(response.id);
+
+      if (response.success) {
+        request.resolve(response.result);
+      } else {
+        request.reject(new Error(`Python worker failed: ${response.error}`));
+      }
+    });
+
+    this.process.stderr.on('data', (data) => {
+      // Log Python worker logs to console
+      console.log('Python logs:', data.toString().trim());
+    });
+
+    this.process.on('exit', (code) => {
+      this.fail(new Error(`Python worker exited with code ${code}`));
+    });
+
+    this.process.on('error', (error) => {
+      this.fail(new Error(`Failed to start Python worker: ${error.message}`));
+    });
+  }
+
+  fail(error) {
+    for (const request of this.pending.values()) {
+      clearTimeout(request.timer);
+      request.reject(error);
+    }
+    this.pending.clear();
+    this.onExit(this);
+  }
+
+  settle(id) {
+    clearTimeout(this.pending.get(id).timer);
+    this.pending.delete(id);
+    // A retired worker is killed once its other requests have finished
+    if (this.retired && this.pending.size === 0) {
+      this.process.kill();
+    }
+  }
+
+  // Stop sending requests to this worker (a Python thread stuck in a call cannot be cancelled)
+  retire() {
+    if (this.retired) return;
+    this.retired = true;
+    this.onExit(this);
+    if (this.pending.size === 0) {
+      this.process.kill();
+    }
+  }
+
+  get load() {
+    return this.pending.size;
+  }
+
+  run(id, scriptName, args, timeoutMs = REQUEST_TIMEOUT_MS) {
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        if (!this.pending.has(id)) return;
+        this.settle(id);
+        reject(new Error(`Python worker timed out after ${timeoutMs}ms running ${scriptName}`));
+        this.retire();
+      }, timeoutMs);
+      this.pending.set(id, { resolve, reject, timer });
+      this.process.stdin.write(JSON.stringify({ id, script: scriptName, args }) + '\n', (error) => {
+        if (error && this.pending.has(id)) {
+          this.settle(id);
+          reject(new Error(`Failed to send request to Python worker: ${error.message}`));
+        }
+      });
+    });
+  }
+
+  stop() {
+    this.process.stdin.end();
+  }
+}
+
+// Small pool of Python workers; each request goes to the least busy worker
+class PythonWorkerPool {
+  constructor(size) {
+    this.size = size;
+    this.workers = [];
+    this.nextId = 0;
+  }
+
+  getWorker() {
+    while (this.workers.length < this.size) {
+      this.workers.push(new PythonWorker((worker) => {
+        // Dead workers are replaced lazily on the next request
+        this.workers = this.workers.filter((w) => w !== worker);
+      }));
+    }
+    return this.workers.reduce((best, worker) => (worker.load < best.load ? worker : best));
+  }
+
+  run(scriptName, args = []) {
+    const id = String(++this.nextId);
+    return this.getWorker().run(id, scriptName, args);
+  }
+
+  stats() {
+    return {
+      size: this.size,
+      timeoutMs: REQUEST_TIMEOUT_MS,
+      workers: this.workers.map((worker) => ({ pid: worker.process.pid, inFlight: worker.load }))
+    };
+  }
+
+  stop() {
+    this.workers.forEach((worker) => worker.stop());
+    this.workers = [];
+  }
+}
+
+export const pythonWorkerPool = new PythonWorkerPool(
+  parseInt(process.env.PYTHON_WORKER_POOL_SIZE || '2', 10)
+);